@@ -0,0 +1,94 @@
+"""
+Benchmark: tiempo de importación de main.py (arranque en frío de cada instancia).
+
+Ejecuta varias veces "python -X importtime -c 'import main'" en procesos nuevos
+y resume la salida: tiempo total, los módulos de primer nivel que más tardan
+(acumulado) y los que más tardan por sí mismos. Termina con código 1 si la
+mediana supera el presupuesto (IMPORT_TIME_BUDGET_MS, 3000 ms por defecto;
+--budget-ms 0 lo desactiva). La misma comprobación la hace
+tests/config/test_startup.py, así que una regresión rompe las pruebas.
+
+Uso:
+    python -m benchmarks.bench_import_time --runs 5 --top 15
+    python -m benchmarks.bench_import_time --budget-ms 2500
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "3000"))
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def parse_importtime(output: str) -> list:
+    """Filas (módulo, propio µs, acumulado µs, profundidad) de la salida de -X importtime."""
+    rows = []
+    for line in output.splitlines():
+        match = LINE.match(line)
+        if match:
+            own, cumulative, indent, module = match.groups()
+            rows.append((module, int(own), int(cumulative), (len(indent) - 1) // 2))
+    return rows
+
+
+def profile(module: str) -> list:
+    """Importar module en un proceso nuevo y devolver sus filas de importtime."""
+    env = {**os.environ, "PYTHONWARNINGS": "ignore"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"No se pudo importar {module}:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def measure(module: str, runs: int) -> tuple:
+    """Tiempos totales en ms de runs imports de module y sus filas de importtime."""
+    # La primera ejecución compila los .pyc; no cuenta
+    profile(module)
+    profiles = [profile(module) for _ in range(runs)]
+    totals = [next(row[2] for row in rows if row[0] == module and row[3] == 0) / 1000 for rows in profiles]
+    return totals, profiles
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_TIME_BUDGET_MS)
+    args = parser.parse_args()
+
+    totals, profiles = measure(args.module, args.runs)
+    cumulative = defaultdict(list)
+    own = defaultdict(list)
+    for rows in profiles:
+        for module, own_us, cumulative_us, depth in rows:
+            own[module].append(own_us / 1000)
+            if depth == 1:
+                cumulative[module].append(cumulative_us / 1000)
+
+    total = statistics.median(totals)
+    print(f"import {args.module}: mediana {total:.0f} ms (min {min(totals):.0f}, max {max(totals):.0f}, {args.runs} ejecuciones)")
+
+    print(f"\n{'importado desde ' + args.module:<50}{'acumulado ms':>14}")
+    for module, values in sorted(cumulative.items(), key=lambda item: -statistics.median(item[1]))[:args.top]:
+        print(f"{module:<50}{statistics.median(values):>14.1f}")
+
+    print(f"\n{'módulo':<50}{'propio ms':>14}")
+    for module, values in sorted(own.items(), key=lambda item: -statistics.median(item[1]))[:args.top]:
+        print(f"{module:<50}{statistics.median(values):>14.1f}")
+
+    if args.budget_ms and total > args.budget_ms:
+        print(f"\nEl arranque supera el presupuesto: {total:.0f} ms > {args.budget_ms:.0f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
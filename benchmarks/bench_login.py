@@ -0,0 +1,169 @@
+"""
+Benchmark: latencia de /login (p50/p99) según la concurrencia y el coste de
+bcrypt, y cuánto afecta a otra ruta que no usa contraseñas.
+
+Mientras se lanzan los inicios de sesión, una sonda pide en bucle una ruta
+síncrona trivial (/ping): si bcrypt acapara los hilos del servidor, su p99 sube.
+Las respuestas 503 son operaciones rechazadas por la cola llena del pool de
+bcrypt (BCRYPT_MAX_QUEUE). La columna "consultas" es la media de sentencias
+SQL por inicio de sesión (cabecera X-Query-Count).
+
+Uso:
+    python -m benchmarks.bench_login --rounds 10 12 --concurrency 1 10 50 --requests 200
+    python -m benchmarks.bench_login --workers 4 --max-queue 32
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+
+import bcrypt
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.auth import auth_handler, rate_limiter
+from src.auth.password_hasher import PasswordHasher
+from src.auth.revocation import RevocationList
+from src.auth.token_store import SQLTokenStore
+from src.config.database import get_db
+from src.config.database_init import init_roles
+from src.config.migrations import run_migrations
+from src.config.security import bcrypt_max_queue, bcrypt_workers
+from src.middlewares.query_counter import QueryCounter
+from src.models.user import User
+from src.routers.auth import auth_router
+
+USERS = 100
+PASSWORD = "benchmark123"
+
+
+def build_app(url: str) -> FastAPI:
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+    SessionLocal = sessionmaker(bind=engine, autoflush=False)
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(auth_router)
+    app.add_middleware(QueryCounter, budget=1000, headers=True)
+    app.dependency_overrides[get_db] = override_get_db
+
+    @app.get("/ping")
+    def ping():
+        return {"ok": True}
+
+    app.state.engine = engine
+    return app
+
+
+def seed(app: FastAPI, rounds: int) -> None:
+    """Usuarios con la contraseña hasheada al coste indicado."""
+    hashed = bcrypt.hashpw(PASSWORD.encode(), bcrypt.gensalt(rounds=rounds)).decode()
+    with sessionmaker(bind=app.state.engine)() as db:
+        init_roles(db)
+        db.query(User).delete()
+        db.execute(insert(User), [
+            {"email": f"user{i}@bench.com", "name": f"User {i}", "password": hashed, "role_id": 2, "id_number": f"{i:08d}",
+             "phone": "600000000", "birth_date": date(1990, 1, 1), "gender": "M",
+             "status": True, "is_verified": True, "final_date": date.today() + timedelta(days=365)}
+            for i in range(USERS)
+        ])
+        db.commit()
+
+
+def percentile(values: list, fraction: float) -> float:
+    values = sorted(values)
+    return values[max(0, int(len(values) * fraction) - 1)] * 1000
+
+
+async def run(app: FastAPI, requests: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    login_latencies, ping_latencies, login_queries = [], [], []
+    rejected = 0
+    done = asyncio.Event()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=None) as client:
+        async def login(i):
+            nonlocal rejected
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.post("/login", json={"email": f"user{i % USERS}@bench.com", "password": PASSWORD})
+                if response.status_code == 503:
+                    rejected += 1
+                    return
+                if response.status_code != 200:
+                    raise RuntimeError(f"/login respondió {response.status_code}: {response.text}")
+                login_latencies.append(time.perf_counter() - start)
+                login_queries.append(int(response.headers["X-Query-Count"]))
+
+        async def probe():
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get("/ping")
+                ping_latencies.append(time.perf_counter() - start)
+                await asyncio.sleep(0.01)
+
+        probe_task = asyncio.create_task(probe())
+        start = time.perf_counter()
+        try:
+            await asyncio.gather(*(login(i) for i in range(requests)))
+        finally:
+            elapsed = time.perf_counter() - start
+            done.set()
+            await probe_task
+
+    return {
+        "logins_s": len(login_latencies) / elapsed,
+        "p50_ms": statistics.median(login_latencies) * 1000 if login_latencies else 0,
+        "p99_ms": percentile(login_latencies, 0.99) if login_latencies else 0,
+        "rejected": rejected,
+        "queries": statistics.mean(login_queries) if login_queries else 0,
+        "ping_p99_ms": percentile(ping_latencies, 0.99) if ping_latencies else 0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, nargs="+", default=[10, 12])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=bcrypt_workers)
+    parser.add_argument("--max-queue", type=int, default=bcrypt_max_queue)
+    args = parser.parse_args()
+
+    url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.sqlite')}"
+    run_migrations(url)
+    app = build_app(url)
+    # Sin .env los tokens se firman con una clave de prueba
+    auth_handler.secret = auth_handler.secret or "benchmark"
+    auth_handler.algorithm = auth_handler.algorithm or "HS256"
+    # Las familias de tokens van a la misma base de pruebas
+    auth_handler.token_store = SQLTokenStore(sessionmaker(bind=app.state.engine))
+    auth_handler.revocations = RevocationList(auth_handler.token_store)
+    # Todas las peticiones salen de la misma IP: sin límite para medir bcrypt
+    rate_limiter.policies = {}
+
+    print(f"{'coste':>6}{'concurrencia':>14}{'logins/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'503':>6}{'consultas':>11}{'ping p99 ms':>13}"
+          f"  ({args.workers} hilos bcrypt, cola {args.max_queue})")
+    for rounds in args.rounds:
+        seed(app, rounds)
+        auth_handler.hasher = PasswordHasher(rounds, args.workers, args.max_queue)
+        for concurrency in args.concurrency:
+            result = asyncio.run(run(app, args.requests, concurrency))
+            print(f"{rounds:>6}{concurrency:>14}{result['logins_s']:>10.1f}{result['p50_ms']:>10.1f}{result['p99_ms']:>10.1f}"
+                  f"{result['rejected']:>6}{result['queries']:>11.1f}{result['ping_p99_ms']:>13.1f}")
+    app.state.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Benchmark: sentencias que ejecutan las lecturas de usuarios (GET /user y
+GET /user/{email}) cuando hay suscripciones vencidas.
+
+Antes, cargar un usuario vencido le cambiaba el rol y hacía commit dentro de la
+lectura (evento load de User, get_all_users y get_user_by_email). Ahora las
+lecturas solo hacen SELECT y las filas las actualiza en bloque el trabajo de
+expiración (src/services/subscription_expiry.py), que se mide al final.
+
+Las columnas cuentan sentencias por petición según su tipo; "commit" son los
+COMMIT que llegan a la base.
+
+Uso:
+    python -m benchmarks.bench_user_reads --users 2000 --expired 0.5 --requests 200
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from collections import Counter
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, insert, update
+from sqlalchemy.orm import sessionmaker
+
+from src.auth import auth_handler
+from src.auth.principal import AuthorizationError, authorization_error_handler
+from src.config.database import get_db
+from src.config.database_init import init_roles
+from src.config.migrations import run_migrations
+from src.models.user import User
+from src.routers.user import user_router
+from src.services.subscription_expiry import expire_subscriptions
+
+
+def build_app(url: str) -> FastAPI:
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+    SessionLocal = sessionmaker(bind=engine, autoflush=False)
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(user_router, prefix="/user")
+    app.add_exception_handler(AuthorizationError, authorization_error_handler)
+    app.dependency_overrides[get_db] = override_get_db
+    app.state.engine = engine
+    app.state.session_factory = SessionLocal
+    return app
+
+
+def seed(app: FastAPI, users: int, expired: float) -> None:
+    """Usuarios premium; la fracción expired tiene la suscripción vencida desde ayer."""
+    today = date.today()
+    with app.state.session_factory() as db:
+        init_roles(db)
+        db.execute(insert(User), [
+            {"email": f"user{i}@bench.com", "name": f"User {i}", "password": "x" * 60, "role_id": 2,
+             "id_number": f"{i:08d}", "phone": "600000000", "birth_date": date(1990, 1, 1), "gender": "M",
+             "status": True, "is_verified": True,
+             "final_date": today - timedelta(days=1) if i < users * expired else today + timedelta(days=365)}
+            for i in range(users)
+        ])
+        db.commit()
+
+
+class StatementCounter:
+    """Cuenta las sentencias del motor por tipo (SELECT, UPDATE, ...) y los COMMIT."""
+
+    def __init__(self, engine) -> None:
+        self.counts = Counter()
+        event.listen(engine, "before_cursor_execute", self._statement)
+        event.listen(engine, "commit", self._commit)
+
+    def _statement(self, conn, cursor, statement, parameters, context, executemany):
+        self.counts[statement.lstrip().split(None, 1)[0].upper()] += 1
+
+    def _commit(self, conn):
+        self.counts["COMMIT"] += 1
+
+    def take(self) -> Counter:
+        counts, self.counts = self.counts, Counter()
+        return counts
+
+
+def measure(client: TestClient, counter: StatementCounter, paths: list, headers: dict) -> dict:
+    counter.take()
+    latencies = []
+    for path in paths:
+        start = time.perf_counter()
+        response = client.get(path, headers=headers)
+        latencies.append(time.perf_counter() - start)
+        if response.status_code != 200:
+            raise RuntimeError(f"{path} respondió {response.status_code}: {response.text}")
+    counts = counter.take()
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        **{kind: counts[kind] / len(paths) for kind in ("SELECT", "UPDATE", "COMMIT")},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--expired", type=float, default=0.5, help="Fracción de usuarios con la suscripción vencida")
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.sqlite')}"
+    run_migrations(url)
+    app = build_app(url)
+    seed(app, args.users, args.expired)
+    # Sin .env los tokens se firman con una clave de prueba
+    auth_handler.secret = auth_handler.secret or "benchmark"
+    auth_handler.algorithm = auth_handler.algorithm or "HS256"
+    admin = SimpleNamespace(email="admin@bench.com", name="Admin", id_number="00000000", role_id=4,
+                            status=True, is_verified=True, final_date=None, gym_id=None)
+    headers = {"Authorization": f"Bearer {auth_handler.encode_token(admin)}"}
+
+    counter = StatementCounter(app.state.engine)
+    client = TestClient(app)
+    expired_users = int(args.users * args.expired)
+    print(f"{'ruta':<22}{'p50 ms':>10}{'SELECT':>9}{'UPDATE':>9}{'COMMIT':>9}   (por petición)")
+    for name, paths in (
+        ("GET /user", ["/user"] * max(1, args.requests // 20)),
+        ("GET /user/{email}", [f"/user/user{i % max(1, expired_users)}@bench.com" for i in range(args.requests)]),
+    ):
+        result = measure(client, counter, paths, headers)
+        print(f"{name:<22}{result['p50_ms']:>10.2f}{result['SELECT']:>9.1f}{result['UPDATE']:>9.1f}{result['COMMIT']:>9.1f}")
+
+    with app.state.session_factory() as db:
+        start = time.perf_counter()
+        expired = expire_subscriptions(db)
+        elapsed = (time.perf_counter() - start) * 1000
+        # Se restauran los roles para poder repetir la medición sobre los mismos datos
+        db.execute(update(User).where(User.email.like("user%@bench.com")).values(role_id=2))
+        db.commit()
+    print(f"\ntrabajo de expiración: {expired} usuarios en {elapsed:.1f} ms con un solo UPDATE")
+    app.state.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
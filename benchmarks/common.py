@@ -0,0 +1,6 @@
+"""
+Utilidades compartidas por los benchmarks.
+"""
+from src.config.migrations import load_models
+
+__all__ = ["load_models"]
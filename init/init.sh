@@ -1,4 +1,13 @@
 #!/bin/bash
-sleep 20
+set -e
 
-uvicorn main:app --host gym_house --reload
\ No newline at end of file
+# Esperar a que la base de datos acepte conexiones (DB_READY_TIMEOUT)
+python -m src.config.startup
+
+# En STARTUP_MODE=fast el esquema y los datos los prepara un paso único:
+#   python -m src.config.migrations
+if [ "${STARTUP_MODE:-full}" != "fast" ]; then
+    python -m src.config.migrations
+fi
+
+uvicorn main:app --host gym_house --reload
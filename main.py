@@ -1,8 +1,13 @@
 """
 Aplicación principal de GymHouseBackend.
 """
+import anyio
 from fastapi import FastAPI, Body, Path
 from src.middlewares.error_handler import ErrorHandler
+from src.middlewares.query_counter import QueryCounter
+from src.auth import revocations
+from src.auth.principal import AuthorizationError, authorization_error_handler
+from src.auth.rate_limiter import RateLimitExceeded, rate_limit_error_handler
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 
@@ -29,18 +34,22 @@ from src.routers.exercise_muscle import exercise_muscle_router
 from src.routers.dificulty import dificulty_router
 from src.routers.comment import comment_router
 from src.routers.notification import notification_router
+from src.routers.metrics import metrics_router
+from src.routers.slow_query import slow_query_router
 
-from src.config.database import Base, engine, SessionLocal
+from src.config.database import SessionLocal
 from src.config.database_init import init_data
+from src.config.security import threadpool_size
+from src.config.startup import seeds_on_startup
+from src.services.subscription_expiry import SubscriptionExpiryJob
+from src.services.like_counters import LikeCountersReconcileJob
 
-import sys
+# El esquema lo crean las migraciones (python -m src.config.migrations) antes de arrancar
 
-# Crear las tablas en la base de datos solo si no estamos en modo de prueba
-if "pytest" not in sys.modules:
-    Base.metadata.create_all(bind=engine)
-
-# Inicializar datos en la base de datos
+# Inicializar datos en la base de datos (en STARTUP_MODE=fast lo hace el paso de migraciones)
 def startup_event():
+    if not seeds_on_startup():
+        return
     db: Session = SessionLocal()
     try:
         init_data(db)
@@ -73,6 +82,13 @@ app.add_middleware(
 
 #app.add_middleware(ErrorHandler)
 
+# Conteo de consultas SQL por petición (X-Query-Count / Server-Timing)
+app.add_middleware(QueryCounter)
+
+# Respuestas de las guardas de rol ({"message", "data"} como el resto de la API)
+app.add_exception_handler(AuthorizationError, authorization_error_handler)
+app.add_exception_handler(RateLimitExceeded, rate_limit_error_handler)
+
 # origins = [
 #     "http://localhost",
 #     "http://localhost:8000",
@@ -93,6 +109,25 @@ app.add_middleware(
 # Agregar el evento de inicio
 app.add_event_handler("startup", startup_event)
 
+# Tamaño del threadpool de las rutas síncronas (bcrypt ocupa como mucho la mitad)
+def configure_threadpool():
+    anyio.to_thread.current_default_thread_limiter().total_tokens = threadpool_size
+
+app.add_event_handler("startup", configure_threadpool)
+
+# Lista de familias de tokens revocadas (se recarga en segundo plano)
+app.add_event_handler("startup", revocations.start)
+
+# Expiración de suscripciones en bloque (SUBSCRIPTION_EXPIRY_INTERVAL=0 la desactiva)
+subscription_expiry_job = SubscriptionExpiryJob(SessionLocal)
+app.add_event_handler("startup", subscription_expiry_job.start)
+app.add_event_handler("shutdown", subscription_expiry_job.stop)
+
+# Conciliación de los contadores de likes (LIKE_COUNTERS_RECONCILE_INTERVAL=0 la desactiva)
+like_counters_job = LikeCountersReconcileJob(SessionLocal)
+app.add_event_handler("startup", like_counters_job.start)
+app.add_event_handler("shutdown", like_counters_job.stop)
+
 #################################################
 #      Router's definition (endpoints sets)     #
 
@@ -119,5 +154,7 @@ app.include_router(prefix="/dropset_pr_exercise", router= dropset_pr_exercise_ro
 app.include_router(prefix="/gym", router= gym_router)
 app.include_router(prefix="/comment", router= comment_router)
 app.include_router(prefix="/notification", router= notification_router)
+app.include_router(prefix="/metrics", router= metrics_router)
+app.include_router(prefix="/slow_query", router= slow_query_router)
 
 #################################################
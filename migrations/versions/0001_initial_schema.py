@@ -0,0 +1,284 @@
+"""initial schema
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-18 12:37:36.131652
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('dificulties',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=20), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('machines',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=True),
+    sa.Column('description', sa.String(length=200), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('muscles',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=True),
+    sa.Column('description', sa.String(length=200), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('roles',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=40), nullable=True),
+    sa.Column('description', sa.String(length=200), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('tags_of_training_plans',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('week_days',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=20), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('exercises',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=60), nullable=True),
+    sa.Column('description', sa.String(length=200), nullable=True),
+    sa.Column('video', sa.String(length=200), nullable=True),
+    sa.Column('image', sa.String(length=200), nullable=True),
+    sa.Column('dateAdded', sa.Date(), nullable=True),
+    sa.Column('dificulty_id', sa.Integer(), nullable=True),
+    sa.Column('machine_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['dificulty_id'], ['dificulties.id'], ),
+    sa.ForeignKeyConstraint(['machine_id'], ['machines.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('specific_muscles',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=40), nullable=True),
+    sa.Column('muscle_id', sa.Integer(), nullable=True),
+    sa.Column('description', sa.String(length=200), nullable=True),
+    sa.ForeignKeyConstraint(['muscle_id'], ['muscles.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('users',
+    sa.Column('email', sa.String(length=250), nullable=False),
+    sa.Column('id_number', sa.String(length=20), nullable=True),
+    sa.Column('password', sa.String(length=255), nullable=True),
+    sa.Column('user_name', sa.String(length=50), nullable=True),
+    sa.Column('name', sa.String(length=80), nullable=True),
+    sa.Column('phone', sa.String(length=20), nullable=True),
+    sa.Column('address', sa.String(length=150), nullable=True),
+    sa.Column('birth_date', sa.Date(), nullable=True),
+    sa.Column('gender', sa.String(length=1), nullable=True),
+    sa.Column('status', sa.Boolean(), nullable=True),
+    sa.Column('start_date', sa.Date(), nullable=True),
+    sa.Column('final_date', sa.Date(), nullable=True),
+    sa.Column('role_id', sa.Integer(), nullable=True),
+    sa.Column('is_verified', sa.Boolean(), nullable=True),
+    sa.Column('verification_code', sa.String(length=6), nullable=True),
+    sa.ForeignKeyConstraint(['role_id'], ['roles.id'], ),
+    sa.PrimaryKeyConstraint('email')
+    )
+    op.create_table('exercises_muscles',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('exercise_id', sa.Integer(), nullable=True),
+    sa.Column('specific_muscle_id', sa.Integer(), nullable=True),
+    sa.Column('rate', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['exercise_id'], ['exercises.id'], ),
+    sa.ForeignKeyConstraint(['specific_muscle_id'], ['specific_muscles.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('exercise_id', 'specific_muscle_id', name='uix_1')
+    )
+    op.create_table('gyms',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('user_email', sa.String(length=250), nullable=True),
+    sa.Column('name', sa.String(length=100), nullable=True),
+    sa.Column('address', sa.String(length=100), nullable=True),
+    sa.Column('phone', sa.String(length=20), nullable=True),
+    sa.Column('email', sa.String(length=250), nullable=True),
+    sa.Column('website', sa.String(length=100), nullable=True),
+    sa.Column('open_time', sa.String(length=10), nullable=True),
+    sa.Column('close_time', sa.String(length=10), nullable=True),
+    sa.Column('price', sa.Float(), nullable=True),
+    sa.Column('description', sa.String(length=200), nullable=True),
+    sa.Column('image', sa.String(length=100), nullable=True),
+    sa.Column('city', sa.String(length=60), nullable=True),
+    sa.Column('country', sa.String(length=60), nullable=True),
+    sa.Column('start_date', sa.Date(), nullable=True),
+    sa.Column('final_date', sa.Date(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('max_users', sa.Integer(), nullable=True),
+    sa.Column('current_users', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['user_email'], ['users.email'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('history_pr_exercises',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('user_email', sa.String(length=250), nullable=True),
+    sa.Column('exercise_id', sa.Integer(), nullable=True),
+    sa.Column('date', sa.Date(), nullable=True),
+    sa.Column('notas', sa.String(length=500), nullable=True),
+    sa.Column('tipo_sesion', sa.String(length=50), nullable=True),
+    sa.ForeignKeyConstraint(['exercise_id'], ['exercises.id'], ),
+    sa.ForeignKeyConstraint(['user_email'], ['users.email'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('notification_tokens',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('token', sa.String(), nullable=True),
+    sa.Column('user_email', sa.String(length=250), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['user_email'], ['users.email'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('notification_tokens', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_notification_tokens_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_notification_tokens_token'), ['token'], unique=True)
+
+    op.create_table('profiles',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('user_email', sa.String(length=250), nullable=True),
+    sa.Column('weight', sa.Float(), nullable=True),
+    sa.Column('height', sa.Float(), nullable=True),
+    sa.Column('physical_activity', sa.Integer(), nullable=True),
+    sa.Column('fat', sa.Float(), nullable=True),
+    sa.Column('muscle', sa.Float(), nullable=True),
+    sa.Column('chest', sa.Float(), nullable=True),
+    sa.Column('waist', sa.Float(), nullable=True),
+    sa.Column('hips', sa.Float(), nullable=True),
+    sa.Column('biceps', sa.Float(), nullable=True),
+    sa.Column('thigh', sa.Float(), nullable=True),
+    sa.Column('notes', sa.String(length=255), nullable=True),
+    sa.Column('date', sa.Date(), nullable=True),
+    sa.ForeignKeyConstraint(['user_email'], ['users.email'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('series_pr_exercises',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('history_pr_exercise_id', sa.Integer(), nullable=True),
+    sa.Column('weight', sa.Float(), nullable=True),
+    sa.Column('reps', sa.Integer(), nullable=True),
+    sa.Column('tipo_serie', sa.String(length=50), nullable=True),
+    sa.Column('rpe', sa.Float(), nullable=True),
+    sa.Column('orden_serie', sa.Integer(), nullable=True),
+    sa.Column('notas_serie', sa.String(length=500), nullable=True),
+    sa.ForeignKeyConstraint(['history_pr_exercise_id'], ['history_pr_exercises.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('users_gyms',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('user_email', sa.String(length=250), nullable=True),
+    sa.Column('gym_id', sa.Integer(), nullable=True),
+    sa.Column('start_date', sa.Date(), nullable=True),
+    sa.Column('final_date', sa.Date(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('is_premium', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['gym_id'], ['gyms.id'], ),
+    sa.ForeignKeyConstraint(['user_email'], ['users.email'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('dropset_pr_exercises',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('serie_pr_exercise_id', sa.Integer(), nullable=True),
+    sa.Column('weight', sa.Float(), nullable=True),
+    sa.Column('reps', sa.Integer(), nullable=True),
+    sa.Column('orden_dropset', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['serie_pr_exercise_id'], ['series_pr_exercises.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('training_plans',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=60), nullable=True),
+    sa.Column('description', sa.String(length=200), nullable=True),
+    sa.Column('tag_of_training_plan_id', sa.Integer(), nullable=True),
+    sa.Column('user_email', sa.String(length=200), nullable=True),
+    sa.Column('user_gym_id', sa.Integer(), nullable=True),
+    sa.Column('is_visible', sa.Boolean(), nullable=True),
+    sa.Column('is_gym_created', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['tag_of_training_plan_id'], ['tags_of_training_plans.id'], ),
+    sa.ForeignKeyConstraint(['user_email'], ['users.email'], ),
+    sa.ForeignKeyConstraint(['user_gym_id'], ['users_gyms.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('comments',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('user_email', sa.String(length=250), nullable=True),
+    sa.Column('training_plan_id', sa.Integer(), nullable=True),
+    sa.Column('content', sa.String(length=200), nullable=True),
+    sa.Column('date', sa.Date(), nullable=True),
+    sa.ForeignKeyConstraint(['training_plan_id'], ['training_plans.id'], ),
+    sa.ForeignKeyConstraint(['user_email'], ['users.email'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('likes',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('user_email', sa.String(length=250), nullable=True),
+    sa.Column('training_plan_id', sa.Integer(), nullable=True),
+    sa.Column('is_like', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['training_plan_id'], ['training_plans.id'], ),
+    sa.ForeignKeyConstraint(['user_email'], ['users.email'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('workout_day_exercises',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('week_day_id', sa.Integer(), nullable=True),
+    sa.Column('training_plan_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['training_plan_id'], ['training_plans.id'], ),
+    sa.ForeignKeyConstraint(['week_day_id'], ['week_days.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('exercise_configurations',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('exercise_id', sa.Integer(), nullable=True),
+    sa.Column('workout_day_exercise_id', sa.Integer(), nullable=True),
+    sa.Column('sets', sa.Integer(), nullable=True),
+    sa.Column('repsHigh', sa.Integer(), nullable=True),
+    sa.Column('repsLow', sa.Integer(), nullable=True),
+    sa.Column('rest', sa.Float(), nullable=True),
+    sa.Column('notes', sa.String(length=255), nullable=True),
+    sa.ForeignKeyConstraint(['exercise_id'], ['exercises.id'], ),
+    sa.ForeignKeyConstraint(['workout_day_exercise_id'], ['workout_day_exercises.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('exercise_configurations')
+    op.drop_table('workout_day_exercises')
+    op.drop_table('likes')
+    op.drop_table('comments')
+    op.drop_table('training_plans')
+    op.drop_table('dropset_pr_exercises')
+    op.drop_table('users_gyms')
+    op.drop_table('series_pr_exercises')
+    op.drop_table('profiles')
+    with op.batch_alter_table('notification_tokens', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_notification_tokens_token'))
+        batch_op.drop_index(batch_op.f('ix_notification_tokens_id'))
+
+    op.drop_table('notification_tokens')
+    op.drop_table('history_pr_exercises')
+    op.drop_table('gyms')
+    op.drop_table('exercises_muscles')
+    op.drop_table('users')
+    op.drop_table('specific_muscles')
+    op.drop_table('exercises')
+    op.drop_table('week_days')
+    op.drop_table('tags_of_training_plans')
+    op.drop_table('roles')
+    op.drop_table('muscles')
+    op.drop_table('machines')
+    op.drop_table('dificulties')
@@ -0,0 +1,90 @@
+"""lookup indexes
+
+Índices para las búsquedas por clave foránea más frecuentes y restricciones
+únicas de likes y users_gyms. Antes de crear las restricciones se eliminan los
+duplicados que pudiera haber, conservando la fila más antigua.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 12:37:52.270113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def delete_duplicates(table: str, columns: Sequence[str]) -> None:
+    """Borrar las filas repetidas por columns dejando la de menor id."""
+    keys = ", ".join(columns)
+    op.execute(
+        f"DELETE FROM {table} WHERE id NOT IN "
+        f"(SELECT keep_id FROM (SELECT MIN(id) AS keep_id FROM {table} GROUP BY {keys}) AS kept)"
+    )
+
+
+def upgrade() -> None:
+    delete_duplicates("likes", ["training_plan_id", "user_email"])
+    # Los planes creados por un gimnasio apuntan a la fila de users_gyms que se conserva
+    op.execute(
+        "UPDATE training_plans SET user_gym_id = ("
+        "SELECT MIN(kept.id) FROM users_gyms AS kept JOIN users_gyms AS current "
+        "ON kept.user_email = current.user_email AND kept.gym_id = current.gym_id "
+        "WHERE current.id = training_plans.user_gym_id"
+        ") WHERE user_gym_id IS NOT NULL"
+    )
+    delete_duplicates("users_gyms", ["user_email", "gym_id"])
+
+    with op.batch_alter_table('comments', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_comments_training_plan_id'), ['training_plan_id'], unique=False)
+
+    with op.batch_alter_table('exercise_configurations', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_exercise_configurations_workout_day_exercise_id'), ['workout_day_exercise_id'], unique=False)
+
+    with op.batch_alter_table('gyms', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_gyms_user_email'), ['user_email'], unique=False)
+
+    with op.batch_alter_table('history_pr_exercises', schema=None) as batch_op:
+        batch_op.create_index('ix_history_pr_exercises_user_email_exercise_id_date', ['user_email', 'exercise_id', 'date'], unique=False)
+
+    with op.batch_alter_table('likes', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_likes_training_plan_id_user_email', ['training_plan_id', 'user_email'])
+        batch_op.create_index('ix_likes_training_plan_id_is_like', ['training_plan_id', 'is_like'], unique=False)
+
+    with op.batch_alter_table('users_gyms', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_users_gyms_user_email_gym_id', ['user_email', 'gym_id'])
+
+    with op.batch_alter_table('workout_day_exercises', schema=None) as batch_op:
+        batch_op.create_index('ix_workout_day_exercises_training_plan_id_week_day_id', ['training_plan_id', 'week_day_id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('workout_day_exercises', schema=None) as batch_op:
+        batch_op.drop_index('ix_workout_day_exercises_training_plan_id_week_day_id')
+
+    with op.batch_alter_table('users_gyms', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_users_gyms_user_email_gym_id', type_='unique')
+
+    with op.batch_alter_table('likes', schema=None) as batch_op:
+        batch_op.drop_index('ix_likes_training_plan_id_is_like')
+        batch_op.drop_constraint('uq_likes_training_plan_id_user_email', type_='unique')
+
+    with op.batch_alter_table('history_pr_exercises', schema=None) as batch_op:
+        batch_op.drop_index('ix_history_pr_exercises_user_email_exercise_id_date')
+
+    with op.batch_alter_table('gyms', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_gyms_user_email'))
+
+    with op.batch_alter_table('exercise_configurations', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_exercise_configurations_workout_day_exercise_id'))
+
+    with op.batch_alter_table('comments', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_comments_training_plan_id'))
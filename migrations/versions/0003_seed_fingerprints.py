@@ -0,0 +1,34 @@
+"""seed fingerprints
+
+Tabla con la huella de los datos iniciales sembrados en el último arranque
+(ver src/config/database_init.py).
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 16:05:12.418339
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('seed_fingerprints',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('fingerprint', sa.String(length=64), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('seed_fingerprints')
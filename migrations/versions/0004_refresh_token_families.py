@@ -0,0 +1,42 @@
+"""refresh token families
+
+Familias de tokens de actualización para la rotación y la revocación
+(ver src/auth/token_store.py).
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 19:42:37.106214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('refresh_token_families',
+    sa.Column('family_id', sa.String(length=36), nullable=False),
+    sa.Column('user_email', sa.String(length=250), nullable=False),
+    sa.Column('current_jti', sa.String(length=36), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.Column('revoked_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_email'], ['users.email'], ),
+    sa.PrimaryKeyConstraint('family_id')
+    )
+    op.create_index(op.f('ix_refresh_token_families_revoked_at'), 'refresh_token_families', ['revoked_at'], unique=False)
+    op.create_index(op.f('ix_refresh_token_families_user_email'), 'refresh_token_families', ['user_email'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_refresh_token_families_user_email'), table_name='refresh_token_families')
+    op.drop_index(op.f('ix_refresh_token_families_revoked_at'), table_name='refresh_token_families')
+    op.drop_table('refresh_token_families')
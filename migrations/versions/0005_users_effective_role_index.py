@@ -0,0 +1,29 @@
+"""users effective role index
+
+Índice compuesto (role_id, final_date) para los filtros por rol vigente
+(User.effective_role).
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 21:05:12.482913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_users_role_id_final_date', 'users', ['role_id', 'final_date'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_role_id_final_date', table_name='users')
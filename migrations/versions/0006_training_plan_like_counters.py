@@ -0,0 +1,46 @@
+"""training plan like counters
+
+Contadores de likes y dislikes en training_plans, rellenados a partir de la
+tabla likes, e índices para ordenar los listados por likes
+(ver src/services/like_counters.py).
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 21:48:30.915274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('training_plans', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('likes_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('dislikes_count', sa.Integer(), server_default='0', nullable=False))
+
+    op.execute(
+        "UPDATE training_plans SET "
+        "likes_count = (SELECT COUNT(*) FROM likes WHERE likes.training_plan_id = training_plans.id AND likes.is_like = true), "
+        "dislikes_count = (SELECT COUNT(*) FROM likes WHERE likes.training_plan_id = training_plans.id AND likes.is_like = false)"
+    )
+
+    with op.batch_alter_table('training_plans', schema=None) as batch_op:
+        batch_op.create_index('ix_training_plans_is_visible_likes_count', ['is_visible', 'likes_count'], unique=False)
+        batch_op.create_index('ix_training_plans_user_email_likes_count', ['user_email', 'likes_count'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('training_plans', schema=None) as batch_op:
+        batch_op.drop_index('ix_training_plans_user_email_likes_count')
+        batch_op.drop_index('ix_training_plans_is_visible_likes_count')
+        batch_op.drop_column('dislikes_count')
+        batch_op.drop_column('likes_count')
@@ -0,0 +1,33 @@
+"""training plan catalog keyset index
+
+El catálogo se ordena por (likes_count, id) para paginar por cursor: el
+índice del catálogo incluye id para recorrerlo sin ordenar.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 22:31:04.628117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('training_plans', schema=None) as batch_op:
+        batch_op.create_index('ix_training_plans_is_visible_likes_count_id', ['is_visible', 'likes_count', 'id'], unique=False)
+        batch_op.drop_index('ix_training_plans_is_visible_likes_count')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('training_plans', schema=None) as batch_op:
+        batch_op.create_index('ix_training_plans_is_visible_likes_count', ['is_visible', 'likes_count'], unique=False)
+        batch_op.drop_index('ix_training_plans_is_visible_likes_count_id')
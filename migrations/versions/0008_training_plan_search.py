@@ -0,0 +1,69 @@
+"""training plan search
+
+Documento de búsqueda de los planes (nombre, descripción y etiqueta) con
+índice GIN sobre to_tsvector('spanish', ...) en PostgreSQL y tabla FTS5 de
+contenido externo con triggers en SQLite (ver src/models/training_plan.py).
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 23:14:51.370462
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SQLITE_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS training_plans_fts USING fts5("
+    "search_document, content='training_plans', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS training_plans_fts_ai AFTER INSERT ON training_plans BEGIN "
+    "INSERT INTO training_plans_fts(rowid, search_document) VALUES (new.id, new.search_document); END",
+    "CREATE TRIGGER IF NOT EXISTS training_plans_fts_ad AFTER DELETE ON training_plans BEGIN "
+    "INSERT INTO training_plans_fts(training_plans_fts, rowid, search_document) VALUES ('delete', old.id, old.search_document); END",
+    "CREATE TRIGGER IF NOT EXISTS training_plans_fts_au AFTER UPDATE OF search_document ON training_plans BEGIN "
+    "INSERT INTO training_plans_fts(training_plans_fts, rowid, search_document) VALUES ('delete', old.id, old.search_document); "
+    "INSERT INTO training_plans_fts(rowid, search_document) VALUES (new.id, new.search_document); END",
+)
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('training_plans', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('search_document', sa.Text(), nullable=True))
+
+    op.execute(
+        "UPDATE training_plans SET search_document = TRIM("
+        "COALESCE(name, '') || ' ' || COALESCE(description, '') || ' ' || COALESCE("
+        "(SELECT name FROM tags_of_training_plans WHERE tags_of_training_plans.id = training_plans.tag_of_training_plan_id), ''))"
+    )
+
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.create_index(
+            'ix_training_plans_search_document', 'training_plans',
+            [sa.text("to_tsvector('spanish', search_document)")], unique=False, postgresql_using='gin',
+        )
+    elif dialect == 'sqlite':
+        for statement in SQLITE_FTS_DDL:
+            op.execute(statement)
+        op.execute("INSERT INTO training_plans_fts(training_plans_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.drop_index('ix_training_plans_search_document', table_name='training_plans')
+    elif dialect == 'sqlite':
+        for trigger in ('training_plans_fts_au', 'training_plans_fts_ad', 'training_plans_fts_ai'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS training_plans_fts")
+
+    with op.batch_alter_table('training_plans', schema=None) as batch_op:
+        batch_op.drop_column('search_document')
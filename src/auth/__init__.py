@@ -1,4 +1,21 @@
 from src.auth.jwt_handler import JWTHandler
-from src.config.security import auth_algorithm, auth_secret_key
+from src.auth.password_hasher import PasswordHasher
+from src.auth.rate_limiter import build_rate_limiter
+from src.auth.revocation import RevocationList
+from src.auth.token_cache import TokenCache
+from src.auth.token_store import build_token_store
+from src.config.security import (
+    auth_algorithm, auth_secret_key, bcrypt_max_queue, bcrypt_rounds, bcrypt_workers, rate_limit_backend,
+    rate_limit_policies, rate_limit_trust_proxy, redis_url, revocation_refresh_seconds, token_cache_size,
+    token_store_backend
+)
 
-auth_handler = JWTHandler(auth_secret_key, auth_algorithm)
\ No newline at end of file
+password_hasher = PasswordHasher(bcrypt_rounds, bcrypt_workers, bcrypt_max_queue)
+token_cache = TokenCache(token_cache_size)
+token_store = build_token_store(token_store_backend, redis_url)
+revocations = RevocationList(token_store, revocation_refresh_seconds)
+auth_handler = JWTHandler(
+    auth_secret_key, auth_algorithm, hasher=password_hasher, token_cache=token_cache,
+    token_store=token_store, revocations=revocations
+)
+rate_limiter = build_rate_limiter(rate_limit_backend, rate_limit_policies, redis_url, rate_limit_trust_proxy)
@@ -1,13 +1,13 @@
 from fastapi import HTTPException, Security 
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer 
-from src.auth.jwt_handler import JWTHandler
+from src.auth import auth_handler
 
 security = HTTPBearer()
 
 async def has_access(credentials: HTTPAuthorizationCredentials = Security(security)) -> dict:    
     try:        
         token = credentials.credentials        
-        payload = JWTHandler().decode_token(token)        
+        payload = auth_handler.decode_token(token)        
         return payload    
     except:        
-        raise HTTPException(status_code=401, detail="Invalid authentication credentials")
\ No newline at end of file
+        raise HTTPException(status_code=401, detail="Invalid authentication credentials")
@@ -2,35 +2,57 @@
 Manejador de tokens JWT.
 """
 import jwt
-from datetime import datetime, timedelta
-import bcrypt
+from datetime import date, datetime, time, timedelta
+from uuid import uuid4
 from fastapi import HTTPException, status
+from src.auth.password_hasher import HasherBusyError, PasswordHasher
+from src.auth.revocation import RevocationList
+from src.auth.token_cache import TokenCache
 from src.repositories.user import UserRepository
 from sqlalchemy.orm import Session
 
 class JWTHandler:
     """Clase para manejar la generación y validación de tokens JWT."""
     
-    def __init__(self, secret: str, algorithm: str, db: Session = None):
+    def __init__(self, secret: str, algorithm: str, db: Session = None, hasher: PasswordHasher = None, token_cache: TokenCache = None,
+                 token_store=None, revocations: RevocationList = None):
         """Inicializar el manejador JWT."""
         self.secret = secret
         self.algorithm = algorithm
         self.db = db
+        self.hasher = hasher if hasher is not None else PasswordHasher()
+        self.token_cache = token_cache if token_cache is not None else TokenCache()
+        self.token_store = token_store
+        self.revocations = revocations if revocations is not None else RevocationList(token_store)
     
     def hash_password(self, password: str) -> str:
-        """Hashear una contraseña."""
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password.encode(), salt)
-        return hashed.decode()
+        """Hashear una contraseña (en el pool de bcrypt)."""
+        try:
+            return self.hasher.hash(password)
+        except HasherBusyError:
+            raise self._busy_error()
     
     def verify_password(self, password: str, hashed: str) -> bool:
-        """Verificar una contraseña."""
-        return bcrypt.checkpw(password.encode(), hashed.encode())
+        """Verificar una contraseña (en el pool de bcrypt)."""
+        try:
+            return self.hasher.verify(password, hashed)
+        except HasherBusyError:
+            raise self._busy_error()
+    
+    @staticmethod
+    def _busy_error() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Servidor ocupado, inténtalo de nuevo en unos segundos",
+            headers={"Retry-After": "1"},
+        )
     
-    def encode_token(self, user) -> str:
+    def encode_token(self, user, family_id: str = None) -> str:
         """Generar un token de acceso."""
+        final_date = getattr(user, "final_date", None)
+        gym_id = getattr(user, "gym_id", None)
         payload = {
-            "exp": datetime.utcnow() + timedelta(hours=1),  # Token válido por 1 hora
+            "exp": self._access_expiration(user.role_id, final_date),
             "iat": datetime.utcnow(),
             "scope": "access_token",
             "sub": user.email,
@@ -39,14 +61,51 @@ class JWTHandler:
             "user.role": user.role_id,
             "user.status": user.status,
             "user.is_verified": user.is_verified,
+            "user.final_date": final_date.isoformat() if final_date else None,
+            "user.gym_id": gym_id if user.role_id == 3 else None,
         }
+        if family_id:
+            payload["jti"] = str(uuid4())
+            payload["fam"] = family_id
         return jwt.encode(payload, self.secret, algorithm=self.algorithm)
     
+    @staticmethod
+    def _access_expiration(role_id: int, final_date: date = None) -> datetime:
+        """Una hora, sin pasar del fin de la suscripción: así el rol del token nunca está vencido."""
+        expiration = datetime.utcnow() + timedelta(hours=1)  # Token válido por 1 hora
+        if role_id in (2, 3) and final_date:
+            expiration = min(expiration, datetime.combine(final_date + timedelta(days=1), time.min))
+        return expiration
+    
+    def issue_tokens(self, user, db: Session = None) -> tuple:
+        """
+        Abrir una familia de tokens y devolver (token de acceso, token de actualización).
+        Con db la familia se guarda en la sesión de la petición.
+        """
+        family_id = str(uuid4())
+        jti = str(uuid4())
+        refresh_token = self.encode_refresh_token(user, family_id, jti)
+        if self.token_store is not None:
+            self.token_store.issue(family_id, user.email, jti, self._refresh_expiration().timestamp(), db=db)
+        return self.encode_token(user, family_id), refresh_token
+    
     def decode_token(self, token: str) -> dict:
-        """Decodificar un token."""
+        """Decodificar un token (los ya verificados se sirven desde la caché)."""
+        key = self.token_cache.key(token)
+        payload = self.token_cache.get(key)
+        if payload is not None:
+            self._check_not_revoked(payload)
+            return payload
+        if self.token_cache.is_revoked(key):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token revoked"
+            )
         try:
             payload = jwt.decode(token, self.secret, algorithms=[self.algorithm])
             if payload and payload["scope"] == "access_token":
+                self._check_not_revoked(payload)
+                self.token_cache.put(key, payload)
                 return payload
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -63,28 +122,85 @@ class JWTHandler:
                 detail="Invalid token"
             )
     
-    def encode_refresh_token(self, user) -> str:
+    def _check_not_revoked(self, payload: dict) -> None:
+        """Rechazar tokens de una familia revocada (comprobación en memoria)."""
+        if self.revocations.is_revoked(payload.get("fam")):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token revoked"
+            )
+    
+    def revoke_token(self, token: str) -> None:
+        """Revocar un token de acceso y, si pertenece a una, toda su familia (cerrar la sesión)."""
+        try:
+            payload = jwt.decode(token, self.secret, algorithms=[self.algorithm])
+        except jwt.InvalidTokenError:
+            return
+        self.token_cache.revoke(self.token_cache.key(token), payload["exp"])
+        family_id = payload.get("fam")
+        if family_id:
+            if self.token_store is not None:
+                self.token_store.revoke_family(family_id)
+            self.revocations.add(family_id)
+    
+    def revoke_user(self, email: str, db: Session = None) -> None:
+        """Revocar todas las sesiones del usuario (cerrar sesión en todos los dispositivos)."""
+        if self.token_store is None:
+            return
+        for family_id in self.token_store.revoke_user(email, db=db):
+            self.revocations.add(family_id)
+    
+    @staticmethod
+    def _refresh_expiration() -> datetime:
+        return datetime.utcnow() + timedelta(hours=10)  # Token válido por 10 horas
+    
+    def encode_refresh_token(self, user, family_id: str = None, jti: str = None) -> str:
         """Generar un token de actualización."""
         payload = {
-            "exp": datetime.utcnow() + timedelta(hours=10),  # Token válido por 10 horas
+            "exp": self._refresh_expiration(),
             "iat": datetime.utcnow(),
             "scope": "refresh_token",
             "sub": user.email,
         }
+        if family_id:
+            payload["jti"] = jti or str(uuid4())
+            payload["fam"] = family_id
         return jwt.encode(payload, self.secret, algorithm=self.algorithm)
     
-    def refresh_token(self, refresh_token: str) -> str:
-        """Actualizar un token de acceso usando un token de actualización."""
+    def refresh_token(self, refresh_token: str, db: Session = None) -> tuple:
+        """
+        Rotar un token de actualización: devuelve (token de acceso, nuevo token de actualización).
+        Reutilizar un token ya rotado revoca toda su familia.
+        """
+        db = db if db is not None else self.db
         try:
             payload = jwt.decode(refresh_token, self.secret, algorithms=[self.algorithm])
             if payload and payload["scope"] == "refresh_token":
-                if self.db is None:
+                if db is None:
                     raise HTTPException(
                         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                         detail="Database session not available"
                     )
-                user = UserRepository(self.db).get_user_by_email(payload["sub"])
-                return self.encode_token(user)
+                family_id = payload.get("fam")
+                if family_id is None:
+                    # Token anterior a las familias: se abre una nueva
+                    user = UserRepository(db).get_login_data(payload["sub"])
+                    if user is None:
+                        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+                    return self.issue_tokens(user, db)
+                if self.revocations.is_revoked(family_id):
+                    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token revoked")
+                new_jti = str(uuid4())
+                if self.token_store is not None and not self.token_store.rotate(
+                    family_id, payload.get("jti"), new_jti, self._refresh_expiration().timestamp(), db=db
+                ):
+                    self.token_store.revoke_family(family_id, db=db)
+                    self.revocations.add(family_id)
+                    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token reused")
+                user = UserRepository(db).get_login_data(payload["sub"])
+                if user is None:
+                    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+                return self.encode_token(user, family_id), self.encode_refresh_token(user, family_id, new_jti)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid scope for token"
@@ -0,0 +1,68 @@
+"""
+Hash y verificación de contraseñas con bcrypt en un pool de hilos propio.
+
+bcrypt tarda cientos de milisegundos por operación. Ejecutarlo en el hilo de
+la petición hace que un pico de inicios de sesión ocupe todos los hilos del
+servidor y retrase peticiones que no tienen nada que ver. Aquí las operaciones
+van a un pool acotado (bcrypt libera el GIL, así que los hilos trabajan en
+paralelo) y, si la cola supera max_queue, se rechazan al momento con
+HasherBusyError en lugar de acumular esperas.
+
+hash() y verify() esperan el resultado en el hilo de la petición, así que
+workers + max_queue es también el máximo de hilos del threadpool que puede
+ocupar bcrypt; src/config/security.py lo limita a la mitad de THREADPOOL_SIZE.
+"""
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import bcrypt
+
+
+class HasherBusyError(RuntimeError):
+    """La cola de operaciones de bcrypt está llena."""
+
+
+class PasswordHasher:
+    """Pool acotado para bcrypt con coste configurable."""
+
+    def __init__(self, rounds: int = 12, workers: int = 2, max_queue: int = 64) -> None:
+        self.rounds = rounds
+        self.workers = workers
+        self.max_queue = max_queue
+        self.pending = 0
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def hash(self, password: str) -> str:
+        """Hashear una contraseña con el coste configurado."""
+        return self._submit(self._hash, password).result()
+
+    def verify(self, password: str, hashed: str) -> bool:
+        """Verificar una contraseña contra su hash."""
+        return self._submit(self._verify, password, hashed).result()
+
+    def _submit(self, function, *args) -> Future:
+        with self._lock:
+            if self.pending >= self.workers + self.max_queue:
+                raise HasherBusyError("Demasiadas operaciones de contraseña en cola")
+            self.pending += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+        try:
+            future = self._executor.submit(function, *args)
+        except BaseException:
+            self._done(None)
+            raise
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future) -> None:
+        with self._lock:
+            self.pending -= 1
+
+    def _hash(self, password: str) -> str:
+        return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=self.rounds)).decode()
+
+    @staticmethod
+    def _verify(password: str, hashed: str) -> bool:
+        return bcrypt.checkpw(password.encode(), hashed.encode())
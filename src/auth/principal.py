@@ -0,0 +1,79 @@
+"""
+Usuario autenticado de la petición y guardas de rol declarativas.
+
+get_principal decodifica el token una sola vez por petición (FastAPI cachea
+las dependencias dentro de la petición) y lo convierte en un Principal tipado.
+require_role(n) devuelve una dependencia que además exige rol >= n y, salvo que
+se indique lo contrario, la cuenta activa. Un token ausente o inválido responde
+401 (decode_token); un rol insuficiente o una cuenta inactiva, 403:
+
+    @router.post('')
+    def create(principal: Annotated[Principal, Depends(require_role(2))], ...):
+        ... principal.email ...
+"""
+from dataclasses import dataclass, field
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.responses import JSONResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from src.auth import auth_handler
+
+# Sin cabecera se responde 401 (HTTPBearer por defecto responde 403)
+bearer = HTTPBearer(auto_error=False)
+
+class AuthorizationError(HTTPException):
+    """El usuario no cumple la guarda de la ruta."""
+
+    def __init__(self, message: str, status_code: int = status.HTTP_403_FORBIDDEN) -> None:
+        super().__init__(status_code=status_code, detail=message)
+
+@dataclass(frozen=True)
+class Principal:
+    """Datos del usuario autenticado tomados del token de acceso."""
+
+    email: str
+    role: int
+    status: bool
+    is_verified: bool
+    name: str = None
+    id_number: str = None
+    final_date: str = None
+    gym_id: int = None
+    # Claims del token tal como llegaron (para devolverlos en /user_data)
+    claims: dict = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> "Principal":
+        return cls(
+            email=payload.get("sub"),
+            role=payload.get("user.role") or 0,
+            status=bool(payload.get("user.status")),
+            is_verified=bool(payload.get("user.is_verified")),
+            name=payload.get("user.name"),
+            id_number=payload.get("user.id_number"),
+            final_date=payload.get("user.final_date"),
+            gym_id=payload.get("user.gym_id"),
+            claims=payload,
+        )
+
+async def get_principal(credentials: Annotated[HTTPAuthorizationCredentials, Depends(bearer)]) -> Principal:
+    """Usuario autenticado de la petición."""
+    if credentials is None:
+        raise AuthorizationError("Not authenticated", status.HTTP_401_UNAUTHORIZED)
+    return Principal.from_payload(auth_handler.decode_token(credentials.credentials))
+
+def require_role(min_role: int = 1, active: bool = True):
+    """Dependencia que exige rol >= min_role y, si active, la cuenta activa."""
+    async def guard(principal: Annotated[Principal, Depends(get_principal)]) -> Principal:
+        if principal.role < min_role:
+            raise AuthorizationError("You do not have the necessary permissions")
+        if active and not principal.status:
+            raise AuthorizationError("Your account is inactive")
+        return principal
+    return guard
+
+async def authorization_error_handler(request: Request, exc: AuthorizationError) -> JSONResponse:
+    """Responder a las guardas con el mismo formato que el resto de la API."""
+    return JSONResponse(content={"message": exc.detail, "data": None}, status_code=exc.status_code)
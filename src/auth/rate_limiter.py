@@ -0,0 +1,203 @@
+"""
+Límite de peticiones por IP y por email para las rutas de autenticación.
+
+/login, /register, /forgot_password y /resend-verification hacen bcrypt o
+envían correo, así que un solo cliente insistente puede ocupar un worker
+entero. Cada ruta tiene sus políticas ("limit/window" por IP y por email) y,
+al superarlas, se responde 429 con Retry-After antes de tocar la base de datos.
+
+Backends:
+    MemoryRateLimitBackend  token bucket en memoria del proceso (un solo worker)
+    RedisRateLimitBackend   ventana deslizante aproximada en el almacén
+                            compartido (INCR + EXPIRE), válida con varios workers
+"""
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from fastapi import HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+from prometheus_client import Counter
+
+from src.config.shared_store import redis_client
+
+RATE_LIMITED = Counter(
+    "auth_rate_limited_total",
+    "Peticiones rechazadas por el límite de peticiones por ruta y clave (ip/email)",
+    ["route", "key"],
+)
+
+
+class RateLimitExceeded(HTTPException):
+    """Límite superado; Retry-After indica los segundos que hay que esperar."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, try again later",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+async def rate_limit_error_handler(request, exc: RateLimitExceeded) -> JSONResponse:
+    """Responder con el formato habitual de la API."""
+    return JSONResponse(content={"message": exc.detail, "data": None}, status_code=exc.status_code, headers=exc.headers)
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """limit peticiones cada window segundos."""
+
+    limit: int
+    window: float
+
+    @classmethod
+    def parse(cls, value: str):
+        """Política a partir de "limit/window" (p. ej. "5/60"); None si está vacía o es 0."""
+        if not value or not value.strip():
+            return None
+        limit, _, window = value.partition("/")
+        policy = cls(int(limit), float(window or 60))
+        return policy if policy.limit > 0 else None
+
+
+class MemoryRateLimitBackend:
+    """Token bucket por clave: capacidad limit que se rellena a limit/window por segundo."""
+
+    blocking = False
+
+    def __init__(self, max_keys: int = 100000) -> None:
+        self.max_keys = max_keys
+        # clave -> (tokens, updated, full_at), del uso más antiguo al más reciente
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, policy: RateLimitPolicy) -> int:
+        """Consumir un token; devuelve 0 si se permite o los segundos de espera."""
+        now = time.monotonic()
+        rate = policy.limit / policy.window
+        with self._lock:
+            tokens, updated, _ = self._buckets.get(key, (policy.limit, now, now))
+            tokens = min(policy.limit, tokens + (now - updated) * rate)
+            if tokens < 1:
+                self._store(key, tokens, now, rate, policy.limit)
+                return max(1, math.ceil((1 - tokens) / rate))
+            if key not in self._buckets and len(self._buckets) >= self.max_keys:
+                self._prune(now)
+            self._store(key, tokens - 1, now, rate, policy.limit)
+            return 0
+
+    def _store(self, key: str, tokens: float, now: float, rate: float, limit: int) -> None:
+        # full_at: instante en que el cubo vuelve a estar lleno con su propia política
+        self._buckets[key] = (tokens, now, now + (limit - tokens) / rate)
+        self._buckets.move_to_end(key)
+
+    def _prune(self, now: float) -> None:
+        # Un cubo que ya se ha rellenado equivale a uno nuevo: se puede olvidar
+        full = [key for key, (_, _, full_at) in self._buckets.items() if full_at <= now]
+        for key in full:
+            del self._buckets[key]
+        # Si no basta, se descartan los de uso más antiguo (con holgura para no repetir
+        # el recorrido en cada clave nueva); los activos conservan su estado
+        target = self.max_keys - max(1, self.max_keys // 10)
+        while len(self._buckets) > target:
+            self._buckets.popitem(last=False)
+
+
+class RedisRateLimitBackend:
+    """Ventana deslizante aproximada: contador de la ventana actual más la parte de la anterior."""
+
+    blocking = True
+
+    def __init__(self, client, prefix: str = "rl") -> None:
+        self.client = client
+        self.prefix = prefix
+
+    def hit(self, key: str, policy: RateLimitPolicy) -> int:
+        now = time.time()
+        current = int(now // policy.window)
+        elapsed = now - current * policy.window
+        current_key = f"{self.prefix}:{key}:{current}"
+        count = self.client.incr(current_key)
+        if count == 1:
+            self.client.expire(current_key, math.ceil(policy.window * 2))
+        previous = int(self.client.get(f"{self.prefix}:{key}:{current - 1}") or 0)
+        weight = 1 - elapsed / policy.window
+        if previous * weight + count <= policy.limit:
+            return 0
+        # Los intentos rechazados no cuentan, así el cliente puede volver tras Retry-After
+        self.client.incr(current_key, -1)
+        count -= 1
+        if count >= policy.limit or not previous:
+            return max(1, math.ceil(policy.window - elapsed))
+        # Espera hasta que la parte de la ventana anterior deje sitio a una petición más
+        wait = policy.window * (1 - (policy.limit - count - 1) / previous) - elapsed
+        return max(1, math.ceil(wait))
+
+
+class RateLimiter:
+    """Políticas por ruta ({ruta: {"ip": política, "email": política}}) sobre un backend."""
+
+    def __init__(self, backend, policies: dict, trust_proxy: bool = False) -> None:
+        self.backend = backend
+        self.policies = policies
+        self.trust_proxy = trust_proxy
+
+    def client_ip(self, request: Request) -> str:
+        if self.trust_proxy:
+            forwarded = request.headers.get("x-forwarded-for")
+            if forwarded:
+                return forwarded.split(",")[0].strip()
+        return request.client.host if request.client else "unknown"
+
+    @staticmethod
+    async def request_email(request: Request):
+        """Email del cuerpo: {"email": ...} o la cadena sola de Body(...)."""
+        try:
+            body = await request.json()
+        except Exception:
+            return None
+        if isinstance(body, dict):
+            body = body.get("email")
+        return body.strip().lower() if isinstance(body, str) and body.strip() else None
+
+    async def check(self, route: str, request: Request) -> None:
+        """Aplicar las políticas de route; lanza RateLimitExceeded con la mayor espera."""
+        policies = self.policies.get(route) or {}
+        retry_after, limited_by = 0, None
+        for kind, policy in policies.items():
+            if policy is None:
+                continue
+            value = self.client_ip(request) if kind == "ip" else await self.request_email(request)
+            if value is None:
+                continue
+            key = f"{route}:{kind}:{value}"
+            if self.backend.blocking:
+                wait = await run_in_threadpool(self.backend.hit, key, policy)
+            else:
+                wait = self.backend.hit(key, policy)
+            if wait > retry_after:
+                retry_after, limited_by = wait, kind
+        if retry_after:
+            RATE_LIMITED.labels(route, limited_by).inc()
+            raise RateLimitExceeded(retry_after)
+
+    def limit(self, route: str):
+        """Dependencia de FastAPI que aplica las políticas de route."""
+        async def dependency(request: Request) -> None:
+            await self.check(route, request)
+        return dependency
+
+
+def build_rate_limiter(backend: str, policies: dict, redis_url: str = None, trust_proxy: bool = False) -> RateLimiter:
+    """Limitador configurado con RATE_LIMIT_BACKEND ("memory", "redis" u "off") y políticas "limit/window"."""
+    policies = {} if backend == "off" else {
+        route: {kind: RateLimitPolicy.parse(value) for kind, value in route_policies.items()}
+        for route, route_policies in policies.items()
+    }
+    if backend == "redis":
+        return RateLimiter(RedisRateLimitBackend(redis_client(redis_url)), policies, trust_proxy)
+    return RateLimiter(MemoryRateLimitBackend(), policies, trust_proxy)
@@ -0,0 +1,123 @@
+"""
+Lista de familias de tokens revocadas, consultable en memoria en O(1).
+
+decode_token pregunta en cada petición si la familia del token ("fam") está
+revocada, dentro del event loop, así que aquí nunca se consulta el almacén: se
+mantiene un filtro de Bloom con las familias revocadas (un "no" es definitivo)
+y el conjunto de esas familias para descartar los falsos positivos del "quizá".
+Ambos se reconstruyen desde el almacén cada refresh_interval segundos en un
+hilo aparte, uno a la vez; mientras tanto se sigue usando la lista anterior.
+Las revocaciones hechas en otras instancias llegan en ese plazo; las de esta
+instancia son inmediatas.
+"""
+import hashlib
+import logging
+import math
+import threading
+import time
+
+from prometheus_client import Counter
+
+REVOCATION_CHECKS = Counter(
+    "auth_revocation_checks_total",
+    "Comprobaciones de revocación de tokens por resultado (clear/revoked/false_positive)",
+    ["result"],
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """Filtro de Bloom para capacity elementos con la tasa de falsos positivos indicada."""
+
+    def __init__(self, capacity: int = 10000, error_rate: float = 0.001) -> None:
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.sha256(item.encode()).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:16], "big") | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class RevocationList:
+    """Familias revocadas: filtro de Bloom refrescado desde el almacén de tokens."""
+
+    def __init__(self, store=None, refresh_interval: float = 5.0, capacity: int = 10000, error_rate: float = 0.001) -> None:
+        self.store = store
+        self.refresh_interval = refresh_interval
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._filter = BloomFilter(capacity, error_rate)
+        self._local = set()
+        self._revoked = set()
+        self._refreshed_at = 0.0 if store is not None else float("inf")
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def refresh(self) -> None:
+        """Reconstruir el filtro con las familias revocadas del almacén."""
+        stored = set(self.store.revoked_ids())
+        with self._lock:
+            # Las revocaciones locales que ya están en el almacén no hace falta recordarlas
+            self._local -= stored
+            revoked = stored | self._local
+            bloom = BloomFilter(max(self.capacity, len(revoked) * 2), self.error_rate)
+            for family_id in revoked:
+                bloom.add(family_id)
+            self._filter = bloom
+            self._revoked = revoked
+            self._refreshed_at = time.monotonic()
+
+    def add(self, family_id: str) -> None:
+        """Marcar una familia como revocada en esta instancia (el almacén ya la tiene)."""
+        with self._lock:
+            self._filter.add(family_id)
+            self._local.add(family_id)
+            self._revoked = self._revoked | {family_id}
+
+    def start(self) -> None:
+        """Cargar la lista al arrancar la aplicación, sin esperar a la primera petición."""
+        if self.store is not None:
+            self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        """Lanzar el refresco en un hilo si no hay otro en curso."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._refresh_in_background, name="revocation-refresh", daemon=True)
+        self._thread.start()
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            # Sin almacén se sigue con la lista anterior y se reintenta en el siguiente intervalo
+            logger.exception("No se pudo refrescar la lista de tokens revocados")
+            self._refreshed_at = time.monotonic()
+        finally:
+            with self._lock:
+                self._thread = None
+
+    def is_revoked(self, family_id: str) -> bool:
+        if not family_id:
+            return False
+        if time.monotonic() - self._refreshed_at > self.refresh_interval:
+            self._schedule_refresh()
+        if family_id not in self._filter:
+            REVOCATION_CHECKS.labels("clear").inc()
+            return False
+        revoked = family_id in self._revoked
+        REVOCATION_CHECKS.labels("revoked" if revoked else "false_positive").inc()
+        return revoked
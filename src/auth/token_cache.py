@@ -0,0 +1,90 @@
+"""
+Caché LRU de tokens de acceso ya verificados.
+
+Las apps móviles envían el mismo token cientos de veces por hora y cada
+decode_token repetía la verificación HMAC y el parseo del JSON. Aquí se guarda
+el payload verificado bajo el SHA-256 del token (el token en sí no se guarda)
+hasta su "exp"; los tokens revocados salen de la caché y quedan en una lista
+de revocados hasta que caducan. Esa lista también está acotada: al llenarse se
+descartan primero los ya caducados y después los que caducan antes.
+"""
+import hashlib
+import heapq
+import threading
+import time
+from collections import OrderedDict
+
+from prometheus_client import Counter
+
+TOKEN_CACHE_REQUESTS = Counter(
+    "auth_token_cache_requests_total",
+    "Consultas a la caché de tokens verificados por resultado (hit/miss)",
+    ["result"],
+)
+
+
+class TokenCache:
+    """Payloads de tokens verificados, acotados a max_size entradas (y otras tantas revocadas)."""
+
+    def __init__(self, max_size: int = 10000, max_revoked: int = None) -> None:
+        self.max_size = max_size
+        # Con la caché desactivada (max_size 0) la lista de revocados sigue haciendo falta
+        self.max_revoked = max_revoked or max_size or 10000
+        self._entries = OrderedDict()
+        self._revoked = {}
+        # (caducidad, clave) de los revocados: el primero es el que antes caduca
+        self._revoked_heap = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, key: bytes):
+        """Payload del token si está en caché y no ha caducado; None si no."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                payload, expires_at = entry
+                if time.time() < expires_at:
+                    self._entries.move_to_end(key)
+                    TOKEN_CACHE_REQUESTS.labels("hit").inc()
+                    return dict(payload)
+                del self._entries[key]
+        TOKEN_CACHE_REQUESTS.labels("miss").inc()
+        return None
+
+    def put(self, key: bytes, payload: dict) -> None:
+        if self.max_size <= 0 or "exp" not in payload:
+            return
+        with self._lock:
+            if key in self._revoked:
+                return
+            self._entries[key] = (dict(payload), payload["exp"])
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def revoke(self, key: bytes, expires_at: float) -> None:
+        """Sacar el token de la caché y rechazarlo hasta que caduque."""
+        with self._lock:
+            self._entries.pop(key, None)
+            if key not in self._revoked:
+                while len(self._revoked) >= self.max_revoked and self._revoked_heap:
+                    exp, oldest = heapq.heappop(self._revoked_heap)
+                    # Las entradas del heap de claves ya borradas o revocadas de nuevo se ignoran
+                    if self._revoked.get(oldest) == exp:
+                        del self._revoked[oldest]
+            self._revoked[key] = expires_at
+            heapq.heappush(self._revoked_heap, (expires_at, key))
+            if len(self._revoked_heap) > 2 * self.max_revoked:
+                self._revoked_heap = [(exp, k) for k, exp in self._revoked.items()]
+                heapq.heapify(self._revoked_heap)
+
+    def is_revoked(self, key: bytes) -> bool:
+        with self._lock:
+            expires_at = self._revoked.get(key)
+            if expires_at is not None and expires_at <= time.time():
+                del self._revoked[key]
+                return False
+            return expires_at is not None
@@ -0,0 +1,189 @@
+"""
+Almacén de familias de tokens de actualización.
+
+Cada inicio de sesión abre una familia: el token de acceso y el de
+actualización llevan su id en el claim "fam". Solo el último token de
+actualización emitido (current_jti) es válido; al usarlo se rota por uno nuevo
+con una sola operación atómica (UPDATE condicional en SQL, SET ... GET en
+Redis). Si llega uno ya rotado se trata como robado y se revoca la familia.
+
+Las operaciones aceptan la sesión de la petición (db): SQLTokenStore escribe en
+ella en lugar de pedir una segunda conexión al pool mientras la petición ya
+tiene una, lo que con carga agota el pool (cada petición esperando por otra).
+
+Backends:
+    SQLTokenStore    tabla refresh_token_families (por defecto)
+    RedisTokenStore  cualquier cliente compatible con redis-py (ver
+                     src/config/shared_store.py; "memory://" usa LocalRedis)
+"""
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from sqlalchemy import select, update
+
+from src.config.routing_session import use_primary
+from src.config.shared_store import redis_client
+from src.models.refresh_token_family import RefreshTokenFamily
+
+
+class SQLTokenStore:
+    """Familias en la tabla refresh_token_families."""
+
+    def __init__(self, session_factory) -> None:
+        self.session_factory = session_factory
+
+    @contextmanager
+    def _session(self, db=None):
+        """La sesión de la petición si se pasa; si no, una propia que lee de la primaria."""
+        if db is not None:
+            yield db
+            return
+        with self.session_factory() as db:
+            # Una réplica con retraso no vería las revocaciones recientes
+            yield use_primary(db)
+
+    def issue(self, family_id: str, user_email: str, jti: str, expires_at: float, db=None) -> None:
+        with self._session(db) as db:
+            db.add(RefreshTokenFamily(
+                family_id=family_id,
+                user_email=user_email,
+                current_jti=jti,
+                created_at=datetime.utcnow(),
+                expires_at=datetime.utcfromtimestamp(expires_at),
+            ))
+            db.commit()
+
+    def rotate(self, family_id: str, jti: str, new_jti: str, expires_at: float, db=None) -> bool:
+        """Sustituir jti por new_jti; False si jti ya no es el vigente o la familia está revocada."""
+        with self._session(db) as db:
+            result = db.execute(
+                update(RefreshTokenFamily)
+                .where(
+                    RefreshTokenFamily.family_id == family_id,
+                    RefreshTokenFamily.current_jti == jti,
+                    RefreshTokenFamily.revoked_at.is_(None),
+                )
+                .values(current_jti=new_jti, expires_at=datetime.utcfromtimestamp(expires_at))
+            )
+            db.commit()
+            return result.rowcount == 1
+
+    def revoke_family(self, family_id: str, db=None) -> None:
+        with self._session(db) as db:
+            db.execute(
+                update(RefreshTokenFamily)
+                .where(RefreshTokenFamily.family_id == family_id, RefreshTokenFamily.revoked_at.is_(None))
+                .values(revoked_at=datetime.utcnow())
+            )
+            db.commit()
+
+    def revoke_user(self, user_email: str, db=None) -> list:
+        """Revocar todas las familias vigentes del usuario y devolver sus ids."""
+        now = datetime.utcnow()
+        with self._session(db) as db:
+            family_ids = db.scalars(
+                select(RefreshTokenFamily.family_id).where(
+                    RefreshTokenFamily.user_email == user_email,
+                    RefreshTokenFamily.revoked_at.is_(None),
+                    RefreshTokenFamily.expires_at > now,
+                )
+            ).all()
+            if family_ids:
+                db.execute(
+                    update(RefreshTokenFamily)
+                    .where(RefreshTokenFamily.family_id.in_(family_ids))
+                    .values(revoked_at=now)
+                )
+                db.commit()
+            return list(family_ids)
+
+    def is_revoked(self, family_id: str) -> bool:
+        with self._session() as db:
+            revoked_at = db.scalar(
+                select(RefreshTokenFamily.revoked_at).where(RefreshTokenFamily.family_id == family_id)
+            )
+            return revoked_at is not None
+
+    def revoked_ids(self) -> list:
+        """Familias revocadas que aún no han caducado."""
+        with self._session() as db:
+            return list(db.scalars(
+                select(RefreshTokenFamily.family_id).where(
+                    RefreshTokenFamily.revoked_at.is_not(None),
+                    RefreshTokenFamily.expires_at > datetime.utcnow(),
+                )
+            ).all())
+
+
+class RedisTokenStore:
+    """Familias en Redis (o cualquier servidor compatible).
+
+    rt:cur:{familia}   jti vigente (caduca con la familia)
+    rt:user:{email}    conjunto de familias del usuario
+    rt:revoked         zset de familias revocadas con su caducidad como score
+    """
+
+    def __init__(self, client, prefix: str = "rt") -> None:
+        self.client = client
+        self.prefix = prefix
+
+    def _key(self, *parts) -> str:
+        return ":".join((self.prefix,) + parts)
+
+    @staticmethod
+    def _ttl(expires_at: float) -> int:
+        return max(1, int(expires_at - time.time()))
+
+    def issue(self, family_id: str, user_email: str, jti: str, expires_at: float, db=None) -> None:
+        self.client.set(self._key("cur", family_id), jti, ex=self._ttl(expires_at))
+        self.client.set(self._key("owner", family_id), user_email, ex=self._ttl(expires_at))
+        self.client.sadd(self._key("user", user_email), family_id)
+
+    def rotate(self, family_id: str, jti: str, new_jti: str, expires_at: float, db=None) -> bool:
+        if self.is_revoked(family_id):
+            return False
+        previous = self.client.set(self._key("cur", family_id), new_jti, ex=self._ttl(expires_at), get=True)
+        if isinstance(previous, bytes):
+            previous = previous.decode()
+        if previous != jti:
+            return False
+        self.client.expire(self._key("owner", family_id), self._ttl(expires_at))
+        return True
+
+    def revoke_family(self, family_id: str, db=None) -> None:
+        ttl = self.client.ttl(self._key("cur", family_id))
+        expires_at = time.time() + (ttl if ttl and ttl > 0 else 0)
+        self.client.zadd(self._key("revoked"), {family_id: expires_at})
+
+    def revoke_user(self, user_email: str, db=None) -> list:
+        family_ids = [
+            family_id.decode() if isinstance(family_id, bytes) else family_id
+            for family_id in self.client.smembers(self._key("user", user_email))
+        ]
+        revoked = [family_id for family_id in family_ids if not self.is_revoked(family_id)]
+        for family_id in revoked:
+            self.revoke_family(family_id)
+        self.client.delete(self._key("user", user_email))
+        return revoked
+
+    def is_revoked(self, family_id: str) -> bool:
+        score = self.client.zscore(self._key("revoked"), family_id)
+        return score is not None and score > time.time()
+
+    def revoked_ids(self) -> list:
+        now = time.time()
+        self.client.zremrangebyscore(self._key("revoked"), "-inf", now)
+        return [
+            family_id.decode() if isinstance(family_id, bytes) else family_id
+            for family_id in self.client.zrangebyscore(self._key("revoked"), now, "+inf")
+        ]
+
+
+def build_token_store(backend: str, redis_url: str = None, session_factory=None):
+    """Almacén configurado con TOKEN_STORE ("sql" o "redis") y REDIS_URL."""
+    if backend == "redis":
+        return RedisTokenStore(redis_client(redis_url))
+    if session_factory is None:
+        from src.config.database import SessionLocal as session_factory
+    return SQLTokenStore(session_factory)
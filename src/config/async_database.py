@@ -0,0 +1,63 @@
+"""
+Motor y sesiones asíncronas de SQLAlchemy.
+
+Convive con el motor síncrono de src/config/database.py mientras los
+routers migran a endpoints async.
+"""
+from fastapi import Request
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from src.config import sqlite_database_connector
+from src.config.database import DB_BACKEND, DB_REPLICA_URLS, POOL_OPTIONS, SQLALCHEMY_DATABASE_URL, get_route_name, slow_query_log
+from src.config.metrics import InstrumentedAsyncAdaptedQueuePool, instrument_engine
+from src.config.pool_monitor import PoolMonitor
+from src.config.routing_session import RoutingSession
+
+ASYNC_DRIVERS = {"postgresql": "postgresql+asyncpg", "sqlite": "sqlite+aiosqlite"}
+
+def to_async_url(url: str) -> str:
+    """Cambiar el driver de una URL síncrona por su equivalente asíncrono."""
+    parsed = make_url(url)
+    return parsed.set(drivername=ASYNC_DRIVERS[parsed.get_backend_name()]).render_as_string(hide_password=False)
+
+ASYNC_SQLALCHEMY_DATABASE_URL = to_async_url(SQLALCHEMY_DATABASE_URL)
+
+if DB_BACKEND == "sqlite":
+    async_engine = sqlite_database_connector.create_async_sqlite_engine(
+        ASYNC_SQLALCHEMY_DATABASE_URL, poolclass=InstrumentedAsyncAdaptedQueuePool, **sqlite_database_connector.SQLITE_POOL_OPTIONS
+    )
+    async_replica_engines = []
+else:
+    async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL, poolclass=InstrumentedAsyncAdaptedQueuePool, **POOL_OPTIONS)
+    async_replica_engines = [
+        create_async_engine(to_async_url(url), poolclass=InstrumentedAsyncAdaptedQueuePool, **POOL_OPTIONS)
+        for url in DB_REPLICA_URLS
+    ]
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    replicas=[replica.sync_engine for replica in async_replica_engines],
+    autoflush=False,
+    expire_on_commit=False
+)
+
+async_pool_monitor = PoolMonitor()
+async_pool_monitor.attach(async_engine.sync_engine, Session)
+
+instrument_engine(async_engine, "async_primary", async_pool_monitor)
+for index, replica_engine in enumerate(async_replica_engines):
+    instrument_engine(replica_engine, f"async_replica_{index}")
+
+for db_engine in [async_engine, *async_replica_engines]:
+    slow_query_log.attach(db_engine)
+
+async def get_async_db(request: Request = None):
+    """Obtener una sesión asíncrona de base de datos ligada a la petición actual."""
+    async with AsyncSessionLocal() as db:
+        if request is not None:
+            db.info["route"] = get_route_name(request)
+        yield db
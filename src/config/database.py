@@ -1,6 +1,12 @@
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from fastapi import Request
+from src.config.metrics import InstrumentedQueuePool, instrument_engine
+from src.config.pool_monitor import PoolMonitor
+from src.config.routing_session import RoutingSession
+from src.config.slow_query_log import SlowQueryLog
+from src.config import sqlite_database_connector
 
 import os
 from dotenv import load_dotenv
@@ -12,10 +18,18 @@ DB_PASS = os.getenv("DB_PASS")
 DB_HOST = os.getenv("DB_HOST")
 DB_PORT = os.getenv("DB_PORT")
 
-SQLALCHEMY_DATABASE_URL = f"postgresql+psycopg2://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+# "postgresql" (por defecto) o "sqlite" para instalaciones pequeñas (ver sqlite_database_connector.py)
+DB_BACKEND = os.getenv("DB_BACKEND", "postgresql").lower()
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
+if DB_BACKEND == "sqlite":
+    SQLALCHEMY_DATABASE_URL = sqlite_database_connector.database_url
+else:
+    SQLALCHEMY_DATABASE_URL = f"postgresql+psycopg2://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+
+# URLs de réplicas de solo lectura separadas por comas (opcional)
+DB_REPLICA_URLS = [url.strip() for url in os.getenv("DB_REPLICA_URLS", "").split(",") if url.strip()]
+
+POOL_OPTIONS = dict(
     pool_size=20,  # Aumentar el tamaño del pool
     max_overflow=30,  # Aumentar el overflow
     pool_timeout=60,  # Aumentar el timeout
@@ -23,13 +37,43 @@ engine = create_engine(
     pool_pre_ping=True  # Verificar conexiones antes de usarlas
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+if DB_BACKEND == "sqlite":
+    engine = sqlite_database_connector.create_sqlite_engine(
+        SQLALCHEMY_DATABASE_URL, poolclass=InstrumentedQueuePool, **sqlite_database_connector.SQLITE_POOL_OPTIONS
+    )
+    replica_engines = []
+else:
+    engine = create_engine(SQLALCHEMY_DATABASE_URL, poolclass=InstrumentedQueuePool, **POOL_OPTIONS)
+    replica_engines = [create_engine(url, poolclass=InstrumentedQueuePool, **POOL_OPTIONS) for url in DB_REPLICA_URLS]
+
+# Las lecturas van a las réplicas y las escrituras (y lo que venga después) a la primaria
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, bind=engine, replicas=replica_engines)
+
+pool_monitor = PoolMonitor()
+pool_monitor.attach(engine, SessionLocal)
+
+instrument_engine(engine, "primary", pool_monitor)
+for index, replica_engine in enumerate(replica_engines):
+    instrument_engine(replica_engine, f"replica_{index}")
+
+# Consultas lentas de todos los motores (también los asíncronos de async_database.py)
+slow_query_log = SlowQueryLog()
+for db_engine in [engine, *replica_engines]:
+    slow_query_log.attach(db_engine)
 
 Base = declarative_base()
 
-def get_db():
-    """Obtener una sesión de base de datos."""
+def get_route_name(request: Request) -> str:
+    """Nombre de la ruta que atiende la petición, p. ej. "GET /exercise/{id}"."""
+    route = request.scope.get("route")
+    path = getattr(route, "path", None) or request.url.path
+    return f"{request.method} {path}"
+
+def get_db(request: Request = None):
+    """Obtener una sesión de base de datos ligada a la petición actual."""
     db = SessionLocal()
+    if request is not None:
+        db.info["route"] = get_route_name(request)
     try:
         yield db
     finally:
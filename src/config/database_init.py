@@ -1,3 +1,17 @@
+"""
+Datos iniciales de los catálogos (roles, días, músculos, máquinas, ejercicios...).
+
+Cada catálogo se inserta en una sola sentencia con INSERT ... ON CONFLICT DO
+NOTHING, así que volver a ejecutarlo no duplica ni pisa filas existentes.
+init_data guarda una huella (SHA-256) de los datos sembrados: si no han
+cambiado desde el último arranque, basta una consulta para saltarse la siembra.
+"""
+import hashlib
+import json
+from datetime import date, datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 from src.models.role import Role
 from src.models.week_day import WeekDay
@@ -6,515 +20,549 @@ from src.models.specific_muscle import SpecificMuscle
 from src.models.dificulty import Dificulty
 from src.models.machine import Machine
 from src.models.exercise import Exercise
+from src.models.seed_fingerprint import SeedFingerprint
+
+SEED_NAME = "init_data"
+
+ROLES = [
+    {"id": 1, "name": "Usuario Logueado", "description": "Rol de usuario logueado"},
+    {"id": 2, "name": "Usuario Premium", "description": "Rol de usuario premium"},
+    {"id": 3, "name": "Gym", "description": "Rol de gimnasio"},
+    {"id": 4, "name": "Admin", "description": "Rol de administrador"}
+]
+
+WEEK_DAYS = [
+    {"id": 1, "name": "Lunes"},
+    {"id": 2, "name": "Martes"},
+    {"id": 3, "name": "Miércoles"},
+    {"id": 4, "name": "Jueves"},
+    {"id": 5, "name": "Viernes"},
+    {"id": 6, "name": "Sábado"},
+    {"id": 7, "name": "Domingo"}
+]
+
+MUSCLES = [
+    {"id": 1, "name": "Pecho", "description": "Grupo muscular en la parte delantera del torso, responsable de movimientos de empuje."},
+    {"id": 2, "name": "Espalda", "description": "Grupo muscular en la parte posterior del torso, involucrado en movimientos de tracción y estabilización."},
+    {"id": 3, "name": "Hombros", "description": "Grupo muscular ubicado en la parte superior del brazo, clave en movimientos de empuje y elevación."},
+    {"id": 4, "name": "Brazos", "description": "Grupo muscular que incluye los músculos en la parte superior del brazo, responsable de flexión y extensión del codo."},
+    {"id": 5, "name": "Antebrazos", "description": "Músculos responsables de la flexión y extensión de la muñeca y los dedos."},
+    {"id": 6, "name": "Abdomen", "description": "Grupo muscular en la parte frontal del torso, fundamental para la estabilidad del core y movimientos de flexión del tronco."},
+    {"id": 7, "name": "Zona Lumbar", "description": "Músculos en la parte baja de la espalda, esenciales para la estabilidad y extensión de la columna."},
+    {"id": 8, "name": "Glúteos", "description": "Grupo muscular en la parte posterior de la cadera, involucrado en la extensión de la cadera y estabilización."},
+    {"id": 9, "name": "Muslos", "description": "Grupo muscular en la parte frontal y posterior del muslo, responsable de la extensión y flexión de la rodilla."},
+    {"id": 10, "name": "Aductores", "description": "Grupo muscular en la parte interna del muslo, encargado de la aducción de la pierna."},
+    {"id": 11, "name": "Pantorrillas", "description": "Músculos en la parte inferior de la pierna, responsables de la flexión plantar del pie."},
+    {"id": 12, "name": "Serrato Anterior", "description": "Músculo en la parte lateral del torso, involucrado en la estabilización de la escápula."}
+]
+
+SPECIFIC_MUSCLES = [
+    {"id": 1, "name": "Pectoral Mayor", "muscle_id": 1, "description": "Músculo principal del pecho, responsable de la aducción y rotación interna del brazo."},
+    {"id": 2, "name": "Pectoral Menor", "muscle_id": 1, "description": "Músculo pequeño bajo el pectoral mayor, responsable de la estabilización de la escápula."},
+    {"id": 3, "name": "Trapecio", "muscle_id": 2, "description": "Músculo grande en la parte superior de la espalda, encargado de los movimientos de la escápula."},
+    {"id": 4, "name": "Dorsal Ancho", "muscle_id": 2, "description": "Músculo principal de la espalda, responsable de la extensión y aducción del brazo."},
+    {"id": 5, "name": "Deltoides Anterior", "muscle_id": 3, "description": "Parte frontal del músculo del hombro, involucrado en la flexión del brazo."},
+    {"id": 6, "name": "Bíceps", "muscle_id": 4, "description": "Músculo en la parte frontal del brazo, encargado de la flexión del codo y la supinación del antebrazo."},
+    {"id": 7, "name": "Tríceps", "muscle_id": 4, "description": "Músculo en la parte posterior del brazo, encargado de la extensión del codo."},
+    {"id": 8, "name": "Flexores del Antebrazo", "muscle_id": 5, "description": "Músculos encargados de la flexión de la muñeca y los dedos."},
+    {"id": 9, "name": "Extensores del Antebrazo", "muscle_id": 5, "description": "Músculos encargados de la extensión de la muñeca y los dedos."},
+    {"id": 10, "name": "Recto Abdominal", "muscle_id": 6, "description": "Músculo frontal del abdomen, responsable de la flexión del tronco."},
+    {"id": 11, "name": "Oblicuos Externos", "muscle_id": 6, "description": "Músculos laterales del abdomen, responsables de la rotación y flexión lateral del tronco."},
+    {"id": 12, "name": "Erector de la Columna", "muscle_id": 7, "description": "Músculos largos a lo largo de la columna vertebral, encargados de su extensión y estabilidad."},
+    {"id": 13, "name": "Glúteo Mayor", "muscle_id": 8, "description": "Músculo más grande de los glúteos, encargado de la extensión de la cadera."},
+    {"id": 14, "name": "Cuádriceps", "muscle_id": 9, "description": "Grupo muscular en la parte frontal del muslo, responsable de la extensión de la rodilla."},
+    {"id": 15, "name": "Isquiotibiales", "muscle_id": 9, "description": "Grupo muscular en la parte posterior del muslo, encargado de la flexión de la rodilla y extensión de la cadera."},
+    {"id": 16, "name": "Aductor Mayor", "muscle_id": 10, "description": "Músculo principal en la parte interna del muslo, responsable de la aducción de la pierna."},
+    {"id": 17, "name": "Gastrocnemio", "muscle_id": 11, "description": "Músculo grande en la pantorrilla, responsable de la flexión plantar del pie."},
+    {"id": 18, "name": "Sóleo", "muscle_id": 11, "description": "Músculo profundo en la pantorrilla, que también contribuye a la flexión plantar del pie."},
+    {"id": 19, "name": "Supraespinoso", "muscle_id": 2, "description": "Músculo del manguito rotador responsable de la abducción del brazo."},
+    {"id": 20, "name": "Romboides", "muscle_id": 2, "description": "Músculos entre la escápula y la columna vertebral, responsables de la retracción de la escápula."},
+    {"id": 21, "name": "Erectores Espinales", "muscle_id": 2, "description": "Grupo de músculos largos a lo largo de la columna vertebral, encargados de su extensión y estabilización."},
+    {"id": 22, "name": "Redondo Mayor", "muscle_id": 2, "description": "Músculo en la parte inferior del omóplato, responsable de la extensión y aducción del brazo."},
+    {"id": 23, "name": "Redondo Menor", "muscle_id": 2, "description": "Músculo del manguito rotador, involucrado en la rotación externa del brazo."},
+    {"id": 24, "name": "Infraespinoso", "muscle_id": 2, "description": "Músculo del manguito rotador que contribuye a la rotación externa del brazo."},
+    {"id": 25, "name": "Deltoides Medio", "muscle_id": 3, "description": "Parte media del músculo del hombro, encargada de la abducción del brazo."},
+    {"id": 26, "name": "Deltoides Posterior", "muscle_id": 3, "description": "Parte posterior del músculo del hombro, involucrada en la extensión y rotación externa del brazo."},
+    {"id": 27, "name": "Oblicuos Internos", "muscle_id": 6, "description": "Músculos en los laterales del abdomen, responsables de la flexión lateral y rotación del tronco."},
+    {"id": 28, "name": "Transverso Abdominal", "muscle_id": 6, "description": "Músculo profundo del abdomen, encargado de la compresión del abdomen y estabilidad del core."},
+    {"id": 29, "name": "Cuadrado Lumbar", "muscle_id": 7, "description": "Músculo profundo en la parte baja de la espalda, responsable de la estabilización y flexión lateral del tronco."},
+    {"id": 30, "name": "Glúteo Medio", "muscle_id": 8, "description": "Músculo en la parte lateral de la cadera, encargado de la abducción de la pierna y estabilización de la pelvis."},
+    {"id": 31, "name": "Glúteo Menor", "muscle_id": 8, "description": "Músculo debajo del glúteo medio, involucrado en la abducción y rotación interna de la pierna."},
+    {"id": 32, "name": "Aductor Largo", "muscle_id": 10, "description": "Músculo en la parte interna del muslo, responsable de la aducción de la pierna."},
+    {"id": 33, "name": "Aductor Corto", "muscle_id": 10, "description": "Músculo más profundo del aductor largo, encargado de la aducción y rotación externa de la pierna."},
+    {"id": 34, "name": "Grácil", "muscle_id": 10, "description": "Músculo delgado en la parte interna del muslo, responsable de la aducción de la pierna y flexión de la rodilla."},
+]
+
+DIFFICULTIES = [
+    {"id": 1, "name": "Facil"},
+    {"id": 2, "name": "Medio"},
+    {"id": 3, "name": "Dificil"},
+    {"id": 4, "name": "Experto"}
+]
+
+MACHINES = [
+    {"id": 1, "name": "Barra Olímpica", "description": "Una barra de acero utilizada en levantamientos compuestos como sentadillas, peso muerto y press de banca. Es fundamental para entrenamientos de fuerza y levantamiento olímpico."},
+    {"id": 2, "name": "Mancuernas", "description": "Pesos libres utilizados para entrenar de forma unilateral, lo que ayuda a equilibrar la fuerza entre ambos lados del cuerpo. Permiten una amplia variedad de ejercicios."},
+    {"id": 3, "name": "Máquina de Fuerza", "description": "Dispositivos mecánicos que guían el movimiento y permiten entrenar músculos específicos de manera controlada y segura, reduciendo el riesgo de lesiones."},
+    {"id": 4, "name": "Peso Corporal", "description": "Ejercicios que utilizan el peso del cuerpo como resistencia, como flexiones, sentadillas o dominadas, promoviendo fuerza funcional y estabilidad."},
+    {"id": 5, "name": "Banda Elástica", "description": "Bandas de resistencia que añaden tensión progresiva a los movimientos. Ideales para entrenar músculos estabilizadores, rehabilitación y movilidad."},
+    {"id": 6, "name": "Kettlebell", "description": "Pesas con forma de bola y una manija. Se utilizan para entrenamientos dinámicos que mejoran la fuerza, la potencia y la resistencia cardiovascular."},
+    {"id": 7, "name": "Balón Medicinal", "description": "Pelotas pesadas que se usan para mejorar la potencia explosiva, la coordinación y la estabilidad del núcleo mediante ejercicios dinámicos."},
+    {"id": 8, "name": "Cables", "description": "Sistema de poleas que permite movimientos multidireccionales y trabajar diferentes músculos. Ideal para entrenamientos funcionales y específicos."},
+    {"id": 9, "name": "Caja Plyo", "description": "Plataforma elevada utilizada para ejercicios pliométricos como saltos, que mejoran la potencia explosiva, agilidad y coordinación."},
+    {"id": 10, "name": "Banco", "description": "Superficie de apoyo para realizar ejercicios con mancuernas, barras u otros equipos. Es fundamental en ejercicios como press de banca y abdominales."},
+    {"id": 11, "name": "Máquina Smith", "description": "Barra guiada que se mueve verticalmente, ideal para entrenar con mayor estabilidad y seguridad en ejercicios de fuerza como sentadillas y press de banca."},
+    {"id": 12, "name": "Estiramientos", "description": "Herramientas o zonas diseñadas para realizar ejercicios de estiramiento que mejoran la flexibilidad y la movilidad, fundamentales para la recuperación."},
+    {"id": 13, "name": "Cardio", "description": "Máquinas como bicicletas estáticas, cintas de correr y elípticas, usadas para mejorar la resistencia cardiovascular y quemar calorías."},
+    {"id": 14, "name": "TRX", "description": "Sistema de suspensión que permite realizar ejercicios de peso corporal con énfasis en la estabilidad del núcleo y la fuerza funcional."},
+    {"id": 15, "name": "Bosu Ball", "description": "Medio balón inflable utilizado para ejercicios de equilibrio, estabilidad y fortalecimiento del núcleo. Ideal para entrenamiento funcional."},
+    {"id": 16, "name": "Recuperación", "description": "Máquinas y equipos utilizados para estiramientos, masajes y otros ejercicios enfocados en la recuperación muscular después del entrenamiento."},
+    {"id": 17, "name": "Yoga", "description": "Espacios y accesorios como colchonetas y bloques utilizados para la práctica de yoga, mejorando la flexibilidad, equilibrio y relajación."},
+    {"id": 18, "name": "Plato", "description": "Pesas circulares que se agregan a barras o se usan de manera independiente para aumentar la carga en levantamientos de fuerza."},
+]
+
+EXERCISES = [
+    #Pectoral Mayor
+    {"id": 1, "name": "Press de Banca", "description": "Ejercicio compuesto que trabaja principalmente el pectoral mayor, los tríceps y los hombros.", "video": "https://www.youtube.com/watch?v=gRVjAtPip0Y", "image": "https://example.com/press-banca.jpg", "dateAdded": date(2024, 1, 1), "dificulty_id": 2, "machine_id": 10},
+    {"id": 2, "name": "Press de Banca Inclinado", "description": "Variante del press de banca que se enfoca en la parte superior del pectoral mayor.", "video": "https://www.youtube.com/watch?v=DbFgADa2PL8", "image": "https://example.com/press-inclinado.jpg", "dateAdded": date(2024, 1, 2), "dificulty_id": 2, "machine_id": 10},
+    {"id": 3, "name": "Press de Banca con Mancuernas", "description": "Alternativa al press de banca que permite mayor rango de movimiento.", "video": "https://www.youtube.com/watch?v=VmB1G1K7v94", "image": "https://example.com/press-mancuernas.jpg", "dateAdded": date(2024, 1, 3), "dificulty_id": 2, "machine_id": 2},
+    {"id": 4, "name": "Flexiones", "description": "Ejercicio de peso corporal que trabaja el pectoral mayor, tríceps y hombros.", "video": "https://www.youtube.com/watch?v=IODxDxX7oi4", "image": "https://example.com/flexiones.jpg", "dateAdded": date(2024, 1, 4), "dificulty_id": 1, "machine_id": 4},
+    {"id": 5, "name": "Fondos en Paralelas", "description": "Ejercicio de empuje que involucra al pectoral mayor y tríceps.", "video": "https://www.youtube.com/watch?v=2z8JmcrW-As", "image": "https://example.com/fondos-paralelas.jpg", "dateAdded": date(2024, 1, 5), "dificulty_id": 3, "machine_id": 8},
+    {"id": 6, "name": "Press de Pecho en Máquina", "description": "Ejercicio en máquina que aísla el pectoral mayor.", "video": "https://www.youtube.com/watch?v=jPLWml3yLFg", "image": "https://example.com/press-maquina.jpg", "dateAdded": date(2024, 1, 6), "dificulty_id": 1, "machine_id": 3},
+    {"id": 7, "name": "Aperturas con Mancuernas", "description": "Ejercicio de aislamiento para el pectoral mayor que se realiza con mancuernas.", "video": "https://www.youtube.com/watch?v=eozdVDA78K0", "image": "https://example.com/aperturas-mancuernas.jpg", "dateAdded": date(2024, 1, 7), "dificulty_id": 2, "machine_id": 2},
+    {"id": 8, "name": "Aperturas en Máquina", "description": "Variante de las aperturas realizada en máquina para mayor control.", "video": "https://www.youtube.com/watch?v=kr8xINvI9DA", "image": "https://example.com/aperturas-maquina.jpg", "dateAdded": date(2024, 1, 8), "dificulty_id": 1, "machine_id": 3},
+    {"id": 9, "name": "Press de Pecho en Máquina Smith", "description": "Ejercicio de pecho guiado por la máquina Smith, ideal para principiantes.", "video": "https://www.youtube.com/watch?v=gpRX-59E6Yc", "image": "https://example.com/press-smith.jpg", "dateAdded": date(2024, 1, 9), "dificulty_id": 1, "machine_id": 11},
+    {"id": 10, "name": "Press de Pecho con Banda Elástica", "description": "Variante que añade resistencia progresiva para trabajar el pectoral mayor.", "video": "https://www.youtube.com/watch?v=h7XjUbUpeHE", "image": "https://example.com/press-banda.jpg", "dateAdded": date(2024, 1, 10), "dificulty_id": 2, "machine_id": 5},
+    #Pectoral Menor
+    {"id": 11, "name": "Press de Banca Declinado", "description": "Variante del press de banca que enfatiza la parte inferior del pecho.", "video": "https://www.youtube.com/watch?v=ubw9uAgvPq8", "image": "https://example.com/press-declinado.jpg", "dateAdded": date(2024, 2, 1), "dificulty_id": 2, "machine_id": 10},
+    {"id": 12, "name": "Pullover con Mancuernas", "description": "Ejercicio que estira y trabaja el pectoral menor y otros músculos del torso.", "video": "https://www.youtube.com/watch?v=k17d7b6b7p8", "image": "https://example.com/pullover.jpg", "dateAdded": date(2024, 2, 2), "dificulty_id": 2, "machine_id": 2},
+    {"id": 13, "name": "Fondos con Banda Elástica", "description": "Fondos asistidos con banda, enfocados en el pectoral menor.", "video": "https://www.youtube.com/watch?v=Ej5zD75Quwg", "image": "https://example.com/fondos-banda.jpg", "dateAdded": date(2024, 2, 3), "dificulty_id": 1, "machine_id": 5},
+    {"id": 14, "name": "Pullover en Máquina", "description": "Pullover guiado por máquina para mayor control del movimiento.", "video": "https://www.youtube.com/watch?v=DsP6X8mjPdc", "image": "https://example.com/pullover-maquina.jpg", "dateAdded": date(2024, 2, 4), "dificulty_id": 1, "machine_id": 3},
+    {"id": 15, "name": "Cable Crossover Bajo", "description": "Ejercicio en polea que enfoca la contracción del pectoral menor.", "video": "https://www.youtube.com/watch?v=vI5EJzET5Lg", "image": "https://example.com/crossover-bajo.jpg", "dateAdded": date(2024, 2, 5), "dificulty_id": 3, "machine_id": 8},
+    {"id": 16, "name": "Press con TRX", "description": "Ejercicio en suspensión que activa el pectoral menor y estabilizadores.", "video": "https://www.youtube.com/watch?v=y7KiW8NGkIQ", "image": "https://example.com/press-trx.jpg", "dateAdded": date(2024, 2, 6), "dificulty_id": 2, "machine_id": 14},
+    {"id": 17, "name": "Flexiones con Banda Elástica", "description": "Flexiones con resistencia adicional enfocadas en el pectoral menor.", "video": "https://www.youtube.com/watch?v=NkzLUY3trFQ", "image": "https://example.com/flexiones-banda.jpg", "dateAdded": date(2024, 2, 7), "dificulty_id": 2, "machine_id": 5},
+    {"id": 18, "name": "Press de Banca con Kettlebell", "description": "Variante del press de banca con kettlebell que trabaja los estabilizadores.", "video": "https://www.youtube.com/watch?v=drXx-LEfwzo", "image": "https://example.com/press-kettlebell.jpg", "dateAdded": date(2024, 2, 8), "dificulty_id": 3, "machine_id": 6},
+    {"id": 19, "name": "Fondos en Anillas", "description": "Ejercicio avanzado que activa intensamente el pectoral menor.", "video": "https://www.youtube.com/watch?v=kOeNZ2J0Tyc", "image": "https://example.com/fondos-anillas.jpg", "dateAdded": date(2024, 2, 9), "dificulty_id": 4, "machine_id": 4},
+    {"id": 20, "name": "Press en Banco Inclinado con Banda", "description": "Ejercicio que añade resistencia progresiva en el pectoral menor.", "video": "https://www.youtube.com/watch?v=G63aq3rZCDg", "image": "https://example.com/press-banda-inclinado.jpg", "dateAdded": date(2024, 2, 10), "dificulty_id": 3, "machine_id": 5},
+    #Dorsal Ancho
+    {"id": 21, "name": "Dominadas", "description": "Ejercicio clásico de tirón que involucra principalmente el dorsal ancho.", "video": "https://www.youtube.com/watch?v=eGo4IYlbE5g", "image": "https://example.com/dominadas.jpg", "dateAdded": date(2024, 3, 1), "dificulty_id": 3, "machine_id": 8},
+    {"id": 22, "name": "Remo con Barra", "description": "Ejercicio compuesto que trabaja el dorsal ancho, trapecio y los romboides.", "video": "https://www.youtube.com/watch?v=Kx9kK8taK10", "image": "https://example.com/remo-barra.jpg", "dateAdded": date(2024, 3, 2), "dificulty_id": 2, "machine_id": 2},
+    {"id": 23, "name": "Remo en Máquina", "description": "Variante del remo realizado en máquina para mayor control.", "video": "https://www.youtube.com/watch?v=qF7dkrce-mQ", "image": "https://example.com/remo-maquina.jpg", "dateAdded": date(2024, 3, 3), "dificulty_id": 1, "machine_id": 3},
+    {"id": 24, "name": "Remo con Mancuernas", "description": "Ejercicio unilateral que aísla el dorsal ancho.", "video": "https://www.youtube.com/watch?v=-koP10y1qZI", "image": "https://example.com/remo-mancuernas.jpg", "dateAdded": date(2024, 3, 4), "dificulty_id": 2, "machine_id": 2},
+    {"id": 25, "name": "Pull Over con Mancuernas", "description": "Ejercicio que trabaja tanto el dorsal ancho como el pectoral mayor.", "video": "https://www.youtube.com/watch?v=xcdmFUdjDRU", "image": "https://example.com/pullover-mancuernas.jpg", "dateAdded": date(2024, 3, 5), "dificulty_id": 2, "machine_id": 2},
+    {"id": 26, "name": "Dominadas Asistidas", "description": "Dominadas con asistencia que permiten trabajar el dorsal ancho con menos peso corporal.", "video": "https://www.youtube.com/watch?v=rdLnmW5PQd0", "image": "https://example.com/dominadas-asistidas.jpg", "dateAdded": date(2024, 3, 6), "dificulty_id": 1, "machine_id": 12},
+    {"id": 27, "name": "Jalón al Pecho", "description": "Ejercicio en polea que aísla el dorsal ancho.", "video": "https://www.youtube.com/watch?v=CAwf7n6Luuc", "image": "https://example.com/jalon-pecho.jpg", "dateAdded": date(2024, 3, 7), "dificulty_id": 1, "machine_id": 8},
+    {"id": 28, "name": "Remo con Banda Elástica", "description": "Variante del remo utilizando una banda elástica.", "video": "https://www.youtube.com/watch?v=4uOfUPVJdNY", "image": "https://example.com/remo-banda.jpg", "dateAdded": date(2024, 3, 8), "dificulty_id": 1, "machine_id": 5},
+    {"id": 29, "name": "Remo en Máquina Smith", "description": "Ejercicio guiado que involucra el dorsal ancho, realizado en la máquina Smith.", "video": "https://www.youtube.com/watch?v=zyI1GRjFj7A", "image": "https://example.com/remo-smith.jpg", "dateAdded": date(2024, 3, 9), "dificulty_id": 2, "machine_id": 11},
+    {"id": 30, "name": "Pullover en Máquina", "description": "Pullover guiado en máquina para trabajar el dorsal ancho.", "video": "https://www.youtube.com/watch?v=DsP6X8mjPdc", "image": "https://example.com/pullover-maquina.jpg", "dateAdded": date(2024, 3, 10), "dificulty_id": 1, "machine_id": 3},
+    #Trapecio
+    {"id": 31, "name": "Encogimiento de Hombros con Barra", "description": "Ejercicio que aísla el trapecio mediante el levantamiento de una barra.", "video": "https://www.youtube.com/watch?v=X7ZHcI4N3mw", "image": "https://example.com/encogimiento-barra.jpg", "dateAdded": date(2024, 4, 1), "dificulty_id": 2, "machine_id": 2},
+    {"id": 32, "name": "Encogimiento con Mancuernas", "description": "Variante con mancuernas que permite trabajar cada lado del trapecio por separado.", "video": "https://www.youtube.com/watch?v=eoS4n4uY7VY", "image": "https://example.com/encogimiento-mancuernas.jpg", "dateAdded": date(2024, 4, 2), "dificulty_id": 1, "machine_id": 2},
+    {"id": 33, "name": "Remo al Cuello con Barra", "description": "Ejercicio compuesto que involucra el trapecio y los hombros.", "video": "https://www.youtube.com/watch?v=RoxxsJTZ6As", "image": "https://example.com/remo-cuello-barra.jpg", "dateAdded": date(2024, 4, 3), "dificulty_id": 3, "machine_id": 2},
+    {"id": 34, "name": "Encogimientos en Máquina", "description": "Ejercicio en máquina que aísla el trapecio.", "video": "https://www.youtube.com/watch?v=cLXJpU85LOU", "image": "https://example.com/encogimientos-maquina.jpg", "dateAdded": date(2024, 4, 4), "dificulty_id": 1, "machine_id": 3},
+    {"id": 35, "name": "Elevación Lateral con Mancuernas", "description": "Ejercicio que trabaja los hombros y el trapecio.", "video": "https://www.youtube.com/watch?v=3VcKaXpzqRo", "image": "https://example.com/elevacion-lateral.jpg", "dateAdded": date(2024, 4, 5), "dificulty_id": 1, "machine_id": 2},
+    {"id": 36, "name": "Remo con Banda Elástica", "description": "Remo utilizando bandas elásticas para trabajar el trapecio.", "video": "https://www.youtube.com/watch?v=qfQvfrUzaM8", "image": "https://example.com/remo-banda.jpg", "dateAdded": date(2024, 4, 6), "dificulty_id": 1, "machine_id": 5},
+    {"id": 37, "name": "Remo al Cuello en Máquina", "description": "Variante del remo al cuello realizado en máquina para mayor estabilidad.", "video": "https://www.youtube.com/watch?v=nhTr6fo7Mzw", "image": "https://example.com/remo-cuello-maquina.jpg", "dateAdded": date(2024, 4, 7), "dificulty_id": 1, "machine_id": 3},
+    {"id": 38, "name": "Encogimiento con Banda Elástica", "description": "Encogimientos realizados con una banda elástica para activar el trapecio.", "video": "https://www.youtube.com/watch?v=rZT5tvvA5Ls", "image": "https://example.com/encogimiento-banda.jpg", "dateAdded": date(2024, 4, 8), "dificulty_id": 1, "machine_id": 5},
+    {"id": 39, "name": "Encogimiento con Kettlebell", "description": "Variante del encogimiento utilizando kettlebells.", "video": "https://www.youtube.com/watch?v=DyxtGdyQLBg", "image": "https://example.com/encogimiento-kettlebell.jpg", "dateAdded": date(2024, 4, 9), "dificulty_id": 2, "machine_id": 6},
+    {"id": 40, "name": "Remo al Cuello con Kettlebell", "description": "Remo con kettlebell para trabajar el trapecio y los hombros.", "video": "https://www.youtube.com/watch?v=1r7CVf-cPPE", "image": "https://example.com/remo-cuello-kettlebell.jpg", "dateAdded": date(2024, 4, 10), "dificulty_id": 2, "machine_id": 6},
+    #Romboides
+    {"id": 41, "name": "Remo con Mancuernas a una Mano", "description": "Ejercicio que aísla el romboide con el movimiento de remo.", "video": "https://www.youtube.com/watch?v=ljxD43OJVFM", "image": "https://example.com/remo-mano.jpg", "dateAdded": date(2024, 5, 1), "dificulty_id": 2, "machine_id": 2},
+    {"id": 42, "name": "Remo en Máquina con Agarre Cerrado", "description": "Ejercicio en máquina con agarre cerrado que trabaja el romboide.", "video": "https://www.youtube.com/watch?v=atJd_kWBlIg", "image": "https://example.com/remo-agarre-cerrado.jpg", "dateAdded": date(2024, 5, 2), "dificulty_id": 1, "machine_id": 3},
+    {"id": 43, "name": "Remo con Banda Elástica", "description": "Remo utilizando bandas elásticas para activar los romboides.", "video": "https://www.youtube.com/watch?v=3ao6NmZAYpk", "image": "https://example.com/remo-banda-elastica.jpg", "dateAdded": date(2024, 5, 3), "dificulty_id": 1, "machine_id": 5},
+    {"id": 44, "name": "Face Pull en Polea", "description": "Ejercicio en polea que trabaja los romboides y los deltoides posteriores.", "video": "https://www.youtube.com/watch?v=7jnn6YkFV7c", "image": "https://example.com/face-pull.jpg", "dateAdded": date(2024, 5, 4), "dificulty_id": 1, "machine_id": 8},
+    {"id": 45, "name": "Remo con Barra T", "description": "Ejercicio compuesto que trabaja los romboides y otros músculos de la espalda.", "video": "https://www.youtube.com/watch?v=mhdc9rxNOno", "image": "https://example.com/remo-barra-t.jpg", "dateAdded": date(2024, 5, 5), "dificulty_id": 3, "machine_id": 9},
+    {"id": 46, "name": "Remo en Máquina Smith", "description": "Variante del remo con barra, realizado en la máquina Smith para mayor estabilidad.", "video": "https://www.youtube.com/watch?v=CTMymImHBts", "image": "https://example.com/remo-smith-romboides.jpg", "dateAdded": date(2024, 5, 6), "dificulty_id": 2, "machine_id": 11},
+    {"id": 47, "name": "Remo Sentado en Polea Baja", "description": "Remo sentado con polea que aísla los romboides.", "video": "https://www.youtube.com/watch?v=GZbfZ033f74", "image": "https://example.com/remo-sentado.jpg", "dateAdded": date(2024, 5, 7), "dificulty_id": 1, "machine_id": 8},
+    {"id": 48, "name": "Pull Over en Máquina", "description": "Ejercicio en máquina que trabaja el dorsal ancho y activa los romboides.", "video": "https://www.youtube.com/watch?v=sKDbLALWikc", "image": "https://example.com/pullover-maquina-romboides.jpg", "dateAdded": date(2024, 5, 8), "dificulty_id": 2, "machine_id": 3},
+    {"id": 49, "name": "Encogimiento de Hombros en Máquina", "description": "Ejercicio que trabaja el trapecio y los romboides.", "video": "https://www.youtube.com/watch?v=8XNGWZT9kaE", "image": "https://example.com/encogimiento-maquina.jpg", "dateAdded": date(2024, 5, 9), "dificulty_id": 1, "machine_id": 3},
+    {"id": 50, "name": "Remo Pendlay", "description": "Variante del remo con barra, enfocado en los romboides y trapecio.", "video": "https://www.youtube.com/watch?v=0_X7E41aUwA", "image": "https://example.com/remo-pendlay.jpg", "dateAdded": date(2024, 5, 10), "dificulty_id": 3, "machine_id": 2},
+    #Deltoide Posterior
+    {"id": 51, "name": "Pájaros con Mancuernas", "description": "Ejercicio que aísla el deltoides posterior, realizado inclinado hacia adelante.", "video": "https://www.youtube.com/watch?v=w2ex35u6f2c", "image": "https://example.com/pajaros-mancuernas.jpg", "dateAdded": date(2024, 6, 1), "dificulty_id": 2, "machine_id": 2},
+    {"id": 52, "name": "Face Pull en Polea Baja", "description": "Ejercicio en polea enfocado en los deltoides posteriores y romboides.", "video": "https://www.youtube.com/watch?v=RlmTksTFDiY", "image": "https://example.com/face-pull-polea.jpg", "dateAdded": date(2024, 6, 2), "dificulty_id": 1, "machine_id": 8},
+    {"id": 53, "name": "Pájaros en Máquina Pec Deck", "description": "Variante de los pájaros realizado en la máquina Pec Deck.", "video": "https://www.youtube.com/watch?v=xG_FvVVnVzI", "image": "https://example.com/pajaros-maquina.jpg", "dateAdded": date(2024, 6, 3), "dificulty_id": 1, "machine_id": 10},
+    {"id": 54, "name": "Elevaciones Laterales Inclinadas", "description": "Elevaciones laterales con mancuernas para activar los deltoides posteriores.", "video": "https://www.youtube.com/watch?v=8XktkZ2ls9I", "image": "https://example.com/elevaciones-inclinadas.jpg", "dateAdded": date(2024, 6, 4), "dificulty_id": 2, "machine_id": 2},
+    {"id": 55, "name": "Remo con Agarre Inverso en Polea Baja", "description": "Remo en polea con agarre inverso, enfocado en los deltoides posteriores.", "video": "https://www.youtube.com/watch?v=hPs9moXsX-w", "image": "https://example.com/remo-inverso-polea.jpg", "dateAdded": date(2024, 6, 5), "dificulty_id": 1, "machine_id": 8},
+    {"id": 56, "name": "Elevaciones Frontales con Mancuernas", "description": "Ejercicio que trabaja los deltoides anteriores y posteriores.", "video": "https://www.youtube.com/watch?v=f2s-JULK6sw", "image": "https://example.com/elevaciones-frontales.jpg", "dateAdded": date(2024, 6, 6), "dificulty_id": 1, "machine_id": 2},
+    {"id": 57, "name": "Remo con Banda Elástica", "description": "Remo con banda elástica que activa los deltoides posteriores.", "video": "https://www.youtube.com/watch?v=NhBO5zRiWlc", "image": "https://example.com/remo-banda-deltoides.jpg", "dateAdded": date(2024, 6, 7), "dificulty_id": 1, "machine_id": 5},
+    {"id": 58, "name": "Pájaros en Polea Alta", "description": "Variante de los pájaros realizado en la polea alta para mayor control.", "video": "https://www.youtube.com/watch?v=G9ZwYHBxX9g", "image": "https://example.com/pajaros-polea-alta.jpg", "dateAdded": date(2024, 6, 8), "dificulty_id": 2, "machine_id": 8},
+    {"id": 59, "name": "Pájaros con Banda Elástica", "description": "Pájaros realizados con bandas elásticas para trabajar los deltoides posteriores.", "video": "https://www.youtube.com/watch?v=ErL1PzH2hdE", "image": "https://example.com/pajaros-banda.jpg", "dateAdded": date(2024, 6, 9), "dificulty_id": 1, "machine_id": 5},
+    {"id": 60, "name": "Remo en Máquina Smith", "description": "Variante del remo con barra en máquina Smith, enfocado en los deltoides posteriores.", "video": "https://www.youtube.com/watch?v=9kMm_xB5X50", "image": "https://example.com/remo-maquina-deltoides.jpg", "dateAdded": date(2024, 6, 10), "dificulty_id": 2, "machine_id": 11},
+    #Deltoides Anterior
+    {"id": 61, "name": "Elevaciones Frontales con Mancuernas", "description": "Ejercicio enfocado en el deltoides anterior con mancuernas.", "video": "https://www.youtube.com/watch?v=f2s-JULK6sw", "image": "https://example.com/elevaciones-frontales.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 2},
+    {"id": 62, "name": "Press Militar con Barra", "description": "Ejercicio compuesto que trabaja el deltoides anterior y otros músculos del hombro.", "video": "https://www.youtube.com/watch?v=2yjwXTZQDDI", "image": "https://example.com/press-militar-barra.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 11},
+    {"id": 63, "name": "Press Militar en Máquina", "description": "Variante del press militar usando máquina para mayor control.", "video": "https://www.youtube.com/watch?v=j8IuTvOV6w4", "image": "https://example.com/press-militar-maquina.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 10},
+    {"id": 64, "name": "Elevaciones Frontales con Barra", "description": "Ejercicio para el deltoides anterior realizado con barra recta.", "video": "https://www.youtube.com/watch?v=FL8i2awzOpk", "image": "https://example.com/elevaciones-barra.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 2},
+    {"id": 65, "name": "Press Arnold con Mancuernas", "description": "Press que combina rotación, enfocado en el deltoides anterior.", "video": "https://www.youtube.com/watch?v=6Z15_WdXmVw", "image": "https://example.com/press-arnold.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 2},
+    {"id": 66, "name": "Push Press", "description": "Ejercicio dinámico con impulso de piernas que involucra el deltoides anterior.", "video": "https://www.youtube.com/watch?v=7eX1zxnDNu0", "image": "https://example.com/push-press.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 11},
+    {"id": 67, "name": "Press de Hombros en Máquina Smith", "description": "Press de hombros en máquina Smith, ideal para enfocarse en el deltoides anterior.", "video": "https://www.youtube.com/watch?v=eE9b8lJ_Fo4", "image": "https://example.com/press-smith.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 11},
+    {"id": 68, "name": "Elevaciones Frontales con Discos", "description": "Variación de elevaciones frontales usando discos.", "video": "https://www.youtube.com/watch?v=lE5VIPFDK_c", "image": "https://example.com/elevaciones-discos.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 2},
+    {"id": 69, "name": "Press Inclinado con Barra", "description": "Press en banca inclinada que activa el deltoides anterior.", "video": "https://www.youtube.com/watch?v=2z8JmcrW-As", "image": "https://example.com/press-inclinado.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 11},
+    {"id": 70, "name": "Elevaciones Frontales en Polea Baja", "description": "Elevaciones frontales utilizando polea para mantener tensión constante.", "video": "https://www.youtube.com/watch?v=shD5FqZO5dc", "image": "https://example.com/elevaciones-polea.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 8},
+    #Bíceps
+    {"id": 71, "name": "Curl con Barra", "description": "Clásico ejercicio para el bíceps realizado con barra.", "video": "https://www.youtube.com/watch?v=kwG2ipFRgfo", "image": "https://example.com/curl-barra.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 11},
+    {"id": 72, "name": "Curl con Mancuernas", "description": "Curl de bíceps con mancuernas, realizado de pie o sentado.", "video": "https://www.youtube.com/watch?v=av7-8igSXTs", "image": "https://example.com/curl-mancuernas.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 2},
+    {"id": 73, "name": "Curl en Banco Scott", "description": "Curl que aísla el bíceps usando un banco Scott.", "video": "https://www.youtube.com/watch?v=pMJKb6uBUsU", "image": "https://example.com/curl-banco-scott.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 10},
+    {"id": 74, "name": "Curl Concentrado", "description": "Ejercicio que aísla el bíceps mediante un curl con apoyo en el muslo.", "video": "https://www.youtube.com/watch?v=1xMaFs0L3ao", "image": "https://example.com/curl-concentrado.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 2},
+    {"id": 75, "name": "Curl en Máquina", "description": "Ejercicio en máquina específica para bíceps.", "video": "https://www.youtube.com/watch?v=_yuqGKm-CcA", "image": "https://example.com/curl-maquina.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 10},
+    {"id": 76, "name": "Curl Martillo con Mancuernas", "description": "Variación del curl con mancuernas, manteniendo un agarre neutro.", "video": "https://www.youtube.com/watch?v=zC3nLlEvin4", "image": "https://example.com/curl-martillo.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 2},
+    {"id": 77, "name": "Curl con Banda Elástica", "description": "Curl utilizando bandas elásticas para variación de resistencia.", "video": "https://www.youtube.com/watch?v=wvUa7_D6t8U", "image": "https://example.com/curl-banda.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 5},
+    {"id": 78, "name": "Curl en Polea Baja", "description": "Ejercicio de curl utilizando polea baja para tensión continua.", "video": "https://www.youtube.com/watch?v=3UWi44yN-wI", "image": "https://example.com/curl-polea.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 8},
+    {"id": 79, "name": "Curl con Agarre Inverso", "description": "Curl con barra o mancuernas, pero con agarre en pronación.", "video": "https://www.youtube.com/watch?v=pGtWVfqsFpI", "image": "https://example.com/curl-inverso.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 11},
+    {"id": 80, "name": "Curl Spider", "description": "Variante avanzada del curl donde los brazos están completamente estirados.", "video": "https://www.youtube.com/watch?v=hBVcn_omrBI", "image": "https://example.com/curl-spider.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 10},
+    #Tríceps
+    {"id": 81, "name": "Fondos en Paralelas", "description": "Ejercicio de peso corporal que trabaja los tríceps y el pecho.", "video": "https://www.youtube.com/watch?v=2z8JmcrW-As", "image": "https://example.com/fondos-paralelas.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 3},
+    {"id": 82, "name": "Extensiones de Tríceps en Polea Alta", "description": "Ejercicio en polea que aísla los músculos tríceps.", "video": "https://www.youtube.com/watch?v=d_K6GdPzB5c", "image": "https://example.com/extensiones-polea.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 8},
+    {"id": 83, "name": "Press Francés con Mancuernas", "description": "Ejercicio para tríceps con mancuernas, realizado en posición acostada.", "video": "https://www.youtube.com/watch?v=Z3q83nXj3Kw", "image": "https://example.com/press-frances.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 2},
+    {"id": 84, "name": "Patadas de Tríceps", "description": "Ejercicio que se realiza inclinándose hacia adelante para trabajar el tríceps.", "video": "https://www.youtube.com/watch?v=6A3y8p4wLiU", "image": "https://example.com/patadas-triceps.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 2},
+    {"id": 85, "name": "Extensión de Tríceps con Mancuerna", "description": "Extensión de tríceps usando una mancuerna, se puede hacer sentado o de pie.", "video": "https://www.youtube.com/watch?v=ddXIzCz7j-s", "image": "https://example.com/extension-mancuerna.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 2},
+    {"id": 86, "name": "Press de Tríceps en Máquina", "description": "Máquina específica para realizar press de tríceps.", "video": "https://www.youtube.com/watch?v=_M7Dk-94r70", "image": "https://example.com/press-maquina.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 10},
+    {"id": 87, "name": "Extensión de Tríceps sobre la Cabeza", "description": "Extensión de tríceps que se realiza por encima de la cabeza.", "video": "https://www.youtube.com/watch?v=wZng1i9IBfw", "image": "https://example.com/extension-cabeza.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 2},
+    {"id": 88, "name": "Dips en Banco", "description": "Variante de fondos que se realiza entre dos bancos, ideal para principiantes.", "video": "https://www.youtube.com/watch?v=xaV8sGBQeE8", "image": "https://example.com/dips-banco.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 3},
+    {"id": 89, "name": "Rompecráneos con Barra", "description": "Ejercicio clásico para el tríceps, realizado con barra recta o Z.", "video": "https://www.youtube.com/watch?v=ei3W8L08MyE", "image": "https://example.com/rompecraneos.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 10},
+    {"id": 90, "name": "Extensión en Polea Baja", "description": "Extensiones de tríceps utilizando polea baja para mayor tensión.", "video": "https://www.youtube.com/watch?v=YyFV5WFr1DI", "image": "https://example.com/extension-polea-baja.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 8},
+    #Flexores del Antebrazo
+    {"id": 91, "name": "Curl de Muñeca con Barra", "description": "Ejercicio para trabajar los flexores del antebrazo utilizando barra.", "video": "https://www.youtube.com/watch?v=9wJqI8S7M8M", "image": "https://example.com/curl-muneca-barra.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 11},
+    {"id": 92, "name": "Curl de Muñeca con Mancuernas", "description": "Curl de muñeca con mancuernas, se puede realizar sentado o de pie.", "video": "https://www.youtube.com/watch?v=udn4Ru9sbVs", "image": "https://example.com/curl-muneca-mancuernas.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 2},
+    {"id": 93, "name": "Curl de Muñeca en Banco Inclinado", "description": "Curl de muñeca realizado en banco inclinado para mayor rango de movimiento.", "video": "https://www.youtube.com/watch?v=oQmNYD7V3cE", "image": "https://example.com/curl-banco-inclinado.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 10},
+    {"id": 94, "name": "Curl de Muñeca en Polea Baja", "description": "Ejercicio de flexores utilizando polea baja.", "video": "https://www.youtube.com/watch?v=jTAcnqNV2wU", "image": "https://example.com/curl-muneca-polea.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 8},
+    {"id": 95, "name": "Rotaciones de Muñeca", "description": "Ejercicio para fortalecer los músculos del antebrazo mediante rotaciones.", "video": "https://www.youtube.com/watch?v=1DhVnQgBKHg", "image": "https://example.com/rotaciones-muneca.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 2},
+    {"id": 96, "name": "Flexiones de Muñeca con Banda Elástica", "description": "Uso de banda elástica para trabajar los flexores de la muñeca.", "video": "https://www.youtube.com/watch?v=6BBsY6C4I9M", "image": "https://example.com/flexiones-banda.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 5},
+    {"id": 97, "name": "Hammer Curl para Muñeca", "description": "Variación del curl martillo enfocada en los flexores de la muñeca.", "video": "https://www.youtube.com/watch?v=lU0q5V9I7Ro", "image": "https://example.com/hammer-curl.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 2},
+    {"id": 98, "name": "Extensiones de Muñeca con Barra", "description": "Ejercicio para trabajar los extensores, complementario a los flexores.", "video": "https://www.youtube.com/watch?v=8Dk7_KwtoIA", "image": "https://example.com/extensiones-muneca-barra.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 11},
+    {"id": 99, "name": "Prono de Muñeca", "description": "Ejercicio para fortalecer los músculos del antebrazo, se hace con una barra.", "video": "https://www.youtube.com/watch?v=6s4TmPZt3k0", "image": "https://example.com/prono-muneca.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 11},
+    {"id": 100, "name": "Flexiones de Muñeca con Discos", "description": "Uso de discos para trabajar los músculos de la muñeca y antebrazo.", "video": "https://www.youtube.com/watch?v=9ujN2gK2i78", "image": "https://example.com/flexiones-discos.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 11},
+    #Extensores del Antebrazo
+    {"id": 101, "name": "Curl de Muñeca Inverso", "description": "Ejercicio para trabajar los extensores de la muñeca utilizando barra.", "video": "https://www.youtube.com/watch?v=9fpx1yyafl8", "image": "https://example.com/curl-muneca-inverso.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 2},
+    {"id": 102, "name": "Extensión de Muñeca en Banco", "description": "Ejercicio de extensión de muñeca realizado en un banco con soporte.", "video": "https://www.youtube.com/watch?v=25vOgTfy7Ws", "image": "https://example.com/extension-banco.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 10},
+    {"id": 103, "name": "Extensión de Muñeca con Mancuernas", "description": "Ejercicio de extensión con mancuernas para fortalecer los extensores.", "video": "https://www.youtube.com/watch?v=8y4v1DL8s20", "image": "https://example.com/extension-mancuernas.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 10},
+    {"id": 104, "name": "Extensión de Muñeca en Polea Alta", "description": "Extensiones de muñeca utilizando polea alta para resistencia.", "video": "https://www.youtube.com/watch?v=1xHhKPrtxPQ", "image": "https://example.com/extension-polea-alta.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 8},
+    {"id": 105, "name": "Rotaciones de Muñeca con Banda Elástica", "description": "Rotaciones de muñeca usando banda elástica para fortalecer.", "video": "https://www.youtube.com/watch?v=_Ow6R_CsuAo", "image": "https://example.com/rotaciones-banda.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 5},
+    {"id": 106, "name": "Prono de Muñeca con Mancuernas", "description": "Ejercicio que trabaja los extensores de la muñeca con mancuernas.", "video": "https://www.youtube.com/watch?v=HYvxRBBYNrI", "image": "https://example.com/prono-muneca-mancuernas.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 2},
+    {"id": 107, "name": "Extensión de Muñeca con Discos", "description": "Uso de discos para trabajar la extensión de la muñeca.", "video": "https://www.youtube.com/watch?v=I4Jj9Y4TAtM", "image": "https://example.com/extension-discos.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 11},
+    {"id": 108, "name": "Curl de Muñeca con Banda Elástica", "description": "Curl para muñeca utilizando banda elástica como resistencia.", "video": "https://www.youtube.com/watch?v=qR_tCQCEQ4s", "image": "https://example.com/curl-banda.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 5},
+    {"id": 109, "name": "Flexiones Inversas", "description": "Flexiones con las palmas hacia abajo para trabajar extensores.", "video": "https://www.youtube.com/watch?v=qSOPe4D1C5c", "image": "https://example.com/flexiones-inversas.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 3},
+    {"id": 110, "name": "Extensiones en Polea Baja", "description": "Extensiones para extensores usando polea baja.", "video": "https://www.youtube.com/watch?v=lKXtQapUB0c", "image": "https://example.com/extensiones-polea-baja.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 8},
+    #Recto Abdominal
+    {"id": 111, "name": "Crunches", "description": "Ejercicio básico para trabajar el recto abdominal, realizado en el suelo.", "video": "https://www.youtube.com/watch?v=1xI_MhPto9c", "image": "https://example.com/crunches.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 12},
+    {"id": 112, "name": "Elevación de Piernas", "description": "Ejercicio que se realiza acostado, levantando las piernas para trabajar el abdomen.", "video": "https://www.youtube.com/watch?v=JB2oyAWg8iY", "image": "https://example.com/elevacion-piernas.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 12},
+    {"id": 113, "name": "Plancha", "description": "Ejercicio de estabilización que trabaja los abdominales, se sostiene en posición de plancha.", "video": "https://www.youtube.com/watch?v=pSHjTRCQxIw", "image": "https://example.com/plancha.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 114, "name": "Crunches en Máquina", "description": "Variación de crunches que se realiza en una máquina específica para abdominales.", "video": "https://www.youtube.com/watch?v=QmwwG9J3KpA", "image": "https://example.com/crunches-maquina.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 10},
+    {"id": 115, "name": "Bicicleta Abdominal", "description": "Ejercicio que trabaja los abdominales y oblicuos en movimiento de bicicleta.", "video": "https://www.youtube.com/watch?v=9FGilxCbdz8", "image": "https://example.com/bicicleta-abdominal.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 116, "name": "Russian Twist", "description": "Ejercicio que se realiza sentado, trabajando los abdominales y oblicuos.", "video": "https://www.youtube.com/watch?v=wkD8rjkodUI", "image": "https://example.com/russian-twist.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 117, "name": "Elevación de Piernas en Banco", "description": "Ejercicio que se realiza en un banco inclinado para trabajar el abdomen.", "video": "https://www.youtube.com/watch?v=owC7Z8fQ2Tk", "image": "https://example.com/elevacion-piernas-banco.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 10},
+    {"id": 118, "name": "Crunches en Bola Suiza", "description": "Ejercicio que se realiza en una bola suiza para mayor estabilidad y trabajo de los abdominales.", "video": "https://www.youtube.com/watch?v=7UbMO7J-o8o", "image": "https://example.com/crunches-bola.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 119, "name": "Sit-Ups", "description": "Ejercicio clásico que trabaja los abdominales en posición acostada.", "video": "https://www.youtube.com/watch?v=1qD1pBfHD0A", "image": "https://example.com/sit-ups.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 120, "name": "Planchas Laterales", "description": "Ejercicio que trabaja los oblicuos y el recto abdominal en posición lateral.", "video": "https://www.youtube.com/watch?v=HhQxOhm5N7A", "image": "https://example.com/planchas-laterales.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    #Oblicuos Externos
+    {"id": 121, "name": "Russian Twist", "description": "Ejercicio que trabaja los oblicuos a través de un movimiento de rotación.", "video": "https://www.youtube.com/watch?v=wkD8rjkodUI", "image": "https://example.com/russian-twist.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 1, "machine_id": 12},
+    {"id": 122, "name": "Plancha Lateral", "description": "Ejercicio isométrico que se sostiene en posición lateral para trabajar los oblicuos.", "video": "https://www.youtube.com/watch?v=K5gK5C4RxG0", "image": "https://example.com/plancha-lateral.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 123, "name": "Elevación de Piernas Lateral", "description": "Elevación de piernas lateral para trabajar los oblicuos.", "video": "https://www.youtube.com/watch?v=YQ1h-6A1I4c", "image": "https://example.com/elevacion-piernas-lateral.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 124, "name": "Caminata Lateral", "description": "Ejercicio de caminata lateral con banda elástica para trabajar los oblicuos.", "video": "https://www.youtube.com/watch?v=6OQBOtYLOCo", "image": "https://example.com/caminata-lateral.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 5},
+    {"id": 125, "name": "Torsiones de Cadera", "description": "Movimientos de torsión para trabajar los oblicuos en posición de pie.", "video": "https://www.youtube.com/watch?v=p5Zs6m2gQRw", "image": "https://example.com/torsiones-cadera.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 126, "name": "Oblique Crunches", "description": "Crunches específicos para los oblicuos.", "video": "https://www.youtube.com/watch?v=xKnT2UEOnpM", "image": "https://example.com/oblique-crunches.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 127, "name": "Rotaciones de Tronco con Mancuernas", "description": "Rotaciones de tronco utilizando mancuernas para trabajar oblicuos.", "video": "https://www.youtube.com/watch?v=GmMS08mLMm0", "image": "https://example.com/rotaciones-tronco-mancuernas.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 10},
+    {"id": 128, "name": "Torsiones con Bola Suiza", "description": "Uso de bola suiza para torsiones y trabajo de los oblicuos.", "video": "https://www.youtube.com/watch?v=KkKp8KhTrG4", "image": "https://example.com/torsiones-bola.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 129, "name": "Sitting Twist", "description": "Torsiones sentado para trabajar los oblicuos.", "video": "https://www.youtube.com/watch?v=YwJv48sqOtA", "image": "https://example.com/sitting-twist.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 130, "name": "Side Bend con Mancuernas", "description": "Flexión lateral con mancuernas para trabajar los oblicuos.", "video": "https://www.youtube.com/watch?v=kFX5wSx7cY4", "image": "https://example.com/side-bend-mancuernas.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 10},
+    #Erector de la Columna
+    {"id": 131, "name": "Peso Muerto", "description": "Ejercicio fundamental para trabajar la cadena posterior, incluyendo el erector de la columna.", "video": "https://www.youtube.com/watch?v=op9kVnSso6Q", "image": "https://example.com/peso-muerto.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 2},
+    {"id": 132, "name": "Buenos Días", "description": "Ejercicio para trabajar el erector de la columna con barra en los hombros.", "video": "https://www.youtube.com/watch?v=U8f6F8Wzm0I", "image": "https://example.com/buenos-dias.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 2},
+    {"id": 133, "name": "Extensión de Espalda en Máquina", "description": "Ejercicio específico para trabajar el erector de la columna en una máquina.", "video": "https://www.youtube.com/watch?v=m5lI7WTFsXc", "image": "https://example.com/extension-espalda-maquina.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 10},
+    {"id": 134, "name": "Hiperextensiones", "description": "Ejercicio de hiperextensión en banco para trabajar el erector de la columna.", "video": "https://www.youtube.com/watch?v=qh40B94LxO4", "image": "https://example.com/hiperextensiones.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 10},
+    {"id": 135, "name": "Levantamiento de Tronco", "description": "Levantamiento de tronco desde posición acostada para fortalecer el erector de la columna.", "video": "https://www.youtube.com/watch?v=WJ9D1gx4P1A", "image": "https://example.com/levantamiento-tronco.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 136, "name": "Remo con Barra", "description": "Ejercicio de remo que también activa el erector de la columna.", "video": "https://www.youtube.com/watch?v=9zR6LbwISkA", "image": "https://example.com/remo-barra.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 2},
+    {"id": 137, "name": "Levantamiento de Caderas", "description": "Levantamiento de caderas para fortalecer la parte baja de la espalda.", "video": "https://www.youtube.com/watch?v=xtY6N1_NvhI", "image": "https://example.com/levantamiento-caderas.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 138, "name": "Puente de Glúteos", "description": "Ejercicio que trabaja el erector de la columna y los glúteos.", "video": "https://www.youtube.com/watch?v=8x3VqPTI_xs", "image": "https://example.com/puente-gluteos.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 139, "name": "Remo con Mancuernas", "description": "Remo unilateral con mancuerna que activa el erector de la columna.", "video": "https://www.youtube.com/watch?v=W2T6EDvSR7g", "image": "https://example.com/remo-mancuernas.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 2},
+    {"id": 140, "name": "Levantamiento de Espalda con Mancuerna", "description": "Levantamiento de espalda con mancuerna para fortalecer el erector de la columna.", "video": "https://www.youtube.com/watch?v=G8PGEctT6Ic", "image": "https://example.com/levantamiento-espalda-mancuerna.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 2},
+    #Glúteo Mayor
+    {"id": 141, "name": "Sentadillas", "description": "Ejercicio que trabaja los glúteos y piernas.", "video": "https://www.youtube.com/watch?v=UXJrBgI2VcM", "image": "https://example.com/sentadillas.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 2},
+    {"id": 142, "name": "Peso Muerto Rumano", "description": "Ejercicio que se enfoca en los glúteos y isquiotibiales.", "video": "https://www.youtube.com/watch?v=Jq9G5bN4nY4", "image": "https://example.com/peso-muerto-rumano.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 2},
+    {"id": 143, "name": "Patadas de Glúteo", "description": "Ejercicio que se realiza en cuadrupedia para activar los glúteos.", "video": "https://www.youtube.com/watch?v=PTg26vY7i5E", "image": "https://example.com/patadas-gluteo.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 144, "name": "Puente de Glúteos", "description": "Ejercicio que se realiza tumbado boca arriba, levantando las caderas.", "video": "https://www.youtube.com/watch?v=5vR_Q7DciR8", "image": "https://example.com/puente-gluteos-2.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 145, "name": "Sentadilla Búlgara", "description": "Sentadilla con una pierna atrás para trabajar los glúteos.", "video": "https://www.youtube.com/watch?v=2C-uNgKwPLE", "image": "https://example.com/sentadilla-bulgar.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 2},
+    {"id": 146, "name": "Elevación de Cadera con Barra", "description": "Elevación de cadera con barra para activar glúteos.", "video": "https://www.youtube.com/watch?v=Gd7BBSklEjE", "image": "https://example.com/elevacion-cadera-barra.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 12},
+    {"id": 147, "name": "Patadas con Banda", "description": "Patadas de glúteo utilizando una banda elástica.", "video": "https://www.youtube.com/watch?v=GYy5m9lTRiE", "image": "https://example.com/patadas-banda.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 148, "name": "Escalera", "description": "Ejercicio de escalera que trabaja los glúteos.", "video": "https://www.youtube.com/watch?v=K7qZKIs4ty0", "image": "https://example.com/escalera.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 149, "name": "Extensiones de Glúteos en Máquina", "description": "Ejercicio en máquina para activar los glúteos.", "video": "https://www.youtube.com/watch?v=G7Vq8WlhEuM", "image": "https://example.com/extensiones-gluteos-maquina.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 10},
+    {"id": 150, "name": "Zancadas", "description": "Ejercicio de zancadas que trabaja los glúteos y piernas.", "video": "https://www.youtube.com/watch?v=Qx7kW3ph0v4", "image": "https://example.com/zancadas.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 2},
+    #Cuádriceps
+    {"id": 151, "name": "Sentadillas", "description": "Ejercicio básico para trabajar los cuádriceps y piernas.", "video": "https://www.youtube.com/watch?v=UXJrBgI2VcM", "image": "https://example.com/sentadillas.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 2},
+    {"id": 152, "name": "Prensa de Piernas", "description": "Ejercicio en máquina para trabajar los cuádriceps.", "video": "https://www.youtube.com/watch?v=ZPRB5Tt4U2c", "image": "https://example.com/prensa-piernas.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 10},
+    {"id": 153, "name": "Extensión de Pierna", "description": "Ejercicio específico para trabajar los cuádriceps en máquina.", "video": "https://www.youtube.com/watch?v=0eI7P8Ut5zs", "image": "https://example.com/extension-pierna.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 10},
+    {"id": 154, "name": "Sentadilla Frontal", "description": "Sentadilla que enfatiza el trabajo en los cuádriceps.", "video": "https://www.youtube.com/watch?v=1DnVZ1t99VI", "image": "https://example.com/sentadilla-frontal.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 2},
+    {"id": 155, "name": "Zancadas", "description": "Ejercicio de zancadas para trabajar los cuádriceps y glúteos.", "video": "https://www.youtube.com/watch?v=Qx7kW3ph0v4", "image": "https://example.com/zancadas.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 2},
+    {"id": 156, "name": "Sentadilla Búlgara", "description": "Sentadilla con una pierna atrás para trabajar los cuádriceps.", "video": "https://www.youtube.com/watch?v=2C-uNgKwPLE", "image": "https://example.com/sentadilla-bulgar.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 2},
+    {"id": 157, "name": "Sentadilla con Mancuernas", "description": "Sentadilla con mancuernas para añadir resistencia.", "video": "https://www.youtube.com/watch?v=U_Fk8kMDxbs", "image": "https://example.com/sentadilla-mancuernas.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 2},
+    {"id": 158, "name": "Subida a Banco", "description": "Subida a un banco o caja para trabajar los cuádriceps.", "video": "https://www.youtube.com/watch?v=3zpRb2Un7cI", "image": "https://example.com/subida-banco.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 159, "name": "Prensa de Piernas Unilateral", "description": "Ejercicio en máquina para trabajar un solo cuádriceps a la vez.", "video": "https://www.youtube.com/watch?v=JhQw4V0w0gQ", "image": "https://example.com/prensa-piernas-unilateral.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 10},
+    {"id": 160, "name": "Flexiones de Cuádriceps", "description": "Ejercicio que trabaja los cuádriceps en el suelo.", "video": "https://www.youtube.com/watch?v=4xpyREz47c4", "image": "https://example.com/flexiones-cuadriceps.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 2},
+    #Isquiotibiales
+    {"id": 161, "name": "Peso Muerto", "description": "Ejercicio clásico que trabaja los isquiotibiales y espalda.", "video": "https://www.youtube.com/watch?v=op9kVgVorxBF", "image": "https://example.com/peso-muerto.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 2},
+    {"id": 162, "name": "Curl de Pierna", "description": "Ejercicio específico en máquina para trabajar los isquiotibiales.", "video": "https://www.youtube.com/watch?v=Uo1hZZCyyhw", "image": "https://example.com/curl-pierna.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 10},
+    {"id": 163, "name": "Peso Muerto Rumano", "description": "Ejercicio que se enfoca en los isquiotibiales.", "video": "https://www.youtube.com/watch?v=Jq9G5bN4nY4", "image": "https://example.com/peso-muerto-rumano.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 2},
+    {"id": 164, "name": "Good Mornings", "description": "Ejercicio que trabaja los isquiotibiales y la espalda baja.", "video": "https://www.youtube.com/watch?v=vNw8V4X0TEA", "image": "https://example.com/good-mornings.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 2},
+    {"id": 165, "name": "Puente de Glúteos", "description": "Ejercicio que activa los isquiotibiales y glúteos.", "video": "https://www.youtube.com/watch?v=5vR_Q7DciR8", "image": "https://example.com/puente-gluteos.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 166, "name": "Extensiones de Espalda en Máquina", "description": "Ejercicio que se enfoca en los isquiotibiales y espalda.", "video": "https://www.youtube.com/watch?v=wT1sMygC2i0", "image": "https://example.com/extensiones-espalda.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 10},
+    {"id": 167, "name": "Sentadilla Frontal", "description": "Sentadilla que también trabaja los isquiotibiales.", "video": "https://www.youtube.com/watch?v=1DnVZ1t99VI", "image": "https://example.com/sentadilla-frontal.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 2},
+    {"id": 168, "name": "Curl de Pierna Unilateral", "description": "Ejercicio en máquina para trabajar un solo isquiotibial a la vez.", "video": "https://www.youtube.com/watch?v=0YI2KZnIoqY", "image": "https://example.com/curl-pierna-unilateral.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 10},
+    {"id": 169, "name": "Tijeras", "description": "Ejercicio que se realiza en el suelo para activar los isquiotibiales.", "video": "https://www.youtube.com/watch?v=J9pCpEMu3gA", "image": "https://example.com/tijeras.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 170, "name": "Estiramiento de Isquiotibiales", "description": "Ejercicio de estiramiento para los isquiotibiales.", "video": "https://www.youtube.com/watch?v=ZMz1od3Z-OI", "image": "https://example.com/estiramiento-isquiotibiales.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    #Aductor Mayor
+    {"id": 171, "name": "Adducción de Pierna en Máquina", "description": "Ejercicio que trabaja los aductores en máquina.", "video": "https://www.youtube.com/watch?v=sWAsnZa7XsI", "image": "https://example.com/adduccion-pierna.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 10},
+    {"id": 172, "name": "Sentadilla Sumo", "description": "Sentadilla con una posición de piernas más ancha para activar los aductores.", "video": "https://www.youtube.com/watch?v=lk1pL8s7xTE", "image": "https://example.com/sentadilla-sumo.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 2},
+    {"id": 173, "name": "Flexiones Laterales", "description": "Ejercicio que trabaja los aductores y los flexores laterales.", "video": "https://www.youtube.com/watch?v=l6Fu5yPllgM", "image": "https://example.com/flexiones-laterales.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 174, "name": "Estiramiento de Aductores", "description": "Estiramiento para los músculos aductores.", "video": "https://www.youtube.com/watch?v=J8AP78UuHfg", "image": "https://example.com/estiramiento-aductores.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 175, "name": "Aductores en Cuadrupedia", "description": "Ejercicio en cuadrupedia que activa los aductores.", "video": "https://www.youtube.com/watch?v=p8th4ra6WlI", "image": "https://example.com/aductores-cuadrupedia.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 176, "name": "Zancadas Sumo", "description": "Zancadas en posición sumo para trabajar los aductores.", "video": "https://www.youtube.com/watch?v=ovbCk3iScgI", "image": "https://example.com/zancadas-sumo.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 2},
+    {"id": 177, "name": "Tijeras Laterales", "description": "Ejercicio que activa los aductores en el suelo.", "video": "https://www.youtube.com/watch?v=H0A31K4k2z4", "image": "https://example.com/tijeras-laterales.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 178, "name": "Puente de Aductores", "description": "Ejercicio que activa los aductores y glúteos.", "video": "https://www.youtube.com/watch?v=Xg41AYzGHAw", "image": "https://example.com/puente-aductores.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 179, "name": "Adducción de Pierna Unilateral", "description": "Ejercicio en máquina para activar un solo aductor a la vez.", "video": "https://www.youtube.com/watch?v=lYk2O-kRo4E", "image": "https://example.com/adduccion-pierna-unilateral.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 10},
+    {"id": 180, "name": "Estiramiento de Muslos", "description": "Estiramiento para los aductores.", "video": "https://www.youtube.com/watch?v=8iN3D9E8DRE", "image": "https://example.com/estiramiento-muslos.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    #Gastrocnemio
+    {"id": 181, "name": "Elevación de Talones de Pie", "description": "Ejercicio que trabaja los gastrocnemios de pie.", "video": "https://www.youtube.com/watch?v=1gXx0YqMRE0", "image": "https://example.com/elevacion-talones-pie.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 10},
+    {"id": 182, "name": "Elevación de Talones Sentado", "description": "Ejercicio que se enfoca en los gastrocnemios sentado.", "video": "https://www.youtube.com/watch?v=MGjKcPc3GL4", "image": "https://example.com/elevacion-talones-sentado.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 183, "name": "Elevación de Talones en Escalera", "description": "Ejercicio en escalera para activar los gastrocnemios.", "video": "https://www.youtube.com/watch?v=xgQ4F_vxwx4", "image": "https://example.com/elevacion-talones-escalera.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 184, "name": "Elevación de Talones con Peso", "description": "Ejercicio que trabaja los gastrocnemios con peso adicional.", "video": "https://www.youtube.com/watch?v=gwVYk2hYp04", "image": "https://example.com/elevacion-talones-peso.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 10},
+    {"id": 185, "name": "Tijeras de Pantorrillas", "description": "Ejercicio que se realiza en el suelo para activar los gastrocnemios.", "video": "https://www.youtube.com/watch?v=6qmyS90Br8A", "image": "https://example.com/tijeras-pantorrillas.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 186, "name": "Saltos de Talón", "description": "Ejercicio que trabaja los gastrocnemios con saltos.", "video": "https://www.youtube.com/watch?v=qWr0Uoz4Jx8", "image": "https://example.com/saltos-talón.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 10},
+    {"id": 187, "name": "Estiramiento de Pantorrillas", "description": "Estiramiento para los gastrocnemios.", "video": "https://www.youtube.com/watch?v=7M6tnk3_lA0", "image": "https://example.com/estiramiento-pantorrillas.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 188, "name": "Elevación de Talones con una Pierna", "description": "Ejercicio que trabaja un solo gastrocnemio.", "video": "https://www.youtube.com/watch?v=gytW4ECPptA", "image": "https://example.com/elevacion-talones-pierna-unilateral.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 10},
+    {"id": 189, "name": "Salto de Pantorrillas", "description": "Ejercicio explosivo que activa los gastrocnemios.", "video": "https://www.youtube.com/watch?v=1cgIRLq2N1Y", "image": "https://example.com/salto-pantorrillas.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 10},
+    {"id": 190, "name": "Estiramiento de Pantorrillas de Pie", "description": "Ejercicio de estiramiento para los gastrocnemios de pie.", "video": "https://www.youtube.com/watch?v=wiMn26N3vY0", "image": "https://example.com/estiramiento-pantorrillas-pie.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    #Supraespinoso
+    {"id": 191, "name": "Elevación Lateral", "description": "Ejercicio que trabaja el supraespinoso con pesas.", "video": "https://www.youtube.com/watch?v=7ZzYY7y5-C4", "image": "https://example.com/elevacion-lateral.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 10},
+    {"id": 192, "name": "Press Militar", "description": "Ejercicio de press que activa el supraespinoso.", "video": "https://www.youtube.com/watch?v=q6V1eBuh0W8", "image": "https://example.com/press-militar.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 2},
+    {"id": 193, "name": "Pájaros", "description": "Ejercicio para trabajar la parte posterior del hombro, incluyendo el supraespinoso.", "video": "https://www.youtube.com/watch?v=K6s3P-0Ml5s", "image": "https://example.com/pajaros.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 10},
+    {"id": 194, "name": "Rotaciones Externas", "description": "Ejercicio específico para el supraespinoso, usando bandas de resistencia.", "video": "https://www.youtube.com/watch?v=Gg7UncIlVmA", "image": "https://example.com/rotaciones-externas.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    {"id": 195, "name": "Plancha Lateral con Elevación de Brazo", "description": "Ejercicio que involucra el supraespinoso durante la estabilización lateral.", "video": "https://www.youtube.com/watch?v=I7q4Iyzg4Rk", "image": "https://example.com/plancha-lateral.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 12},
+    {"id": 196, "name": "Press de Hombros en Máquina", "description": "Ejercicio en máquina para trabajar el supraespinoso.", "video": "https://www.youtube.com/watch?v=HXxgPz1lt6E", "image": "https://example.com/press-hombros-maquina.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 10},
+    {"id": 197, "name": "Elevaciones Frontales", "description": "Ejercicio que se enfoca en los deltoides y el supraespinoso.", "video": "https://www.youtube.com/watch?v=pDhv8o6wi1g", "image": "https://example.com/elevaciones-frontales.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 10},
+    {"id": 198, "name": "Fondos en Paralelas", "description": "Ejercicio que activa los músculos del hombro, incluyendo el supraespinoso.", "video": "https://www.youtube.com/watch?v=ghXlfrTRwOE", "image": "https://example.com/fondos-paralelas.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 3, "machine_id": 2},
+    {"id": 199, "name": "Pulsos de Hombro con Mancuerna", "description": "Ejercicio que involucra el supraespinoso con movimientos pulsados.", "video": "https://www.youtube.com/watch?v=DP1CBn9JK9Q", "image": "https://example.com/pulsos-hombro.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 10},
+    {"id": 200, "name": "Estiramiento de Hombros", "description": "Estiramiento para el supraespinoso y otros músculos del hombro.", "video": "https://www.youtube.com/watch?v=6e3gP5IjP-w", "image": "https://example.com/estiramiento-hombros.jpg", "dateAdded": date(2024, 10, 13), "dificulty_id": 2, "machine_id": 12},
+    #Soleo
+    {"id": 201, "name": "Elevación de Talones en Máquina", "description": "Ejercicio específico para trabajar el sóleo en la máquina de pantorrillas.", "video": "https://www.youtube.com/watch?v=Vv6pQh99N68", "image": "https://example.com/elevacion-talones-maquina.jpg", "dateAdded": date(2024, 6, 1), "dificulty_id": 1, "machine_id": 3},
+    {"id": 202, "name": "Elevación de Talones de Pie", "description": "Ejercicio que se realiza de pie, utilizando solo el peso corporal para activar el sóleo.", "video": "https://www.youtube.com/watch?v=Y2aH4cfDReU", "image": "https://example.com/elevacion-talones-pie.jpg", "dateAdded": date(2024, 6, 2), "dificulty_id": 1, "machine_id": 4},
+    {"id": 203, "name": "Elevación de Talones Sentado", "description": "Ejercicio en el que se realiza una elevación de talones en posición sentada, enfocándose en el sóleo.", "video": "https://www.youtube.com/watch?v=PrfMTxKp8es", "image": "https://example.com/elevacion-talones-sentado.jpg", "dateAdded": date(2024, 6, 3), "dificulty_id": 1, "machine_id": 3},
+    {"id": 204, "name": "Saltos en la Punta de los Pies", "description": "Ejercicio pliométrico que activa los músculos de la pantorrilla, incluido el sóleo.", "video": "https://www.youtube.com/watch?v=zyk6OYmD4lM", "image": "https://example.com/saltos-punta-pies.jpg", "dateAdded": date(2024, 6, 4), "dificulty_id": 1, "machine_id": 4},
+    {"id": 205, "name": "Caminata en Punta de Pies", "description": "Ejercicio de activación que involucra caminar sobre la punta de los pies, enfocándose en el sóleo.", "video": "https://www.youtube.com/watch?v=Zn6Ri2qS9qY", "image": "https://example.com/caminata-punta-pies.jpg", "dateAdded": date(2024, 6, 5), "dificulty_id": 1, "machine_id": 4},
+    {"id": 206, "name": "Zancadas hacia Adelante con Elevación de Talones", "description": "Ejercicio que combina zancadas con elevación de talones, trabajando el sóleo.", "video": "https://www.youtube.com/watch?v=yk6CT01i3uY", "image": "https://example.com/zancadas-elevacion-talones.jpg", "dateAdded": date(2024, 6, 6), "dificulty_id": 2, "machine_id": 2},
+    {"id": 207, "name": "Estiramientos de Sóleo", "description": "Ejercicio de estiramiento enfocado en el sóleo para mejorar la flexibilidad.", "video": "https://www.youtube.com/watch?v=EK7m8yKn5-4", "image": "https://example.com/estiramiento-soleo.jpg", "dateAdded": date(2024, 6, 7), "dificulty_id": 1, "machine_id": 12},
+    {"id": 208, "name": "Elevación de Talones con Banda Elástica", "description": "Ejercicio que utiliza una banda elástica para agregar resistencia en la elevación de talones.", "video": "https://www.youtube.com/watch?v=xFBt7UE9e4o", "image": "https://example.com/elevacion-banda-elastica.jpg", "dateAdded": date(2024, 6, 8), "dificulty_id": 1, "machine_id": 5},
+    {"id": 209, "name": "Caminata en Pendiente", "description": "Ejercicio que implica caminar en una superficie inclinada, activando el sóleo.", "video": "https://www.youtube.com/watch?v=4x5L-AfrHj4", "image": "https://example.com/caminata-pendiente.jpg", "dateAdded": date(2024, 6, 9), "dificulty_id": 1, "machine_id": 13},
+    {"id": 210, "name": "Escalera de Agilidad", "description": "Ejercicio que utiliza una escalera de agilidad para trabajar la coordinación y el sóleo.", "video": "https://www.youtube.com/watch?v=PTsS5ysxXjM", "image": "https://example.com/escalera-agilidad.jpg", "dateAdded": date(2024, 6, 10), "dificulty_id": 1, "machine_id": 9},
+    #Erectores Espinales
+    {"id": 211, "name": "Extensiones de Espalda en Banco", "description": "Ejercicio en un banco que trabaja los erectores espinales.", "video": "https://www.youtube.com/watch?v=Z5n4XH5KSHM", "image": "https://example.com/extensiones-espalda.jpg", "dateAdded": date(2024, 6, 1), "dificulty_id": 2, "machine_id": 3},
+    {"id": 212, "name": "Peso Muerto con Piernas Rígidas", "description": "Ejercicio que se centra en los erectores espinales y los isquiotibiales.", "video": "https://www.youtube.com/watch?v=KmcMDr0k0sM", "image": "https://example.com/peso-muerto-rigido.jpg", "dateAdded": date(2024, 6, 2), "dificulty_id": 2, "machine_id": 2},
+    {"id": 213, "name": "Superman", "description": "Ejercicio de activación de espalda baja.", "video": "https://www.youtube.com/watch?v=2p4iGkE3ChI", "image": "https://example.com/superman.jpg", "dateAdded": date(2024, 6, 3), "dificulty_id": 1, "machine_id": 4},
+    {"id": 214, "name": "Hiperextensiones en Banco Romano", "description": "Ejercicio de aislamiento que se realiza en un banco romano.", "video": "https://www.youtube.com/watch?v=J8e2sP-TWc8", "image": "https://example.com/hiperextensiones.jpg", "dateAdded": date(2024, 6, 4), "dificulty_id": 1, "machine_id": 1},
+    {"id": 215, "name": "Remo con Barra", "description": "Ejercicio que, al ser realizado con buena postura, activa los erectores espinales.", "video": "https://www.youtube.com/watch?v=8h_m1I0H9Wc", "image": "https://example.com/remo-barra.jpg", "dateAdded": date(2024, 6, 5), "dificulty_id": 2, "machine_id": 2},
+    {"id": 216, "name": "Plancha", "description": "Ejercicio de isometría que fortalece toda la zona media, incluidos los erectores espinales.", "video": "https://www.youtube.com/watch?v=pSHjTRCQxIw", "image": "https://example.com/plancha.jpg", "dateAdded": date(2024, 6, 6), "dificulty_id": 1, "machine_id": 3},
+    {"id": 217, "name": "Puente de Glúteos", "description": "Ejercicio que, aunque se enfoca en los glúteos, también activa los erectores espinales.", "video": "https://www.youtube.com/watch?v=8B0a1I-vw9U", "image": "https://example.com/puente-gluteos.jpg", "dateAdded": date(2024, 6, 7), "dificulty_id": 1, "machine_id": 1},
+    {"id": 218, "name": "Sentadillas con Peso", "description": "Ejercicio que involucra la parte baja de la espalda, incluyendo los erectores espinales.", "video": "https://www.youtube.com/watch?v=1gqG2zqMR0c", "image": "https://example.com/sentadillas.jpg", "dateAdded": date(2024, 6, 8), "dificulty_id": 2, "machine_id": 2},
+    {"id": 219, "name": "Deadlift Rumano", "description": "Variante del peso muerto que enfatiza el trabajo de los erectores espinales.", "video": "https://www.youtube.com/watch?v=ljV_1K7t4OM", "image": "https://example.com/deadlift-rumano.jpg", "dateAdded": date(2024, 6, 9), "dificulty_id": 2, "machine_id": 2},
+    {"id": 220, "name": "Estiramiento de Espalda", "description": "Estiramiento para los músculos de la espalda, incluidos los erectores espinales.", "video": "https://www.youtube.com/watch?v=4B8ZJZQVj4k", "image": "https://example.com/estiramiento-espalda.jpg", "dateAdded": date(2024, 6, 10), "dificulty_id": 1, "machine_id": 12},
+    #Redondo Mayor
+    {"id": 221, "name": "Remo con Mancuernas", "description": "Ejercicio que trabaja el redondo mayor al tirar de las mancuernas hacia el torso.", "video": "https://www.youtube.com/watch?v=LGqj46fAfwE", "image": "https://example.com/remo-mancuernas.jpg", "dateAdded": date(2024, 6, 1), "dificulty_id": 2, "machine_id": 2},
+    {"id": 222, "name": "Pull Over con Mancuerna", "description": "Ejercicio que activa el redondo mayor al levantar una mancuerna sobre la cabeza.", "video": "https://www.youtube.com/watch?v=RzA9hUoSg9M", "image": "https://example.com/pull-over-mancuerna.jpg", "dateAdded": date(2024, 6, 2), "dificulty_id": 2, "machine_id": 1},
+    {"id": 223, "name": "Remo en Máquina", "description": "Ejercicio en una máquina de remo que se enfoca en los músculos de la espalda, incluido el redondo mayor.", "video": "https://www.youtube.com/watch?v=a4Pt8TDhZTg", "image": "https://example.com/remo-maquina.jpg", "dateAdded": date(2024, 6, 3), "dificulty_id": 2, "machine_id": 3},
+    {"id": 224, "name": "Dominadas", "description": "Ejercicio clásico que trabaja varios músculos de la espalda, incluido el redondo mayor.", "video": "https://www.youtube.com/watch?v=U8IMH8dQj6Y", "image": "https://example.com/dominadas.jpg", "dateAdded": date(2024, 6, 4), "dificulty_id": 3, "machine_id": 4},
+    {"id": 225, "name": "Flexiones de Brazos", "description": "Ejercicio que activa la espalda alta, incluyendo el redondo mayor, al estabilizarse en la posición.", "video": "https://www.youtube.com/watch?v=IODxDxX7oi4", "image": "https://example.com/flexiones.jpg", "dateAdded": date(2024, 6, 5), "dificulty_id": 2, "machine_id": 4},
+    {"id": 226, "name": "Face Pull", "description": "Ejercicio con cables que se enfoca en la parte superior de la espalda, trabajando el redondo mayor.", "video": "https://www.youtube.com/watch?v=8fSS6G7mBVI", "image": "https://example.com/face-pull.jpg", "dateAdded": date(2024, 6, 6), "dificulty_id": 2, "machine_id": 8},
+    {"id": 227, "name": "Remo Invertido", "description": "Ejercicio que se realiza con el peso corporal, activando el redondo mayor.", "video": "https://www.youtube.com/watch?v=4yC0oOiISZg", "image": "https://example.com/remo-invertido.jpg", "dateAdded": date(2024, 6, 7), "dificulty_id": 2, "machine_id": 4},
+    {"id": 228, "name": "Remo en Barra T", "description": "Ejercicio que trabaja la parte media de la espalda, incluido el redondo mayor.", "video": "https://www.youtube.com/watch?v=gbN0c3-8Wqc", "image": "https://example.com/remo-barra-t.jpg", "dateAdded": date(2024, 6, 8), "dificulty_id": 2, "machine_id": 3},
+    {"id": 229, "name": "Press Militar", "description": "Ejercicio de hombros que también involucra la parte superior de la espalda, incluido el redondo mayor.", "video": "https://www.youtube.com/watch?v=2yjwTTL55YI", "image": "https://example.com/press-militar.jpg", "dateAdded": date(2024, 6, 9), "dificulty_id": 2, "machine_id": 1},
+    {"id": 230, "name": "Desplante Inverso", "description": "Ejercicio que, además de trabajar las piernas, activa la parte posterior de la espalda.", "video": "https://www.youtube.com/watch?v=8PpSH_7-tbY", "image": "https://example.com/desplante-inverso.jpg", "dateAdded": date(2024, 6, 10), "dificulty_id": 2, "machine_id": 2},
+    #Redondo Menor
+    {"id": 231, "name": "Remo con Mancuernas", "description": "Ejercicio que se enfoca en la parte posterior del hombro y el redondo menor.", "video": "https://www.youtube.com/watch?v=5aQeb9UnPeE", "image": "https://example.com/remo-mancuernas.jpg", "dateAdded": date(2024, 6, 1), "dificulty_id": 2, "machine_id": 2},
+    {"id": 232, "name": "Rotación Externa con Mancuerna", "description": "Ejercicio que activa el redondo menor a través de la rotación externa del hombro.", "video": "https://www.youtube.com/watch?v=3G38o1DJTOc", "image": "https://example.com/rotacion-externa.jpg", "dateAdded": date(2024, 6, 2), "dificulty_id": 1, "machine_id": 1},
+    {"id": 233, "name": "Rotación Externa en Cables", "description": "Ejercicio que se realiza en una máquina de cables, enfocándose en el redondo menor.", "video": "https://www.youtube.com/watch?v=z74kPPLhD3k", "image": "https://example.com/rotacion-externa-cables.jpg", "dateAdded": date(2024, 6, 3), "dificulty_id": 1, "machine_id": 8},
+    {"id": 234, "name": "Press de Hombros", "description": "Ejercicio que activa el redondo menor al trabajar los músculos del hombro.", "video": "https://www.youtube.com/watch?v=2y-8z6Jm3h8", "image": "https://example.com/press-hombros.jpg", "dateAdded": date(2024, 6, 4), "dificulty_id": 2, "machine_id": 1},
+    {"id": 235, "name": "Remo al Pecho", "description": "Ejercicio que trabaja la parte superior de la espalda, incluyendo el redondo menor.", "video": "https://www.youtube.com/watch?v=V9kr7RBCeWg", "image": "https://example.com/remo-pecho.jpg", "dateAdded": date(2024, 6, 5), "dificulty_id": 2, "machine_id": 3},
+    {"id": 236, "name": "Vuelo Inverso", "description": "Ejercicio que se enfoca en la parte posterior de los hombros y el redondo menor.", "video": "https://www.youtube.com/watch?v=1CkfbwvnCUA", "image": "https://example.com/vuelo-inverso.jpg", "dateAdded": date(2024, 6, 6), "dificulty_id": 2, "machine_id": 1},
+    {"id": 237, "name": "Elevaciones Laterales", "description": "Ejercicio que trabaja el deltoides y el redondo menor al levantar las mancuernas hacia los lados.", "video": "https://www.youtube.com/watch?v=3sITXGg_xME", "image": "https://example.com/elevaciones-laterales.jpg", "dateAdded": date(2024, 6, 7), "dificulty_id": 1, "machine_id": 2},
+    {"id": 238, "name": "Estiramiento de Hombro", "description": "Ejercicio de estiramiento para mejorar la movilidad del redondo menor.", "video": "https://www.youtube.com/watch?v=UGMIVFzIHp8", "image": "https://example.com/estiramiento-hombro.jpg", "dateAdded": date(2024, 6, 8), "dificulty_id": 1, "machine_id": 1},
+    {"id": 239, "name": "Remo en T", "description": "Ejercicio que se enfoca en la parte media de la espalda y el redondo menor.", "video": "https://www.youtube.com/watch?v=wRi4ubwHn1g", "image": "https://example.com/remo-t.jpg", "dateAdded": date(2024, 6, 9), "dificulty_id": 2, "machine_id": 3},
+    {"id": 240, "name": "Pullover en Máquina", "description": "Ejercicio que trabaja los músculos de la espalda, incluyendo el redondo menor.", "video": "https://www.youtube.com/watch?v=zMkfgPCrOgA", "image": "https://example.com/pullover-maquina.jpg", "dateAdded": date(2024, 6, 10), "dificulty_id": 2, "machine_id": 8},
+    #Infraespinoso
+    {"id": 241, "name": "Rotación Externa con Banda", "description": "Ejercicio que trabaja el infraespinoso mediante la rotación externa.", "video": "https://www.youtube.com/watch?v=FV8fFzU0Fqw", "image": "https://example.com/rotacion-externa-banda.jpg", "dateAdded": date(2024, 6, 1), "dificulty_id": 1, "machine_id": 2},
+    {"id": 242, "name": "Remo Invertido", "description": "Ejercicio que involucra el infraespinoso al mantener la posición de remado.", "video": "https://www.youtube.com/watch?v=4yC0oOiISZg", "image": "https://example.com/remo-invertido.jpg", "dateAdded": date(2024, 6, 2), "dificulty_id": 2, "machine_id": 4},
+    {"id": 243, "name": "Pull Over con Mancuerna", "description": "Ejercicio que activa el infraespinoso al levantar una mancuerna por encima de la cabeza.", "video": "https://www.youtube.com/watch?v=RzA9hUoSg9M", "image": "https://example.com/pull-over-mancuerna.jpg", "dateAdded": date(2024, 6, 3), "dificulty_id": 2, "machine_id": 1},
+    {"id": 244, "name": "Press de Hombros", "description": "Ejercicio que trabaja el infraespinoso al empujar hacia arriba las pesas.", "video": "https://www.youtube.com/watch?v=2y-8z6Jm3h8", "image": "https://example.com/press-hombros.jpg", "dateAdded": date(2024, 6, 4), "dificulty_id": 2, "machine_id": 1},
+    {"id": 245, "name": "Remo con Barra", "description": "Ejercicio que involucra el infraespinoso al tirar de la barra hacia el torso.", "video": "https://www.youtube.com/watch?v=Y8l2R_k58kg", "image": "https://example.com/remo-barra.jpg", "dateAdded": date(2024, 6, 5), "dificulty_id": 2, "machine_id": 3},
+    {"id": 246, "name": "Dominadas", "description": "Ejercicio que trabaja la parte superior de la espalda, incluyendo el infraespinoso.", "video": "https://www.youtube.com/watch?v=U8IMH8dQj6Y", "image": "https://example.com/dominadas.jpg", "dateAdded": date(2024, 6, 6), "dificulty_id": 3, "machine_id": 4},
+    {"id": 247, "name": "Face Pull", "description": "Ejercicio que se realiza con cables y trabaja el infraespinoso.", "video": "https://www.youtube.com/watch?v=8fSS6G7mBVI", "image": "https://example.com/face-pull.jpg", "dateAdded": date(2024, 6, 7), "dificulty_id": 2, "machine_id": 8},
+    {"id": 248, "name": "Vuelo Inverso", "description": "Ejercicio que se enfoca en la parte posterior de los hombros, activando el infraespinoso.", "video": "https://www.youtube.com/watch?v=1CkfbwvnCUA", "image": "https://example.com/vuelo-inverso.jpg", "dateAdded": date(2024, 6, 8), "dificulty_id": 2, "machine_id": 1},
+    {"id": 249, "name": "Rotación Interna con Banda", "description": "Ejercicio que se centra en el infraespinoso a través de la rotación interna.", "video": "https://www.youtube.com/watch?v=v6g1zVdu8lg", "image": "https://example.com/rotacion-interna-banda.jpg", "dateAdded": date(2024, 6, 9), "dificulty_id": 1, "machine_id": 2},
+    {"id": 250, "name": "Extensiones de Hombro", "description": "Ejercicio que se realiza con mancuernas y activa el infraespinoso.", "video": "https://www.youtube.com/watch?v=I1tDFaC4dNk", "image": "https://example.com/extensiones-hombro.jpg", "dateAdded": date(2024, 6, 10), "dificulty_id": 1, "machine_id": 1},
+    #Deltoides Medio
+    {"id": 251, "name": "Elevaciones Laterales", "description": "Ejercicio que se centra en el deltoides medio, levantando mancuernas hacia los lados.", "video": "https://www.youtube.com/watch?v=3bU8E7cJvCI", "image": "https://example.com/elevaciones-laterales.jpg", "dateAdded": date(2024, 6, 11), "dificulty_id": 1, "machine_id": 1},
+    {"id": 252, "name": "Press Militar", "description": "Ejercicio que activa el deltoides medio al empujar hacia arriba con una barra o mancuernas.", "video": "https://www.youtube.com/watch?v=ziYpAZhW9tU", "image": "https://example.com/press-militar.jpg", "dateAdded": date(2024, 6, 12), "dificulty_id": 2, "machine_id": 1},
+    {"id": 253, "name": "Remo con Mancuernas", "description": "Ejercicio que involucra el deltoides medio en el movimiento de remo.", "video": "https://www.youtube.com/watch?v=wRi4ubwHn1g", "image": "https://example.com/remo-barra-t.jpg", "dateAdded": date(2024, 6, 13), "dificulty_id": 2, "machine_id": 3},
+    {"id": 254, "name": "Pájaros con Mancuernas", "description": "Ejercicio que se realiza para activar el deltoides medio, levantando las mancuernas hacia los lados.", "video": "https://www.youtube.com/watch?v=Ib7e6tVdUjA", "image": "https://example.com/pajaros-mancuernas.jpg", "dateAdded": date(2024, 6, 14), "dificulty_id": 1, "machine_id": 1},
+    {"id": 255, "name": "Presión con Mancuerna", "description": "Ejercicio que activa el deltoides medio al presionar con mancuernas.", "video": "https://www.youtube.com/watch?v=pPTh6X6cO8s", "image": "https://example.com/presion-mancuernas.jpg", "dateAdded": date(2024, 6, 15), "dificulty_id": 1, "machine_id": 1},
+    {"id": 256, "name": "Levantamiento Frontal", "description": "Ejercicio que se enfoca en el deltoides medio al levantar las mancuernas frente al cuerpo.", "video": "https://www.youtube.com/watch?v=2ddYmrK8Q0U", "image": "https://example.com/levantamiento-frontal.jpg", "dateAdded": date(2024, 6, 16), "dificulty_id": 1, "machine_id": 1},
+    {"id": 257, "name": "Press de Hombros con Barra", "description": "Ejercicio que involucra el deltoides medio al empujar una barra por encima de la cabeza.", "video": "https://www.youtube.com/watch?v=8MrSvlVb4v4", "image": "https://example.com/press-hombros-barra.jpg", "dateAdded": date(2024, 6, 17), "dificulty_id": 2, "machine_id": 11},
+    {"id": 258, "name": "Pájaros Invertidos", "description": "Ejercicio que se centra en el deltoides medio y posterior, levantando las mancuernas hacia los lados en posición inclinada.", "video": "https://www.youtube.com/watch?v=xL6b1f1-uy4", "image": "https://example.com/pajaros-invertidos.jpg", "dateAdded": date(2024, 6, 18), "dificulty_id": 2, "machine_id": 1},
+    {"id": 259, "name": "Remo en Cable", "description": "Ejercicio que se realiza en una máquina de cables para activar el deltoides medio.", "video": "https://www.youtube.com/watch?v=5bHnHJ1WTjs", "image": "https://example.com/remo-cable.jpg", "dateAdded": date(2024, 6, 19), "dificulty_id": 2, "machine_id": 8},
+    {"id": 260, "name": "Flexiones de Hombros", "description": "Ejercicio que se enfoca en el deltoides medio utilizando el peso corporal para realizar flexiones.", "video": "https://www.youtube.com/watch?v=sK3T7o_GcCg", "image": "https://example.com/flexiones-hombros.jpg", "dateAdded": date(2024, 6, 20), "dificulty_id": 1, "machine_id": 4},
+    #Oblicuos Internos
+    {"id": 261, "name": "Twist Ruso", "description": "Ejercicio que trabaja los oblicuos internos al rotar el torso.", "video": "https://www.youtube.com/watch?v=8yUfr3xtKdo", "image": "https://example.com/twist-ruso.jpg", "dateAdded": date(2024, 6, 21), "dificulty_id": 1, "machine_id": 1},
+    {"id": 262, "name": "Plancha Lateral", "description": "Ejercicio que activa los oblicuos internos al mantener la posición de plancha de lado.", "video": "https://www.youtube.com/watch?v=2nFcz3Nw5GE", "image": "https://example.com/plancha-lateral.jpg", "dateAdded": date(2024, 6, 22), "dificulty_id": 2, "machine_id": 1},
+    {"id": 263, "name": "Elevación de Pierna Lateral", "description": "Ejercicio que trabaja los oblicuos internos al elevar la pierna lateralmente.", "video": "https://www.youtube.com/watch?v=W4M2D2yU47s", "image": "https://example.com/elevacion-pierna-lateral.jpg", "dateAdded": date(2024, 6, 23), "dificulty_id": 2, "machine_id": 1},
+    {"id": 264, "name": "Crunch Lateral", "description": "Ejercicio que activa los oblicuos internos al realizar un crunch lateral.", "video": "https://www.youtube.com/watch?v=CqMWe8DdPhg", "image": "https://example.com/crunch-lateral.jpg", "dateAdded": date(2024, 6, 24), "dificulty_id": 1, "machine_id": 1},
+    {"id": 265, "name": "Torsiones con Banda", "description": "Ejercicio que involucra una banda elástica para trabajar los oblicuos internos.", "video": "https://www.youtube.com/watch?v=YZ9r4e0FcNQ", "image": "https://example.com/torsiones-banda.jpg", "dateAdded": date(2024, 6, 25), "dificulty_id": 2, "machine_id": 1},
+    {"id": 266, "name": "Elevaciones de Pierna", "description": "Ejercicio que activa los oblicuos internos al elevar las piernas desde una posición acostada.", "video": "https://www.youtube.com/watch?v=JAMoVxWpjTA", "image": "https://example.com/elevaciones-pierna.jpg", "dateAdded": date(2024, 6, 26), "dificulty_id": 1, "machine_id": 1},
+    {"id": 267, "name": "Crunch de Bicicleta", "description": "Ejercicio que trabaja los oblicuos internos al realizar un crunch de bicicleta.", "video": "https://www.youtube.com/watch?v=9zR0K0ZzwS0", "image": "https://example.com/crunch-bicicleta.jpg", "dateAdded": date(2024, 6, 27), "dificulty_id": 1, "machine_id": 1},
+    {"id": 268, "name": "Torsiones de Cadera", "description": "Ejercicio que trabaja los oblicuos internos al girar la parte inferior del cuerpo.", "video": "https://www.youtube.com/watch?v=lECL35lcRj4", "image": "https://example.com/torsiones-cadera.jpg", "dateAdded": date(2024, 6, 28), "dificulty_id": 2, "machine_id": 1},
+    {"id": 269, "name": "Levantamiento de Piernas con Giro", "description": "Ejercicio que combina el levantamiento de piernas con un giro para activar los oblicuos internos.", "video": "https://www.youtube.com/watch?v=RZ1Q41KkWX4", "image": "https://example.com/levantamiento-piernas-giro.jpg", "dateAdded": date(2024, 6, 29), "dificulty_id": 2, "machine_id": 1},
+    {"id": 270, "name": "Plancha Lateral con Elevación", "description": "Ejercicio que combina la plancha lateral con una elevación de cadera para trabajar los oblicuos internos.", "video": "https://www.youtube.com/watch?v=sTqK6q-d5KM", "image": "https://example.com/plancha-lateral-elevacion.jpg", "dateAdded": date(2024, 6, 30), "dificulty_id": 2, "machine_id": 1},
+    #Transverso Abdominal
+    {"id": 271, "name": "Plancha", "description": "Ejercicio que activa el transverso abdominal manteniendo una posición de plancha.", "video": "https://www.youtube.com/watch?v=pSHjTRCQxIw", "image": "https://example.com/plancha.jpg", "dateAdded": date(2024, 7, 1), "dificulty_id": 1, "machine_id": 1},
+    {"id": 272, "name": "Puente", "description": "Ejercicio que trabaja el transverso abdominal al elevar las caderas desde una posición acostada.", "video": "https://www.youtube.com/watch?v=8d8_aM4L1TE", "image": "https://example.com/puente.jpg", "dateAdded": date(2024, 7, 2), "dificulty_id": 1, "machine_id": 1},
+    {"id": 273, "name": "Respiración Diafragmática", "description": "Ejercicio que activa el transverso abdominal mediante la respiración profunda.", "video": "https://www.youtube.com/watch?v=eR8CMQm9jzk", "image": "https://example.com/respiracion-diafragmatica.jpg", "dateAdded": date(2024, 7, 3), "dificulty_id": 1, "machine_id": 1},
+    {"id": 274, "name": "Tijeras", "description": "Ejercicio que involucra el transverso abdominal al cruzar las piernas en posición acostada.", "video": "https://www.youtube.com/watch?v=XdbqAdcB-nM", "image": "https://example.com/tijeras.jpg", "dateAdded": date(2024, 7, 4), "dificulty_id": 1, "machine_id": 1},
+    {"id": 275, "name": "Levantamiento de Caderas", "description": "Ejercicio que activa el transverso abdominal al levantar las caderas desde el suelo.", "video": "https://www.youtube.com/watch?v=Qi0JfdUtPE0", "image": "https://example.com/levantamiento-caderas.jpg", "dateAdded": date(2024, 7, 5), "dificulty_id": 1, "machine_id": 1},
+    {"id": 276, "name": "Crunch Abdominal", "description": "Ejercicio que se enfoca en el transverso abdominal al realizar un crunch desde una posición acostada.", "video": "https://www.youtube.com/watch?v=5cUQgsB3i3I", "image": "https://example.com/crunch-abdominal.jpg", "dateAdded": date(2024, 7, 6), "dificulty_id": 1, "machine_id": 1},
+    {"id": 277, "name": "Rollout con Rueda", "description": "Ejercicio que activa el transverso abdominal al rodar hacia adelante con una rueda.", "video": "https://www.youtube.com/watch?v=7lFwrpA_mog", "image": "https://example.com/rollout-rueda.jpg", "dateAdded": date(2024, 7, 7), "dificulty_id": 2, "machine_id": 1},
+    {"id": 278, "name": "Ciclón", "description": "Ejercicio que trabaja el transverso abdominal mediante movimientos de giro.", "video": "https://www.youtube.com/watch?v=Wn2a4msZ8Rg", "image": "https://example.com/ciclon.jpg", "dateAdded": date(2024, 7, 8), "dificulty_id": 2, "machine_id": 1},
+    {"id": 279, "name": "Elevación de Pierna en Suspensión", "description": "Ejercicio que activa el transverso abdominal al elevar las piernas desde una posición suspendida.", "video": "https://www.youtube.com/watch?v=4Z6O9kaM0Lg", "image": "https://example.com/elevacion-pierna-suspension.jpg", "dateAdded": date(2024, 7, 9), "dificulty_id": 2, "machine_id": 1},
+    {"id": 280, "name": "Plancha Inclinada", "description": "Ejercicio que se centra en el transverso abdominal al mantener una plancha inclinada.", "video": "https://www.youtube.com/watch?v=4Hh1E_XnA8Q", "image": "https://example.com/plancha-inclinada.jpg", "dateAdded": date(2024, 7, 10), "dificulty_id": 2, "machine_id": 1},
+    #Cuadrado Lumbar
+    {"id": 281, "name": "Hip Thrust", "description": "Ejercicio que se centra en el cuadrado lumbar al elevar las caderas con peso.", "video": "https://www.youtube.com/watch?v=1f1AXD3cn5A", "image": "https://example.com/hip-thrust.jpg", "dateAdded": date(2024, 7, 11), "dificulty_id": 2, "machine_id": 1},
+    {"id": 282, "name": "Extensión de Espalda", "description": "Ejercicio que activa el cuadrado lumbar al realizar una extensión desde una posición de tumbado.", "video": "https://www.youtube.com/watch?v=YxeY5Z6OiG0", "image": "https://example.com/extension-espalda.jpg", "dateAdded": date(2024, 7, 12), "dificulty_id": 2, "machine_id": 3},
+    {"id": 283, "name": "Superman", "description": "Ejercicio que se enfoca en el cuadrado lumbar al elevar brazos y piernas simultáneamente.", "video": "https://www.youtube.com/watch?v=Z9M4gPYWf50", "image": "https://example.com/superman.jpg", "dateAdded": date(2024, 7, 13), "dificulty_id": 1, "machine_id": 1},
+    {"id": 284, "name": "Peso Muerto", "description": "Ejercicio que trabaja el cuadrado lumbar al levantar una barra desde el suelo.", "video": "https://www.youtube.com/watch?v=Wg6c8x1lLrI", "image": "https://example.com/peso-muerto.jpg", "dateAdded": date(2024, 7, 14), "dificulty_id": 2, "machine_id": 1},
+    {"id": 285, "name": "Puente en una Pierna", "description": "Ejercicio que se centra en el cuadrado lumbar al elevar las caderas con una pierna levantada.", "video": "https://www.youtube.com/watch?v=GoK2lAGXdvI", "image": "https://example.com/puente-una-pierna.jpg", "dateAdded": date(2024, 7, 15), "dificulty_id": 2, "machine_id": 1},
+    {"id": 286, "name": "Remo Invertido", "description": "Ejercicio que trabaja el cuadrado lumbar en posición invertida usando una barra.", "video": "https://www.youtube.com/watch?v=EBuG3RtnLBw", "image": "https://example.com/remo-invertido.jpg", "dateAdded": date(2024, 7, 16), "dificulty_id": 2, "machine_id": 1},
+    {"id": 287, "name": "Flexión de Caderas", "description": "Ejercicio que activa el cuadrado lumbar al realizar flexiones desde una posición de pie.", "video": "https://www.youtube.com/watch?v=d1UXK8zTQGQ", "image": "https://example.com/flexion-caderas.jpg", "dateAdded": date(2024, 7, 17), "dificulty_id": 1, "machine_id": 1},
+    {"id": 288, "name": "Caminata de Osos", "description": "Ejercicio que involucra movimientos de osos para trabajar el cuadrado lumbar.", "video": "https://www.youtube.com/watch?v=2Zs6vU1b3hA", "image": "https://example.com/caminata-osos.jpg", "dateAdded": date(2024, 7, 18), "dificulty_id": 2, "machine_id": 1},
+    {"id": 289, "name": "Tijeras Invertidas", "description": "Ejercicio que se centra en el cuadrado lumbar mediante movimientos de tijera en posición invertida.", "video": "https://www.youtube.com/watch?v=zgyFjOUDz2A", "image": "https://example.com/tijeras-invertidas.jpg", "dateAdded": date(2024, 7, 19), "dificulty_id": 2, "machine_id": 1},
+    {"id": 290, "name": "Puente con Peso", "description": "Ejercicio que se enfoca en el cuadrado lumbar al añadir peso en el puente.", "video": "https://www.youtube.com/watch?v=f7nmgq8sI8A", "image": "https://example.com/puente-peso.jpg", "dateAdded": date(2024, 7, 20), "dificulty_id": 2, "machine_id": 1},
+    #Glúteo Medio
+    {"id": 291, "name": "Abducción de Cadera", "description": "Ejercicio que trabaja el glúteo medio al elevar la pierna lateralmente.", "video": "https://www.youtube.com/watch?v=KX5cEsw0e4U", "image": "https://example.com/abduccion-cadera.jpg", "dateAdded": date(2024, 7, 21), "dificulty_id": 2, "machine_id": 1},
+    {"id": 292, "name": "Puente de Glúteos", "description": "Ejercicio que activa el glúteo medio al elevar las caderas desde una posición tumbada.", "video": "https://www.youtube.com/watch?v=4mxKCD9U4X4", "image": "https://example.com/puente-gluteos.jpg", "dateAdded": date(2024, 7, 22), "dificulty_id": 2, "machine_id": 1},
+    {"id": 293, "name": "Sentadillas Laterales", "description": "Ejercicio que involucra el glúteo medio al realizar sentadillas hacia un lado.", "video": "https://www.youtube.com/watch?v=42ClE1ueVww", "image": "https://example.com/sentadilla-lateral.jpg", "dateAdded": date(2024, 7, 23), "dificulty_id": 2, "machine_id": 1},
+    {"id": 294, "name": "Elevación de Talones", "description": "Ejercicio que trabaja el glúteo medio al elevar los talones en posición de pie.", "video": "https://www.youtube.com/watch?v=2A5I6O7V8h0", "image": "https://example.com/elevacion-talones.jpg", "dateAdded": date(2024, 7, 24), "dificulty_id": 1, "machine_id": 1},
+    {"id": 295, "name": "Patada de Glúteo", "description": "Ejercicio que se enfoca en el glúteo medio al realizar patadas hacia atrás.", "video": "https://www.youtube.com/watch?v=5nSL0DB4yRg", "image": "https://example.com/patada-gluteo.jpg", "dateAdded": date(2024, 7, 25), "dificulty_id": 1, "machine_id": 1},
+    {"id": 296, "name": "Clamshell", "description": "Ejercicio que trabaja el glúteo medio al abrir las rodillas desde una posición acostada.", "video": "https://www.youtube.com/watch?v=6QFXwFNHp2c", "image": "https://example.com/clamshell.jpg", "dateAdded": date(2024, 7, 26), "dificulty_id": 1, "machine_id": 1},
+    {"id": 297, "name": "Sentadilla Búlgara", "description": "Ejercicio que involucra el glúteo medio al realizar sentadillas con una pierna detrás.", "video": "https://www.youtube.com/watch?v=7UtM8SDoDDI", "image": "https://example.com/sentadilla-bulgar.jpg", "dateAdded": date(2024, 7, 27), "dificulty_id": 2, "machine_id": 1},
+    {"id": 298, "name": "Elevación de Pierna Tumbada", "description": "Ejercicio que se enfoca en el glúteo medio al elevar la pierna desde una posición tumbada.", "video": "https://www.youtube.com/watch?v=4aVjjmD09GQ", "image": "https://example.com/elevacion-pierna-tumbada.jpg", "dateAdded": date(2024, 7, 28), "dificulty_id": 2, "machine_id": 1},
+    {"id": 299, "name": "Puente con Una Pierna", "description": "Ejercicio que activa el glúteo medio al elevar las caderas con una pierna levantada.", "video": "https://www.youtube.com/watch?v=POx-1NSyLOU", "image": "https://example.com/puente-una-pierna.jpg", "dateAdded": date(2024, 7, 29), "dificulty_id": 2, "machine_id": 1},
+    {"id": 300, "name": "Zancadas Laterales", "description": "Ejercicio que trabaja el glúteo medio al realizar zancadas hacia los lados.", "video": "https://www.youtube.com/watch?v=ZSK79FJ0tEg", "image": "https://example.com/zancadas-laterales.jpg", "dateAdded": date(2024, 7, 30), "dificulty_id": 2, "machine_id": 1},
+    #Glúteo Menor
+    {"id": 301, "name": "Sentadilla", "description": "Ejercicio básico que activa el glúteo menor al descender y elevar el cuerpo.", "video": "https://www.youtube.com/watch?v=3X2wK3ArEoE", "image": "https://example.com/sentadilla.jpg", "dateAdded": date(2024, 7, 31), "dificulty_id": 1, "machine_id": 1},
+    {"id": 302, "name": "Abducción de Pierna", "description": "Ejercicio que se centra en el glúteo menor al elevar la pierna hacia un lado.", "video": "https://www.youtube.com/watch?v=I6OlbVmN0Ko", "image": "https://example.com/abduccion-pierna.jpg", "dateAdded": date(2024, 8, 1), "dificulty_id": 1, "machine_id": 1},
+    {"id": 303, "name": "Zancadas", "description": "Ejercicio que trabaja el glúteo menor al realizar movimientos de zancada hacia adelante.", "video": "https://www.youtube.com/watch?v=j_QH7k39j9k", "image": "https://example.com/zancadas.jpg", "dateAdded": date(2024, 8, 2), "dificulty_id": 1, "machine_id": 1},
+    {"id": 304, "name": "Extensión de Caderas", "description": "Ejercicio que se enfoca en el glúteo menor al extender las caderas en posición de pie.", "video": "https://www.youtube.com/watch?v=cGUn2-IfIPM", "image": "https://example.com/extension-caderas.jpg", "dateAdded": date(2024, 8, 3), "dificulty_id": 1, "machine_id": 1},
+    {"id": 305, "name": "Puente con Banda Elástica", "description": "Ejercicio que activa el glúteo menor al realizar un puente con resistencia adicional de una banda elástica.", "video": "https://www.youtube.com/watch?v=l6_66f1E2g0", "image": "https://example.com/puente-banda.jpg", "dateAdded": date(2024, 8, 4), "dificulty_id": 2, "machine_id": 1},
+    {"id": 306, "name": "Patada de Glúteo con Banda", "description": "Ejercicio que trabaja el glúteo menor al realizar una patada hacia atrás con resistencia de una banda elástica.", "video": "https://www.youtube.com/watch?v=vfZ4O3qDye0", "image": "https://example.com/patada-banda.jpg", "dateAdded": date(2024, 8, 5), "dificulty_id": 2, "machine_id": 1},
+    {"id": 307, "name": "Elevación de Talón", "description": "Ejercicio que se centra en el glúteo menor al elevar el talón hacia el glúteo en posición de pie.", "video": "https://www.youtube.com/watch?v=wbDBSnS4c3E", "image": "https://example.com/elevacion-talon.jpg", "dateAdded": date(2024, 8, 6), "dificulty_id": 1, "machine_id": 1},
+    {"id": 308, "name": "Flexión de Cadera", "description": "Ejercicio que activa el glúteo menor al realizar una flexión de cadera con peso.", "video": "https://www.youtube.com/watch?v=R56bPaGdDUE", "image": "https://example.com/flexion-cadera.jpg", "dateAdded": date(2024, 8, 7), "dificulty_id": 2, "machine_id": 1},
+    {"id": 309, "name": "Rotación Externa de Cadera", "description": "Ejercicio que trabaja el glúteo menor al realizar rotaciones externas de la cadera en posición tumbada.", "video": "https://www.youtube.com/watch?v=glOkYRxhI8I", "image": "https://example.com/rotacion-externa.jpg", "dateAdded": date(2024, 8, 8), "dificulty_id": 2, "machine_id": 1},
+    {"id": 310, "name": "Zancadas Cortas", "description": "Ejercicio que se enfoca en el glúteo menor al realizar zancadas cortas en posición de pie.", "video": "https://www.youtube.com/watch?v=U0kkp2H0KDE", "image": "https://example.com/zancadas-cortas.jpg", "dateAdded": date(2024, 8, 9), "dificulty_id": 2, "machine_id": 1},
+    #Aductor Largo
+    {"id": 311, "name": "Sentadilla con Aductor", "description": "Ejercicio que activa el aductor largo al realizar una sentadilla profunda.", "video": "https://www.youtube.com/watch?v=RcmQH_8fGPE", "image": "https://example.com/sentadilla-aductor.jpg", "dateAdded": date(2024, 8, 10), "dificulty_id": 2, "machine_id": 1},
+    {"id": 312, "name": "Zancadas con Aductor", "description": "Ejercicio que trabaja el aductor largo al realizar zancadas hacia adelante con un enfoque en los aductores.", "video": "https://www.youtube.com/watch?v=0yU35IhANwE", "image": "https://example.com/zancadas-aductor.jpg", "dateAdded": date(2024, 8, 11), "dificulty_id": 1, "machine_id": 1},
+    {"id": 313, "name": "Estiramiento de Aductor", "description": "Ejercicio que se centra en el aductor largo al realizar estiramientos profundos.", "video": "https://www.youtube.com/watch?v=eX5U9-y8NOE", "image": "https://example.com/estiramiento-aductor.jpg", "dateAdded": date(2024, 8, 12), "dificulty_id": 1, "machine_id": 1},
+    {"id": 314, "name": "Patada Lateral", "description": "Ejercicio que trabaja el aductor largo al realizar patadas laterales.", "video": "https://www.youtube.com/watch?v=Bw1f0yBZZc0", "image": "https://example.com/patada-lateral.jpg", "dateAdded": date(2024, 8, 13), "dificulty_id": 1, "machine_id": 1},
+    {"id": 315, "name": "Puente de Aductor", "description": "Ejercicio que activa el aductor largo al realizar un puente con los pies juntos.", "video": "https://www.youtube.com/watch?v=TE_O8D_C1ow", "image": "https://example.com/puente-aductor.jpg", "dateAdded": date(2024, 8, 14), "dificulty_id": 2, "machine_id": 1},
+    {"id": 316, "name": "Rotación de Cadera", "description": "Ejercicio que se enfoca en el aductor largo al realizar rotaciones de cadera en posición tumbada.", "video": "https://www.youtube.com/watch?v=NWCLlJhiLxg", "image": "https://example.com/rotacion-cadera.jpg", "dateAdded": date(2024, 8, 15), "dificulty_id": 2, "machine_id": 1},
+    {"id": 317, "name": "Apertura de Cadera", "description": "Ejercicio que trabaja el aductor largo al realizar aperturas de cadera en posición de pie.", "video": "https://www.youtube.com/watch?v=rz0XZ0eZqvI", "image": "https://example.com/apertura-cadera.jpg", "dateAdded": date(2024, 8, 16), "dificulty_id": 1, "machine_id": 1},
+    {"id": 318, "name": "Sentadilla Búlgara con Aductor", "description": "Ejercicio que activa el aductor largo al realizar una sentadilla búlgara.", "video": "https://www.youtube.com/watch?v=v1Q1UNwsvSk", "image": "https://example.com/sentadilla-bulgar-aductor.jpg", "dateAdded": date(2024, 8, 17), "dificulty_id": 2, "machine_id": 1},
+    {"id": 319, "name": "Elevación de Pierna Lateral", "description": "Ejercicio que se centra en el aductor largo al elevar la pierna lateralmente.", "video": "https://www.youtube.com/watch?v=6fr_7fx1gqU", "image": "https://example.com/elevacion-pierna-lateral.jpg", "dateAdded": date(2024, 8, 18), "dificulty_id": 2, "machine_id": 1},
+    {"id": 320, "name": "Estiramiento de Cadera", "description": "Ejercicio que trabaja el aductor largo al realizar estiramientos de cadera.", "video": "https://www.youtube.com/watch?v=Mi6zO8l7Uok", "image": "https://example.com/estiramiento-cadera.jpg", "dateAdded": date(2024, 8, 19), "dificulty_id": 1, "machine_id": 1},
+    #Aductor Corto
+    {"id": 321, "name": "Zancadas Cortas", "description": "Ejercicio que trabaja el aductor corto al realizar zancadas cortas hacia adelante.", "video": "https://www.youtube.com/watch?v=pt1IK_0LfEY", "image": "https://example.com/zancadas-cortas-aductor.jpg", "dateAdded": date(2024, 8, 20), "dificulty_id": 1, "machine_id": 1},
+    {"id": 322, "name": "Estiramiento de Aductor Corto", "description": "Ejercicio que se centra en el aductor corto al realizar estiramientos específicos.", "video": "https://www.youtube.com/watch?v=ObFhKz7bHL0", "image": "https://example.com/estiramiento-aductor-corto.jpg", "dateAdded": date(2024, 8, 21), "dificulty_id": 1, "machine_id": 1},
+    {"id": 323, "name": "Rotación de Cadera Corto", "description": "Ejercicio que trabaja el aductor corto al realizar rotaciones de cadera en posición de pie.", "video": "https://www.youtube.com/watch?v=ZJIKmGvfsrY", "image": "https://example.com/rotacion-cadera-corto.jpg", "dateAdded": date(2024, 8, 22), "dificulty_id": 2, "machine_id": 1},
+    {"id": 324, "name": "Apertura de Cadera Corto", "description": "Ejercicio que se enfoca en el aductor corto al realizar aperturas de cadera en posición de pie.", "video": "https://www.youtube.com/watch?v=kC8oBQkPrfI", "image": "https://example.com/apertura-cadera-corto.jpg", "dateAdded": date(2024, 8, 23), "dificulty_id": 1, "machine_id": 1},
+    {"id": 325, "name": "Patada Lateral Corto", "description": "Ejercicio que activa el aductor corto al realizar patadas laterales.", "video": "https://www.youtube.com/watch?v=o67Ll4nU_Dk", "image": "https://example.com/patada-lateral-corto.jpg", "dateAdded": date(2024, 8, 24), "dificulty_id": 2, "machine_id": 1},
+    {"id": 326, "name": "Zancadas Inversas", "description": "Ejercicio que se centra en el aductor corto al realizar zancadas hacia atrás.", "video": "https://www.youtube.com/watch?v=GfU9Kxw4k6I", "image": "https://example.com/zancadas-inversas.jpg", "dateAdded": date(2024, 8, 25), "dificulty_id": 1, "machine_id": 1},
+    {"id": 327, "name": "Elevación de Pierna Corto", "description": "Ejercicio que trabaja el aductor corto al elevar la pierna lateralmente.", "video": "https://www.youtube.com/watch?v=g5waQGcpOBg", "image": "https://example.com/elevacion-pierna-corto.jpg", "dateAdded": date(2024, 8, 26), "dificulty_id": 2, "machine_id": 1},
+    {"id": 328, "name": "Flexión de Cadera Corto", "description": "Ejercicio que se enfoca en el aductor corto al realizar flexiones de cadera con peso.", "video": "https://www.youtube.com/watch?v=dyb4y1MujCw", "image": "https://example.com/flexion-cadera-corto.jpg", "dateAdded": date(2024, 8, 27), "dificulty_id": 2, "machine_id": 1},
+    {"id": 329, "name": "Estiramiento de Cadera Corto", "description": "Ejercicio que activa el aductor corto al realizar estiramientos de cadera.", "video": "https://www.youtube.com/watch?v=cJwnzRMc5MQ", "image": "https://example.com/estiramiento-cadera-corto.jpg", "dateAdded": date(2024, 8, 28), "dificulty_id": 1, "machine_id": 1},
+    {"id": 330, "name": "Patada Lateral de Aductor Corto", "description": "Ejercicio que se centra en el aductor corto al realizar patadas laterales específicas.", "video": "https://www.youtube.com/watch?v=lAexOXzZKfo", "image": "https://example.com/patada-lateral-aductor-corto.jpg", "dateAdded": date(2024, 8, 29), "dificulty_id": 2, "machine_id": 1},
+    #Grácil
+    {"id": 331, "name": "Zancadas con Grácil", "description": "Ejercicio que trabaja el grácil al realizar zancadas con énfasis en el muslo interno.", "video": "https://www.youtube.com/watch?v=0N53MTyABgI", "image": "https://example.com/zancadas-gracil.jpg", "dateAdded": date(2024, 8, 30), "dificulty_id": 2, "machine_id": 1},
+    {"id": 332, "name": "Sentadilla con Grácil", "description": "Ejercicio que activa el grácil al realizar una sentadilla con enfoque en el muslo interno.", "video": "https://www.youtube.com/watch?v=6RHMktJ89_Q", "image": "https://example.com/sentadilla-gracil.jpg", "dateAdded": date(2024, 8, 31), "dificulty_id": 1, "machine_id": 1},
+    {"id": 333, "name": "Estiramiento de Grácil", "description": "Ejercicio que se centra en el grácil al realizar estiramientos específicos para el muslo interno.", "video": "https://www.youtube.com/watch?v=GJzILH8XqzY", "image": "https://example.com/estiramiento-gracil.jpg", "dateAdded": date(2024, 9, 1), "dificulty_id": 1, "machine_id": 1},
+    {"id": 334, "name": "Rotación de Cadera con Grácil", "description": "Ejercicio que trabaja el grácil al realizar rotaciones de cadera en posición tumbada.", "video": "https://www.youtube.com/watch?v=9oZ1RFEqVQ8", "image": "https://example.com/rotacion-cadera-gracil.jpg", "dateAdded": date(2024, 9, 2), "dificulty_id": 2, "machine_id": 1},
+    {"id": 335, "name": "Apertura de Pierna con Grácil", "description": "Ejercicio que se enfoca en el grácil al realizar aperturas de pierna lateralmente.", "video": "https://www.youtube.com/watch?v=ukAWgPK5YtM", "image": "https://example.com/apertura-pierna-gracil.jpg", "dateAdded": date(2024, 9, 3), "dificulty_id": 2, "machine_id": 1},
+    {"id": 336, "name": "Elevación de Pierna con Grácil", "description": "Ejercicio que activa el grácil al elevar la pierna lateralmente en posición de pie.", "video": "https://www.youtube.com/watch?v=WtPEUymq7C4", "image": "https://example.com/elevacion-pierna-gracil.jpg", "dateAdded": date(2024, 9, 4), "dificulty_id": 1, "machine_id": 1},
+    {"id": 337, "name": "Estiramiento de Cadera con Grácil", "description": "Ejercicio que trabaja el grácil al realizar estiramientos de cadera.", "video": "https://www.youtube.com/watch?v=d6lfyE3j1b0", "image": "https://example.com/estiramiento-cadera-gracil.jpg", "dateAdded": date(2024, 9, 5), "dificulty_id": 1, "machine_id": 1},
+    {"id": 338, "name": "Flexión de Cadera con Grácil", "description": "Ejercicio que se centra en el grácil al realizar flexiones de cadera con peso.", "video": "https://www.youtube.com/watch?v=fuwg8m0e_9g", "image": "https://example.com/flexion-cadera-gracil.jpg", "dateAdded": date(2024, 9, 6), "dificulty_id": 2, "machine_id": 1},
+    {"id": 339, "name": "Rotación de Cadera Interna con Grácil", "description": "Ejercicio que trabaja el grácil al realizar rotaciones internas de cadera en posición de pie.", "video": "https://www.youtube.com/watch?v=I3IuBHFwRHA", "image": "https://example.com/rotacion-cadera-interna-gracil.jpg", "dateAdded": date(2024, 9, 7), "dificulty_id": 2, "machine_id": 1},
+    {"id": 340, "name": "Zancadas Lateral con Grácil", "description": "Ejercicio que activa el grácil al realizar zancadas laterales.", "video": "https://www.youtube.com/watch?v=t4WvnPMuPrA", "image": "https://example.com/zancadas-laterales-gracil.jpg", "dateAdded": date(2024, 9, 8), "dificulty_id": 2, "machine_id": 1}
+]
+
+def dialect_insert(db: Session):
+    """insert() del dialecto de la sesión, con ON CONFLICT (PostgreSQL o SQLite)."""
+    return postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+
+def insert_ignore(db: Session, model, rows: list) -> None:
+    """Insertar las filas que no existan todavía (por clave primaria) en una sola sentencia."""
+    if not rows:
+        return
+    db.execute(dialect_insert(db)(model).on_conflict_do_nothing(), rows)
+    if db.get_bind().dialect.name == "postgresql" and "id" in rows[0]:
+        # Las filas llevan id explícito: la secuencia debe seguir al máximo insertado
+        table = model.__table__
+        db.execute(select(func.setval(
+            func.pg_get_serial_sequence(table.fullname, "id"),
+            select(func.max(table.c.id)).scalar_subquery(),
+        )))
 
 def init_roles(db: Session):
-    roles = [
-        {"id": 1, "name": "Usuario Logueado", "description": "Rol de usuario logueado"},
-        {"id": 2, "name": "Usuario Premium", "description": "Rol de usuario premium"},
-        {"id": 3, "name": "Gym", "description": "Rol de gimnasio"},
-        {"id": 4, "name": "Admin", "description": "Rol de administrador"}
-    ]
-    for role in roles:
-        if not db.query(Role).filter_by(id=role["id"]).first():
-            db.add(Role(**role))
+    insert_ignore(db, Role, ROLES)
     db.commit()
 
 def init_week_days(db: Session):
-    days = [
-        {"id": 1, "name": "Lunes"},
-        {"id": 2, "name": "Martes"},
-        {"id": 3, "name": "Miércoles"},
-        {"id": 4, "name": "Jueves"},
-        {"id": 5, "name": "Viernes"},
-        {"id": 6, "name": "Sábado"},
-        {"id": 7, "name": "Domingo"}
-    ]
-    for day in days:
-        if not db.query(WeekDay).filter_by(id=day["id"]).first():
-            db.add(WeekDay(**day))
+    insert_ignore(db, WeekDay, WEEK_DAYS)
     db.commit()
 
 def init_muscles(db: Session):
-    muscles = [
-        {"id": 1, "name": "Pecho", "description": "Grupo muscular en la parte delantera del torso, responsable de movimientos de empuje."},
-        {"id": 2, "name": "Espalda", "description": "Grupo muscular en la parte posterior del torso, involucrado en movimientos de tracción y estabilización."},
-        {"id": 3, "name": "Hombros", "description": "Grupo muscular ubicado en la parte superior del brazo, clave en movimientos de empuje y elevación."},
-        {"id": 4, "name": "Brazos", "description": "Grupo muscular que incluye los músculos en la parte superior del brazo, responsable de flexión y extensión del codo."},
-        {"id": 5, "name": "Antebrazos", "description": "Músculos responsables de la flexión y extensión de la muñeca y los dedos."},
-        {"id": 6, "name": "Abdomen", "description": "Grupo muscular en la parte frontal del torso, fundamental para la estabilidad del core y movimientos de flexión del tronco."},
-        {"id": 7, "name": "Zona Lumbar", "description": "Músculos en la parte baja de la espalda, esenciales para la estabilidad y extensión de la columna."},
-        {"id": 8, "name": "Glúteos", "description": "Grupo muscular en la parte posterior de la cadera, involucrado en la extensión de la cadera y estabilización."},
-        {"id": 9, "name": "Muslos", "description": "Grupo muscular en la parte frontal y posterior del muslo, responsable de la extensión y flexión de la rodilla."},
-        {"id": 10, "name": "Aductores", "description": "Grupo muscular en la parte interna del muslo, encargado de la aducción de la pierna."},
-        {"id": 11, "name": "Pantorrillas", "description": "Músculos en la parte inferior de la pierna, responsables de la flexión plantar del pie."},
-        {"id": 12, "name": "Serrato Anterior", "description": "Músculo en la parte lateral del torso, involucrado en la estabilización de la escápula."}
-    ]
-    for muscle in muscles:
-        if not db.query(Muscle).filter_by(id=muscle["id"]).first():
-            db.add(Muscle(**muscle))
+    insert_ignore(db, Muscle, MUSCLES)
     db.commit()
 
 def init_specific_muscles(db: Session):
-    specific_muscles = [
-        {"id": 1, "name": "Pectoral Mayor", "muscle_id": 1, "description": "Músculo principal del pecho, responsable de la aducción y rotación interna del brazo."},
-        {"id": 2, "name": "Pectoral Menor", "muscle_id": 1, "description": "Músculo pequeño bajo el pectoral mayor, responsable de la estabilización de la escápula."},
-        {"id": 3, "name": "Trapecio", "muscle_id": 2, "description": "Músculo grande en la parte superior de la espalda, encargado de los movimientos de la escápula."},
-        {"id": 4, "name": "Dorsal Ancho", "muscle_id": 2, "description": "Músculo principal de la espalda, responsable de la extensión y aducción del brazo."},
-        {"id": 5, "name": "Deltoides Anterior", "muscle_id": 3, "description": "Parte frontal del músculo del hombro, involucrado en la flexión del brazo."},
-        {"id": 6, "name": "Bíceps", "muscle_id": 4, "description": "Músculo en la parte frontal del brazo, encargado de la flexión del codo y la supinación del antebrazo."},
-        {"id": 7, "name": "Tríceps", "muscle_id": 4, "description": "Músculo en la parte posterior del brazo, encargado de la extensión del codo."},
-        {"id": 8, "name": "Flexores del Antebrazo", "muscle_id": 5, "description": "Músculos encargados de la flexión de la muñeca y los dedos."},
-        {"id": 9, "name": "Extensores del Antebrazo", "muscle_id": 5, "description": "Músculos encargados de la extensión de la muñeca y los dedos."},
-        {"id": 10, "name": "Recto Abdominal", "muscle_id": 6, "description": "Músculo frontal del abdomen, responsable de la flexión del tronco."},
-        {"id": 11, "name": "Oblicuos Externos", "muscle_id": 6, "description": "Músculos laterales del abdomen, responsables de la rotación y flexión lateral del tronco."},
-        {"id": 12, "name": "Erector de la Columna", "muscle_id": 7, "description": "Músculos largos a lo largo de la columna vertebral, encargados de su extensión y estabilidad."},
-        {"id": 13, "name": "Glúteo Mayor", "muscle_id": 8, "description": "Músculo más grande de los glúteos, encargado de la extensión de la cadera."},
-        {"id": 14, "name": "Cuádriceps", "muscle_id": 9, "description": "Grupo muscular en la parte frontal del muslo, responsable de la extensión de la rodilla."},
-        {"id": 15, "name": "Isquiotibiales", "muscle_id": 9, "description": "Grupo muscular en la parte posterior del muslo, encargado de la flexión de la rodilla y extensión de la cadera."},
-        {"id": 16, "name": "Aductor Mayor", "muscle_id": 10, "description": "Músculo principal en la parte interna del muslo, responsable de la aducción de la pierna."},
-        {"id": 17, "name": "Gastrocnemio", "muscle_id": 11, "description": "Músculo grande en la pantorrilla, responsable de la flexión plantar del pie."},
-        {"id": 18, "name": "Sóleo", "muscle_id": 11, "description": "Músculo profundo en la pantorrilla, que también contribuye a la flexión plantar del pie."},
-        {"id": 19, "name": "Supraespinoso", "muscle_id": 2, "description": "Músculo del manguito rotador responsable de la abducción del brazo."},
-        {"id": 20, "name": "Romboides", "muscle_id": 2, "description": "Músculos entre la escápula y la columna vertebral, responsables de la retracción de la escápula."},
-        {"id": 21, "name": "Erectores Espinales", "muscle_id": 2, "description": "Grupo de músculos largos a lo largo de la columna vertebral, encargados de su extensión y estabilización."},
-        {"id": 22, "name": "Redondo Mayor", "muscle_id": 2, "description": "Músculo en la parte inferior del omóplato, responsable de la extensión y aducción del brazo."},
-        {"id": 23, "name": "Redondo Menor", "muscle_id": 2, "description": "Músculo del manguito rotador, involucrado en la rotación externa del brazo."},
-        {"id": 24, "name": "Infraespinoso", "muscle_id": 2, "description": "Músculo del manguito rotador que contribuye a la rotación externa del brazo."},
-        {"id": 25, "name": "Deltoides Medio", "muscle_id": 3, "description": "Parte media del músculo del hombro, encargada de la abducción del brazo."},
-        {"id": 26, "name": "Deltoides Posterior", "muscle_id": 3, "description": "Parte posterior del músculo del hombro, involucrada en la extensión y rotación externa del brazo."},
-        {"id": 27, "name": "Oblicuos Internos", "muscle_id": 6, "description": "Músculos en los laterales del abdomen, responsables de la flexión lateral y rotación del tronco."},
-        {"id": 28, "name": "Transverso Abdominal", "muscle_id": 6, "description": "Músculo profundo del abdomen, encargado de la compresión del abdomen y estabilidad del core."},
-        {"id": 29, "name": "Cuadrado Lumbar", "muscle_id": 7, "description": "Músculo profundo en la parte baja de la espalda, responsable de la estabilización y flexión lateral del tronco."},
-        {"id": 30, "name": "Glúteo Medio", "muscle_id": 8, "description": "Músculo en la parte lateral de la cadera, encargado de la abducción de la pierna y estabilización de la pelvis."},
-        {"id": 31, "name": "Glúteo Menor", "muscle_id": 8, "description": "Músculo debajo del glúteo medio, involucrado en la abducción y rotación interna de la pierna."},
-        {"id": 32, "name": "Aductor Largo", "muscle_id": 10, "description": "Músculo en la parte interna del muslo, responsable de la aducción de la pierna."},
-        {"id": 33, "name": "Aductor Corto", "muscle_id": 10, "description": "Músculo más profundo del aductor largo, encargado de la aducción y rotación externa de la pierna."},
-        {"id": 34, "name": "Grácil", "muscle_id": 10, "description": "Músculo delgado en la parte interna del muslo, responsable de la aducción de la pierna y flexión de la rodilla."},
-    ]
-    for specific_muscle in specific_muscles:
-        if not db.query(SpecificMuscle).filter_by(id=specific_muscle["id"]).first():
-            db.add(SpecificMuscle(**specific_muscle))
+    insert_ignore(db, SpecificMuscle, SPECIFIC_MUSCLES)
     db.commit()
 
 def init_difficulties(db: Session):
-    difficulties = [
-        {"id": 1, "name": "Facil"},
-        {"id": 2, "name": "Medio"},
-        {"id": 3, "name": "Dificil"},
-        {"id": 4, "name": "Experto"}
-    ]
-    for difficulty in difficulties:
-        if not db.query(Dificulty).filter_by(id=difficulty["id"]).first():
-            db.add(Dificulty(**difficulty))
+    insert_ignore(db, Dificulty, DIFFICULTIES)
     db.commit()
 
 def init_machines(db: Session):
-    machines = [
-        {"id": 1, "name": "Barra Olímpica", "description": "Una barra de acero utilizada en levantamientos compuestos como sentadillas, peso muerto y press de banca. Es fundamental para entrenamientos de fuerza y levantamiento olímpico."},
-        {"id": 2, "name": "Mancuernas", "description": "Pesos libres utilizados para entrenar de forma unilateral, lo que ayuda a equilibrar la fuerza entre ambos lados del cuerpo. Permiten una amplia variedad de ejercicios."},
-        {"id": 3, "name": "Máquina de Fuerza", "description": "Dispositivos mecánicos que guían el movimiento y permiten entrenar músculos específicos de manera controlada y segura, reduciendo el riesgo de lesiones."},
-        {"id": 4, "name": "Peso Corporal", "description": "Ejercicios que utilizan el peso del cuerpo como resistencia, como flexiones, sentadillas o dominadas, promoviendo fuerza funcional y estabilidad."},
-        {"id": 5, "name": "Banda Elástica", "description": "Bandas de resistencia que añaden tensión progresiva a los movimientos. Ideales para entrenar músculos estabilizadores, rehabilitación y movilidad."},
-        {"id": 6, "name": "Kettlebell", "description": "Pesas con forma de bola y una manija. Se utilizan para entrenamientos dinámicos que mejoran la fuerza, la potencia y la resistencia cardiovascular."},
-        {"id": 7, "name": "Balón Medicinal", "description": "Pelotas pesadas que se usan para mejorar la potencia explosiva, la coordinación y la estabilidad del núcleo mediante ejercicios dinámicos."},
-        {"id": 8, "name": "Cables", "description": "Sistema de poleas que permite movimientos multidireccionales y trabajar diferentes músculos. Ideal para entrenamientos funcionales y específicos."},
-        {"id": 9, "name": "Caja Plyo", "description": "Plataforma elevada utilizada para ejercicios pliométricos como saltos, que mejoran la potencia explosiva, agilidad y coordinación."},
-        {"id": 10, "name": "Banco", "description": "Superficie de apoyo para realizar ejercicios con mancuernas, barras u otros equipos. Es fundamental en ejercicios como press de banca y abdominales."},
-        {"id": 11, "name": "Máquina Smith", "description": "Barra guiada que se mueve verticalmente, ideal para entrenar con mayor estabilidad y seguridad en ejercicios de fuerza como sentadillas y press de banca."},
-        {"id": 12, "name": "Estiramientos", "description": "Herramientas o zonas diseñadas para realizar ejercicios de estiramiento que mejoran la flexibilidad y la movilidad, fundamentales para la recuperación."},
-        {"id": 13, "name": "Cardio", "description": "Máquinas como bicicletas estáticas, cintas de correr y elípticas, usadas para mejorar la resistencia cardiovascular y quemar calorías."},
-        {"id": 14, "name": "TRX", "description": "Sistema de suspensión que permite realizar ejercicios de peso corporal con énfasis en la estabilidad del núcleo y la fuerza funcional."},
-        {"id": 15, "name": "Bosu Ball", "description": "Medio balón inflable utilizado para ejercicios de equilibrio, estabilidad y fortalecimiento del núcleo. Ideal para entrenamiento funcional."},
-        {"id": 16, "name": "Recuperación", "description": "Máquinas y equipos utilizados para estiramientos, masajes y otros ejercicios enfocados en la recuperación muscular después del entrenamiento."},
-        {"id": 17, "name": "Yoga", "description": "Espacios y accesorios como colchonetas y bloques utilizados para la práctica de yoga, mejorando la flexibilidad, equilibrio y relajación."},
-        {"id": 18, "name": "Plato", "description": "Pesas circulares que se agregan a barras o se usan de manera independiente para aumentar la carga en levantamientos de fuerza."},
-    ]
-    for machine in machines:
-        if not db.query(Machine).filter_by(id=machine["id"]).first():
-            db.add(Machine(**machine))
+    insert_ignore(db, Machine, MACHINES)
     db.commit()
 
 def init_exercises(db: Session):
-    exercises = [
-        #Pectoral Mayor
-        {"id": 1, "name": "Press de Banca", "description": "Ejercicio compuesto que trabaja principalmente el pectoral mayor, los tríceps y los hombros.", "video": "https://www.youtube.com/watch?v=gRVjAtPip0Y", "image": "https://example.com/press-banca.jpg", "dateAdded": "2024-01-01", "dificulty_id": 2, "machine_id": 10},
-        {"id": 2, "name": "Press de Banca Inclinado", "description": "Variante del press de banca que se enfoca en la parte superior del pectoral mayor.", "video": "https://www.youtube.com/watch?v=DbFgADa2PL8", "image": "https://example.com/press-inclinado.jpg", "dateAdded": "2024-01-02", "dificulty_id": 2, "machine_id": 10},
-        {"id": 3, "name": "Press de Banca con Mancuernas", "description": "Alternativa al press de banca que permite mayor rango de movimiento.", "video": "https://www.youtube.com/watch?v=VmB1G1K7v94", "image": "https://example.com/press-mancuernas.jpg", "dateAdded": "2024-01-03", "dificulty_id": 2, "machine_id": 2},
-        {"id": 4, "name": "Flexiones", "description": "Ejercicio de peso corporal que trabaja el pectoral mayor, tríceps y hombros.", "video": "https://www.youtube.com/watch?v=IODxDxX7oi4", "image": "https://example.com/flexiones.jpg", "dateAdded": "2024-01-04", "dificulty_id": 1, "machine_id": 4},
-        {"id": 5, "name": "Fondos en Paralelas", "description": "Ejercicio de empuje que involucra al pectoral mayor y tríceps.", "video": "https://www.youtube.com/watch?v=2z8JmcrW-As", "image": "https://example.com/fondos-paralelas.jpg", "dateAdded": "2024-01-05", "dificulty_id": 3, "machine_id": 8},
-        {"id": 6, "name": "Press de Pecho en Máquina", "description": "Ejercicio en máquina que aísla el pectoral mayor.", "video": "https://www.youtube.com/watch?v=jPLWml3yLFg", "image": "https://example.com/press-maquina.jpg", "dateAdded": "2024-01-06", "dificulty_id": 1, "machine_id": 3},
-        {"id": 7, "name": "Aperturas con Mancuernas", "description": "Ejercicio de aislamiento para el pectoral mayor que se realiza con mancuernas.", "video": "https://www.youtube.com/watch?v=eozdVDA78K0", "image": "https://example.com/aperturas-mancuernas.jpg", "dateAdded": "2024-01-07", "dificulty_id": 2, "machine_id": 2},
-        {"id": 8, "name": "Aperturas en Máquina", "description": "Variante de las aperturas realizada en máquina para mayor control.", "video": "https://www.youtube.com/watch?v=kr8xINvI9DA", "image": "https://example.com/aperturas-maquina.jpg", "dateAdded": "2024-01-08", "dificulty_id": 1, "machine_id": 3},
-        {"id": 9, "name": "Press de Pecho en Máquina Smith", "description": "Ejercicio de pecho guiado por la máquina Smith, ideal para principiantes.", "video": "https://www.youtube.com/watch?v=gpRX-59E6Yc", "image": "https://example.com/press-smith.jpg", "dateAdded": "2024-01-09", "dificulty_id": 1, "machine_id": 11},
-        {"id": 10, "name": "Press de Pecho con Banda Elástica", "description": "Variante que añade resistencia progresiva para trabajar el pectoral mayor.", "video": "https://www.youtube.com/watch?v=h7XjUbUpeHE", "image": "https://example.com/press-banda.jpg", "dateAdded": "2024-01-10", "dificulty_id": 2, "machine_id": 5},
-        #Pectoral Menor
-        {"id": 11, "name": "Press de Banca Declinado", "description": "Variante del press de banca que enfatiza la parte inferior del pecho.", "video": "https://www.youtube.com/watch?v=ubw9uAgvPq8", "image": "https://example.com/press-declinado.jpg", "dateAdded": "2024-02-01", "dificulty_id": 2, "machine_id": 10},
-        {"id": 12, "name": "Pullover con Mancuernas", "description": "Ejercicio que estira y trabaja el pectoral menor y otros músculos del torso.", "video": "https://www.youtube.com/watch?v=k17d7b6b7p8", "image": "https://example.com/pullover.jpg", "dateAdded": "2024-02-02", "dificulty_id": 2, "machine_id": 2},
-        {"id": 13, "name": "Fondos con Banda Elástica", "description": "Fondos asistidos con banda, enfocados en el pectoral menor.", "video": "https://www.youtube.com/watch?v=Ej5zD75Quwg", "image": "https://example.com/fondos-banda.jpg", "dateAdded": "2024-02-03", "dificulty_id": 1, "machine_id": 5},
-        {"id": 14, "name": "Pullover en Máquina", "description": "Pullover guiado por máquina para mayor control del movimiento.", "video": "https://www.youtube.com/watch?v=DsP6X8mjPdc", "image": "https://example.com/pullover-maquina.jpg", "dateAdded": "2024-02-04", "dificulty_id": 1, "machine_id": 3},
-        {"id": 15, "name": "Cable Crossover Bajo", "description": "Ejercicio en polea que enfoca la contracción del pectoral menor.", "video": "https://www.youtube.com/watch?v=vI5EJzET5Lg", "image": "https://example.com/crossover-bajo.jpg", "dateAdded": "2024-02-05", "dificulty_id": 3, "machine_id": 8},
-        {"id": 16, "name": "Press con TRX", "description": "Ejercicio en suspensión que activa el pectoral menor y estabilizadores.", "video": "https://www.youtube.com/watch?v=y7KiW8NGkIQ", "image": "https://example.com/press-trx.jpg", "dateAdded": "2024-02-06", "dificulty_id": 2, "machine_id": 14},
-        {"id": 17, "name": "Flexiones con Banda Elástica", "description": "Flexiones con resistencia adicional enfocadas en el pectoral menor.", "video": "https://www.youtube.com/watch?v=NkzLUY3trFQ", "image": "https://example.com/flexiones-banda.jpg", "dateAdded": "2024-02-07", "dificulty_id": 2, "machine_id": 5},
-        {"id": 18, "name": "Press de Banca con Kettlebell", "description": "Variante del press de banca con kettlebell que trabaja los estabilizadores.", "video": "https://www.youtube.com/watch?v=drXx-LEfwzo", "image": "https://example.com/press-kettlebell.jpg", "dateAdded": "2024-02-08", "dificulty_id": 3, "machine_id": 6},
-        {"id": 19, "name": "Fondos en Anillas", "description": "Ejercicio avanzado que activa intensamente el pectoral menor.", "video": "https://www.youtube.com/watch?v=kOeNZ2J0Tyc", "image": "https://example.com/fondos-anillas.jpg", "dateAdded": "2024-02-09", "dificulty_id": 4, "machine_id": 4},
-        {"id": 20, "name": "Press en Banco Inclinado con Banda", "description": "Ejercicio que añade resistencia progresiva en el pectoral menor.", "video": "https://www.youtube.com/watch?v=G63aq3rZCDg", "image": "https://example.com/press-banda-inclinado.jpg", "dateAdded": "2024-02-10", "dificulty_id": 3, "machine_id": 5},
-        #Dorsal Ancho
-        {"id": 21, "name": "Dominadas", "description": "Ejercicio clásico de tirón que involucra principalmente el dorsal ancho.", "video": "https://www.youtube.com/watch?v=eGo4IYlbE5g", "image": "https://example.com/dominadas.jpg", "dateAdded": "2024-03-01", "dificulty_id": 3, "machine_id": 8},
-        {"id": 22, "name": "Remo con Barra", "description": "Ejercicio compuesto que trabaja el dorsal ancho, trapecio y los romboides.", "video": "https://www.youtube.com/watch?v=Kx9kK8taK10", "image": "https://example.com/remo-barra.jpg", "dateAdded": "2024-03-02", "dificulty_id": 2, "machine_id": 2},
-        {"id": 23, "name": "Remo en Máquina", "description": "Variante del remo realizado en máquina para mayor control.", "video": "https://www.youtube.com/watch?v=qF7dkrce-mQ", "image": "https://example.com/remo-maquina.jpg", "dateAdded": "2024-03-03", "dificulty_id": 1, "machine_id": 3},
-        {"id": 24, "name": "Remo con Mancuernas", "description": "Ejercicio unilateral que aísla el dorsal ancho.", "video": "https://www.youtube.com/watch?v=-koP10y1qZI", "image": "https://example.com/remo-mancuernas.jpg", "dateAdded": "2024-03-04", "dificulty_id": 2, "machine_id": 2},
-        {"id": 25, "name": "Pull Over con Mancuernas", "description": "Ejercicio que trabaja tanto el dorsal ancho como el pectoral mayor.", "video": "https://www.youtube.com/watch?v=xcdmFUdjDRU", "image": "https://example.com/pullover-mancuernas.jpg", "dateAdded": "2024-03-05", "dificulty_id": 2, "machine_id": 2},
-        {"id": 26, "name": "Dominadas Asistidas", "description": "Dominadas con asistencia que permiten trabajar el dorsal ancho con menos peso corporal.", "video": "https://www.youtube.com/watch?v=rdLnmW5PQd0", "image": "https://example.com/dominadas-asistidas.jpg", "dateAdded": "2024-03-06", "dificulty_id": 1, "machine_id": 12},
-        {"id": 27, "name": "Jalón al Pecho", "description": "Ejercicio en polea que aísla el dorsal ancho.", "video": "https://www.youtube.com/watch?v=CAwf7n6Luuc", "image": "https://example.com/jalon-pecho.jpg", "dateAdded": "2024-03-07", "dificulty_id": 1, "machine_id": 8},
-        {"id": 28, "name": "Remo con Banda Elástica", "description": "Variante del remo utilizando una banda elástica.", "video": "https://www.youtube.com/watch?v=4uOfUPVJdNY", "image": "https://example.com/remo-banda.jpg", "dateAdded": "2024-03-08", "dificulty_id": 1, "machine_id": 5},
-        {"id": 29, "name": "Remo en Máquina Smith", "description": "Ejercicio guiado que involucra el dorsal ancho, realizado en la máquina Smith.", "video": "https://www.youtube.com/watch?v=zyI1GRjFj7A", "image": "https://example.com/remo-smith.jpg", "dateAdded": "2024-03-09", "dificulty_id": 2, "machine_id": 11},
-        {"id": 30, "name": "Pullover en Máquina", "description": "Pullover guiado en máquina para trabajar el dorsal ancho.", "video": "https://www.youtube.com/watch?v=DsP6X8mjPdc", "image": "https://example.com/pullover-maquina.jpg", "dateAdded": "2024-03-10", "dificulty_id": 1, "machine_id": 3},
-        #Trapecio
-        {"id": 31, "name": "Encogimiento de Hombros con Barra", "description": "Ejercicio que aísla el trapecio mediante el levantamiento de una barra.", "video": "https://www.youtube.com/watch?v=X7ZHcI4N3mw", "image": "https://example.com/encogimiento-barra.jpg", "dateAdded": "2024-04-01", "dificulty_id": 2, "machine_id": 2},
-        {"id": 32, "name": "Encogimiento con Mancuernas", "description": "Variante con mancuernas que permite trabajar cada lado del trapecio por separado.", "video": "https://www.youtube.com/watch?v=eoS4n4uY7VY", "image": "https://example.com/encogimiento-mancuernas.jpg", "dateAdded": "2024-04-02", "dificulty_id": 1, "machine_id": 2},
-        {"id": 33, "name": "Remo al Cuello con Barra", "description": "Ejercicio compuesto que involucra el trapecio y los hombros.", "video": "https://www.youtube.com/watch?v=RoxxsJTZ6As", "image": "https://example.com/remo-cuello-barra.jpg", "dateAdded": "2024-04-03", "dificulty_id": 3, "machine_id": 2},
-        {"id": 34, "name": "Encogimientos en Máquina", "description": "Ejercicio en máquina que aísla el trapecio.", "video": "https://www.youtube.com/watch?v=cLXJpU85LOU", "image": "https://example.com/encogimientos-maquina.jpg", "dateAdded": "2024-04-04", "dificulty_id": 1, "machine_id": 3},
-        {"id": 35, "name": "Elevación Lateral con Mancuernas", "description": "Ejercicio que trabaja los hombros y el trapecio.", "video": "https://www.youtube.com/watch?v=3VcKaXpzqRo", "image": "https://example.com/elevacion-lateral.jpg", "dateAdded": "2024-04-05", "dificulty_id": 1, "machine_id": 2},
-        {"id": 36, "name": "Remo con Banda Elástica", "description": "Remo utilizando bandas elásticas para trabajar el trapecio.", "video": "https://www.youtube.com/watch?v=qfQvfrUzaM8", "image": "https://example.com/remo-banda.jpg", "dateAdded": "2024-04-06", "dificulty_id": 1, "machine_id": 5},
-        {"id": 37, "name": "Remo al Cuello en Máquina", "description": "Variante del remo al cuello realizado en máquina para mayor estabilidad.", "video": "https://www.youtube.com/watch?v=nhTr6fo7Mzw", "image": "https://example.com/remo-cuello-maquina.jpg", "dateAdded": "2024-04-07", "dificulty_id": 1, "machine_id": 3},
-        {"id": 38, "name": "Encogimiento con Banda Elástica", "description": "Encogimientos realizados con una banda elástica para activar el trapecio.", "video": "https://www.youtube.com/watch?v=rZT5tvvA5Ls", "image": "https://example.com/encogimiento-banda.jpg", "dateAdded": "2024-04-08", "dificulty_id": 1, "machine_id": 5},
-        {"id": 39, "name": "Encogimiento con Kettlebell", "description": "Variante del encogimiento utilizando kettlebells.", "video": "https://www.youtube.com/watch?v=DyxtGdyQLBg", "image": "https://example.com/encogimiento-kettlebell.jpg", "dateAdded": "2024-04-09", "dificulty_id": 2, "machine_id": 6},
-        {"id": 40, "name": "Remo al Cuello con Kettlebell", "description": "Remo con kettlebell para trabajar el trapecio y los hombros.", "video": "https://www.youtube.com/watch?v=1r7CVf-cPPE", "image": "https://example.com/remo-cuello-kettlebell.jpg", "dateAdded": "2024-04-10", "dificulty_id": 2, "machine_id": 6},
-        #Romboides
-        {"id": 41, "name": "Remo con Mancuernas a una Mano", "description": "Ejercicio que aísla el romboide con el movimiento de remo.", "video": "https://www.youtube.com/watch?v=ljxD43OJVFM", "image": "https://example.com/remo-mano.jpg", "dateAdded": "2024-05-01", "dificulty_id": 2, "machine_id": 2},
-        {"id": 42, "name": "Remo en Máquina con Agarre Cerrado", "description": "Ejercicio en máquina con agarre cerrado que trabaja el romboide.", "video": "https://www.youtube.com/watch?v=atJd_kWBlIg", "image": "https://example.com/remo-agarre-cerrado.jpg", "dateAdded": "2024-05-02", "dificulty_id": 1, "machine_id": 3},
-        {"id": 43, "name": "Remo con Banda Elástica", "description": "Remo utilizando bandas elásticas para activar los romboides.", "video": "https://www.youtube.com/watch?v=3ao6NmZAYpk", "image": "https://example.com/remo-banda-elastica.jpg", "dateAdded": "2024-05-03", "dificulty_id": 1, "machine_id": 5},
-        {"id": 44, "name": "Face Pull en Polea", "description": "Ejercicio en polea que trabaja los romboides y los deltoides posteriores.", "video": "https://www.youtube.com/watch?v=7jnn6YkFV7c", "image": "https://example.com/face-pull.jpg", "dateAdded": "2024-05-04", "dificulty_id": 1, "machine_id": 8},
-        {"id": 45, "name": "Remo con Barra T", "description": "Ejercicio compuesto que trabaja los romboides y otros músculos de la espalda.", "video": "https://www.youtube.com/watch?v=mhdc9rxNOno", "image": "https://example.com/remo-barra-t.jpg", "dateAdded": "2024-05-05", "dificulty_id": 3, "machine_id": 9},
-        {"id": 46, "name": "Remo en Máquina Smith", "description": "Variante del remo con barra, realizado en la máquina Smith para mayor estabilidad.", "video": "https://www.youtube.com/watch?v=CTMymImHBts", "image": "https://example.com/remo-smith-romboides.jpg", "dateAdded": "2024-05-06", "dificulty_id": 2, "machine_id": 11},
-        {"id": 47, "name": "Remo Sentado en Polea Baja", "description": "Remo sentado con polea que aísla los romboides.", "video": "https://www.youtube.com/watch?v=GZbfZ033f74", "image": "https://example.com/remo-sentado.jpg", "dateAdded": "2024-05-07", "dificulty_id": 1, "machine_id": 8},
-        {"id": 48, "name": "Pull Over en Máquina", "description": "Ejercicio en máquina que trabaja el dorsal ancho y activa los romboides.", "video": "https://www.youtube.com/watch?v=sKDbLALWikc", "image": "https://example.com/pullover-maquina-romboides.jpg", "dateAdded": "2024-05-08", "dificulty_id": 2, "machine_id": 3},
-        {"id": 49, "name": "Encogimiento de Hombros en Máquina", "description": "Ejercicio que trabaja el trapecio y los romboides.", "video": "https://www.youtube.com/watch?v=8XNGWZT9kaE", "image": "https://example.com/encogimiento-maquina.jpg", "dateAdded": "2024-05-09", "dificulty_id": 1, "machine_id": 3},
-        {"id": 50, "name": "Remo Pendlay", "description": "Variante del remo con barra, enfocado en los romboides y trapecio.", "video": "https://www.youtube.com/watch?v=0_X7E41aUwA", "image": "https://example.com/remo-pendlay.jpg", "dateAdded": "2024-05-10", "dificulty_id": 3, "machine_id": 2},
-        #Deltoide Posterior
-        {"id": 51, "name": "Pájaros con Mancuernas", "description": "Ejercicio que aísla el deltoides posterior, realizado inclinado hacia adelante.", "video": "https://www.youtube.com/watch?v=w2ex35u6f2c", "image": "https://example.com/pajaros-mancuernas.jpg", "dateAdded": "2024-06-01", "dificulty_id": 2, "machine_id": 2},
-        {"id": 52, "name": "Face Pull en Polea Baja", "description": "Ejercicio en polea enfocado en los deltoides posteriores y romboides.", "video": "https://www.youtube.com/watch?v=RlmTksTFDiY", "image": "https://example.com/face-pull-polea.jpg", "dateAdded": "2024-06-02", "dificulty_id": 1, "machine_id": 8},
-        {"id": 53, "name": "Pájaros en Máquina Pec Deck", "description": "Variante de los pájaros realizado en la máquina Pec Deck.", "video": "https://www.youtube.com/watch?v=xG_FvVVnVzI", "image": "https://example.com/pajaros-maquina.jpg", "dateAdded": "2024-06-03", "dificulty_id": 1, "machine_id": 10},
-        {"id": 54, "name": "Elevaciones Laterales Inclinadas", "description": "Elevaciones laterales con mancuernas para activar los deltoides posteriores.", "video": "https://www.youtube.com/watch?v=8XktkZ2ls9I", "image": "https://example.com/elevaciones-inclinadas.jpg", "dateAdded": "2024-06-04", "dificulty_id": 2, "machine_id": 2},
-        {"id": 55, "name": "Remo con Agarre Inverso en Polea Baja", "description": "Remo en polea con agarre inverso, enfocado en los deltoides posteriores.", "video": "https://www.youtube.com/watch?v=hPs9moXsX-w", "image": "https://example.com/remo-inverso-polea.jpg", "dateAdded": "2024-06-05", "dificulty_id": 1, "machine_id": 8},
-        {"id": 56, "name": "Elevaciones Frontales con Mancuernas", "description": "Ejercicio que trabaja los deltoides anteriores y posteriores.", "video": "https://www.youtube.com/watch?v=f2s-JULK6sw", "image": "https://example.com/elevaciones-frontales.jpg", "dateAdded": "2024-06-06", "dificulty_id": 1, "machine_id": 2},
-        {"id": 57, "name": "Remo con Banda Elástica", "description": "Remo con banda elástica que activa los deltoides posteriores.", "video": "https://www.youtube.com/watch?v=NhBO5zRiWlc", "image": "https://example.com/remo-banda-deltoides.jpg", "dateAdded": "2024-06-07", "dificulty_id": 1, "machine_id": 5},
-        {"id": 58, "name": "Pájaros en Polea Alta", "description": "Variante de los pájaros realizado en la polea alta para mayor control.", "video": "https://www.youtube.com/watch?v=G9ZwYHBxX9g", "image": "https://example.com/pajaros-polea-alta.jpg", "dateAdded": "2024-06-08", "dificulty_id": 2, "machine_id": 8},
-        {"id": 59, "name": "Pájaros con Banda Elástica", "description": "Pájaros realizados con bandas elásticas para trabajar los deltoides posteriores.", "video": "https://www.youtube.com/watch?v=ErL1PzH2hdE", "image": "https://example.com/pajaros-banda.jpg", "dateAdded": "2024-06-09", "dificulty_id": 1, "machine_id": 5},
-        {"id": 60, "name": "Remo en Máquina Smith", "description": "Variante del remo con barra en máquina Smith, enfocado en los deltoides posteriores.", "video": "https://www.youtube.com/watch?v=9kMm_xB5X50", "image": "https://example.com/remo-maquina-deltoides.jpg", "dateAdded": "2024-06-10", "dificulty_id": 2, "machine_id": 11},
-        #Deltoides Anterior
-        {"id": 61, "name": "Elevaciones Frontales con Mancuernas", "description": "Ejercicio enfocado en el deltoides anterior con mancuernas.", "video": "https://www.youtube.com/watch?v=f2s-JULK6sw", "image": "https://example.com/elevaciones-frontales.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 2},
-        {"id": 62, "name": "Press Militar con Barra", "description": "Ejercicio compuesto que trabaja el deltoides anterior y otros músculos del hombro.", "video": "https://www.youtube.com/watch?v=2yjwXTZQDDI", "image": "https://example.com/press-militar-barra.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 11},
-        {"id": 63, "name": "Press Militar en Máquina", "description": "Variante del press militar usando máquina para mayor control.", "video": "https://www.youtube.com/watch?v=j8IuTvOV6w4", "image": "https://example.com/press-militar-maquina.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 10},
-        {"id": 64, "name": "Elevaciones Frontales con Barra", "description": "Ejercicio para el deltoides anterior realizado con barra recta.", "video": "https://www.youtube.com/watch?v=FL8i2awzOpk", "image": "https://example.com/elevaciones-barra.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 2},
-        {"id": 65, "name": "Press Arnold con Mancuernas", "description": "Press que combina rotación, enfocado en el deltoides anterior.", "video": "https://www.youtube.com/watch?v=6Z15_WdXmVw", "image": "https://example.com/press-arnold.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 2},
-        {"id": 66, "name": "Push Press", "description": "Ejercicio dinámico con impulso de piernas que involucra el deltoides anterior.", "video": "https://www.youtube.com/watch?v=7eX1zxnDNu0", "image": "https://example.com/push-press.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 11},
-        {"id": 67, "name": "Press de Hombros en Máquina Smith", "description": "Press de hombros en máquina Smith, ideal para enfocarse en el deltoides anterior.", "video": "https://www.youtube.com/watch?v=eE9b8lJ_Fo4", "image": "https://example.com/press-smith.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 11},
-        {"id": 68, "name": "Elevaciones Frontales con Discos", "description": "Variación de elevaciones frontales usando discos.", "video": "https://www.youtube.com/watch?v=lE5VIPFDK_c", "image": "https://example.com/elevaciones-discos.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 2},
-        {"id": 69, "name": "Press Inclinado con Barra", "description": "Press en banca inclinada que activa el deltoides anterior.", "video": "https://www.youtube.com/watch?v=2z8JmcrW-As", "image": "https://example.com/press-inclinado.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 11},
-        {"id": 70, "name": "Elevaciones Frontales en Polea Baja", "description": "Elevaciones frontales utilizando polea para mantener tensión constante.", "video": "https://www.youtube.com/watch?v=shD5FqZO5dc", "image": "https://example.com/elevaciones-polea.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 8},
-        #Bíceps
-        {"id": 71, "name": "Curl con Barra", "description": "Clásico ejercicio para el bíceps realizado con barra.", "video": "https://www.youtube.com/watch?v=kwG2ipFRgfo", "image": "https://example.com/curl-barra.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 11},
-        {"id": 72, "name": "Curl con Mancuernas", "description": "Curl de bíceps con mancuernas, realizado de pie o sentado.", "video": "https://www.youtube.com/watch?v=av7-8igSXTs", "image": "https://example.com/curl-mancuernas.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 2},
-        {"id": 73, "name": "Curl en Banco Scott", "description": "Curl que aísla el bíceps usando un banco Scott.", "video": "https://www.youtube.com/watch?v=pMJKb6uBUsU", "image": "https://example.com/curl-banco-scott.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 10},
-        {"id": 74, "name": "Curl Concentrado", "description": "Ejercicio que aísla el bíceps mediante un curl con apoyo en el muslo.", "video": "https://www.youtube.com/watch?v=1xMaFs0L3ao", "image": "https://example.com/curl-concentrado.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 2},
-        {"id": 75, "name": "Curl en Máquina", "description": "Ejercicio en máquina específica para bíceps.", "video": "https://www.youtube.com/watch?v=_yuqGKm-CcA", "image": "https://example.com/curl-maquina.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 10},
-        {"id": 76, "name": "Curl Martillo con Mancuernas", "description": "Variación del curl con mancuernas, manteniendo un agarre neutro.", "video": "https://www.youtube.com/watch?v=zC3nLlEvin4", "image": "https://example.com/curl-martillo.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 2},
-        {"id": 77, "name": "Curl con Banda Elástica", "description": "Curl utilizando bandas elásticas para variación de resistencia.", "video": "https://www.youtube.com/watch?v=wvUa7_D6t8U", "image": "https://example.com/curl-banda.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 5},
-        {"id": 78, "name": "Curl en Polea Baja", "description": "Ejercicio de curl utilizando polea baja para tensión continua.", "video": "https://www.youtube.com/watch?v=3UWi44yN-wI", "image": "https://example.com/curl-polea.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 8},
-        {"id": 79, "name": "Curl con Agarre Inverso", "description": "Curl con barra o mancuernas, pero con agarre en pronación.", "video": "https://www.youtube.com/watch?v=pGtWVfqsFpI", "image": "https://example.com/curl-inverso.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 11},
-        {"id": 80, "name": "Curl Spider", "description": "Variante avanzada del curl donde los brazos están completamente estirados.", "video": "https://www.youtube.com/watch?v=hBVcn_omrBI", "image": "https://example.com/curl-spider.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 10},
-        #Tríceps
-        {"id": 81, "name": "Fondos en Paralelas", "description": "Ejercicio de peso corporal que trabaja los tríceps y el pecho.", "video": "https://www.youtube.com/watch?v=2z8JmcrW-As", "image": "https://example.com/fondos-paralelas.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 3},
-        {"id": 82, "name": "Extensiones de Tríceps en Polea Alta", "description": "Ejercicio en polea que aísla los músculos tríceps.", "video": "https://www.youtube.com/watch?v=d_K6GdPzB5c", "image": "https://example.com/extensiones-polea.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 8},
-        {"id": 83, "name": "Press Francés con Mancuernas", "description": "Ejercicio para tríceps con mancuernas, realizado en posición acostada.", "video": "https://www.youtube.com/watch?v=Z3q83nXj3Kw", "image": "https://example.com/press-frances.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 2},
-        {"id": 84, "name": "Patadas de Tríceps", "description": "Ejercicio que se realiza inclinándose hacia adelante para trabajar el tríceps.", "video": "https://www.youtube.com/watch?v=6A3y8p4wLiU", "image": "https://example.com/patadas-triceps.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 2},
-        {"id": 85, "name": "Extensión de Tríceps con Mancuerna", "description": "Extensión de tríceps usando una mancuerna, se puede hacer sentado o de pie.", "video": "https://www.youtube.com/watch?v=ddXIzCz7j-s", "image": "https://example.com/extension-mancuerna.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 2},
-        {"id": 86, "name": "Press de Tríceps en Máquina", "description": "Máquina específica para realizar press de tríceps.", "video": "https://www.youtube.com/watch?v=_M7Dk-94r70", "image": "https://example.com/press-maquina.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 10},
-        {"id": 87, "name": "Extensión de Tríceps sobre la Cabeza", "description": "Extensión de tríceps que se realiza por encima de la cabeza.", "video": "https://www.youtube.com/watch?v=wZng1i9IBfw", "image": "https://example.com/extension-cabeza.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 2},
-        {"id": 88, "name": "Dips en Banco", "description": "Variante de fondos que se realiza entre dos bancos, ideal para principiantes.", "video": "https://www.youtube.com/watch?v=xaV8sGBQeE8", "image": "https://example.com/dips-banco.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 3},
-        {"id": 89, "name": "Rompecráneos con Barra", "description": "Ejercicio clásico para el tríceps, realizado con barra recta o Z.", "video": "https://www.youtube.com/watch?v=ei3W8L08MyE", "image": "https://example.com/rompecraneos.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 10},
-        {"id": 90, "name": "Extensión en Polea Baja", "description": "Extensiones de tríceps utilizando polea baja para mayor tensión.", "video": "https://www.youtube.com/watch?v=YyFV5WFr1DI", "image": "https://example.com/extension-polea-baja.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 8},
-        #Flexores del Antebrazo
-        {"id": 91, "name": "Curl de Muñeca con Barra", "description": "Ejercicio para trabajar los flexores del antebrazo utilizando barra.", "video": "https://www.youtube.com/watch?v=9wJqI8S7M8M", "image": "https://example.com/curl-muneca-barra.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 11},
-        {"id": 92, "name": "Curl de Muñeca con Mancuernas", "description": "Curl de muñeca con mancuernas, se puede realizar sentado o de pie.", "video": "https://www.youtube.com/watch?v=udn4Ru9sbVs", "image": "https://example.com/curl-muneca-mancuernas.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 2},
-        {"id": 93, "name": "Curl de Muñeca en Banco Inclinado", "description": "Curl de muñeca realizado en banco inclinado para mayor rango de movimiento.", "video": "https://www.youtube.com/watch?v=oQmNYD7V3cE", "image": "https://example.com/curl-banco-inclinado.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 10},
-        {"id": 94, "name": "Curl de Muñeca en Polea Baja", "description": "Ejercicio de flexores utilizando polea baja.", "video": "https://www.youtube.com/watch?v=jTAcnqNV2wU", "image": "https://example.com/curl-muneca-polea.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 8},
-        {"id": 95, "name": "Rotaciones de Muñeca", "description": "Ejercicio para fortalecer los músculos del antebrazo mediante rotaciones.", "video": "https://www.youtube.com/watch?v=1DhVnQgBKHg", "image": "https://example.com/rotaciones-muneca.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 2},
-        {"id": 96, "name": "Flexiones de Muñeca con Banda Elástica", "description": "Uso de banda elástica para trabajar los flexores de la muñeca.", "video": "https://www.youtube.com/watch?v=6BBsY6C4I9M", "image": "https://example.com/flexiones-banda.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 5},
-        {"id": 97, "name": "Hammer Curl para Muñeca", "description": "Variación del curl martillo enfocada en los flexores de la muñeca.", "video": "https://www.youtube.com/watch?v=lU0q5V9I7Ro", "image": "https://example.com/hammer-curl.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 2},
-        {"id": 98, "name": "Extensiones de Muñeca con Barra", "description": "Ejercicio para trabajar los extensores, complementario a los flexores.", "video": "https://www.youtube.com/watch?v=8Dk7_KwtoIA", "image": "https://example.com/extensiones-muneca-barra.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 11},
-        {"id": 99, "name": "Prono de Muñeca", "description": "Ejercicio para fortalecer los músculos del antebrazo, se hace con una barra.", "video": "https://www.youtube.com/watch?v=6s4TmPZt3k0", "image": "https://example.com/prono-muneca.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 11},
-        {"id": 100, "name": "Flexiones de Muñeca con Discos", "description": "Uso de discos para trabajar los músculos de la muñeca y antebrazo.", "video": "https://www.youtube.com/watch?v=9ujN2gK2i78", "image": "https://example.com/flexiones-discos.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 11},
-        #Extensores del Antebrazo
-        {"id": 101, "name": "Curl de Muñeca Inverso", "description": "Ejercicio para trabajar los extensores de la muñeca utilizando barra.", "video": "https://www.youtube.com/watch?v=9fpx1yyafl8", "image": "https://example.com/curl-muneca-inverso.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 2},
-        {"id": 102, "name": "Extensión de Muñeca en Banco", "description": "Ejercicio de extensión de muñeca realizado en un banco con soporte.", "video": "https://www.youtube.com/watch?v=25vOgTfy7Ws", "image": "https://example.com/extension-banco.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 10},
-        {"id": 103, "name": "Extensión de Muñeca con Mancuernas", "description": "Ejercicio de extensión con mancuernas para fortalecer los extensores.", "video": "https://www.youtube.com/watch?v=8y4v1DL8s20", "image": "https://example.com/extension-mancuernas.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 10},
-        {"id": 104, "name": "Extensión de Muñeca en Polea Alta", "description": "Extensiones de muñeca utilizando polea alta para resistencia.", "video": "https://www.youtube.com/watch?v=1xHhKPrtxPQ", "image": "https://example.com/extension-polea-alta.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 8},
-        {"id": 105, "name": "Rotaciones de Muñeca con Banda Elástica", "description": "Rotaciones de muñeca usando banda elástica para fortalecer.", "video": "https://www.youtube.com/watch?v=_Ow6R_CsuAo", "image": "https://example.com/rotaciones-banda.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 5},
-        {"id": 106, "name": "Prono de Muñeca con Mancuernas", "description": "Ejercicio que trabaja los extensores de la muñeca con mancuernas.", "video": "https://www.youtube.com/watch?v=HYvxRBBYNrI", "image": "https://example.com/prono-muneca-mancuernas.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 2},
-        {"id": 107, "name": "Extensión de Muñeca con Discos", "description": "Uso de discos para trabajar la extensión de la muñeca.", "video": "https://www.youtube.com/watch?v=I4Jj9Y4TAtM", "image": "https://example.com/extension-discos.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 11},
-        {"id": 108, "name": "Curl de Muñeca con Banda Elástica", "description": "Curl para muñeca utilizando banda elástica como resistencia.", "video": "https://www.youtube.com/watch?v=qR_tCQCEQ4s", "image": "https://example.com/curl-banda.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 5},
-        {"id": 109, "name": "Flexiones Inversas", "description": "Flexiones con las palmas hacia abajo para trabajar extensores.", "video": "https://www.youtube.com/watch?v=qSOPe4D1C5c", "image": "https://example.com/flexiones-inversas.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 3},
-        {"id": 110, "name": "Extensiones en Polea Baja", "description": "Extensiones para extensores usando polea baja.", "video": "https://www.youtube.com/watch?v=lKXtQapUB0c", "image": "https://example.com/extensiones-polea-baja.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 8},
-        #Recto Abdominal
-        {"id": 111, "name": "Crunches", "description": "Ejercicio básico para trabajar el recto abdominal, realizado en el suelo.", "video": "https://www.youtube.com/watch?v=1xI_MhPto9c", "image": "https://example.com/crunches.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 12},
-        {"id": 112, "name": "Elevación de Piernas", "description": "Ejercicio que se realiza acostado, levantando las piernas para trabajar el abdomen.", "video": "https://www.youtube.com/watch?v=JB2oyAWg8iY", "image": "https://example.com/elevacion-piernas.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 12},
-        {"id": 113, "name": "Plancha", "description": "Ejercicio de estabilización que trabaja los abdominales, se sostiene en posición de plancha.", "video": "https://www.youtube.com/watch?v=pSHjTRCQxIw", "image": "https://example.com/plancha.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 114, "name": "Crunches en Máquina", "description": "Variación de crunches que se realiza en una máquina específica para abdominales.", "video": "https://www.youtube.com/watch?v=QmwwG9J3KpA", "image": "https://example.com/crunches-maquina.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 10},
-        {"id": 115, "name": "Bicicleta Abdominal", "description": "Ejercicio que trabaja los abdominales y oblicuos en movimiento de bicicleta.", "video": "https://www.youtube.com/watch?v=9FGilxCbdz8", "image": "https://example.com/bicicleta-abdominal.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 116, "name": "Russian Twist", "description": "Ejercicio que se realiza sentado, trabajando los abdominales y oblicuos.", "video": "https://www.youtube.com/watch?v=wkD8rjkodUI", "image": "https://example.com/russian-twist.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 117, "name": "Elevación de Piernas en Banco", "description": "Ejercicio que se realiza en un banco inclinado para trabajar el abdomen.", "video": "https://www.youtube.com/watch?v=owC7Z8fQ2Tk", "image": "https://example.com/elevacion-piernas-banco.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 10},
-        {"id": 118, "name": "Crunches en Bola Suiza", "description": "Ejercicio que se realiza en una bola suiza para mayor estabilidad y trabajo de los abdominales.", "video": "https://www.youtube.com/watch?v=7UbMO7J-o8o", "image": "https://example.com/crunches-bola.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 119, "name": "Sit-Ups", "description": "Ejercicio clásico que trabaja los abdominales en posición acostada.", "video": "https://www.youtube.com/watch?v=1qD1pBfHD0A", "image": "https://example.com/sit-ups.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 120, "name": "Planchas Laterales", "description": "Ejercicio que trabaja los oblicuos y el recto abdominal en posición lateral.", "video": "https://www.youtube.com/watch?v=HhQxOhm5N7A", "image": "https://example.com/planchas-laterales.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        #Oblicuos Externos
-        {"id": 121, "name": "Russian Twist", "description": "Ejercicio que trabaja los oblicuos a través de un movimiento de rotación.", "video": "https://www.youtube.com/watch?v=wkD8rjkodUI", "image": "https://example.com/russian-twist.jpg", "dateAdded": "2024-10-13", "dificulty_id": 1, "machine_id": 12},
-        {"id": 122, "name": "Plancha Lateral", "description": "Ejercicio isométrico que se sostiene en posición lateral para trabajar los oblicuos.", "video": "https://www.youtube.com/watch?v=K5gK5C4RxG0", "image": "https://example.com/plancha-lateral.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 123, "name": "Elevación de Piernas Lateral", "description": "Elevación de piernas lateral para trabajar los oblicuos.", "video": "https://www.youtube.com/watch?v=YQ1h-6A1I4c", "image": "https://example.com/elevacion-piernas-lateral.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 124, "name": "Caminata Lateral", "description": "Ejercicio de caminata lateral con banda elástica para trabajar los oblicuos.", "video": "https://www.youtube.com/watch?v=6OQBOtYLOCo", "image": "https://example.com/caminata-lateral.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 5},
-        {"id": 125, "name": "Torsiones de Cadera", "description": "Movimientos de torsión para trabajar los oblicuos en posición de pie.", "video": "https://www.youtube.com/watch?v=p5Zs6m2gQRw", "image": "https://example.com/torsiones-cadera.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 126, "name": "Oblique Crunches", "description": "Crunches específicos para los oblicuos.", "video": "https://www.youtube.com/watch?v=xKnT2UEOnpM", "image": "https://example.com/oblique-crunches.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 127, "name": "Rotaciones de Tronco con Mancuernas", "description": "Rotaciones de tronco utilizando mancuernas para trabajar oblicuos.", "video": "https://www.youtube.com/watch?v=GmMS08mLMm0", "image": "https://example.com/rotaciones-tronco-mancuernas.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 10},
-        {"id": 128, "name": "Torsiones con Bola Suiza", "description": "Uso de bola suiza para torsiones y trabajo de los oblicuos.", "video": "https://www.youtube.com/watch?v=KkKp8KhTrG4", "image": "https://example.com/torsiones-bola.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 129, "name": "Sitting Twist", "description": "Torsiones sentado para trabajar los oblicuos.", "video": "https://www.youtube.com/watch?v=YwJv48sqOtA", "image": "https://example.com/sitting-twist.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 130, "name": "Side Bend con Mancuernas", "description": "Flexión lateral con mancuernas para trabajar los oblicuos.", "video": "https://www.youtube.com/watch?v=kFX5wSx7cY4", "image": "https://example.com/side-bend-mancuernas.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 10},
-        #Erector de la Columna
-        {"id": 131, "name": "Peso Muerto", "description": "Ejercicio fundamental para trabajar la cadena posterior, incluyendo el erector de la columna.", "video": "https://www.youtube.com/watch?v=op9kVnSso6Q", "image": "https://example.com/peso-muerto.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 2},
-        {"id": 132, "name": "Buenos Días", "description": "Ejercicio para trabajar el erector de la columna con barra en los hombros.", "video": "https://www.youtube.com/watch?v=U8f6F8Wzm0I", "image": "https://example.com/buenos-dias.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 2},
-        {"id": 133, "name": "Extensión de Espalda en Máquina", "description": "Ejercicio específico para trabajar el erector de la columna en una máquina.", "video": "https://www.youtube.com/watch?v=m5lI7WTFsXc", "image": "https://example.com/extension-espalda-maquina.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 10},
-        {"id": 134, "name": "Hiperextensiones", "description": "Ejercicio de hiperextensión en banco para trabajar el erector de la columna.", "video": "https://www.youtube.com/watch?v=qh40B94LxO4", "image": "https://example.com/hiperextensiones.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 10},
-        {"id": 135, "name": "Levantamiento de Tronco", "description": "Levantamiento de tronco desde posición acostada para fortalecer el erector de la columna.", "video": "https://www.youtube.com/watch?v=WJ9D1gx4P1A", "image": "https://example.com/levantamiento-tronco.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 136, "name": "Remo con Barra", "description": "Ejercicio de remo que también activa el erector de la columna.", "video": "https://www.youtube.com/watch?v=9zR6LbwISkA", "image": "https://example.com/remo-barra.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 2},
-        {"id": 137, "name": "Levantamiento de Caderas", "description": "Levantamiento de caderas para fortalecer la parte baja de la espalda.", "video": "https://www.youtube.com/watch?v=xtY6N1_NvhI", "image": "https://example.com/levantamiento-caderas.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 138, "name": "Puente de Glúteos", "description": "Ejercicio que trabaja el erector de la columna y los glúteos.", "video": "https://www.youtube.com/watch?v=8x3VqPTI_xs", "image": "https://example.com/puente-gluteos.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 139, "name": "Remo con Mancuernas", "description": "Remo unilateral con mancuerna que activa el erector de la columna.", "video": "https://www.youtube.com/watch?v=W2T6EDvSR7g", "image": "https://example.com/remo-mancuernas.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 2},
-        {"id": 140, "name": "Levantamiento de Espalda con Mancuerna", "description": "Levantamiento de espalda con mancuerna para fortalecer el erector de la columna.", "video": "https://www.youtube.com/watch?v=G8PGEctT6Ic", "image": "https://example.com/levantamiento-espalda-mancuerna.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 2},
-        #Glúteo Mayor
-        {"id": 141, "name": "Sentadillas", "description": "Ejercicio que trabaja los glúteos y piernas.", "video": "https://www.youtube.com/watch?v=UXJrBgI2VcM", "image": "https://example.com/sentadillas.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 2},
-        {"id": 142, "name": "Peso Muerto Rumano", "description": "Ejercicio que se enfoca en los glúteos y isquiotibiales.", "video": "https://www.youtube.com/watch?v=Jq9G5bN4nY4", "image": "https://example.com/peso-muerto-rumano.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 2},
-        {"id": 143, "name": "Patadas de Glúteo", "description": "Ejercicio que se realiza en cuadrupedia para activar los glúteos.", "video": "https://www.youtube.com/watch?v=PTg26vY7i5E", "image": "https://example.com/patadas-gluteo.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 144, "name": "Puente de Glúteos", "description": "Ejercicio que se realiza tumbado boca arriba, levantando las caderas.", "video": "https://www.youtube.com/watch?v=5vR_Q7DciR8", "image": "https://example.com/puente-gluteos-2.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 145, "name": "Sentadilla Búlgara", "description": "Sentadilla con una pierna atrás para trabajar los glúteos.", "video": "https://www.youtube.com/watch?v=2C-uNgKwPLE", "image": "https://example.com/sentadilla-bulgar.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 2},
-        {"id": 146, "name": "Elevación de Cadera con Barra", "description": "Elevación de cadera con barra para activar glúteos.", "video": "https://www.youtube.com/watch?v=Gd7BBSklEjE", "image": "https://example.com/elevacion-cadera-barra.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 12},
-        {"id": 147, "name": "Patadas con Banda", "description": "Patadas de glúteo utilizando una banda elástica.", "video": "https://www.youtube.com/watch?v=GYy5m9lTRiE", "image": "https://example.com/patadas-banda.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 148, "name": "Escalera", "description": "Ejercicio de escalera que trabaja los glúteos.", "video": "https://www.youtube.com/watch?v=K7qZKIs4ty0", "image": "https://example.com/escalera.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 149, "name": "Extensiones de Glúteos en Máquina", "description": "Ejercicio en máquina para activar los glúteos.", "video": "https://www.youtube.com/watch?v=G7Vq8WlhEuM", "image": "https://example.com/extensiones-gluteos-maquina.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 10},
-        {"id": 150, "name": "Zancadas", "description": "Ejercicio de zancadas que trabaja los glúteos y piernas.", "video": "https://www.youtube.com/watch?v=Qx7kW3ph0v4", "image": "https://example.com/zancadas.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 2},
-        #Cuádriceps
-        {"id": 151, "name": "Sentadillas", "description": "Ejercicio básico para trabajar los cuádriceps y piernas.", "video": "https://www.youtube.com/watch?v=UXJrBgI2VcM", "image": "https://example.com/sentadillas.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 2},
-        {"id": 152, "name": "Prensa de Piernas", "description": "Ejercicio en máquina para trabajar los cuádriceps.", "video": "https://www.youtube.com/watch?v=ZPRB5Tt4U2c", "image": "https://example.com/prensa-piernas.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 10},
-        {"id": 153, "name": "Extensión de Pierna", "description": "Ejercicio específico para trabajar los cuádriceps en máquina.", "video": "https://www.youtube.com/watch?v=0eI7P8Ut5zs", "image": "https://example.com/extension-pierna.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 10},
-        {"id": 154, "name": "Sentadilla Frontal", "description": "Sentadilla que enfatiza el trabajo en los cuádriceps.", "video": "https://www.youtube.com/watch?v=1DnVZ1t99VI", "image": "https://example.com/sentadilla-frontal.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 2},
-        {"id": 155, "name": "Zancadas", "description": "Ejercicio de zancadas para trabajar los cuádriceps y glúteos.", "video": "https://www.youtube.com/watch?v=Qx7kW3ph0v4", "image": "https://example.com/zancadas.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 2},
-        {"id": 156, "name": "Sentadilla Búlgara", "description": "Sentadilla con una pierna atrás para trabajar los cuádriceps.", "video": "https://www.youtube.com/watch?v=2C-uNgKwPLE", "image": "https://example.com/sentadilla-bulgar.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 2},
-        {"id": 157, "name": "Sentadilla con Mancuernas", "description": "Sentadilla con mancuernas para añadir resistencia.", "video": "https://www.youtube.com/watch?v=U_Fk8kMDxbs", "image": "https://example.com/sentadilla-mancuernas.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 2},
-        {"id": 158, "name": "Subida a Banco", "description": "Subida a un banco o caja para trabajar los cuádriceps.", "video": "https://www.youtube.com/watch?v=3zpRb2Un7cI", "image": "https://example.com/subida-banco.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 159, "name": "Prensa de Piernas Unilateral", "description": "Ejercicio en máquina para trabajar un solo cuádriceps a la vez.", "video": "https://www.youtube.com/watch?v=JhQw4V0w0gQ", "image": "https://example.com/prensa-piernas-unilateral.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 10},
-        {"id": 160, "name": "Flexiones de Cuádriceps", "description": "Ejercicio que trabaja los cuádriceps en el suelo.", "video": "https://www.youtube.com/watch?v=4xpyREz47c4", "image": "https://example.com/flexiones-cuadriceps.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 2},
-        #Isquiotibiales
-        {"id": 161, "name": "Peso Muerto", "description": "Ejercicio clásico que trabaja los isquiotibiales y espalda.", "video": "https://www.youtube.com/watch?v=op9kVgVorxBF", "image": "https://example.com/peso-muerto.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 2},
-        {"id": 162, "name": "Curl de Pierna", "description": "Ejercicio específico en máquina para trabajar los isquiotibiales.", "video": "https://www.youtube.com/watch?v=Uo1hZZCyyhw", "image": "https://example.com/curl-pierna.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 10},
-        {"id": 163, "name": "Peso Muerto Rumano", "description": "Ejercicio que se enfoca en los isquiotibiales.", "video": "https://www.youtube.com/watch?v=Jq9G5bN4nY4", "image": "https://example.com/peso-muerto-rumano.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 2},
-        {"id": 164, "name": "Good Mornings", "description": "Ejercicio que trabaja los isquiotibiales y la espalda baja.", "video": "https://www.youtube.com/watch?v=vNw8V4X0TEA", "image": "https://example.com/good-mornings.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 2},
-        {"id": 165, "name": "Puente de Glúteos", "description": "Ejercicio que activa los isquiotibiales y glúteos.", "video": "https://www.youtube.com/watch?v=5vR_Q7DciR8", "image": "https://example.com/puente-gluteos.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 166, "name": "Extensiones de Espalda en Máquina", "description": "Ejercicio que se enfoca en los isquiotibiales y espalda.", "video": "https://www.youtube.com/watch?v=wT1sMygC2i0", "image": "https://example.com/extensiones-espalda.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 10},
-        {"id": 167, "name": "Sentadilla Frontal", "description": "Sentadilla que también trabaja los isquiotibiales.", "video": "https://www.youtube.com/watch?v=1DnVZ1t99VI", "image": "https://example.com/sentadilla-frontal.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 2},
-        {"id": 168, "name": "Curl de Pierna Unilateral", "description": "Ejercicio en máquina para trabajar un solo isquiotibial a la vez.", "video": "https://www.youtube.com/watch?v=0YI2KZnIoqY", "image": "https://example.com/curl-pierna-unilateral.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 10},
-        {"id": 169, "name": "Tijeras", "description": "Ejercicio que se realiza en el suelo para activar los isquiotibiales.", "video": "https://www.youtube.com/watch?v=J9pCpEMu3gA", "image": "https://example.com/tijeras.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 170, "name": "Estiramiento de Isquiotibiales", "description": "Ejercicio de estiramiento para los isquiotibiales.", "video": "https://www.youtube.com/watch?v=ZMz1od3Z-OI", "image": "https://example.com/estiramiento-isquiotibiales.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        #Aductor Mayor
-        {"id": 171, "name": "Adducción de Pierna en Máquina", "description": "Ejercicio que trabaja los aductores en máquina.", "video": "https://www.youtube.com/watch?v=sWAsnZa7XsI", "image": "https://example.com/adduccion-pierna.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 10},
-        {"id": 172, "name": "Sentadilla Sumo", "description": "Sentadilla con una posición de piernas más ancha para activar los aductores.", "video": "https://www.youtube.com/watch?v=lk1pL8s7xTE", "image": "https://example.com/sentadilla-sumo.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 2},
-        {"id": 173, "name": "Flexiones Laterales", "description": "Ejercicio que trabaja los aductores y los flexores laterales.", "video": "https://www.youtube.com/watch?v=l6Fu5yPllgM", "image": "https://example.com/flexiones-laterales.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 174, "name": "Estiramiento de Aductores", "description": "Estiramiento para los músculos aductores.", "video": "https://www.youtube.com/watch?v=J8AP78UuHfg", "image": "https://example.com/estiramiento-aductores.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 175, "name": "Aductores en Cuadrupedia", "description": "Ejercicio en cuadrupedia que activa los aductores.", "video": "https://www.youtube.com/watch?v=p8th4ra6WlI", "image": "https://example.com/aductores-cuadrupedia.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 176, "name": "Zancadas Sumo", "description": "Zancadas en posición sumo para trabajar los aductores.", "video": "https://www.youtube.com/watch?v=ovbCk3iScgI", "image": "https://example.com/zancadas-sumo.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 2},
-        {"id": 177, "name": "Tijeras Laterales", "description": "Ejercicio que activa los aductores en el suelo.", "video": "https://www.youtube.com/watch?v=H0A31K4k2z4", "image": "https://example.com/tijeras-laterales.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 178, "name": "Puente de Aductores", "description": "Ejercicio que activa los aductores y glúteos.", "video": "https://www.youtube.com/watch?v=Xg41AYzGHAw", "image": "https://example.com/puente-aductores.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 179, "name": "Adducción de Pierna Unilateral", "description": "Ejercicio en máquina para activar un solo aductor a la vez.", "video": "https://www.youtube.com/watch?v=lYk2O-kRo4E", "image": "https://example.com/adduccion-pierna-unilateral.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 10},
-        {"id": 180, "name": "Estiramiento de Muslos", "description": "Estiramiento para los aductores.", "video": "https://www.youtube.com/watch?v=8iN3D9E8DRE", "image": "https://example.com/estiramiento-muslos.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        #Gastrocnemio
-        {"id": 181, "name": "Elevación de Talones de Pie", "description": "Ejercicio que trabaja los gastrocnemios de pie.", "video": "https://www.youtube.com/watch?v=1gXx0YqMRE0", "image": "https://example.com/elevacion-talones-pie.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 10},
-        {"id": 182, "name": "Elevación de Talones Sentado", "description": "Ejercicio que se enfoca en los gastrocnemios sentado.", "video": "https://www.youtube.com/watch?v=MGjKcPc3GL4", "image": "https://example.com/elevacion-talones-sentado.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 183, "name": "Elevación de Talones en Escalera", "description": "Ejercicio en escalera para activar los gastrocnemios.", "video": "https://www.youtube.com/watch?v=xgQ4F_vxwx4", "image": "https://example.com/elevacion-talones-escalera.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 184, "name": "Elevación de Talones con Peso", "description": "Ejercicio que trabaja los gastrocnemios con peso adicional.", "video": "https://www.youtube.com/watch?v=gwVYk2hYp04", "image": "https://example.com/elevacion-talones-peso.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 10},
-        {"id": 185, "name": "Tijeras de Pantorrillas", "description": "Ejercicio que se realiza en el suelo para activar los gastrocnemios.", "video": "https://www.youtube.com/watch?v=6qmyS90Br8A", "image": "https://example.com/tijeras-pantorrillas.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 186, "name": "Saltos de Talón", "description": "Ejercicio que trabaja los gastrocnemios con saltos.", "video": "https://www.youtube.com/watch?v=qWr0Uoz4Jx8", "image": "https://example.com/saltos-talón.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 10},
-        {"id": 187, "name": "Estiramiento de Pantorrillas", "description": "Estiramiento para los gastrocnemios.", "video": "https://www.youtube.com/watch?v=7M6tnk3_lA0", "image": "https://example.com/estiramiento-pantorrillas.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 188, "name": "Elevación de Talones con una Pierna", "description": "Ejercicio que trabaja un solo gastrocnemio.", "video": "https://www.youtube.com/watch?v=gytW4ECPptA", "image": "https://example.com/elevacion-talones-pierna-unilateral.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 10},
-        {"id": 189, "name": "Salto de Pantorrillas", "description": "Ejercicio explosivo que activa los gastrocnemios.", "video": "https://www.youtube.com/watch?v=1cgIRLq2N1Y", "image": "https://example.com/salto-pantorrillas.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 10},
-        {"id": 190, "name": "Estiramiento de Pantorrillas de Pie", "description": "Ejercicio de estiramiento para los gastrocnemios de pie.", "video": "https://www.youtube.com/watch?v=wiMn26N3vY0", "image": "https://example.com/estiramiento-pantorrillas-pie.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        #Supraespinoso
-        {"id": 191, "name": "Elevación Lateral", "description": "Ejercicio que trabaja el supraespinoso con pesas.", "video": "https://www.youtube.com/watch?v=7ZzYY7y5-C4", "image": "https://example.com/elevacion-lateral.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 10},
-        {"id": 192, "name": "Press Militar", "description": "Ejercicio de press que activa el supraespinoso.", "video": "https://www.youtube.com/watch?v=q6V1eBuh0W8", "image": "https://example.com/press-militar.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 2},
-        {"id": 193, "name": "Pájaros", "description": "Ejercicio para trabajar la parte posterior del hombro, incluyendo el supraespinoso.", "video": "https://www.youtube.com/watch?v=K6s3P-0Ml5s", "image": "https://example.com/pajaros.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 10},
-        {"id": 194, "name": "Rotaciones Externas", "description": "Ejercicio específico para el supraespinoso, usando bandas de resistencia.", "video": "https://www.youtube.com/watch?v=Gg7UncIlVmA", "image": "https://example.com/rotaciones-externas.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        {"id": 195, "name": "Plancha Lateral con Elevación de Brazo", "description": "Ejercicio que involucra el supraespinoso durante la estabilización lateral.", "video": "https://www.youtube.com/watch?v=I7q4Iyzg4Rk", "image": "https://example.com/plancha-lateral.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 12},
-        {"id": 196, "name": "Press de Hombros en Máquina", "description": "Ejercicio en máquina para trabajar el supraespinoso.", "video": "https://www.youtube.com/watch?v=HXxgPz1lt6E", "image": "https://example.com/press-hombros-maquina.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 10},
-        {"id": 197, "name": "Elevaciones Frontales", "description": "Ejercicio que se enfoca en los deltoides y el supraespinoso.", "video": "https://www.youtube.com/watch?v=pDhv8o6wi1g", "image": "https://example.com/elevaciones-frontales.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 10},
-        {"id": 198, "name": "Fondos en Paralelas", "description": "Ejercicio que activa los músculos del hombro, incluyendo el supraespinoso.", "video": "https://www.youtube.com/watch?v=ghXlfrTRwOE", "image": "https://example.com/fondos-paralelas.jpg", "dateAdded": "2024-10-13", "dificulty_id": 3, "machine_id": 2},
-        {"id": 199, "name": "Pulsos de Hombro con Mancuerna", "description": "Ejercicio que involucra el supraespinoso con movimientos pulsados.", "video": "https://www.youtube.com/watch?v=DP1CBn9JK9Q", "image": "https://example.com/pulsos-hombro.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 10},
-        {"id": 200, "name": "Estiramiento de Hombros", "description": "Estiramiento para el supraespinoso y otros músculos del hombro.", "video": "https://www.youtube.com/watch?v=6e3gP5IjP-w", "image": "https://example.com/estiramiento-hombros.jpg", "dateAdded": "2024-10-13", "dificulty_id": 2, "machine_id": 12},
-        #Soleo
-        {"id": 201, "name": "Elevación de Talones en Máquina", "description": "Ejercicio específico para trabajar el sóleo en la máquina de pantorrillas.", "video": "https://www.youtube.com/watch?v=Vv6pQh99N68", "image": "https://example.com/elevacion-talones-maquina.jpg", "dateAdded": "2024-06-01", "dificulty_id": 1, "machine_id": 3},
-        {"id": 202, "name": "Elevación de Talones de Pie", "description": "Ejercicio que se realiza de pie, utilizando solo el peso corporal para activar el sóleo.", "video": "https://www.youtube.com/watch?v=Y2aH4cfDReU", "image": "https://example.com/elevacion-talones-pie.jpg", "dateAdded": "2024-06-02", "dificulty_id": 1, "machine_id": 4},
-        {"id": 203, "name": "Elevación de Talones Sentado", "description": "Ejercicio en el que se realiza una elevación de talones en posición sentada, enfocándose en el sóleo.", "video": "https://www.youtube.com/watch?v=PrfMTxKp8es", "image": "https://example.com/elevacion-talones-sentado.jpg", "dateAdded": "2024-06-03", "dificulty_id": 1, "machine_id": 3},
-        {"id": 204, "name": "Saltos en la Punta de los Pies", "description": "Ejercicio pliométrico que activa los músculos de la pantorrilla, incluido el sóleo.", "video": "https://www.youtube.com/watch?v=zyk6OYmD4lM", "image": "https://example.com/saltos-punta-pies.jpg", "dateAdded": "2024-06-04", "dificulty_id": 1, "machine_id": 4},
-        {"id": 205, "name": "Caminata en Punta de Pies", "description": "Ejercicio de activación que involucra caminar sobre la punta de los pies, enfocándose en el sóleo.", "video": "https://www.youtube.com/watch?v=Zn6Ri2qS9qY", "image": "https://example.com/caminata-punta-pies.jpg", "dateAdded": "2024-06-05", "dificulty_id": 1, "machine_id": 4},
-        {"id": 206, "name": "Zancadas hacia Adelante con Elevación de Talones", "description": "Ejercicio que combina zancadas con elevación de talones, trabajando el sóleo.", "video": "https://www.youtube.com/watch?v=yk6CT01i3uY", "image": "https://example.com/zancadas-elevacion-talones.jpg", "dateAdded": "2024-06-06", "dificulty_id": 2, "machine_id": 2},
-        {"id": 207, "name": "Estiramientos de Sóleo", "description": "Ejercicio de estiramiento enfocado en el sóleo para mejorar la flexibilidad.", "video": "https://www.youtube.com/watch?v=EK7m8yKn5-4", "image": "https://example.com/estiramiento-soleo.jpg", "dateAdded": "2024-06-07", "dificulty_id": 1, "machine_id": 12},
-        {"id": 208, "name": "Elevación de Talones con Banda Elástica", "description": "Ejercicio que utiliza una banda elástica para agregar resistencia en la elevación de talones.", "video": "https://www.youtube.com/watch?v=xFBt7UE9e4o", "image": "https://example.com/elevacion-banda-elastica.jpg", "dateAdded": "2024-06-08", "dificulty_id": 1, "machine_id": 5},
-        {"id": 209, "name": "Caminata en Pendiente", "description": "Ejercicio que implica caminar en una superficie inclinada, activando el sóleo.", "video": "https://www.youtube.com/watch?v=4x5L-AfrHj4", "image": "https://example.com/caminata-pendiente.jpg", "dateAdded": "2024-06-09", "dificulty_id": 1, "machine_id": 13},
-        {"id": 210, "name": "Escalera de Agilidad", "description": "Ejercicio que utiliza una escalera de agilidad para trabajar la coordinación y el sóleo.", "video": "https://www.youtube.com/watch?v=PTsS5ysxXjM", "image": "https://example.com/escalera-agilidad.jpg", "dateAdded": "2024-06-10", "dificulty_id": 1, "machine_id": 9},
-        #Erectores Espinales
-        {"id": 211, "name": "Extensiones de Espalda en Banco", "description": "Ejercicio en un banco que trabaja los erectores espinales.", "video": "https://www.youtube.com/watch?v=Z5n4XH5KSHM", "image": "https://example.com/extensiones-espalda.jpg", "dateAdded": "2024-06-01", "dificulty_id": 2, "machine_id": 3},
-        {"id": 212, "name": "Peso Muerto con Piernas Rígidas", "description": "Ejercicio que se centra en los erectores espinales y los isquiotibiales.", "video": "https://www.youtube.com/watch?v=KmcMDr0k0sM", "image": "https://example.com/peso-muerto-rigido.jpg", "dateAdded": "2024-06-02", "dificulty_id": 2, "machine_id": 2},
-        {"id": 213, "name": "Superman", "description": "Ejercicio de activación de espalda baja.", "video": "https://www.youtube.com/watch?v=2p4iGkE3ChI", "image": "https://example.com/superman.jpg", "dateAdded": "2024-06-03", "dificulty_id": 1, "machine_id": 4},
-        {"id": 214, "name": "Hiperextensiones en Banco Romano", "description": "Ejercicio de aislamiento que se realiza en un banco romano.", "video": "https://www.youtube.com/watch?v=J8e2sP-TWc8", "image": "https://example.com/hiperextensiones.jpg", "dateAdded": "2024-06-04", "dificulty_id": 1, "machine_id": 1},
-        {"id": 215, "name": "Remo con Barra", "description": "Ejercicio que, al ser realizado con buena postura, activa los erectores espinales.", "video": "https://www.youtube.com/watch?v=8h_m1I0H9Wc", "image": "https://example.com/remo-barra.jpg", "dateAdded": "2024-06-05", "dificulty_id": 2, "machine_id": 2},
-        {"id": 216, "name": "Plancha", "description": "Ejercicio de isometría que fortalece toda la zona media, incluidos los erectores espinales.", "video": "https://www.youtube.com/watch?v=pSHjTRCQxIw", "image": "https://example.com/plancha.jpg", "dateAdded": "2024-06-06", "dificulty_id": 1, "machine_id": 3},
-        {"id": 217, "name": "Puente de Glúteos", "description": "Ejercicio que, aunque se enfoca en los glúteos, también activa los erectores espinales.", "video": "https://www.youtube.com/watch?v=8B0a1I-vw9U", "image": "https://example.com/puente-gluteos.jpg", "dateAdded": "2024-06-07", "dificulty_id": 1, "machine_id": 1},
-        {"id": 218, "name": "Sentadillas con Peso", "description": "Ejercicio que involucra la parte baja de la espalda, incluyendo los erectores espinales.", "video": "https://www.youtube.com/watch?v=1gqG2zqMR0c", "image": "https://example.com/sentadillas.jpg", "dateAdded": "2024-06-08", "dificulty_id": 2, "machine_id": 2},
-        {"id": 219, "name": "Deadlift Rumano", "description": "Variante del peso muerto que enfatiza el trabajo de los erectores espinales.", "video": "https://www.youtube.com/watch?v=ljV_1K7t4OM", "image": "https://example.com/deadlift-rumano.jpg", "dateAdded": "2024-06-09", "dificulty_id": 2, "machine_id": 2},
-        {"id": 220, "name": "Estiramiento de Espalda", "description": "Estiramiento para los músculos de la espalda, incluidos los erectores espinales.", "video": "https://www.youtube.com/watch?v=4B8ZJZQVj4k", "image": "https://example.com/estiramiento-espalda.jpg", "dateAdded": "2024-06-10", "dificulty_id": 1, "machine_id": 12},
-        #Redondo Mayor
-        {"id": 221, "name": "Remo con Mancuernas", "description": "Ejercicio que trabaja el redondo mayor al tirar de las mancuernas hacia el torso.", "video": "https://www.youtube.com/watch?v=LGqj46fAfwE", "image": "https://example.com/remo-mancuernas.jpg", "dateAdded": "2024-06-01", "dificulty_id": 2, "machine_id": 2},
-        {"id": 222, "name": "Pull Over con Mancuerna", "description": "Ejercicio que activa el redondo mayor al levantar una mancuerna sobre la cabeza.", "video": "https://www.youtube.com/watch?v=RzA9hUoSg9M", "image": "https://example.com/pull-over-mancuerna.jpg", "dateAdded": "2024-06-02", "dificulty_id": 2, "machine_id": 1},
-        {"id": 223, "name": "Remo en Máquina", "description": "Ejercicio en una máquina de remo que se enfoca en los músculos de la espalda, incluido el redondo mayor.", "video": "https://www.youtube.com/watch?v=a4Pt8TDhZTg", "image": "https://example.com/remo-maquina.jpg", "dateAdded": "2024-06-03", "dificulty_id": 2, "machine_id": 3},
-        {"id": 224, "name": "Dominadas", "description": "Ejercicio clásico que trabaja varios músculos de la espalda, incluido el redondo mayor.", "video": "https://www.youtube.com/watch?v=U8IMH8dQj6Y", "image": "https://example.com/dominadas.jpg", "dateAdded": "2024-06-04", "dificulty_id": 3, "machine_id": 4},
-        {"id": 225, "name": "Flexiones de Brazos", "description": "Ejercicio que activa la espalda alta, incluyendo el redondo mayor, al estabilizarse en la posición.", "video": "https://www.youtube.com/watch?v=IODxDxX7oi4", "image": "https://example.com/flexiones.jpg", "dateAdded": "2024-06-05", "dificulty_id": 2, "machine_id": 4},
-        {"id": 226, "name": "Face Pull", "description": "Ejercicio con cables que se enfoca en la parte superior de la espalda, trabajando el redondo mayor.", "video": "https://www.youtube.com/watch?v=8fSS6G7mBVI", "image": "https://example.com/face-pull.jpg", "dateAdded": "2024-06-06", "dificulty_id": 2, "machine_id": 8},
-        {"id": 227, "name": "Remo Invertido", "description": "Ejercicio que se realiza con el peso corporal, activando el redondo mayor.", "video": "https://www.youtube.com/watch?v=4yC0oOiISZg", "image": "https://example.com/remo-invertido.jpg", "dateAdded": "2024-06-07", "dificulty_id": 2, "machine_id": 4},
-        {"id": 228, "name": "Remo en Barra T", "description": "Ejercicio que trabaja la parte media de la espalda, incluido el redondo mayor.", "video": "https://www.youtube.com/watch?v=gbN0c3-8Wqc", "image": "https://example.com/remo-barra-t.jpg", "dateAdded": "2024-06-08", "dificulty_id": 2, "machine_id": 3},
-        {"id": 229, "name": "Press Militar", "description": "Ejercicio de hombros que también involucra la parte superior de la espalda, incluido el redondo mayor.", "video": "https://www.youtube.com/watch?v=2yjwTTL55YI", "image": "https://example.com/press-militar.jpg", "dateAdded": "2024-06-09", "dificulty_id": 2, "machine_id": 1},
-        {"id": 230, "name": "Desplante Inverso", "description": "Ejercicio que, además de trabajar las piernas, activa la parte posterior de la espalda.", "video": "https://www.youtube.com/watch?v=8PpSH_7-tbY", "image": "https://example.com/desplante-inverso.jpg", "dateAdded": "2024-06-10", "dificulty_id": 2, "machine_id": 2},
-        #Redondo Menor
-        {"id": 231, "name": "Remo con Mancuernas", "description": "Ejercicio que se enfoca en la parte posterior del hombro y el redondo menor.", "video": "https://www.youtube.com/watch?v=5aQeb9UnPeE", "image": "https://example.com/remo-mancuernas.jpg", "dateAdded": "2024-06-01", "dificulty_id": 2, "machine_id": 2},
-        {"id": 232, "name": "Rotación Externa con Mancuerna", "description": "Ejercicio que activa el redondo menor a través de la rotación externa del hombro.", "video": "https://www.youtube.com/watch?v=3G38o1DJTOc", "image": "https://example.com/rotacion-externa.jpg", "dateAdded": "2024-06-02", "dificulty_id": 1, "machine_id": 1},
-        {"id": 233, "name": "Rotación Externa en Cables", "description": "Ejercicio que se realiza en una máquina de cables, enfocándose en el redondo menor.", "video": "https://www.youtube.com/watch?v=z74kPPLhD3k", "image": "https://example.com/rotacion-externa-cables.jpg", "dateAdded": "2024-06-03", "dificulty_id": 1, "machine_id": 8},
-        {"id": 234, "name": "Press de Hombros", "description": "Ejercicio que activa el redondo menor al trabajar los músculos del hombro.", "video": "https://www.youtube.com/watch?v=2y-8z6Jm3h8", "image": "https://example.com/press-hombros.jpg", "dateAdded": "2024-06-04", "dificulty_id": 2, "machine_id": 1},
-        {"id": 235, "name": "Remo al Pecho", "description": "Ejercicio que trabaja la parte superior de la espalda, incluyendo el redondo menor.", "video": "https://www.youtube.com/watch?v=V9kr7RBCeWg", "image": "https://example.com/remo-pecho.jpg", "dateAdded": "2024-06-05", "dificulty_id": 2, "machine_id": 3},
-        {"id": 236, "name": "Vuelo Inverso", "description": "Ejercicio que se enfoca en la parte posterior de los hombros y el redondo menor.", "video": "https://www.youtube.com/watch?v=1CkfbwvnCUA", "image": "https://example.com/vuelo-inverso.jpg", "dateAdded": "2024-06-06", "dificulty_id": 2, "machine_id": 1},
-        {"id": 237, "name": "Elevaciones Laterales", "description": "Ejercicio que trabaja el deltoides y el redondo menor al levantar las mancuernas hacia los lados.", "video": "https://www.youtube.com/watch?v=3sITXGg_xME", "image": "https://example.com/elevaciones-laterales.jpg", "dateAdded": "2024-06-07", "dificulty_id": 1, "machine_id": 2},
-        {"id": 238, "name": "Estiramiento de Hombro", "description": "Ejercicio de estiramiento para mejorar la movilidad del redondo menor.", "video": "https://www.youtube.com/watch?v=UGMIVFzIHp8", "image": "https://example.com/estiramiento-hombro.jpg", "dateAdded": "2024-06-08", "dificulty_id": 1, "machine_id": 1},
-        {"id": 239, "name": "Remo en T", "description": "Ejercicio que se enfoca en la parte media de la espalda y el redondo menor.", "video": "https://www.youtube.com/watch?v=wRi4ubwHn1g", "image": "https://example.com/remo-t.jpg", "dateAdded": "2024-06-09", "dificulty_id": 2, "machine_id": 3},
-        {"id": 240, "name": "Pullover en Máquina", "description": "Ejercicio que trabaja los músculos de la espalda, incluyendo el redondo menor.", "video": "https://www.youtube.com/watch?v=zMkfgPCrOgA", "image": "https://example.com/pullover-maquina.jpg", "dateAdded": "2024-06-10", "dificulty_id": 2, "machine_id": 8},
-        #Infraespinoso
-        {"id": 241, "name": "Rotación Externa con Banda", "description": "Ejercicio que trabaja el infraespinoso mediante la rotación externa.", "video": "https://www.youtube.com/watch?v=FV8fFzU0Fqw", "image": "https://example.com/rotacion-externa-banda.jpg", "dateAdded": "2024-06-01", "dificulty_id": 1, "machine_id": 2},
-        {"id": 242, "name": "Remo Invertido", "description": "Ejercicio que involucra el infraespinoso al mantener la posición de remado.", "video": "https://www.youtube.com/watch?v=4yC0oOiISZg", "image": "https://example.com/remo-invertido.jpg", "dateAdded": "2024-06-02", "dificulty_id": 2, "machine_id": 4},
-        {"id": 243, "name": "Pull Over con Mancuerna", "description": "Ejercicio que activa el infraespinoso al levantar una mancuerna por encima de la cabeza.", "video": "https://www.youtube.com/watch?v=RzA9hUoSg9M", "image": "https://example.com/pull-over-mancuerna.jpg", "dateAdded": "2024-06-03", "dificulty_id": 2, "machine_id": 1},
-        {"id": 244, "name": "Press de Hombros", "description": "Ejercicio que trabaja el infraespinoso al empujar hacia arriba las pesas.", "video": "https://www.youtube.com/watch?v=2y-8z6Jm3h8", "image": "https://example.com/press-hombros.jpg", "dateAdded": "2024-06-04", "dificulty_id": 2, "machine_id": 1},
-        {"id": 245, "name": "Remo con Barra", "description": "Ejercicio que involucra el infraespinoso al tirar de la barra hacia el torso.", "video": "https://www.youtube.com/watch?v=Y8l2R_k58kg", "image": "https://example.com/remo-barra.jpg", "dateAdded": "2024-06-05", "dificulty_id": 2, "machine_id": 3},
-        {"id": 246, "name": "Dominadas", "description": "Ejercicio que trabaja la parte superior de la espalda, incluyendo el infraespinoso.", "video": "https://www.youtube.com/watch?v=U8IMH8dQj6Y", "image": "https://example.com/dominadas.jpg", "dateAdded": "2024-06-06", "dificulty_id": 3, "machine_id": 4},
-        {"id": 247, "name": "Face Pull", "description": "Ejercicio que se realiza con cables y trabaja el infraespinoso.", "video": "https://www.youtube.com/watch?v=8fSS6G7mBVI", "image": "https://example.com/face-pull.jpg", "dateAdded": "2024-06-07", "dificulty_id": 2, "machine_id": 8},
-        {"id": 248, "name": "Vuelo Inverso", "description": "Ejercicio que se enfoca en la parte posterior de los hombros, activando el infraespinoso.", "video": "https://www.youtube.com/watch?v=1CkfbwvnCUA", "image": "https://example.com/vuelo-inverso.jpg", "dateAdded": "2024-06-08", "dificulty_id": 2, "machine_id": 1},
-        {"id": 249, "name": "Rotación Interna con Banda", "description": "Ejercicio que se centra en el infraespinoso a través de la rotación interna.", "video": "https://www.youtube.com/watch?v=v6g1zVdu8lg", "image": "https://example.com/rotacion-interna-banda.jpg", "dateAdded": "2024-06-09", "dificulty_id": 1, "machine_id": 2},
-        {"id": 250, "name": "Extensiones de Hombro", "description": "Ejercicio que se realiza con mancuernas y activa el infraespinoso.", "video": "https://www.youtube.com/watch?v=I1tDFaC4dNk", "image": "https://example.com/extensiones-hombro.jpg", "dateAdded": "2024-06-10", "dificulty_id": 1, "machine_id": 1},
-        #Deltoides Medio
-        {"id": 251, "name": "Elevaciones Laterales", "description": "Ejercicio que se centra en el deltoides medio, levantando mancuernas hacia los lados.", "video": "https://www.youtube.com/watch?v=3bU8E7cJvCI", "image": "https://example.com/elevaciones-laterales.jpg", "dateAdded": "2024-06-11", "dificulty_id": 1, "machine_id": 1},
-        {"id": 252, "name": "Press Militar", "description": "Ejercicio que activa el deltoides medio al empujar hacia arriba con una barra o mancuernas.", "video": "https://www.youtube.com/watch?v=ziYpAZhW9tU", "image": "https://example.com/press-militar.jpg", "dateAdded": "2024-06-12", "dificulty_id": 2, "machine_id": 1},
-        {"id": 253, "name": "Remo con Mancuernas", "description": "Ejercicio que involucra el deltoides medio en el movimiento de remo.", "video": "https://www.youtube.com/watch?v=wRi4ubwHn1g", "image": "https://example.com/remo-barra-t.jpg", "dateAdded": "2024-06-13", "dificulty_id": 2, "machine_id": 3},
-        {"id": 254, "name": "Pájaros con Mancuernas", "description": "Ejercicio que se realiza para activar el deltoides medio, levantando las mancuernas hacia los lados.", "video": "https://www.youtube.com/watch?v=Ib7e6tVdUjA", "image": "https://example.com/pajaros-mancuernas.jpg", "dateAdded": "2024-06-14", "dificulty_id": 1, "machine_id": 1},
-        {"id": 255, "name": "Presión con Mancuerna", "description": "Ejercicio que activa el deltoides medio al presionar con mancuernas.", "video": "https://www.youtube.com/watch?v=pPTh6X6cO8s", "image": "https://example.com/presion-mancuernas.jpg", "dateAdded": "2024-06-15", "dificulty_id": 1, "machine_id": 1},
-        {"id": 256, "name": "Levantamiento Frontal", "description": "Ejercicio que se enfoca en el deltoides medio al levantar las mancuernas frente al cuerpo.", "video": "https://www.youtube.com/watch?v=2ddYmrK8Q0U", "image": "https://example.com/levantamiento-frontal.jpg", "dateAdded": "2024-06-16", "dificulty_id": 1, "machine_id": 1},
-        {"id": 257, "name": "Press de Hombros con Barra", "description": "Ejercicio que involucra el deltoides medio al empujar una barra por encima de la cabeza.", "video": "https://www.youtube.com/watch?v=8MrSvlVb4v4", "image": "https://example.com/press-hombros-barra.jpg", "dateAdded": "2024-06-17", "dificulty_id": 2, "machine_id": 11},
-        {"id": 258, "name": "Pájaros Invertidos", "description": "Ejercicio que se centra en el deltoides medio y posterior, levantando las mancuernas hacia los lados en posición inclinada.", "video": "https://www.youtube.com/watch?v=xL6b1f1-uy4", "image": "https://example.com/pajaros-invertidos.jpg", "dateAdded": "2024-06-18", "dificulty_id": 2, "machine_id": 1},
-        {"id": 259, "name": "Remo en Cable", "description": "Ejercicio que se realiza en una máquina de cables para activar el deltoides medio.", "video": "https://www.youtube.com/watch?v=5bHnHJ1WTjs", "image": "https://example.com/remo-cable.jpg", "dateAdded": "2024-06-19", "dificulty_id": 2, "machine_id": 8},
-        {"id": 260, "name": "Flexiones de Hombros", "description": "Ejercicio que se enfoca en el deltoides medio utilizando el peso corporal para realizar flexiones.", "video": "https://www.youtube.com/watch?v=sK3T7o_GcCg", "image": "https://example.com/flexiones-hombros.jpg", "dateAdded": "2024-06-20", "dificulty_id": 1, "machine_id": 4},
-        #Oblicuos Internos
-        {"id": 261, "name": "Twist Ruso", "description": "Ejercicio que trabaja los oblicuos internos al rotar el torso.", "video": "https://www.youtube.com/watch?v=8yUfr3xtKdo", "image": "https://example.com/twist-ruso.jpg", "dateAdded": "2024-06-21", "dificulty_id": 1, "machine_id": 1},
-        {"id": 262, "name": "Plancha Lateral", "description": "Ejercicio que activa los oblicuos internos al mantener la posición de plancha de lado.", "video": "https://www.youtube.com/watch?v=2nFcz3Nw5GE", "image": "https://example.com/plancha-lateral.jpg", "dateAdded": "2024-06-22", "dificulty_id": 2, "machine_id": 1},
-        {"id": 263, "name": "Elevación de Pierna Lateral", "description": "Ejercicio que trabaja los oblicuos internos al elevar la pierna lateralmente.", "video": "https://www.youtube.com/watch?v=W4M2D2yU47s", "image": "https://example.com/elevacion-pierna-lateral.jpg", "dateAdded": "2024-06-23", "dificulty_id": 2, "machine_id": 1},
-        {"id": 264, "name": "Crunch Lateral", "description": "Ejercicio que activa los oblicuos internos al realizar un crunch lateral.", "video": "https://www.youtube.com/watch?v=CqMWe8DdPhg", "image": "https://example.com/crunch-lateral.jpg", "dateAdded": "2024-06-24", "dificulty_id": 1, "machine_id": 1},
-        {"id": 265, "name": "Torsiones con Banda", "description": "Ejercicio que involucra una banda elástica para trabajar los oblicuos internos.", "video": "https://www.youtube.com/watch?v=YZ9r4e0FcNQ", "image": "https://example.com/torsiones-banda.jpg", "dateAdded": "2024-06-25", "dificulty_id": 2, "machine_id": 1},
-        {"id": 266, "name": "Elevaciones de Pierna", "description": "Ejercicio que activa los oblicuos internos al elevar las piernas desde una posición acostada.", "video": "https://www.youtube.com/watch?v=JAMoVxWpjTA", "image": "https://example.com/elevaciones-pierna.jpg", "dateAdded": "2024-06-26", "dificulty_id": 1, "machine_id": 1},
-        {"id": 267, "name": "Crunch de Bicicleta", "description": "Ejercicio que trabaja los oblicuos internos al realizar un crunch de bicicleta.", "video": "https://www.youtube.com/watch?v=9zR0K0ZzwS0", "image": "https://example.com/crunch-bicicleta.jpg", "dateAdded": "2024-06-27", "dificulty_id": 1, "machine_id": 1},
-        {"id": 268, "name": "Torsiones de Cadera", "description": "Ejercicio que trabaja los oblicuos internos al girar la parte inferior del cuerpo.", "video": "https://www.youtube.com/watch?v=lECL35lcRj4", "image": "https://example.com/torsiones-cadera.jpg", "dateAdded": "2024-06-28", "dificulty_id": 2, "machine_id": 1},
-        {"id": 269, "name": "Levantamiento de Piernas con Giro", "description": "Ejercicio que combina el levantamiento de piernas con un giro para activar los oblicuos internos.", "video": "https://www.youtube.com/watch?v=RZ1Q41KkWX4", "image": "https://example.com/levantamiento-piernas-giro.jpg", "dateAdded": "2024-06-29", "dificulty_id": 2, "machine_id": 1},
-        {"id": 270, "name": "Plancha Lateral con Elevación", "description": "Ejercicio que combina la plancha lateral con una elevación de cadera para trabajar los oblicuos internos.", "video": "https://www.youtube.com/watch?v=sTqK6q-d5KM", "image": "https://example.com/plancha-lateral-elevacion.jpg", "dateAdded": "2024-06-30", "dificulty_id": 2, "machine_id": 1},
-        #Transverso Abdominal
-        {"id": 271, "name": "Plancha", "description": "Ejercicio que activa el transverso abdominal manteniendo una posición de plancha.", "video": "https://www.youtube.com/watch?v=pSHjTRCQxIw", "image": "https://example.com/plancha.jpg", "dateAdded": "2024-07-01", "dificulty_id": 1, "machine_id": 1},
-        {"id": 272, "name": "Puente", "description": "Ejercicio que trabaja el transverso abdominal al elevar las caderas desde una posición acostada.", "video": "https://www.youtube.com/watch?v=8d8_aM4L1TE", "image": "https://example.com/puente.jpg", "dateAdded": "2024-07-02", "dificulty_id": 1, "machine_id": 1},
-        {"id": 273, "name": "Respiración Diafragmática", "description": "Ejercicio que activa el transverso abdominal mediante la respiración profunda.", "video": "https://www.youtube.com/watch?v=eR8CMQm9jzk", "image": "https://example.com/respiracion-diafragmatica.jpg", "dateAdded": "2024-07-03", "dificulty_id": 1, "machine_id": 1},
-        {"id": 274, "name": "Tijeras", "description": "Ejercicio que involucra el transverso abdominal al cruzar las piernas en posición acostada.", "video": "https://www.youtube.com/watch?v=XdbqAdcB-nM", "image": "https://example.com/tijeras.jpg", "dateAdded": "2024-07-04", "dificulty_id": 1, "machine_id": 1},
-        {"id": 275, "name": "Levantamiento de Caderas", "description": "Ejercicio que activa el transverso abdominal al levantar las caderas desde el suelo.", "video": "https://www.youtube.com/watch?v=Qi0JfdUtPE0", "image": "https://example.com/levantamiento-caderas.jpg", "dateAdded": "2024-07-05", "dificulty_id": 1, "machine_id": 1},
-        {"id": 276, "name": "Crunch Abdominal", "description": "Ejercicio que se enfoca en el transverso abdominal al realizar un crunch desde una posición acostada.", "video": "https://www.youtube.com/watch?v=5cUQgsB3i3I", "image": "https://example.com/crunch-abdominal.jpg", "dateAdded": "2024-07-06", "dificulty_id": 1, "machine_id": 1},
-        {"id": 277, "name": "Rollout con Rueda", "description": "Ejercicio que activa el transverso abdominal al rodar hacia adelante con una rueda.", "video": "https://www.youtube.com/watch?v=7lFwrpA_mog", "image": "https://example.com/rollout-rueda.jpg", "dateAdded": "2024-07-07", "dificulty_id": 2, "machine_id": 1},
-        {"id": 278, "name": "Ciclón", "description": "Ejercicio que trabaja el transverso abdominal mediante movimientos de giro.", "video": "https://www.youtube.com/watch?v=Wn2a4msZ8Rg", "image": "https://example.com/ciclon.jpg", "dateAdded": "2024-07-08", "dificulty_id": 2, "machine_id": 1},
-        {"id": 279, "name": "Elevación de Pierna en Suspensión", "description": "Ejercicio que activa el transverso abdominal al elevar las piernas desde una posición suspendida.", "video": "https://www.youtube.com/watch?v=4Z6O9kaM0Lg", "image": "https://example.com/elevacion-pierna-suspension.jpg", "dateAdded": "2024-07-09", "dificulty_id": 2, "machine_id": 1},
-        {"id": 280, "name": "Plancha Inclinada", "description": "Ejercicio que se centra en el transverso abdominal al mantener una plancha inclinada.", "video": "https://www.youtube.com/watch?v=4Hh1E_XnA8Q", "image": "https://example.com/plancha-inclinada.jpg", "dateAdded": "2024-07-10", "dificulty_id": 2, "machine_id": 1},
-        #Cuadrado Lumbar
-        {"id": 281, "name": "Hip Thrust", "description": "Ejercicio que se centra en el cuadrado lumbar al elevar las caderas con peso.", "video": "https://www.youtube.com/watch?v=1f1AXD3cn5A", "image": "https://example.com/hip-thrust.jpg", "dateAdded": "2024-07-11", "dificulty_id": 2, "machine_id": 1},
-        {"id": 282, "name": "Extensión de Espalda", "description": "Ejercicio que activa el cuadrado lumbar al realizar una extensión desde una posición de tumbado.", "video": "https://www.youtube.com/watch?v=YxeY5Z6OiG0", "image": "https://example.com/extension-espalda.jpg", "dateAdded": "2024-07-12", "dificulty_id": 2, "machine_id": 3},
-        {"id": 283, "name": "Superman", "description": "Ejercicio que se enfoca en el cuadrado lumbar al elevar brazos y piernas simultáneamente.", "video": "https://www.youtube.com/watch?v=Z9M4gPYWf50", "image": "https://example.com/superman.jpg", "dateAdded": "2024-07-13", "dificulty_id": 1, "machine_id": 1},
-        {"id": 284, "name": "Peso Muerto", "description": "Ejercicio que trabaja el cuadrado lumbar al levantar una barra desde el suelo.", "video": "https://www.youtube.com/watch?v=Wg6c8x1lLrI", "image": "https://example.com/peso-muerto.jpg", "dateAdded": "2024-07-14", "dificulty_id": 2, "machine_id": 1},
-        {"id": 285, "name": "Puente en una Pierna", "description": "Ejercicio que se centra en el cuadrado lumbar al elevar las caderas con una pierna levantada.", "video": "https://www.youtube.com/watch?v=GoK2lAGXdvI", "image": "https://example.com/puente-una-pierna.jpg", "dateAdded": "2024-07-15", "dificulty_id": 2, "machine_id": 1},
-        {"id": 286, "name": "Remo Invertido", "description": "Ejercicio que trabaja el cuadrado lumbar en posición invertida usando una barra.", "video": "https://www.youtube.com/watch?v=EBuG3RtnLBw", "image": "https://example.com/remo-invertido.jpg", "dateAdded": "2024-07-16", "dificulty_id": 2, "machine_id": 1},
-        {"id": 287, "name": "Flexión de Caderas", "description": "Ejercicio que activa el cuadrado lumbar al realizar flexiones desde una posición de pie.", "video": "https://www.youtube.com/watch?v=d1UXK8zTQGQ", "image": "https://example.com/flexion-caderas.jpg", "dateAdded": "2024-07-17", "dificulty_id": 1, "machine_id": 1},
-        {"id": 288, "name": "Caminata de Osos", "description": "Ejercicio que involucra movimientos de osos para trabajar el cuadrado lumbar.", "video": "https://www.youtube.com/watch?v=2Zs6vU1b3hA", "image": "https://example.com/caminata-osos.jpg", "dateAdded": "2024-07-18", "dificulty_id": 2, "machine_id": 1},
-        {"id": 289, "name": "Tijeras Invertidas", "description": "Ejercicio que se centra en el cuadrado lumbar mediante movimientos de tijera en posición invertida.", "video": "https://www.youtube.com/watch?v=zgyFjOUDz2A", "image": "https://example.com/tijeras-invertidas.jpg", "dateAdded": "2024-07-19", "dificulty_id": 2, "machine_id": 1},
-        {"id": 290, "name": "Puente con Peso", "description": "Ejercicio que se enfoca en el cuadrado lumbar al añadir peso en el puente.", "video": "https://www.youtube.com/watch?v=f7nmgq8sI8A", "image": "https://example.com/puente-peso.jpg", "dateAdded": "2024-07-20", "dificulty_id": 2, "machine_id": 1},
-        #Glúteo Medio
-        {"id": 291, "name": "Abducción de Cadera", "description": "Ejercicio que trabaja el glúteo medio al elevar la pierna lateralmente.", "video": "https://www.youtube.com/watch?v=KX5cEsw0e4U", "image": "https://example.com/abduccion-cadera.jpg", "dateAdded": "2024-07-21", "dificulty_id": 2, "machine_id": 1},
-        {"id": 292, "name": "Puente de Glúteos", "description": "Ejercicio que activa el glúteo medio al elevar las caderas desde una posición tumbada.", "video": "https://www.youtube.com/watch?v=4mxKCD9U4X4", "image": "https://example.com/puente-gluteos.jpg", "dateAdded": "2024-07-22", "dificulty_id": 2, "machine_id": 1},
-        {"id": 293, "name": "Sentadillas Laterales", "description": "Ejercicio que involucra el glúteo medio al realizar sentadillas hacia un lado.", "video": "https://www.youtube.com/watch?v=42ClE1ueVww", "image": "https://example.com/sentadilla-lateral.jpg", "dateAdded": "2024-07-23", "dificulty_id": 2, "machine_id": 1},
-        {"id": 294, "name": "Elevación de Talones", "description": "Ejercicio que trabaja el glúteo medio al elevar los talones en posición de pie.", "video": "https://www.youtube.com/watch?v=2A5I6O7V8h0", "image": "https://example.com/elevacion-talones.jpg", "dateAdded": "2024-07-24", "dificulty_id": 1, "machine_id": 1},
-        {"id": 295, "name": "Patada de Glúteo", "description": "Ejercicio que se enfoca en el glúteo medio al realizar patadas hacia atrás.", "video": "https://www.youtube.com/watch?v=5nSL0DB4yRg", "image": "https://example.com/patada-gluteo.jpg", "dateAdded": "2024-07-25", "dificulty_id": 1, "machine_id": 1},
-        {"id": 296, "name": "Clamshell", "description": "Ejercicio que trabaja el glúteo medio al abrir las rodillas desde una posición acostada.", "video": "https://www.youtube.com/watch?v=6QFXwFNHp2c", "image": "https://example.com/clamshell.jpg", "dateAdded": "2024-07-26", "dificulty_id": 1, "machine_id": 1},
-        {"id": 297, "name": "Sentadilla Búlgara", "description": "Ejercicio que involucra el glúteo medio al realizar sentadillas con una pierna detrás.", "video": "https://www.youtube.com/watch?v=7UtM8SDoDDI", "image": "https://example.com/sentadilla-bulgar.jpg", "dateAdded": "2024-07-27", "dificulty_id": 2, "machine_id": 1},
-        {"id": 298, "name": "Elevación de Pierna Tumbada", "description": "Ejercicio que se enfoca en el glúteo medio al elevar la pierna desde una posición tumbada.", "video": "https://www.youtube.com/watch?v=4aVjjmD09GQ", "image": "https://example.com/elevacion-pierna-tumbada.jpg", "dateAdded": "2024-07-28", "dificulty_id": 2, "machine_id": 1},
-        {"id": 299, "name": "Puente con Una Pierna", "description": "Ejercicio que activa el glúteo medio al elevar las caderas con una pierna levantada.", "video": "https://www.youtube.com/watch?v=POx-1NSyLOU", "image": "https://example.com/puente-una-pierna.jpg", "dateAdded": "2024-07-29", "dificulty_id": 2, "machine_id": 1},
-        {"id": 300, "name": "Zancadas Laterales", "description": "Ejercicio que trabaja el glúteo medio al realizar zancadas hacia los lados.", "video": "https://www.youtube.com/watch?v=ZSK79FJ0tEg", "image": "https://example.com/zancadas-laterales.jpg", "dateAdded": "2024-07-30", "dificulty_id": 2, "machine_id": 1},
-        #Glúteo Menor
-        {"id": 301, "name": "Sentadilla", "description": "Ejercicio básico que activa el glúteo menor al descender y elevar el cuerpo.", "video": "https://www.youtube.com/watch?v=3X2wK3ArEoE", "image": "https://example.com/sentadilla.jpg", "dateAdded": "2024-07-31", "dificulty_id": 1, "machine_id": 1},
-        {"id": 302, "name": "Abducción de Pierna", "description": "Ejercicio que se centra en el glúteo menor al elevar la pierna hacia un lado.", "video": "https://www.youtube.com/watch?v=I6OlbVmN0Ko", "image": "https://example.com/abduccion-pierna.jpg", "dateAdded": "2024-08-01", "dificulty_id": 1, "machine_id": 1},
-        {"id": 303, "name": "Zancadas", "description": "Ejercicio que trabaja el glúteo menor al realizar movimientos de zancada hacia adelante.", "video": "https://www.youtube.com/watch?v=j_QH7k39j9k", "image": "https://example.com/zancadas.jpg", "dateAdded": "2024-08-02", "dificulty_id": 1, "machine_id": 1},
-        {"id": 304, "name": "Extensión de Caderas", "description": "Ejercicio que se enfoca en el glúteo menor al extender las caderas en posición de pie.", "video": "https://www.youtube.com/watch?v=cGUn2-IfIPM", "image": "https://example.com/extension-caderas.jpg", "dateAdded": "2024-08-03", "dificulty_id": 1, "machine_id": 1},
-        {"id": 305, "name": "Puente con Banda Elástica", "description": "Ejercicio que activa el glúteo menor al realizar un puente con resistencia adicional de una banda elástica.", "video": "https://www.youtube.com/watch?v=l6_66f1E2g0", "image": "https://example.com/puente-banda.jpg", "dateAdded": "2024-08-04", "dificulty_id": 2, "machine_id": 1},
-        {"id": 306, "name": "Patada de Glúteo con Banda", "description": "Ejercicio que trabaja el glúteo menor al realizar una patada hacia atrás con resistencia de una banda elástica.", "video": "https://www.youtube.com/watch?v=vfZ4O3qDye0", "image": "https://example.com/patada-banda.jpg", "dateAdded": "2024-08-05", "dificulty_id": 2, "machine_id": 1},
-        {"id": 307, "name": "Elevación de Talón", "description": "Ejercicio que se centra en el glúteo menor al elevar el talón hacia el glúteo en posición de pie.", "video": "https://www.youtube.com/watch?v=wbDBSnS4c3E", "image": "https://example.com/elevacion-talon.jpg", "dateAdded": "2024-08-06", "dificulty_id": 1, "machine_id": 1},
-        {"id": 308, "name": "Flexión de Cadera", "description": "Ejercicio que activa el glúteo menor al realizar una flexión de cadera con peso.", "video": "https://www.youtube.com/watch?v=R56bPaGdDUE", "image": "https://example.com/flexion-cadera.jpg", "dateAdded": "2024-08-07", "dificulty_id": 2, "machine_id": 1},
-        {"id": 309, "name": "Rotación Externa de Cadera", "description": "Ejercicio que trabaja el glúteo menor al realizar rotaciones externas de la cadera en posición tumbada.", "video": "https://www.youtube.com/watch?v=glOkYRxhI8I", "image": "https://example.com/rotacion-externa.jpg", "dateAdded": "2024-08-08", "dificulty_id": 2, "machine_id": 1},
-        {"id": 310, "name": "Zancadas Cortas", "description": "Ejercicio que se enfoca en el glúteo menor al realizar zancadas cortas en posición de pie.", "video": "https://www.youtube.com/watch?v=U0kkp2H0KDE", "image": "https://example.com/zancadas-cortas.jpg", "dateAdded": "2024-08-09", "dificulty_id": 2, "machine_id": 1},
-        #Aductor Largo
-        {"id": 311, "name": "Sentadilla con Aductor", "description": "Ejercicio que activa el aductor largo al realizar una sentadilla profunda.", "video": "https://www.youtube.com/watch?v=RcmQH_8fGPE", "image": "https://example.com/sentadilla-aductor.jpg", "dateAdded": "2024-08-10", "dificulty_id": 2, "machine_id": 1},
-        {"id": 312, "name": "Zancadas con Aductor", "description": "Ejercicio que trabaja el aductor largo al realizar zancadas hacia adelante con un enfoque en los aductores.", "video": "https://www.youtube.com/watch?v=0yU35IhANwE", "image": "https://example.com/zancadas-aductor.jpg", "dateAdded": "2024-08-11", "dificulty_id": 1, "machine_id": 1},
-        {"id": 313, "name": "Estiramiento de Aductor", "description": "Ejercicio que se centra en el aductor largo al realizar estiramientos profundos.", "video": "https://www.youtube.com/watch?v=eX5U9-y8NOE", "image": "https://example.com/estiramiento-aductor.jpg", "dateAdded": "2024-08-12", "dificulty_id": 1, "machine_id": 1},
-        {"id": 314, "name": "Patada Lateral", "description": "Ejercicio que trabaja el aductor largo al realizar patadas laterales.", "video": "https://www.youtube.com/watch?v=Bw1f0yBZZc0", "image": "https://example.com/patada-lateral.jpg", "dateAdded": "2024-08-13", "dificulty_id": 1, "machine_id": 1},
-        {"id": 315, "name": "Puente de Aductor", "description": "Ejercicio que activa el aductor largo al realizar un puente con los pies juntos.", "video": "https://www.youtube.com/watch?v=TE_O8D_C1ow", "image": "https://example.com/puente-aductor.jpg", "dateAdded": "2024-08-14", "dificulty_id": 2, "machine_id": 1},
-        {"id": 316, "name": "Rotación de Cadera", "description": "Ejercicio que se enfoca en el aductor largo al realizar rotaciones de cadera en posición tumbada.", "video": "https://www.youtube.com/watch?v=NWCLlJhiLxg", "image": "https://example.com/rotacion-cadera.jpg", "dateAdded": "2024-08-15", "dificulty_id": 2, "machine_id": 1},
-        {"id": 317, "name": "Apertura de Cadera", "description": "Ejercicio que trabaja el aductor largo al realizar aperturas de cadera en posición de pie.", "video": "https://www.youtube.com/watch?v=rz0XZ0eZqvI", "image": "https://example.com/apertura-cadera.jpg", "dateAdded": "2024-08-16", "dificulty_id": 1, "machine_id": 1},
-        {"id": 318, "name": "Sentadilla Búlgara con Aductor", "description": "Ejercicio que activa el aductor largo al realizar una sentadilla búlgara.", "video": "https://www.youtube.com/watch?v=v1Q1UNwsvSk", "image": "https://example.com/sentadilla-bulgar-aductor.jpg", "dateAdded": "2024-08-17", "dificulty_id": 2, "machine_id": 1},
-        {"id": 319, "name": "Elevación de Pierna Lateral", "description": "Ejercicio que se centra en el aductor largo al elevar la pierna lateralmente.", "video": "https://www.youtube.com/watch?v=6fr_7fx1gqU", "image": "https://example.com/elevacion-pierna-lateral.jpg", "dateAdded": "2024-08-18", "dificulty_id": 2, "machine_id": 1},
-        {"id": 320, "name": "Estiramiento de Cadera", "description": "Ejercicio que trabaja el aductor largo al realizar estiramientos de cadera.", "video": "https://www.youtube.com/watch?v=Mi6zO8l7Uok", "image": "https://example.com/estiramiento-cadera.jpg", "dateAdded": "2024-08-19", "dificulty_id": 1, "machine_id": 1},
-        #Aductor Corto
-        {"id": 321, "name": "Zancadas Cortas", "description": "Ejercicio que trabaja el aductor corto al realizar zancadas cortas hacia adelante.", "video": "https://www.youtube.com/watch?v=pt1IK_0LfEY", "image": "https://example.com/zancadas-cortas-aductor.jpg", "dateAdded": "2024-08-20", "dificulty_id": 1, "machine_id": 1},
-        {"id": 322, "name": "Estiramiento de Aductor Corto", "description": "Ejercicio que se centra en el aductor corto al realizar estiramientos específicos.", "video": "https://www.youtube.com/watch?v=ObFhKz7bHL0", "image": "https://example.com/estiramiento-aductor-corto.jpg", "dateAdded": "2024-08-21", "dificulty_id": 1, "machine_id": 1},
-        {"id": 323, "name": "Rotación de Cadera Corto", "description": "Ejercicio que trabaja el aductor corto al realizar rotaciones de cadera en posición de pie.", "video": "https://www.youtube.com/watch?v=ZJIKmGvfsrY", "image": "https://example.com/rotacion-cadera-corto.jpg", "dateAdded": "2024-08-22", "dificulty_id": 2, "machine_id": 1},
-        {"id": 324, "name": "Apertura de Cadera Corto", "description": "Ejercicio que se enfoca en el aductor corto al realizar aperturas de cadera en posición de pie.", "video": "https://www.youtube.com/watch?v=kC8oBQkPrfI", "image": "https://example.com/apertura-cadera-corto.jpg", "dateAdded": "2024-08-23", "dificulty_id": 1, "machine_id": 1},
-        {"id": 325, "name": "Patada Lateral Corto", "description": "Ejercicio que activa el aductor corto al realizar patadas laterales.", "video": "https://www.youtube.com/watch?v=o67Ll4nU_Dk", "image": "https://example.com/patada-lateral-corto.jpg", "dateAdded": "2024-08-24", "dificulty_id": 2, "machine_id": 1},
-        {"id": 326, "name": "Zancadas Inversas", "description": "Ejercicio que se centra en el aductor corto al realizar zancadas hacia atrás.", "video": "https://www.youtube.com/watch?v=GfU9Kxw4k6I", "image": "https://example.com/zancadas-inversas.jpg", "dateAdded": "2024-08-25", "dificulty_id": 1, "machine_id": 1},
-        {"id": 327, "name": "Elevación de Pierna Corto", "description": "Ejercicio que trabaja el aductor corto al elevar la pierna lateralmente.", "video": "https://www.youtube.com/watch?v=g5waQGcpOBg", "image": "https://example.com/elevacion-pierna-corto.jpg", "dateAdded": "2024-08-26", "dificulty_id": 2, "machine_id": 1},
-        {"id": 328, "name": "Flexión de Cadera Corto", "description": "Ejercicio que se enfoca en el aductor corto al realizar flexiones de cadera con peso.", "video": "https://www.youtube.com/watch?v=dyb4y1MujCw", "image": "https://example.com/flexion-cadera-corto.jpg", "dateAdded": "2024-08-27", "dificulty_id": 2, "machine_id": 1},
-        {"id": 329, "name": "Estiramiento de Cadera Corto", "description": "Ejercicio que activa el aductor corto al realizar estiramientos de cadera.", "video": "https://www.youtube.com/watch?v=cJwnzRMc5MQ", "image": "https://example.com/estiramiento-cadera-corto.jpg", "dateAdded": "2024-08-28", "dificulty_id": 1, "machine_id": 1},
-        {"id": 330, "name": "Patada Lateral de Aductor Corto", "description": "Ejercicio que se centra en el aductor corto al realizar patadas laterales específicas.", "video": "https://www.youtube.com/watch?v=lAexOXzZKfo", "image": "https://example.com/patada-lateral-aductor-corto.jpg", "dateAdded": "2024-08-29", "dificulty_id": 2, "machine_id": 1},
-        #Grácil
-        {"id": 331, "name": "Zancadas con Grácil", "description": "Ejercicio que trabaja el grácil al realizar zancadas con énfasis en el muslo interno.", "video": "https://www.youtube.com/watch?v=0N53MTyABgI", "image": "https://example.com/zancadas-gracil.jpg", "dateAdded": "2024-08-30", "dificulty_id": 2, "machine_id": 1},
-        {"id": 332, "name": "Sentadilla con Grácil", "description": "Ejercicio que activa el grácil al realizar una sentadilla con enfoque en el muslo interno.", "video": "https://www.youtube.com/watch?v=6RHMktJ89_Q", "image": "https://example.com/sentadilla-gracil.jpg", "dateAdded": "2024-08-31", "dificulty_id": 1, "machine_id": 1},
-        {"id": 333, "name": "Estiramiento de Grácil", "description": "Ejercicio que se centra en el grácil al realizar estiramientos específicos para el muslo interno.", "video": "https://www.youtube.com/watch?v=GJzILH8XqzY", "image": "https://example.com/estiramiento-gracil.jpg", "dateAdded": "2024-09-01", "dificulty_id": 1, "machine_id": 1},
-        {"id": 334, "name": "Rotación de Cadera con Grácil", "description": "Ejercicio que trabaja el grácil al realizar rotaciones de cadera en posición tumbada.", "video": "https://www.youtube.com/watch?v=9oZ1RFEqVQ8", "image": "https://example.com/rotacion-cadera-gracil.jpg", "dateAdded": "2024-09-02", "dificulty_id": 2, "machine_id": 1},
-        {"id": 335, "name": "Apertura de Pierna con Grácil", "description": "Ejercicio que se enfoca en el grácil al realizar aperturas de pierna lateralmente.", "video": "https://www.youtube.com/watch?v=ukAWgPK5YtM", "image": "https://example.com/apertura-pierna-gracil.jpg", "dateAdded": "2024-09-03", "dificulty_id": 2, "machine_id": 1},
-        {"id": 336, "name": "Elevación de Pierna con Grácil", "description": "Ejercicio que activa el grácil al elevar la pierna lateralmente en posición de pie.", "video": "https://www.youtube.com/watch?v=WtPEUymq7C4", "image": "https://example.com/elevacion-pierna-gracil.jpg", "dateAdded": "2024-09-04", "dificulty_id": 1, "machine_id": 1},
-        {"id": 337, "name": "Estiramiento de Cadera con Grácil", "description": "Ejercicio que trabaja el grácil al realizar estiramientos de cadera.", "video": "https://www.youtube.com/watch?v=d6lfyE3j1b0", "image": "https://example.com/estiramiento-cadera-gracil.jpg", "dateAdded": "2024-09-05", "dificulty_id": 1, "machine_id": 1},
-        {"id": 338, "name": "Flexión de Cadera con Grácil", "description": "Ejercicio que se centra en el grácil al realizar flexiones de cadera con peso.", "video": "https://www.youtube.com/watch?v=fuwg8m0e_9g", "image": "https://example.com/flexion-cadera-gracil.jpg", "dateAdded": "2024-09-06", "dificulty_id": 2, "machine_id": 1},
-        {"id": 339, "name": "Rotación de Cadera Interna con Grácil", "description": "Ejercicio que trabaja el grácil al realizar rotaciones internas de cadera en posición de pie.", "video": "https://www.youtube.com/watch?v=I3IuBHFwRHA", "image": "https://example.com/rotacion-cadera-interna-gracil.jpg", "dateAdded": "2024-09-07", "dificulty_id": 2, "machine_id": 1},
-        {"id": 340, "name": "Zancadas Lateral con Grácil", "description": "Ejercicio que activa el grácil al realizar zancadas laterales.", "video": "https://www.youtube.com/watch?v=t4WvnPMuPrA", "image": "https://example.com/zancadas-laterales-gracil.jpg", "dateAdded": "2024-09-08", "dificulty_id": 2, "machine_id": 1}
-    ]
-    for exercise in exercises:
-        if not db.query(Exercise).filter_by(id=exercise["id"]).first():
-            db.add(Exercise(**exercise))
+    insert_ignore(db, Exercise, EXERCISES)
     db.commit()
 
-def init_data(db: Session):
-    init_roles(db)
\ No newline at end of file
+# Catálogos que se siembran en cada arranque, en orden de dependencias
+SEEDS = [
+    (Role, ROLES),
+]
+
+def seed_fingerprint(seeds: list = SEEDS) -> str:
+    """Huella de los datos a sembrar; cambia si cambia cualquier fila."""
+    payload = [(model.__tablename__, rows) for model, rows in seeds]
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+def init_data(db: Session, seeds: list = SEEDS):
+    fingerprint = seed_fingerprint(seeds)
+    stored = db.scalar(select(SeedFingerprint.fingerprint).where(SeedFingerprint.name == SEED_NAME))
+    if stored == fingerprint:
+        return
+    for model, rows in seeds:
+        insert_ignore(db, model, rows)
+    upsert = dialect_insert(db)(SeedFingerprint).values(name=SEED_NAME, fingerprint=fingerprint, updated_at=datetime.utcnow())
+    db.execute(upsert.on_conflict_do_update(
+        index_elements=[SeedFingerprint.name],
+        set_={"fingerprint": upsert.excluded.fingerprint, "updated_at": upsert.excluded.updated_at},
+    ))
+    db.commit()
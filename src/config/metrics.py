@@ -0,0 +1,155 @@
+"""
+Métricas estilo Prometheus del pool de conexiones y de las consultas SQL.
+
+Los histogramas y contadores se alimentan de los eventos del pool y del motor;
+los gauges del pool se leen en el momento del scrape.
+"""
+import time
+
+from prometheus_client import REGISTRY, Counter, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+UNKNOWN_ROUTE = "desconocido"
+
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Tiempo de espera para obtener una conexión del pool",
+    ["engine"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+DB_POOL_PRE_PING = Histogram(
+    "db_pool_pre_ping_seconds",
+    "Duración del pre-ping al sacar una conexión del pool",
+    ["engine"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1),
+)
+DB_POOL_CONNECTIONS_OPENED = Counter(
+    "db_pool_connections_opened_total",
+    "Conexiones nuevas abiertas contra la base de datos",
+    ["engine"],
+)
+DB_POOL_CONNECTIONS_RECYCLED = Counter(
+    "db_pool_connections_recycled_total",
+    "Conexiones cerradas por superar pool_recycle",
+    ["engine"],
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Duración de las sentencias SQL por ruta",
+    ["engine", "route"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 10),
+)
+
+
+class _CheckoutTimingMixin:
+    """Mide cuánto tarda el pool en entregar una conexión (cola + conexión nueva)."""
+
+    metrics_label = "default"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.labels(self.metrics_label).observe(time.perf_counter() - start)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics_label = self.metrics_label
+        return pool
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    """QueuePool con el tiempo de checkout instrumentado."""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool con el tiempo de checkout instrumentado."""
+
+
+class PoolCollector:
+    """Gauges del estado de cada pool registrado, leídos en cada scrape."""
+
+    def __init__(self) -> None:
+        self._engines = {}
+
+    def add(self, label: str, engine, monitor=None) -> None:
+        self._engines[label] = (engine, monitor)
+
+    def collect(self):
+        size = GaugeMetricFamily("db_pool_size", "Conexiones permanentes configuradas en el pool", labels=["engine"])
+        max_overflow = GaugeMetricFamily("db_pool_max_overflow", "Conexiones de desborde permitidas", labels=["engine"])
+        checked_out = GaugeMetricFamily("db_pool_checked_out", "Conexiones prestadas en este momento", labels=["engine"])
+        checked_in = GaugeMetricFamily("db_pool_checked_in", "Conexiones libres dentro del pool", labels=["engine"])
+        overflow = GaugeMetricFamily("db_pool_overflow", "Conexiones de desborde abiertas en este momento", labels=["engine"])
+        peak = GaugeMetricFamily("db_pool_peak_checked_out", "Máximo de conexiones prestadas a la vez", labels=["engine"])
+        leaks = CounterMetricFamily("db_pool_leaks", "Conexiones retenidas más allá del umbral de fuga", labels=["engine"])
+        saturation = CounterMetricFamily("db_pool_saturation", "Checkouts con el pool por encima del umbral de alerta", labels=["engine"])
+
+        for label, (engine, monitor) in self._engines.items():
+            pool = engine.pool
+            if isinstance(pool, QueuePool):
+                size.add_metric([label], pool.size())
+                max_overflow.add_metric([label], max(pool._max_overflow, 0))
+                checked_out.add_metric([label], pool.checkedout())
+                checked_in.add_metric([label], pool.checkedin())
+                overflow.add_metric([label], max(pool.overflow(), 0))
+            if monitor is not None:
+                usage = monitor.usage()
+                peak.add_metric([label], usage["peak_checked_out"])
+                leaks.add_metric([label], usage["leaks_total"])
+                saturation.add_metric([label], usage["saturation_total"])
+
+        yield from (size, max_overflow, checked_out, checked_in, overflow, peak, leaks, saturation)
+
+
+pool_collector = PoolCollector()
+REGISTRY.register(pool_collector)
+
+
+def instrument_engine(engine, label: str, monitor=None) -> None:
+    """Registrar los eventos del pool y del motor que alimentan las métricas."""
+    engine = getattr(engine, "sync_engine", engine)
+    pool = engine.pool
+    pool.metrics_label = label
+    pool_collector.add(label, engine, monitor)
+
+    dialect = engine.dialect
+    do_ping = dialect.do_ping
+
+    def timed_ping(dbapi_connection):
+        start = time.perf_counter()
+        try:
+            return do_ping(dbapi_connection)
+        finally:
+            DB_POOL_PRE_PING.labels(label).observe(time.perf_counter() - start)
+
+    dialect.do_ping = timed_ping
+
+    @event.listens_for(pool, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        DB_POOL_CONNECTIONS_OPENED.labels(label).inc()
+
+    @event.listens_for(pool, "close")
+    def on_close(dbapi_connection, connection_record):
+        recycle = engine.pool._recycle
+        if recycle > -1 and time.time() - connection_record.starttime > recycle:
+            DB_POOL_CONNECTIONS_RECYCLED.labels(label).inc()
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("query_start")
+        if starts:
+            DB_QUERY_DURATION.labels(label, conn.info.get("route", UNKNOWN_ROUTE)).observe(time.perf_counter() - starts.pop())
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start"):
+            conn.info["query_start"].pop()
@@ -0,0 +1,85 @@
+"""
+Migraciones versionadas del esquema con Alembic.
+
+Sustituye a Base.metadata.create_all: el esquema se crea y evoluciona con las
+revisiones de migrations/versions. Se ejecuta antes de arrancar la API y,
+además de migrar, siembra los datos iniciales:
+
+    python -m src.config.migrations
+"""
+import importlib
+import os
+import pkgutil
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, inspect
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ALEMBIC_INI = os.path.join(ROOT_DIR, "alembic.ini")
+
+# Revisión equivalente al esquema que generaba create_all
+BASELINE_REVISION = "0001"
+
+
+# Tablas que no están en la metadata: la tabla FTS5 de búsqueda de SQLite y sus tablas internas
+UNMANAGED_TABLE_PREFIXES = ("training_plans_fts",)
+
+
+def include_name(name, type_, parent_names) -> bool:
+    """Filtro de autogenerate: ignorar las tablas que no gestionan los modelos."""
+    return not (type_ == "table" and name.startswith(UNMANAGED_TABLE_PREFIXES))
+
+
+def load_models() -> None:
+    """Importar todos los modelos para que la metadata contenga todas las tablas."""
+    import src.models
+
+    for module in pkgutil.iter_modules(src.models.__path__):
+        importlib.import_module(f"src.models.{module.name}")
+
+
+def alembic_config(url: str = None) -> Config:
+    """Configuración de Alembic apuntando a la URL indicada o a la de la aplicación."""
+    config = Config(ALEMBIC_INI)
+    config.set_main_option("script_location", os.path.join(ROOT_DIR, "migrations"))
+    if url is not None:
+        config.attributes["url"] = url
+    return config
+
+
+def run_migrations(url: str = None, revision: str = "head") -> None:
+    """
+    Llevar el esquema a la revisión indicada.
+
+    Las bases creadas antes con create_all no tienen tabla alembic_version:
+    se marcan con la revisión inicial antes de aplicar el resto.
+    """
+    from src.config.database import SQLALCHEMY_DATABASE_URL
+
+    config = alembic_config(url)
+    engine = create_engine(url or SQLALCHEMY_DATABASE_URL)
+    try:
+        tables = inspect(engine).get_table_names()
+    finally:
+        engine.dispose()
+    if tables and "alembic_version" not in tables:
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, revision)
+
+
+def seed_data() -> None:
+    """Sembrar los datos iniciales (paso único del modo de arranque rápido)."""
+    from src.config.database import SessionLocal
+    from src.config.database_init import init_data
+
+    db = SessionLocal()
+    try:
+        init_data(db)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    run_migrations()
+    seed_data()
@@ -0,0 +1,98 @@
+"""
+Monitor del pool de conexiones: detección de fugas y contadores de uso.
+"""
+import logging
+import os
+import threading
+import time
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+DB_LEAK_THRESHOLD_SECONDS = float(os.getenv("DB_LEAK_THRESHOLD_SECONDS", "30"))
+DB_POOL_ALERT_RATIO = float(os.getenv("DB_POOL_ALERT_RATIO", "0.8"))
+
+
+class PoolMonitor:
+    """Registra quién tiene cada conexión del pool y durante cuánto tiempo."""
+
+    def __init__(self, leak_threshold: float = DB_LEAK_THRESHOLD_SECONDS, alert_ratio: float = DB_POOL_ALERT_RATIO) -> None:
+        self.leak_threshold = leak_threshold
+        self.alert_ratio = alert_ratio
+        self.capacity = None
+        self.checkouts_total = 0
+        self.leaks_total = 0
+        self.saturation_total = 0
+        self.peak_checked_out = 0
+        self._checked_out = {}
+        self._lock = threading.Lock()
+
+    def attach(self, engine, session_factory=None) -> None:
+        """Registrar los eventos del pool y, opcionalmente, de la fábrica de sesiones."""
+        pool = engine.pool
+        if hasattr(pool, "size") and hasattr(pool, "_max_overflow"):
+            self.capacity = pool.size() + max(pool._max_overflow, 0)
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "checkin", self._on_checkin)
+        if session_factory is not None:
+            event.listen(session_factory, "after_begin", self._on_session_begin)
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        self.check_leaks()
+        with self._lock:
+            self._checked_out[id(connection_record)] = [connection_record, time.monotonic(), False]
+            self.checkouts_total += 1
+            in_use = len(self._checked_out)
+            self.peak_checked_out = max(self.peak_checked_out, in_use)
+            saturated = self.capacity and in_use >= self.capacity * self.alert_ratio
+            if saturated:
+                self.saturation_total += 1
+        if saturated:
+            logger.warning("Pool de conexiones al %d/%d de su capacidad", in_use, self.capacity)
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            entry = self._checked_out.pop(id(connection_record), None)
+        if entry is not None:
+            held = time.monotonic() - entry[1]
+            if held > self.leak_threshold and not entry[2]:
+                with self._lock:
+                    self.leaks_total += 1
+                logger.warning(
+                    "Conexión retenida %.1fs por %s",
+                    held, connection_record.info.get("route", "desconocido")
+                )
+        connection_record.info.pop("route", None)
+
+    def _on_session_begin(self, session, transaction, connection) -> None:
+        route = session.info.get("route")
+        if route:
+            connection.info["route"] = route
+
+    def check_leaks(self) -> list:
+        """Reportar las conexiones que superan el umbral y siguen sin devolverse."""
+        now = time.monotonic()
+        leaked = []
+        with self._lock:
+            for entry in self._checked_out.values():
+                record, since, reported = entry
+                if not reported and now - since > self.leak_threshold:
+                    entry[2] = True
+                    self.leaks_total += 1
+                    leaked.append((record.info.get("route", "desconocido"), now - since))
+        for route, held in leaked:
+            logger.warning("Posible fuga: conexión abierta hace %.1fs por %s", held, route)
+        return leaked
+
+    def usage(self) -> dict:
+        """Contadores de uso del pool para alertas."""
+        with self._lock:
+            return {
+                "checked_out": len(self._checked_out),
+                "capacity": self.capacity,
+                "peak_checked_out": self.peak_checked_out,
+                "checkouts_total": self.checkouts_total,
+                "leaks_total": self.leaks_total,
+                "saturation_total": self.saturation_total,
+            }
@@ -0,0 +1,67 @@
+"""
+Conteo de sentencias SQL y tiempo de base de datos por petición.
+
+El middleware QueryCounter abre un QueryStats por petición; los eventos del
+motor lo encuentran a través de un ContextVar, que Starlette copia tanto al
+pool de hilos (endpoints síncronos) como a las tareas asíncronas.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_current_stats: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+# Sentencias que se guardan por petición; a partir de ahí solo se cuentan
+MAX_STATEMENTS = 100
+
+
+class QueryStats:
+    """Sentencias ejecutadas (las primeras max_statements) y segundos pasados en la base de datos."""
+
+    def __init__(self, max_statements: int = MAX_STATEMENTS) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.statements = []
+        self.max_statements = max_statements
+
+    def add(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        if len(self.statements) < self.max_statements:
+            self.statements.append(statement)
+
+
+@contextmanager
+def track_queries(max_statements: int = MAX_STATEMENTS):
+    """Contar las sentencias ejecutadas dentro del bloque."""
+    stats = QueryStats(max_statements)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_stats_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    starts = conn.info.get("query_stats_start")
+    if stats is not None and starts:
+        stats.add(statement, time.perf_counter() - starts.pop())
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_stats_start"):
+        conn.info["query_stats_start"].pop()
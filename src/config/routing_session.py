@@ -0,0 +1,43 @@
+"""
+Sesión que separa lecturas y escrituras entre la base primaria y sus réplicas.
+"""
+import random
+
+from sqlalchemy.orm import Session
+
+STICKY_PRIMARY = "sticky_primary"
+
+
+class RoutingSession(Session):
+    """
+    Envía las consultas SELECT a una réplica y todo lo demás a la primaria.
+
+    En cuanto la sesión escribe (flush, INSERT/UPDATE/DELETE o SELECT ... FOR UPDATE)
+    queda fijada a la primaria hasta cerrarse, de modo que el resto de la petición
+    lee sus propias escrituras.
+    """
+
+    def __init__(self, *args, replicas=(), **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.replicas = list(replicas)
+        self._replica = None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if not self.replicas or self.info.get(STICKY_PRIMARY):
+            return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+        if self._flushing or not self._is_plain_select(clause):
+            self.info[STICKY_PRIMARY] = True
+            return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+        if self._replica is None:
+            self._replica = random.choice(self.replicas)
+        return self._replica
+
+    @staticmethod
+    def _is_plain_select(clause) -> bool:
+        return clause is not None and getattr(clause, "is_select", False) and getattr(clause, "_for_update_arg", None) is None
+
+
+def use_primary(db: Session) -> Session:
+    """Fijar la sesión a la primaria para flujos que leen lo que acaban de escribir."""
+    db.info[STICKY_PRIMARY] = True
+    return db
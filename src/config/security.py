@@ -1,3 +1,48 @@
 import os
 auth_secret_key = os.getenv("AUTH_SECRET_KEY")
-auth_algorithm = os.getenv("AUTH_ALGORITHM")
\ No newline at end of file
+auth_algorithm = os.getenv("AUTH_ALGORITHM")
+
+# Coste de bcrypt para los hashes nuevos (cada +1 duplica el tiempo)
+bcrypt_rounds = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# Hilos del threadpool en el que se ejecutan las rutas síncronas (anyio usa 40)
+threadpool_size = int(os.getenv("THREADPOOL_SIZE", "40"))
+# Hilos dedicados a bcrypt y operaciones en cola admitidas antes de responder 503.
+# Cada operación en curso o en cola bloquea un hilo del threadpool, así que entre
+# las dos nunca pasan de la mitad y el resto de rutas síncronas sigue atendiéndose
+bcrypt_workers = int(os.getenv("BCRYPT_WORKERS", "2"))
+bcrypt_max_queue = min(int(os.getenv("BCRYPT_MAX_QUEUE", "8")), max(0, threadpool_size // 2 - bcrypt_workers))
+
+# Tokens de acceso verificados que se guardan en memoria (0 desactiva la caché)
+token_cache_size = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+
+# Almacén de familias de tokens de actualización: "sql" (por defecto) o "redis".
+# Con REDIS_URL=memory:// se usa un sustituto en memoria (desarrollo y pruebas)
+token_store_backend = os.getenv("TOKEN_STORE", "sql").lower()
+redis_url = os.getenv("REDIS_URL")
+# Cada cuántos segundos se recarga la lista de familias revocadas desde el almacén
+revocation_refresh_seconds = float(os.getenv("REVOCATION_REFRESH_SECONDS", "5"))
+
+# Límite de peticiones de las rutas de autenticación: "memory" (un proceso),
+# "redis" (compartido entre workers, usa REDIS_URL) u "off"
+rate_limit_backend = os.getenv("RATE_LIMIT_BACKEND", "memory").lower()
+# Tomar la IP de X-Forwarded-For (solo detrás de un proxy de confianza)
+rate_limit_trust_proxy = os.getenv("RATE_LIMIT_TRUST_PROXY", "false").lower() == "true"
+# Políticas "peticiones/segundos" por ruta y clave; vacío o 0 desactiva esa política
+rate_limit_policies = {
+    "login": {
+        "ip": os.getenv("RATE_LIMIT_LOGIN_IP", "20/60"),
+        "email": os.getenv("RATE_LIMIT_LOGIN_EMAIL", "5/60"),
+    },
+    "register": {
+        "ip": os.getenv("RATE_LIMIT_REGISTER_IP", "10/3600"),
+        "email": os.getenv("RATE_LIMIT_REGISTER_EMAIL", "3/3600"),
+    },
+    "forgot_password": {
+        "ip": os.getenv("RATE_LIMIT_FORGOT_PASSWORD_IP", "5/300"),
+        "email": os.getenv("RATE_LIMIT_FORGOT_PASSWORD_EMAIL", "3/900"),
+    },
+    "resend_verification": {
+        "ip": os.getenv("RATE_LIMIT_RESEND_VERIFICATION_IP", "5/300"),
+        "email": os.getenv("RATE_LIMIT_RESEND_VERIFICATION_EMAIL", "3/900"),
+    },
+}
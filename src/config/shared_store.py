@@ -0,0 +1,124 @@
+"""
+Cliente del almacén compartido (Redis o compatible) entre procesos.
+
+Lo usan el almacén de tokens (TOKEN_STORE=redis), el limitador de peticiones
+(RATE_LIMIT_BACKEND=redis) y la caché de árboles de planes. Con REDIS_URL vacía o "memory://" se usa
+LocalRedis, un sustituto en memoria del proceso para desarrollo y pruebas; no
+comparte nada entre workers.
+"""
+import threading
+import time
+from functools import lru_cache
+
+
+class LocalRedis:
+    """Subconjunto en memoria de redis-py con los comandos que usan los tokens y el limitador."""
+
+    def __init__(self) -> None:
+        self._values = {}
+        self._expires = {}
+        self._lock = threading.Lock()
+
+    def _alive(self, name: str) -> bool:
+        expires_at = self._expires.get(name)
+        if expires_at is not None and expires_at <= time.time():
+            self._values.pop(name, None)
+            self._expires.pop(name, None)
+        return name in self._values
+
+    def set(self, name: str, value, ex: int = None, get: bool = False):
+        with self._lock:
+            previous = self._values.get(name) if self._alive(name) else None
+            self._values[name] = value
+            if ex is not None:
+                self._expires[name] = time.time() + ex
+            else:
+                self._expires.pop(name, None)
+            return previous if get else True
+
+    def get(self, name: str):
+        with self._lock:
+            return self._values.get(name) if self._alive(name) else None
+
+    def delete(self, *names) -> int:
+        with self._lock:
+            removed = 0
+            for name in names:
+                if self._alive(name):
+                    removed += 1
+                self._values.pop(name, None)
+                self._expires.pop(name, None)
+            return removed
+
+    def expire(self, name: str, seconds: int) -> bool:
+        with self._lock:
+            if not self._alive(name):
+                return False
+            self._expires[name] = time.time() + seconds
+            return True
+
+    def ttl(self, name: str) -> int:
+        with self._lock:
+            if not self._alive(name):
+                return -2
+            expires_at = self._expires.get(name)
+            return -1 if expires_at is None else int(expires_at - time.time())
+
+    def sadd(self, name: str, *values) -> int:
+        with self._lock:
+            if not self._alive(name):
+                self._values[name] = set()
+            members = self._values[name]
+            added = len(set(values) - members)
+            members.update(values)
+            return added
+
+    def smembers(self, name: str) -> set:
+        with self._lock:
+            return set(self._values.get(name, ())) if self._alive(name) else set()
+
+    def zadd(self, name: str, mapping: dict) -> int:
+        with self._lock:
+            scores = self._values.setdefault(name, {})
+            added = len(set(mapping) - set(scores))
+            scores.update(mapping)
+            return added
+
+    def zscore(self, name: str, member: str):
+        with self._lock:
+            return self._values.get(name, {}).get(member)
+
+    @staticmethod
+    def _bound(value) -> float:
+        return {"-inf": float("-inf"), "+inf": float("inf")}.get(value, value)
+
+    def zrangebyscore(self, name: str, min, max) -> list:
+        with self._lock:
+            low, high = self._bound(min), self._bound(max)
+            scores = self._values.get(name, {})
+            return [member for member, score in sorted(scores.items(), key=lambda item: item[1]) if low <= score <= high]
+
+    def zremrangebyscore(self, name: str, min, max) -> int:
+        with self._lock:
+            low, high = self._bound(min), self._bound(max)
+            scores = self._values.get(name, {})
+            removed = [member for member, score in scores.items() if low <= score <= high]
+            for member in removed:
+                del scores[member]
+            return len(removed)
+
+    def incr(self, name: str, amount: int = 1) -> int:
+        with self._lock:
+            value = int(self._values[name]) + amount if self._alive(name) else amount
+            self._values[name] = value
+            return value
+
+
+
+@lru_cache(maxsize=None)
+def redis_client(url: str = None):
+    """Cliente para url (uno por URL y proceso); redis solo se importa si se usa."""
+    if not url or url.startswith("memory://"):
+        return LocalRedis()
+    import redis
+    return redis.Redis.from_url(url)
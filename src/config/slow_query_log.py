@@ -0,0 +1,193 @@
+"""
+Registro de consultas lentas con captura del plan de ejecución.
+
+Las sentencias que superan el umbral se guardan con sus parámetros y la ruta
+que las lanzó en un archivo rotativo y en un buffer en memoria que expone el
+endpoint de administración. Para una muestra de ellas se pide el EXPLAIN en
+segundo plano (hilo aparte en motores síncronos, tarea del event loop en los
+asíncronos), de modo que la captura no añade latencia a la petición.
+"""
+import asyncio
+import itertools
+import json
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+DB_SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "500"))
+DB_SLOW_QUERY_EXPLAIN_SAMPLE = float(os.getenv("DB_SLOW_QUERY_EXPLAIN_SAMPLE", "0.1"))
+DB_SLOW_QUERY_LOG_FILE = os.getenv("DB_SLOW_QUERY_LOG_FILE", "logs/slow_queries.log")
+DB_SLOW_QUERY_LOG_PARAMS = os.getenv("DB_SLOW_QUERY_LOG_PARAMS", "true").lower() == "true"
+
+EXPLAIN_PREFIXES = {"postgresql": "EXPLAIN (ANALYZE off) ", "sqlite": "EXPLAIN QUERY PLAN "}
+MAX_PARAMETERS_LENGTH = 1000
+
+
+class SlowQueryLog:
+    """Detecta las sentencias lentas de los motores registrados y guarda las últimas."""
+
+    def __init__(
+        self,
+        threshold_ms: float = DB_SLOW_QUERY_MS,
+        explain_sample: float = DB_SLOW_QUERY_EXPLAIN_SAMPLE,
+        log_file: str = DB_SLOW_QUERY_LOG_FILE,
+        log_parameters: bool = DB_SLOW_QUERY_LOG_PARAMS,
+        buffer_size: int = 200,
+        max_pending_explains: int = 10,
+    ) -> None:
+        self.threshold = threshold_ms / 1000
+        self.explain_sample = explain_sample
+        self.log_file = log_file
+        self.log_parameters = log_parameters
+        self.max_pending_explains = max_pending_explains
+        self.entries = deque(maxlen=buffer_size)
+        self._ids = itertools.count(1)
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._executor = None
+        self._tasks = set()
+        self._file_logger = None
+
+    def attach(self, engine) -> None:
+        """Registrar los eventos del motor (síncrono o asíncrono)."""
+        sync_engine = getattr(engine, "sync_engine", engine)
+        explain = self._explain_async if sync_engine is not engine else self._explain_sync
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("slow_query_start", []).append(time.perf_counter())
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            starts = conn.info.get("slow_query_start")
+            if not starts:
+                return
+            duration = time.perf_counter() - starts.pop()
+            if duration < self.threshold or statement.startswith("EXPLAIN"):
+                return
+            entry = self.record(statement, parameters, duration, conn.info.get("route"))
+            if not executemany and self._should_explain(statement):
+                explain(engine, entry, statement, parameters)
+
+        @event.listens_for(sync_engine, "handle_error")
+        def handle_error(exception_context):
+            conn = exception_context.connection
+            if conn is not None and conn.info.get("slow_query_start"):
+                conn.info["slow_query_start"].pop()
+
+    def record(self, statement: str, parameters, duration: float, route: str = None) -> dict:
+        """Guardar una consulta lenta en el buffer y en el archivo."""
+        entry = {
+            "id": next(self._ids),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": round(duration * 1000, 2),
+            "route": route or "desconocido",
+            "statement": statement,
+            "parameters": self._format_parameters(parameters),
+            "plan": None,
+        }
+        with self._lock:
+            self.entries.append(entry)
+        logger.warning("Consulta lenta (%.0f ms) en %s", entry["duration_ms"], entry["route"])
+        self._write({key: value for key, value in entry.items() if key != "plan"})
+        return entry
+
+    def recent(self, limit: int = 50) -> list:
+        """Últimas consultas lentas, de la más reciente a la más antigua."""
+        with self._lock:
+            return list(itertools.islice(reversed(self.entries), limit))
+
+    def _should_explain(self, statement: str) -> bool:
+        if self.explain_sample <= 0 or random.random() >= self.explain_sample:
+            return False
+        if not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            return False
+        with self._lock:
+            if self._pending >= self.max_pending_explains:
+                return False
+            self._pending += 1
+        return True
+
+    def _explain_sync(self, engine, entry: dict, statement: str, parameters) -> None:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+        self._executor.submit(self._run_explain, engine, entry, statement, parameters)
+
+    def _run_explain(self, engine, entry: dict, statement: str, parameters) -> None:
+        try:
+            with engine.connect() as connection:
+                rows = connection.exec_driver_sql(self._explain_sql(engine, statement), parameters).all()
+            self._store_plan(entry, rows)
+        except Exception:
+            logger.exception("No se pudo obtener el plan de la consulta lenta %s", entry["id"])
+        finally:
+            self._explain_done()
+
+    def _explain_async(self, engine, entry: dict, statement: str, parameters) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._explain_done()
+            return
+        task = loop.create_task(self._run_explain_async(engine, entry, statement, parameters))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_explain_async(self, engine, entry: dict, statement: str, parameters) -> None:
+        try:
+            async with engine.connect() as connection:
+                result = await connection.exec_driver_sql(self._explain_sql(engine, statement), parameters)
+                rows = result.all()
+            self._store_plan(entry, rows)
+        except Exception:
+            logger.exception("No se pudo obtener el plan de la consulta lenta %s", entry["id"])
+        finally:
+            self._explain_done()
+
+    def _explain_done(self) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    @staticmethod
+    def _explain_sql(engine, statement: str) -> str:
+        return EXPLAIN_PREFIXES.get(engine.dialect.name, "EXPLAIN ") + statement
+
+    def _store_plan(self, entry: dict, rows) -> None:
+        entry["plan"] = "\n".join(" ".join(str(value) for value in row) for row in rows)
+        self._write({"id": entry["id"], "plan": entry["plan"]})
+
+    def _format_parameters(self, parameters):
+        if not self.log_parameters:
+            return None
+        text = repr(parameters)
+        return text if len(text) <= MAX_PARAMETERS_LENGTH else text[:MAX_PARAMETERS_LENGTH] + "..."
+
+    def _write(self, data: dict) -> None:
+        if not self.log_file:
+            return
+        if self._file_logger is None:
+            self._file_logger = self._build_file_logger()
+        self._file_logger.info(json.dumps(data, ensure_ascii=False, default=str))
+
+    def _build_file_logger(self) -> logging.Logger:
+        directory = os.path.dirname(self.log_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        file_logger = logging.getLogger(f"{__name__}.file.{id(self)}")
+        file_logger.setLevel(logging.INFO)
+        file_logger.propagate = False
+        handler = RotatingFileHandler(self.log_file, maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        file_logger.addHandler(handler)
+        return file_logger
@@ -1,13 +1,57 @@
-from sqlalchemy import create_engine, func
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.declarative import declarative_base
+"""
+Backend SQLite para instalaciones pequeñas de un solo gimnasio.
 
+Se activa con DB_BACKEND=sqlite. Cada conexión nueva del pool recibe los PRAGMA
+de SQLITE_PRAGMAS: WAL para que las lecturas no bloqueen a la escritura,
+synchronous=NORMAL (seguro con WAL y mucho más rápido que FULL), lectura por
+mmap, espera ante bloqueos en lugar de fallar con "database is locked" y
+claves foráneas activas para comportarse como PostgreSQL.
+"""
+import os
 
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine
 
-database_url = "sqlite:///./GymHouseDB.sqlite"
+SQLITE_DATABASE_PATH = os.getenv("SQLITE_DATABASE_PATH", "./GymHouseDB.sqlite")
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
 
-engine = create_engine(database_url,native_datetime=True,connect_args={ "check_same_thread": False})
+database_url = f"sqlite:///{SQLITE_DATABASE_PATH}"
 
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": SQLITE_MMAP_SIZE,
+    "busy_timeout": SQLITE_BUSY_TIMEOUT_MS,
+    "foreign_keys": "ON",
+}
 
-Base = declarative_base()
+SQLITE_POOL_OPTIONS = dict(
+    pool_size=5,  # Un escritor a la vez; pocas conexiones bastan
+    max_overflow=10,
+    pool_timeout=30,
+)
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record, pragmas: dict = SQLITE_PRAGMAS) -> None:
+    """Aplicar los PRAGMA a una conexión recién abierta."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def create_sqlite_engine(url: str = database_url, **kwargs):
+    """Motor síncrono con los PRAGMA aplicados en cada conexión."""
+    engine = create_engine(url, connect_args={"check_same_thread": False}, **kwargs)
+    event.listen(engine, "connect", set_sqlite_pragmas)
+    return engine
+
+
+def create_async_sqlite_engine(url: str, **kwargs):
+    """Motor asíncrono (aiosqlite) con los mismos PRAGMA."""
+    engine = create_async_engine(url, **kwargs)
+    event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+    return engine
@@ -0,0 +1,72 @@
+"""
+Arranque rápido de la aplicación.
+
+STARTUP_MODE decide qué hace cada instancia al arrancar:
+- "full" (por defecto): init/init.sh aplica las migraciones y la aplicación
+  siembra los datos iniciales en el evento de inicio.
+- "fast": el esquema y los datos los prepara un paso único antes del despliegue
+  (python -m src.config.migrations); las instancias nuevas solo esperan a la
+  base de datos y empiezan a servir.
+
+Ejecutado como módulo (python -m src.config.startup) es la sonda de
+disponibilidad que sustituye al antiguo "sleep 20" de init/init.sh: reintenta
+un SELECT 1 hasta que la base responde o se agota DB_READY_TIMEOUT.
+"""
+import logging
+import os
+import sys
+import time
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+logger = logging.getLogger(__name__)
+
+STARTUP_MODE = os.getenv("STARTUP_MODE", "full").lower()
+DB_READY_TIMEOUT = float(os.getenv("DB_READY_TIMEOUT", "60"))
+DB_READY_INTERVAL = float(os.getenv("DB_READY_INTERVAL", "0.5"))
+
+
+def seeds_on_startup() -> bool:
+    """Indica si la aplicación debe sembrar los datos iniciales al arrancar."""
+    return STARTUP_MODE != "fast"
+
+
+def wait_for_database(url: str = None, timeout: float = DB_READY_TIMEOUT, interval: float = DB_READY_INTERVAL) -> float:
+    """
+    Esperar a que la base de datos acepte conexiones.
+
+    Devuelve los segundos esperados o lanza TimeoutError si no responde a tiempo.
+    """
+    if url is None:
+        from src.config.database import SQLALCHEMY_DATABASE_URL
+        url = SQLALCHEMY_DATABASE_URL
+
+    engine = create_engine(url, pool_pre_ping=False)
+    start = time.monotonic()
+    delay = interval
+    try:
+        while True:
+            try:
+                with engine.connect() as connection:
+                    connection.execute(text("SELECT 1"))
+                return time.monotonic() - start
+            except OperationalError as error:
+                elapsed = time.monotonic() - start
+                if elapsed + delay > timeout:
+                    raise TimeoutError(f"La base de datos no respondió en {timeout:.0f}s") from error
+                logger.info("Base de datos no disponible todavía, reintentando en %.1fs", delay)
+                time.sleep(delay)
+                delay = min(delay * 2, 5)
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    try:
+        waited = wait_for_database()
+    except TimeoutError as error:
+        logger.error(str(error))
+        sys.exit(1)
+    logger.info("Base de datos disponible tras %.1fs", waited)
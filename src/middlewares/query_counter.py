@@ -0,0 +1,54 @@
+import logging
+import os
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import FastAPI, Request, Response
+
+from src.config.database import get_route_name
+from src.config.query_stats import track_queries
+
+logger = logging.getLogger(__name__)
+
+# Sentencias por petición a partir de las cuales se registra un aviso
+DB_QUERY_BUDGET = int(os.getenv("DB_QUERY_BUDGET", "25"))
+# Exponer X-Query-Count y Server-Timing en las respuestas
+DB_QUERY_HEADERS = os.getenv("DB_QUERY_HEADERS", "true").lower() == "true"
+
+#################################################
+class QueryCounter(BaseHTTPMiddleware):
+    """
+    Cuenta las sentencias SQL de cada petición, avisa si superan el presupuesto
+    y las expone en X-Query-Count y Server-Timing.
+
+    En las respuestas en streaming (sin Content-Length, p. ej. GET /user) las
+    consultas siguen mientras se envía el cuerpo, después de las cabeceras: no
+    se envían X-Query-Count ni Server-Timing (el valor sería parcial) y el
+    presupuesto se comprueba al terminar el cuerpo, con el total.
+    """
+    def __init__(self, app: FastAPI, budget: int = DB_QUERY_BUDGET, headers: bool = DB_QUERY_HEADERS) -> None:
+        super().__init__(app)
+        self.budget = budget
+        self.headers = headers
+    async def dispatch(self, request: Request, call_next) -> Response:
+        with track_queries() as stats:
+            response = await call_next(request)
+        if "content-length" not in response.headers:
+            response.body_iterator = self._check_after_body(request, response.body_iterator, stats)
+            return response
+        self._check_budget(request, stats)
+        if self.headers:
+            response.headers["X-Query-Count"] = str(stats.count)
+            response.headers["Server-Timing"] = f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries"'
+        return response
+    async def _check_after_body(self, request: Request, body_iterator, stats):
+        async for chunk in body_iterator:
+            yield chunk
+        self._check_budget(request, stats)
+    def _check_budget(self, request: Request, stats) -> None:
+        if stats.count > self.budget:
+            logger.warning(
+                "%s ejecutó %d consultas SQL (presupuesto %d)",
+                get_route_name(request), stats.count, self.budget
+            )
+
+#################################################
@@ -7,7 +7,7 @@ class Comment(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_email = Column(String(length=250), ForeignKey("users.email"))
-    training_plan_id = Column(Integer, ForeignKey("training_plans.id"))
+    training_plan_id = Column(Integer, ForeignKey("training_plans.id"), index=True)
     content = Column(String(length=200))
     date = Column(Date)
 
@@ -7,7 +7,7 @@ class ExerciseConfiguration(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     exercise_id = Column(Integer, ForeignKey("exercises.id"))
-    workout_day_exercise_id = Column(Integer, ForeignKey("workout_day_exercises.id"))
+    workout_day_exercise_id = Column(Integer, ForeignKey("workout_day_exercises.id"), index=True)
     sets = Column(Integer)
     repsHigh = Column(Integer)
     repsLow = Column(Integer)
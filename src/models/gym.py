@@ -6,7 +6,7 @@ class Gym(Base):
     __tablename__ = "gyms"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_email = Column(String(length=250), ForeignKey("users.email"))
+    user_email = Column(String(length=250), ForeignKey("users.email"), index=True)
     name = Column(String(length=100))
     address = Column(String(length=100))
     phone = Column(String(length=20))
@@ -1,9 +1,12 @@
-from sqlalchemy import Column, ForeignKey, Integer, Float, Date, String, inspect, Boolean
+from sqlalchemy import Column, ForeignKey, Integer, Float, Date, String, inspect, Boolean, Index
 from sqlalchemy.orm import relationship
 from src.config.database import Base
 
 class HistoryPrExercise(Base):
     __tablename__ = "history_pr_exercises"
+    __table_args__ = (
+        Index("ix_history_pr_exercises_user_email_exercise_id_date", "user_email", "exercise_id", "date"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_email = Column(String(length=250), ForeignKey("users.email"))
@@ -1,9 +1,15 @@
-from sqlalchemy import Column, ForeignKey, Integer, Float, Date, String, inspect, Boolean
+from sqlalchemy import Column, ForeignKey, Integer, Float, Date, String, inspect, Boolean, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from src.config.database import Base
 
 class Like(Base):
     __tablename__ = "likes"
+    __table_args__ = (
+        # Un único like/dislike por usuario y plan; también sirve los conteos por plan
+        UniqueConstraint("training_plan_id", "user_email", name="uq_likes_training_plan_id_user_email"),
+        # Cubre el conteo de likes/dislikes por plan sin leer la tabla
+        Index("ix_likes_training_plan_id_is_like", "training_plan_id", "is_like"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_email = Column(String(length=250), ForeignKey("users.email"))
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, DateTime, ForeignKey, String, inspect
+from src.config.database import Base
+
+class RefreshTokenFamily(Base):
+    __tablename__ = "refresh_token_families"
+
+    family_id = Column(String(length=36), primary_key=True)
+    user_email = Column(String(length=250), ForeignKey("users.email"), nullable=False, index=True)
+    current_jti = Column(String(length=36), nullable=False)
+    created_at = Column(DateTime)
+    expires_at = Column(DateTime, nullable=False)
+    revoked_at = Column(DateTime, index=True)
+
+    def to_dict(self):
+        return {c.key: getattr(self, c.key) for c in inspect(self).mapper.column_attrs}
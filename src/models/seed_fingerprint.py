@@ -0,0 +1,12 @@
+from sqlalchemy import Column, DateTime, String, inspect
+from src.config.database import Base
+
+class SeedFingerprint(Base):
+    __tablename__ = "seed_fingerprints"
+
+    name = Column(String(length=50), primary_key=True)
+    fingerprint = Column(String(length=64), nullable=False)
+    updated_at = Column(DateTime)
+
+    def to_dict(self):
+        return {c.key: getattr(self, c.key) for c in inspect(self).mapper.column_attrs}
@@ -1,9 +1,33 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, inspect
+from sqlalchemy import DDL, Boolean, Column, ForeignKey, Index, Integer, String, Text, event, func, inspect, select, text, update
 from sqlalchemy.orm import relationship
 from src.config.database import Base
+from src.models.tag_of_training_plan import TagOfTrainingPlan
+
+# Configuración de texto de PostgreSQL para la búsqueda (stemming y stopwords en español)
+SEARCH_CONFIG = "spanish"
+
+# Búsqueda en SQLite: tabla FTS5 de contenido externo sobre search_document, sincronizada por triggers.
+# Las migraciones que recreen training_plans con batch_alter_table deben volver a crear los triggers.
+SQLITE_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS training_plans_fts USING fts5("
+    "search_document, content='training_plans', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS training_plans_fts_ai AFTER INSERT ON training_plans BEGIN "
+    "INSERT INTO training_plans_fts(rowid, search_document) VALUES (new.id, new.search_document); END",
+    "CREATE TRIGGER IF NOT EXISTS training_plans_fts_ad AFTER DELETE ON training_plans BEGIN "
+    "INSERT INTO training_plans_fts(training_plans_fts, rowid, search_document) VALUES ('delete', old.id, old.search_document); END",
+    "CREATE TRIGGER IF NOT EXISTS training_plans_fts_au AFTER UPDATE OF search_document ON training_plans BEGIN "
+    "INSERT INTO training_plans_fts(training_plans_fts, rowid, search_document) VALUES ('delete', old.id, old.search_document); "
+    "INSERT INTO training_plans_fts(rowid, search_document) VALUES (new.id, new.search_document); END",
+)
 
 class TrainingPlan(Base):
     __tablename__ = "training_plans"
+    __table_args__ = (
+        # Catálogo de planes visibles ordenado por (likes, id), también para la paginación por cursor
+        Index("ix_training_plans_is_visible_likes_count_id", "is_visible", "likes_count", "id"),
+        # Planes de un usuario ordenados por likes
+        Index("ix_training_plans_user_email_likes_count", "user_email", "likes_count"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(length=60))
@@ -13,6 +37,11 @@ class TrainingPlan(Base):
     user_gym_id = Column(Integer, ForeignKey("users_gyms.id"), nullable=True)
     is_visible = Column(Boolean, default=False)
     is_gym_created = Column(Boolean, default=False)
+    # Contadores mantenidos por LikeRepository (ver src/services/like_counters.py)
+    likes_count = Column(Integer, nullable=False, default=0, server_default="0")
+    dislikes_count = Column(Integer, nullable=False, default=0, server_default="0")
+    # Nombre, descripción y nombre de la etiqueta para la búsqueda de texto (ver set_search_document)
+    search_document = Column(Text)
 
     workout_day_exercises = relationship("WorkoutDayExercise", back_populates="training_plans")
     tags_of_training_plans = relationship("TagOfTrainingPlan", back_populates="training_plans")
@@ -22,4 +51,50 @@ class TrainingPlan(Base):
     likes = relationship("Like", back_populates="training_plans")
 
     def to_dict(self):
-        return {c.key: getattr(self, c.key) for c in inspect(self).mapper.column_attrs}
\ No newline at end of file
+        return {c.key: getattr(self, c.key) for c in inspect(self).mapper.column_attrs}
+
+def search_vector(document):
+    """tsvector del documento de búsqueda; la misma expresión que el índice GIN para que lo use."""
+    return func.to_tsvector(text(f"'{SEARCH_CONFIG}'"), document)
+
+def build_search_document(name: str, description: str, tag_name: str) -> str:
+    return " ".join(part for part in (name, description, tag_name) if part)
+
+# Índice GIN de la búsqueda en PostgreSQL; en SQLite la búsqueda usa training_plans_fts
+Index(
+    "ix_training_plans_search_document",
+    search_vector(TrainingPlan.search_document),
+    postgresql_using="gin",
+).ddl_if(dialect="postgresql")
+
+for statement in SQLITE_FTS_DDL:
+    event.listen(TrainingPlan.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+
+@event.listens_for(TrainingPlan, "before_insert")
+@event.listens_for(TrainingPlan, "before_update")
+def set_search_document(mapper, connection, target):
+    """Recalcular search_document si cambia el nombre, la descripción o la etiqueta del plan."""
+    state = inspect(target)
+    if state.persistent and not any(
+        state.attrs[key].history.has_changes() for key in ("name", "description", "tag_of_training_plan_id")
+    ):
+        return
+    tag_name = None
+    if target.tag_of_training_plan_id is not None:
+        tag_name = connection.scalar(
+            select(TagOfTrainingPlan.name).where(TagOfTrainingPlan.id == target.tag_of_training_plan_id)
+        )
+    target.search_document = build_search_document(target.name, target.description, tag_name)
+
+@event.listens_for(TagOfTrainingPlan, "after_update")
+def rename_tag_in_search_documents(mapper, connection, target):
+    """Al renombrar una etiqueta, rehacer el documento de búsqueda de sus planes."""
+    if not inspect(target).attrs.name.history.has_changes():
+        return
+    connection.execute(
+        update(TrainingPlan.__table__)
+        .where(TrainingPlan.tag_of_training_plan_id == target.id)
+        .values(search_document=func.trim(
+            func.coalesce(TrainingPlan.name, "") + " " + func.coalesce(TrainingPlan.description, "") + " " + (target.name or "")
+        ))
+    )
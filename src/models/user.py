@@ -1,10 +1,46 @@
-from sqlalchemy import Column, ForeignKey, Integer, Float, Date, String, inspect, Boolean, event
+from sqlalchemy import Column, ForeignKey, Integer, Float, Date, String, inspect, Boolean, Index, and_, case, or_
+from sqlalchemy.ext.hybrid import Comparator, hybrid_property
 from sqlalchemy.orm import relationship
 from src.config.database import Base
 from datetime import date
 
+class EffectiveRoleComparator(Comparator):
+    """
+    User.effective_role en SQL. Como expresión es un CASE; la igualdad con un rol concreto
+    se reescribe sobre role_id y final_date para que la resuelva ix_users_role_id_final_date:
+        == 4       role_id = 4
+        == 2 o 3   role_id = n AND final_date >= hoy
+        == 1       role_id = 1 OR (role_id <> 4 AND (final_date IS NULL OR final_date < hoy))
+    """
+
+    def __init__(self, role_id, final_date) -> None:
+        self.role_id = role_id
+        self.final_date = final_date
+        self.today = date.today()
+        super().__init__(case((self._expired(), 1), else_=role_id))
+
+    def _expired(self):
+        return and_(self.role_id != 4, or_(self.final_date.is_(None), self.final_date < self.today))
+
+    def __eq__(self, role):
+        if not isinstance(role, int):
+            return self.expression == role
+        if role == 4:
+            return self.role_id == 4
+        if role == 1:
+            return or_(self.role_id == 1, self._expired())
+        return and_(self.role_id == role, self.final_date >= self.today)
+
+    def __ne__(self, role):
+        # Negar los predicados de __eq__ perdería las filas con final_date NULL
+        return self.expression != role
+
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Filtros por rol vigente (User.effective_role): rol y fecha de fin de la suscripción
+        Index("ix_users_role_id_final_date", "role_id", "final_date"),
+    )
 
     email = Column(String(length=250), primary_key=True)
     id_number = Column(String(length=20))
@@ -35,16 +71,18 @@ class User(Base):
     def to_dict(self):
         return {c.key: getattr(self, c.key) for c in inspect(self).mapper.column_attrs}
 
-@event.listens_for(User, 'load')
-def check_final_date(target, context):
-    """
-    Evento que se dispara cuando se carga un usuario.
-    Verifica si la fecha final ha pasado o no está definida y actualiza el rol si es necesario.
-    Solo se aplica a usuarios que no son administradores (rol 4).
-    """
-    if target.role_id != 4 and (target.final_date is None or target.final_date < date.today()):
-        target.role_id = 1  # Cambiar el rol a 1 (rol básico)
-        # Asegurarse de que los cambios se guarden
-        if context.session:
-            context.session.add(target)
-            context.session.commit()
\ No newline at end of file
+    @hybrid_property
+    def effective_role(self) -> int:
+        """Rol vigente: el de la fila salvo suscripción vencida (rol 1); en SQL, ver EffectiveRoleComparator."""
+        return effective_role_id(self.role_id, self.final_date)
+
+    @effective_role.inplace.comparator
+    @classmethod
+    def _effective_role_comparator(cls) -> EffectiveRoleComparator:
+        return EffectiveRoleComparator(cls.role_id, cls.final_date)
+
+def effective_role_id(role_id: int, final_date: date) -> int:
+    """Rol vigente: si la suscripción venció (o no tiene fecha), los no administradores pasan a rol 1."""
+    if role_id != 4 and (final_date is None or final_date < date.today()):
+        return 1
+    return role_id
@@ -1,9 +1,12 @@
-from sqlalchemy import Column, ForeignKey, Integer, Float, Date, String, inspect, Boolean
+from sqlalchemy import Column, ForeignKey, Integer, Float, Date, String, inspect, Boolean, UniqueConstraint
 from sqlalchemy.orm import relationship
 from src.config.database import Base
 
 class UserGym(Base):
     __tablename__ = "users_gyms"
+    __table_args__ = (
+        UniqueConstraint("user_email", "gym_id", name="uq_users_gyms_user_email_gym_id"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_email = Column(String(length=250), ForeignKey("users.email"))
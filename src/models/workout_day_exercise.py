@@ -1,9 +1,12 @@
-from sqlalchemy import Column, ForeignKey, Integer, inspect
+from sqlalchemy import Column, ForeignKey, Index, Integer, inspect
 from sqlalchemy.orm import relationship
 from src.config.database import Base
 
 class WorkoutDayExercise(Base):
     __tablename__ = "workout_day_exercises"
+    __table_args__ = (
+        Index("ix_workout_day_exercises_training_plan_id_week_day_id", "training_plan_id", "week_day_id"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     week_day_id = Column(Integer, ForeignKey("week_days.id"))
@@ -1,6 +1,5 @@
 from fastapi import HTTPException, status 
 from src.repositories.user import UserRepository 
-from src.config.database import SessionLocal 
 from src.auth import auth_handler 
 from src.schemas.user import UserLogin as UserLoginSchema 
 from src.schemas.user import User as UserCreateSchema
@@ -11,8 +10,8 @@ import string
 import traceback
 
 class AuthRepository:
-    def __init__(self) -> None:
-        self.db = SessionLocal()
+    def __init__(self, db) -> None:
+        self.db = db
         self.email_service = EmailService()
 
     def generate_verification_code(self) -> str:
@@ -29,6 +28,9 @@ class AuthRepository:
                     detail="El usuario ya existe"
                 )
 
+            # Devolver la conexión al pool mientras bcrypt trabaja
+            self.db.rollback()
+
             # Generar código de verificación
             verification_code = self.generate_verification_code()
 
@@ -122,23 +124,24 @@ class AuthRepository:
 
     def login_user(self, user: UserLoginSchema) -> dict:
         try:
-            # Buscar el usuario directamente en la base de datos
-            check_user = self.db.query(UserModel).filter(UserModel.email == user.email).first()
+            # Una sola consulta de columnas; el vencimiento del rol se aplica al token, no a la fila
+            check_user = UserRepository(self.db).get_login_data(user.email)
             
             if check_user is None:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Credenciales inválidas",
                 )
-                
+
+            # Devolver la conexión al pool mientras bcrypt trabaja; la familia se guarda después
+            self.db.rollback()
             if not auth_handler.verify_password(user.password, check_user.password):
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Credenciales inválidas",
                 )
-            # Generar los tokens
-            access_token = auth_handler.encode_token(check_user)
-            refresh_token = auth_handler.encode_refresh_token(check_user)
+            # Generar los tokens (abre una familia nueva para la rotación)
+            access_token, refresh_token = auth_handler.issue_tokens(check_user, self.db)
             
             return access_token, refresh_token
             
@@ -151,8 +154,7 @@ class AuthRepository:
             )
 
     def change_password(self, email: str, current_password: str, new_password: str) -> dict:
-        db = SessionLocal()
-        user = UserRepository(db).get_user_model_by_email(email=email)
+        user = UserRepository(self.db).get_user_model_by_email(email=email)
         
         if user is None:
             raise HTTPException(
@@ -168,8 +170,10 @@ class AuthRepository:
             
         hashed_password = auth_handler.hash_password(password=new_password)
         user.password = hashed_password
-        db.commit()
-        db.refresh(user)
+        self.db.commit()
+        self.db.refresh(user)
+        # Las sesiones abiertas con la contraseña anterior dejan de valer
+        auth_handler.revoke_user(email, self.db)
         return {"message": "Contraseña actualizada exitosamente"}
 
     def generate_reset_code(self, email: str) -> dict:
@@ -240,6 +244,7 @@ class AuthRepository:
             # Guardar los cambios
             self.db.commit()
             self.db.refresh(user)
+            auth_handler.revoke_user(email, self.db)
             
             return {"message": "Contraseña restablecida exitosamente"}
             
@@ -317,9 +322,10 @@ class AuthRepository:
             self.db.commit()
             self.db.refresh(user)
             
-            # Generar nuevos tokens con el estado actualizado
-            access_token = auth_handler.encode_token(user)
-            refresh_token = auth_handler.encode_refresh_token(user)
+            # Generar nuevos tokens con el estado actualizado y el rol vigente
+            token_user = UserRepository(self.db).get_login_data(email)
+            access_token = auth_handler.encode_token(token_user)
+            refresh_token = auth_handler.encode_refresh_token(token_user)
             
             return {
                 "message": "Cuenta habilitada exitosamente",
@@ -1,8 +1,26 @@
 from typing import List, Tuple, Optional
-from sqlalchemy import or_
+from sqlalchemy import or_, select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.models.exercise import Exercise as ExerciseModel
 from src.schemas.exercise import Exercise, PaginatedResponse
 
+def build_exercises_query(
+    search_name: Optional[str] = None,
+    difficulty_id: Optional[int] = None,
+    machine_id: Optional[int] = None
+):
+    """
+    Construye la consulta filtrada de ejercicios, compartida por el repositorio síncrono y el asíncrono.
+    """
+    query = select(ExerciseModel)
+    if search_name:
+        query = query.filter(ExerciseModel.name.ilike(f"%{search_name}%"))
+    if difficulty_id:
+        query = query.filter(ExerciseModel.dificulty_id == difficulty_id)
+    if machine_id:
+        query = query.filter(ExerciseModel.machine_id == machine_id)
+    return query
+
 class ExerciseRepository:
     def __init__(self, db):
         self.db = db
@@ -28,18 +46,11 @@ class ExerciseRepository:
         Returns:
             Tuple con la lista de ejercicios y el total de registros
         """
-        query = self.db.query(ExerciseModel)
-        
-        if search_name:
-            query = query.filter(ExerciseModel.name.ilike(f"%{search_name}%"))
-        if difficulty_id:
-            query = query.filter(ExerciseModel.dificulty_id == difficulty_id)
-        if machine_id:
-            query = query.filter(ExerciseModel.machine_id == machine_id)
+        query = build_exercises_query(search_name, difficulty_id, machine_id)
             
-        total = query.count()
+        total = self.db.scalar(select(func.count()).select_from(query.subquery()))
         offset = (page - 1) * size
-        exercises = query.offset(offset).limit(size).all()
+        exercises = self.db.scalars(query.offset(offset).limit(size)).all()
         
         return exercises, total
 
@@ -72,4 +83,27 @@ class ExerciseRepository:
 
         self.db.commit()
         self.db.refresh(element)
-        return element
\ No newline at end of file
+        return element
+
+class AsyncExerciseRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_all_excercises(
+        self, 
+        page: int = 1, 
+        size: int = 10,
+        search_name: Optional[str] = None,
+        difficulty_id: Optional[int] = None,
+        machine_id: Optional[int] = None
+    ) -> Tuple[List[ExerciseModel], int]:
+        """
+        Versión asíncrona de ExerciseRepository.get_all_excercises.
+        """
+        query = build_exercises_query(search_name, difficulty_id, machine_id)
+
+        total = await self.db.scalar(select(func.count()).select_from(query.subquery()))
+        offset = (page - 1) * size
+        exercises = (await self.db.scalars(query.offset(offset).limit(size))).all()
+
+        return exercises, total
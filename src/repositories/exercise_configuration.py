@@ -3,9 +3,10 @@ from src.schemas.exercise_configuration import ExerciseConfiguration
 from src.models.exercise_configuration import ExerciseConfiguration as ExerciseConfigurationModel
 from src.models.workout_day_exercise import WorkoutDayExercise as WorkoutDayExerciseModel
 from src.models.training_plan import TrainingPlan as TrainingPlanModel
-from src.models.user import User as UserModel
 from src.repositories.user_gym import UserGymRepository
 from src.repositories.gym import GymRepository
+from src.repositories.training_plan import can_manage_training_plan
+from src.auth.principal import Principal
 
 class ExerciseConfigurationRepository():
     def __init__(self, db) -> None:
@@ -55,22 +56,17 @@ class ExerciseConfigurationRepository():
         
         return element
     
-    def delete_exercise_configuration(self, id: int, user_email: str) -> dict:
+    def delete_exercise_configuration(self, id: int, principal: Principal) -> dict:
         """
         Elimina un ejercicio detallado por su ID.
 
         Parámetros:
         - id: el ID del ejercicio detallado que se desea eliminar.
-        - user_email: email del usuario que está eliminando la configuración
+        - principal: usuario autenticado que está eliminando la configuración
         
         Precondición: El parámetro 'id' debe ser un entero válido.
         Postcondición: Elimina el ejercicio detallado con el ID especificado de la base de datos y devuelve un diccionario que contiene los datos del ejercicio eliminado.
         """
-        # Obtener el usuario actual
-        current_user = self.db.query(UserModel).filter(UserModel.email == user_email).first()
-        if not current_user:
-            raise ValueError("Usuario no encontrado")
-
         # Obtener la configuración de ejercicio
         element = self.db.query(ExerciseConfigurationModel).filter(ExerciseConfigurationModel.id == id).first()
         if not element:
@@ -90,27 +86,8 @@ class ExerciseConfigurationRepository():
         if not training_plan:
             raise ValueError("Plan de entrenamiento no encontrado")
 
-        # Obtener el usuario objetivo
-        target_user = self.db.query(UserModel).filter(UserModel.email == training_plan.user_email).first()
-        if not target_user:
-            raise ValueError("Usuario objetivo no encontrado")
-
-        # Verificar permisos
-        can_delete = False
-
-        # Si el usuario actual es administrador (role 4)
-        if current_user.role_id == 4:
-            can_delete = True
-        # Si el usuario actual es el mismo que el objetivo y es premium (role 2)
-        elif user_email == training_plan.user_email and current_user.role_id == 2:
-            can_delete = True
-        #Verifica que el plan fue creado por un gimnasio, que el gimnasio está asociado con el usuario (user_gym.is_active) y 
-        #que ese mismo gimnasio fue el que creó el plan (training_plan.user_gym_id == user_gym.id).
-        gym = self.gym_repo.get_gym_by_email(user_email)
-        if current_user.role_id == 3 and training_plan.is_gym_created and gym:
-            user_gym = self.user_gym_repo.get_user_gym(training_plan.user_email, gym.id)
-            if user_gym and user_gym.is_active and training_plan.user_gym_id == user_gym.id:
-                can_delete = True
+        # Verificar permisos con los claims del token
+        can_delete = can_manage_training_plan(training_plan, principal, self.user_gym_repo)
 
         if not can_delete:
             raise ValueError("No tienes permiso para eliminar esta configuración de ejercicio")
@@ -121,22 +98,17 @@ class ExerciseConfigurationRepository():
         self.db.commit()
         return element_data
 
-    def create_new_exercise_configuration(self, exercise_configuration: ExerciseConfiguration, user_email: str) -> dict:
+    def create_new_exercise_configuration(self, exercise_configuration: ExerciseConfiguration, principal: Principal) -> dict:
         """
         Crea un nuevo ejercicio detallado.
 
         Parámetros:
         - exercise_configuration: un objeto ExerciseConfiguration que contiene los datos del nuevo ejercicio a crear.
-        - user_email: email del usuario que está creando la configuración
+        - principal: usuario autenticado que está creando la configuración
         
         Precondición: El parámetro 'exercise_configuration' debe ser un objeto ExerciseConfiguration válido.
         Postcondición: Crea un nuevo ejercicio detallado en la base de datos.
         """
-        # Obtener el usuario actual
-        current_user = self.db.query(UserModel).filter(UserModel.email == user_email).first()
-        if not current_user:
-            raise ValueError("Usuario no encontrado")
-
         # Verificar que el ejercicio por día de la semana existe
         workout_day_exercise = self.db.query(WorkoutDayExerciseModel).filter(
             WorkoutDayExerciseModel.id == exercise_configuration.workout_day_exercise_id
@@ -151,27 +123,8 @@ class ExerciseConfigurationRepository():
         if not training_plan:
             raise ValueError("Plan de entrenamiento no encontrado")
 
-        # Obtener el usuario objetivo
-        target_user = self.db.query(UserModel).filter(UserModel.email == training_plan.user_email).first()
-        if not target_user:
-            raise ValueError("Usuario objetivo no encontrado")
-
-        # Verificar permisos
-        can_create = False
-
-        # Si el usuario actual es administrador (role 4)
-        if current_user.role_id == 4:
-            can_create = True
-        # Si el usuario actual es el mismo que el objetivo y es premium (role 2)
-        elif user_email == training_plan.user_email and current_user.role_id == 2:
-            can_create = True
-        #Verifica que el plan fue creado por un gimnasio, que el gimnasio está asociado con el usuario (user_gym.is_active) y 
-        #que ese mismo gimnasio fue el que creó el plan (training_plan.user_gym_id == user_gym.id).
-        gym = self.gym_repo.get_gym_by_email(user_email)
-        if current_user.role_id == 3 and training_plan.is_gym_created and gym:
-            user_gym = self.user_gym_repo.get_user_gym(training_plan.user_email, gym.id)
-            if user_gym and user_gym.is_active and training_plan.user_gym_id == user_gym.id:
-                can_create = True
+        # Verificar permisos con los claims del token
+        can_create = can_manage_training_plan(training_plan, principal, self.user_gym_repo)
 
         if not can_create:
             raise ValueError("No tienes permiso para crear configuraciones para este ejercicio")
@@ -182,23 +135,18 @@ class ExerciseConfigurationRepository():
         self.db.refresh(new_exercise_configuration)
         return new_exercise_configuration
 
-    def update_exercise_configuration(self, id: int, exercise_configuration: ExerciseConfiguration, user_email: str) -> dict:
+    def update_exercise_configuration(self, id: int, exercise_configuration: ExerciseConfiguration, principal: Principal) -> dict:
         """
         Actualiza un ejercicio detallado por su ID.
 
         Parámetros:
         - id: el ID del ejercicio detallado que se desea actualizar.
         - exercise_configuration: un objeto ExerciseConfiguration que contiene los datos actualizados del ejercicio detallado.
-        - user_email: email del usuario que está actualizando la configuración
+        - principal: usuario autenticado que está actualizando la configuración
         
         Precondición: El parámetro 'id' debe ser un entero válido. El parámetro 'exercise_configuration' debe ser un objeto ExerciseConfiguration válido.
         Postcondición: Actualiza los datos del ejercicio detallado con el ID especificado utilizando los datos proporcionados en 'exercise_configuration' y devuelve un diccionario que contiene los datos del ejercicio actualizado.
         """
-        # Obtener el usuario actual
-        current_user = self.db.query(UserModel).filter(UserModel.email == user_email).first()
-        if not current_user:
-            raise ValueError("Usuario no encontrado")
-
         # Obtener la configuración de ejercicio existente
         element = self.db.query(ExerciseConfigurationModel).filter(ExerciseConfigurationModel.id == id).first()
         if not element:
@@ -218,27 +166,8 @@ class ExerciseConfigurationRepository():
         if not training_plan:
             raise ValueError("Plan de entrenamiento no encontrado")
 
-        # Obtener el usuario objetivo
-        target_user = self.db.query(UserModel).filter(UserModel.email == training_plan.user_email).first()
-        if not target_user:
-            raise ValueError("Usuario objetivo no encontrado")
-
-        # Verificar permisos
-        can_update = False
-
-        # Si el usuario actual es administrador (role 4)
-        if current_user.role_id == 4:
-            can_update = True
-        # Si el usuario actual es el mismo que el objetivo y es premium (role 2)
-        elif user_email == training_plan.user_email and current_user.role_id == 2:
-            can_update = True
-        #Verifica que el plan fue creado por un gimnasio, que el gimnasio está asociado con el usuario (user_gym.is_active) y 
-        #que ese mismo gimnasio fue el que creó el plan (training_plan.user_gym_id == user_gym.id).
-        gym = self.gym_repo.get_gym_by_email(user_email)
-        if current_user.role_id == 3 and training_plan.is_gym_created and gym:
-            user_gym = self.user_gym_repo.get_user_gym(training_plan.user_email, gym.id)
-            if user_gym and user_gym.is_active and training_plan.user_gym_id == user_gym.id:
-                can_update = True
+        # Verificar permisos con los claims del token
+        can_update = can_manage_training_plan(training_plan, principal, self.user_gym_repo)
 
         if not can_update:
             raise ValueError("No tienes permiso para actualizar esta configuración de ejercicio")
@@ -253,14 +182,10 @@ class ExerciseConfigurationRepository():
         self.db.commit()
         self.db.refresh(element)
         return element
-    def check_user_permissions_on_exercise_configuration(self, exercise_configuration_id: int, user_email: str) -> dict:
+    def check_user_permissions_on_exercise_configuration(self, exercise_configuration_id: int, principal: Principal) -> dict:
         """
         Retorna un dict con flags 'can_edit' y 'can_delete' para la configuración de ejercicio y el usuario.
         """
-        current_user = self.db.query(UserModel).filter(UserModel.email == user_email).first()
-        if not current_user:
-            raise ValueError("Usuario no encontrado")
-
         element = self.db.query(ExerciseConfigurationModel).filter(
             ExerciseConfigurationModel.id == exercise_configuration_id
         ).first()
@@ -279,25 +204,6 @@ class ExerciseConfigurationRepository():
         if not training_plan:
             raise ValueError("Plan de entrenamiento no encontrado")
 
-        can_edit = False
-        can_delete = False
-
-        # Administrador
-        if current_user.role_id == 4:
-            can_edit = True
-            can_delete = True
-
-        # Usuario dueño del plan (premium o superior)
-        elif user_email == training_plan.user_email and current_user.role_id >= 2:
-            can_edit = True
-            can_delete = True
-
-        # Gimnasio creador del plan
-        gym = self.gym_repo.get_gym_by_email(user_email)
-        if gym and current_user.role_id == 3 and training_plan.is_gym_created:
-            user_gym = self.user_gym_repo.get_user_gym(training_plan.user_email, gym.id)
-            if user_gym and user_gym.is_active and training_plan.user_gym_id == user_gym.id:
-                can_edit = True
-                can_delete = True
+        can_edit = can_delete = can_manage_training_plan(training_plan, principal, self.user_gym_repo)
 
         return {"can_edit": can_edit, "can_delete": can_delete}
@@ -1,15 +1,27 @@
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import delete, select, update
 from src.models.like import Like
 from src.models.training_plan import TrainingPlan
 from src.models.user import User
 from src.schemas.like import Like as LikeSchema
+from src.services.catalog_cache import catalog_changed
 
 class LikeRepository:
     def __init__(self, db: Session):
         self.db = db
 
+    def _count(self, training_plan_id: int, is_like: bool, delta: int) -> None:
+        """Sumar delta al contador de likes o dislikes del plan en la misma transacción (cambia el orden del catálogo)."""
+        column = TrainingPlan.likes_count if is_like else TrainingPlan.dislikes_count
+        self.db.execute(
+            update(TrainingPlan)
+            .where(TrainingPlan.id == training_plan_id)
+            .values({column: column + delta})
+            .execution_options(synchronize_session=False)
+        )
+        catalog_changed(self.db)
+
     def create_like(self, like: LikeSchema) -> Like:
         # Verificar si ya existe un like/dislike del usuario para este plan
         existing_like = self.db.query(Like).filter(
@@ -18,9 +30,20 @@ class LikeRepository:
         ).first()
 
         if existing_like:
-            # Si existe, actualizar el estado del like
-            existing_like.is_like = like.is_like
+            if existing_like.is_like == like.is_like:
+                return existing_like
+            # Cambio condicional: solo una petición concurrente mueve los contadores
+            changed = self.db.execute(
+                update(Like)
+                .where(Like.id == existing_like.id, Like.is_like == existing_like.is_like)
+                .values(is_like=like.is_like)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            if changed:
+                self._count(like.training_plan_id, existing_like.is_like, -1)
+                self._count(like.training_plan_id, like.is_like, 1)
             self.db.commit()
+            self.db.refresh(existing_like)
             return existing_like
 
         # Si no existe, crear nuevo like/dislike
@@ -30,6 +53,8 @@ class LikeRepository:
             is_like=like.is_like
         )
         self.db.add(db_like)
+        self.db.flush()
+        self._count(like.training_plan_id, db_like.is_like, 1)
         self.db.commit()
         self.db.refresh(db_like)
         return db_like
@@ -45,23 +70,22 @@ class LikeRepository:
 
     def remove_like(self, like_id: int) -> bool:
         like = self.get_like_by_id(like_id)
-        if like:
-            self.db.delete(like)
-            self.db.commit()
-            return True
-        return False
+        if not like:
+            return False
+        # Solo el DELETE que borra la fila descuenta el like
+        deleted = self.db.execute(
+            delete(Like).where(Like.id == like.id).execution_options(synchronize_session=False)
+        ).rowcount
+        if deleted:
+            self._count(like.training_plan_id, like.is_like, -1)
+        self.db.commit()
+        return bool(deleted)
 
     def get_training_plan_likes_count(self, training_plan_id: int) -> int:
-        return self.db.query(func.count(Like.id)).filter(
-            Like.training_plan_id == training_plan_id,
-            Like.is_like == True
-        ).scalar()
+        return self.db.scalar(select(TrainingPlan.likes_count).where(TrainingPlan.id == training_plan_id)) or 0
 
     def get_training_plan_dislikes_count(self, training_plan_id: int) -> int:
-        return self.db.query(func.count(Like.id)).filter(
-            Like.training_plan_id == training_plan_id,
-            Like.is_like == False
-        ).scalar()
+        return self.db.scalar(select(TrainingPlan.dislikes_count).where(TrainingPlan.id == training_plan_id)) or 0
 
     def get_user_like_status(self, user_email: str, training_plan_id: int) -> Optional[bool]:
         like = self.db.query(Like).filter(
@@ -1,15 +1,166 @@
+import base64
+import os
+import re
+import threading
+import time
 from typing import List, Tuple, Optional
-from sqlalchemy import or_, func, and_
+from sqlalchemy import column, or_, func, and_, select, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 from src.schemas.training_plan import TrainingPlan, TrainingPlanCreate, TrainingPlanCreateByGym, TrainingPlanUpdate
-from src.models.training_plan import TrainingPlan as training_plans
+from src.models.training_plan import SEARCH_CONFIG, TrainingPlan as training_plans, search_vector
 from src.models.user import User
 from src.models.workout_day_exercise import WorkoutDayExercise as WorkoutDayExerciseModel
+from src.models.exercise_configuration import ExerciseConfiguration as ExerciseConfigurationModel
 from src.models.week_day import WeekDay as WeekDayModel
-from src.models.like import Like as LikeModel
 from src.models.user_gym import UserGym
 from src.repositories.user_gym import UserGymRepository
 from src.models.gym import Gym
 from src.repositories.gym import GymRepository
+from src.auth.principal import Principal
+from src.services.catalog_cache import catalog_changed
+
+
+# Segundos que se reutiliza el total del catálogo por combinación de filtros en la paginación por cursor
+CATALOG_COUNT_TTL = float(os.getenv("CATALOG_COUNT_TTL", "60"))
+
+def encode_plan_cursor(*position: int) -> str:
+    """Cursor opaco con la posición en el catálogo: (likes_count, id) del último plan o, en búsquedas, el desplazamiento."""
+    return base64.urlsafe_b64encode(":".join(map(str, position)).encode()).decode().rstrip("=")
+
+def decode_plan_cursor(cursor: str, size: int = 2) -> Tuple[int, ...]:
+    """Posición codificada en el cursor (size enteros); ValueError si el cursor no es válido."""
+    try:
+        value = base64.b64decode(cursor + "=" * (-len(cursor) % 4), altchars=b"-_", validate=True).decode()
+        position = tuple(int(part) for part in value.split(":"))
+    except Exception as error:
+        raise ValueError("Cursor inválido") from error
+    if len(position) != size:
+        raise ValueError("Cursor inválido")
+    return position
+
+class CatalogCountCache:
+    """Totales del catálogo por filtros durante ttl segundos (el total del cursor es aproximado)."""
+
+    def __init__(self, ttl: float = CATALOG_COUNT_TTL, max_size: int = 1000) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() < entry[1]:
+                return entry[0]
+            return None
+
+    def put(self, key: tuple, total: int) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            if len(self._entries) >= self.max_size:
+                self._entries.clear()
+            self._entries[key] = (total, time.monotonic() + self.ttl)
+
+catalog_count_cache = CatalogCountCache()
+
+# Tabla FTS5 de la búsqueda en SQLite (ver src/models/training_plan.py)
+training_plans_fts = table("training_plans_fts", column("rowid"), column("rank"))
+
+def apply_text_search(query, search_text: str, dialect: str):
+    """
+    Filtrar query por la búsqueda de texto en nombre, descripción y etiqueta del plan.
+
+    Devuelve la consulta y la expresión de relevancia por la que ordenar (None si no hay):
+    - postgresql: websearch_to_tsquery en español contra el índice GIN, ordenado por ts_rank.
+    - sqlite: MATCH en training_plans_fts (cada palabra como prefijo), ordenado por bm25.
+    - otros: ilike sobre el documento, sin relevancia.
+    """
+    if dialect == "postgresql":
+        tsquery = func.websearch_to_tsquery(text(f"'{SEARCH_CONFIG}'"), search_text)
+        vector = search_vector(training_plans.search_document)
+        return query.filter(vector.op("@@")(tsquery)), func.ts_rank(vector, tsquery).desc()
+    if dialect == "sqlite":
+        words = re.findall(r"\w+", search_text)
+        if not words:
+            return query, None
+        # Palabras entre comillas: la sintaxis de FTS5 del usuario no llega a la consulta
+        match = " ".join(f'"{word}"*' for word in words)
+        query = query.join(training_plans_fts, training_plans_fts.c.rowid == training_plans.id).\
+            filter(text("training_plans_fts MATCH :match").bindparams(match=match))
+        return query, training_plans_fts.c.rank
+    return query.filter(training_plans.search_document.ilike(f"%{search_text}%")), None
+
+def build_training_plans_query(
+    search_name: Optional[str] = None,
+    role_id: Optional[int] = None,
+    tag_id: Optional[int] = None,
+    max_days: Optional[int] = None,
+    after: Optional[Tuple[int, int]] = None,
+    dialect: str = "postgresql"
+):
+    """
+    Construye la consulta filtrada y ordenada por likes del catálogo de planes visibles,
+    compartida por el repositorio síncrono y el asíncrono. El orden es (likes_count, id)
+    descendente; after (likes_count, id) continúa después de ese plan (paginación por cursor).
+    Con search_name se filtra por búsqueda de texto (apply_text_search) y se ordena primero
+    por relevancia.
+    """
+    # Consulta base con join a la tabla de usuarios
+    query = select(training_plans).\
+        join(User, training_plans.user_email == User.email).\
+        filter(training_plans.is_visible == True)
+    
+    # Aplicar filtros
+    relevance = None
+    if search_name:
+        query, relevance = apply_text_search(query, search_name, dialect)
+    if role_id:
+        query = query.filter(User.effective_role == role_id)
+    if tag_id:
+        query = query.filter(training_plans.tag_of_training_plan_id == tag_id)
+        
+    # Si se especifica max_days, necesitamos contar los días de la semana
+    if max_days is not None:
+        # Subconsulta para contar los días de la semana por plan
+        days_count = select(
+            WorkoutDayExerciseModel.training_plan_id,
+            func.count(WorkoutDayExerciseModel.id).label('days_count')
+        ).\
+        group_by(WorkoutDayExerciseModel.training_plan_id).\
+        having(func.count(WorkoutDayExerciseModel.id) <= max_days).\
+        subquery()
+        
+        # Filtrar por los planes que tienen como máximo max_days días
+        query = query.join(days_count, training_plans.id == days_count.c.training_plan_id)
+        
+    if after is not None:
+        likes_count, plan_id = after
+        query = query.filter(or_(
+            training_plans.likes_count < likes_count,
+            and_(training_plans.likes_count == likes_count, training_plans.id < plan_id),
+        ))
+
+    # Ordenar por relevancia (si se busca), por cantidad de likes (contador del plan, indexado) y desempatar por id
+    if relevance is not None:
+        query = query.order_by(relevance)
+    return query.order_by(training_plans.likes_count.desc(), training_plans.id.desc())
+
+def can_manage_training_plan(plan: training_plans, principal: Principal, user_gym_repo: UserGymRepository) -> bool:
+    """
+    Permiso de escritura sobre un plan (y sus ejercicios y configuraciones) según los claims del token:
+    administrador (rol 4), dueño con rol >= 2 o el gimnasio (rol 3) que lo creó para un usuario
+    asociado activo. Solo este último caso consulta la base de datos (la relación usuario-gimnasio).
+    """
+    if principal.role == 4:
+        return True
+    if principal.email == plan.user_email and principal.role >= 2:
+        return True
+    if principal.role == 3 and plan.is_gym_created and principal.gym_id:
+        user_gym = user_gym_repo.get_user_gym(plan.user_email, principal.gym_id)
+        return bool(user_gym and user_gym.is_active and plan.user_gym_id == user_gym.id)
+    return False
 
 
 class TrainingPlanRepository():
@@ -33,7 +184,7 @@ class TrainingPlanRepository():
         Args:
             page: Número de página (comienza en 1)
             size: Tamaño de la página
-            search_name: Texto para buscar en el nombre
+            search_name: Texto para buscar en el nombre, la descripción y la etiqueta
             role_id: ID del rol del usuario para filtrar
             tag_id: ID de la etiqueta para filtrar
             max_days: Cantidad máxima de días de la semana
@@ -41,52 +192,14 @@ class TrainingPlanRepository():
         Returns:
             Tuple con la lista de planes de entrenamiento y el total de registros
         """
-        # Subconsulta para contar los likes por plan de entrenamiento
-        likes_count = self.db.query(
-            LikeModel.training_plan_id,
-            func.count(LikeModel.id).label('likes_count')
-        ).\
-        filter(LikeModel.is_like == True).\
-        group_by(LikeModel.training_plan_id).\
-        subquery()
-        
-        # Consulta base con join a la tabla de usuarios y likes
-        query = self.db.query(training_plans).\
-            join(User, training_plans.user_email == User.email).\
-            outerjoin(likes_count, training_plans.id == likes_count.c.training_plan_id).\
-            filter(training_plans.is_visible == True)
-        
-        # Aplicar filtros
-        if search_name:
-            query = query.filter(training_plans.name.ilike(f"%{search_name}%"))
-        if role_id:
-            query = query.filter(User.role_id == role_id)
-        if tag_id:
-            query = query.filter(training_plans.tag_of_training_plan_id == tag_id)
-            
-        # Si se especifica max_days, necesitamos contar los días de la semana
-        if max_days is not None:
-            # Subconsulta para contar los días de la semana por plan
-            days_count = self.db.query(
-                WorkoutDayExerciseModel.training_plan_id,
-                func.count(WorkoutDayExerciseModel.id).label('days_count')
-            ).\
-            group_by(WorkoutDayExerciseModel.training_plan_id).\
-            having(func.count(WorkoutDayExerciseModel.id) <= max_days).\
-            subquery()
-            
-            # Filtrar por los planes que tienen como máximo max_days días
-            query = query.join(days_count, training_plans.id == days_count.c.training_plan_id)
-            
-        # Ordenar por cantidad de likes en orden descendente
-        query = query.order_by(func.coalesce(likes_count.c.likes_count, 0).desc())
+        query = build_training_plans_query(search_name, role_id, tag_id, max_days, dialect=self.db.bind.dialect.name)
             
         # Contar el total de registros
-        total = query.count()
+        total = self.db.scalar(select(func.count()).select_from(query.subquery()))
         
         # Aplicar paginación
         offset = (page - 1) * size
-        training_plans_list = query.offset(offset).limit(size).all()
+        training_plans_list = self.db.scalars(query.offset(offset).limit(size)).all()
         
         return training_plans_list, total
     
@@ -100,36 +213,26 @@ class TrainingPlanRepository():
         Returns:
             Lista de planes de entrenamiento del usuario
         """
-        # Subconsulta para contar los likes por plan de entrenamiento
-        likes_count = self.db.query(
-            LikeModel.training_plan_id,
-            func.count(LikeModel.id).label('likes_count')
-        ).\
-        filter(LikeModel.is_like == True).\
-        group_by(LikeModel.training_plan_id).\
-        subquery()
-        
-        # Consulta base con join a la tabla de usuarios y likes
+        # Consulta base con join a la tabla de usuarios
         query = self.db.query(training_plans).\
             join(User, training_plans.user_email == User.email).\
-            outerjoin(likes_count, training_plans.id == likes_count.c.training_plan_id).\
             filter(training_plans.user_email == email)
         
-        # Ordenar por cantidad de likes en orden descendente
-        query = query.order_by(func.coalesce(likes_count.c.likes_count, 0).desc())
+        # Ordenar por cantidad de likes (contador del plan, indexado) en orden descendente
+        query = query.order_by(training_plans.likes_count.desc())
         
         return query.all()
     
     def get_all_training_plans_by_role_admin(self) -> List[TrainingPlan]:
-        query = self.db.query(training_plans).join(User, training_plans.user_email == User.email).filter(User.role_id == 4, training_plans.is_visible == True)
+        query = self.db.query(training_plans).join(User, training_plans.user_email == User.email).filter(User.effective_role == 4, training_plans.is_visible == True)
         return query.all()
     
     def get_all_training_plans_by_role_gym(self) -> List[TrainingPlan]:
-        query = self.db.query(training_plans).join(User, training_plans.user_email == User.email).filter(User.role_id == 3, training_plans.is_visible == True)
+        query = self.db.query(training_plans).join(User, training_plans.user_email == User.email).filter(User.effective_role == 3, training_plans.is_visible == True)
         return query.all()
     
     def get_all_training_plans_by_role_premium(self) -> List[TrainingPlan]:
-        query = self.db.query(training_plans).join(User, training_plans.user_email == User.email).filter(User.role_id == 2, training_plans.is_visible == True)
+        query = self.db.query(training_plans).join(User, training_plans.user_email == User.email).filter(User.effective_role == 2, training_plans.is_visible == True)
         return query.all()
     
     def get_all_my_training_plans(self, user_email: str) -> List[TrainingPlan]:
@@ -159,13 +262,35 @@ class TrainingPlanRepository():
         element = query.first()
         return element
     
-    def delete_training_plan(self, id: int, current_user_email: str) -> dict:
+    def get_training_plan_tree(self, id: int) -> Optional[training_plans]:
+        """
+        Obtiene un plan con su etiqueta, sus días, las configuraciones de cada día y sus
+        ejercicios en cuatro consultas, sea cual sea el tamaño del plan (plan y etiqueta
+        con join; días, configuraciones y ejercicios con selectinload).
+
+        Args:
+            id: ID del plan de entrenamiento
+
+        Returns:
+            El plan con las relaciones cargadas o None si no existe
+        """
+        query = select(training_plans).\
+            where(training_plans.id == id).\
+            options(
+                joinedload(training_plans.tags_of_training_plans),
+                selectinload(training_plans.workout_day_exercises).
+                selectinload(WorkoutDayExerciseModel.exercise_configurations).
+                selectinload(ExerciseConfigurationModel.exercises),
+            )
+        return self.db.scalars(query).first()
+
+    def delete_training_plan(self, id: int, principal: Principal) -> dict:
         """
         Elimina un plan de entrenamiento.
         
         Args:
             id: ID del plan a eliminar
-            current_user_email: Email del usuario que intenta eliminar el plan
+            principal: Usuario autenticado que intenta eliminar el plan
             
         Returns:
             El plan de entrenamiento eliminado
@@ -175,49 +300,32 @@ class TrainingPlanRepository():
         if not plan:
             raise ValueError("Plan de entrenamiento no encontrado")
             
-        # Obtener el usuario actual
-        current_user = self.db.query(User).filter(User.email == current_user_email).first()
-        if not current_user:
-            raise ValueError("Usuario no encontrado")
-        # Verificar permisos
-        can_delete = False
-
-        # Si el usuario actual es administrador (role 4)
-        if current_user.role_id == 4:
-            can_delete = True
-        # Si el usuario actual es el dueño del plan y es premium (role 2)
-        elif current_user_email == plan.user_email and current_user.role_id >= 2:
-            can_delete = True
-        # Si el usuario actual es un gimnasio (role 3), el plan fue creado por un gym y ese gimnasio es el creador
-        gym = self.gym_repo.get_gym_by_email(current_user_email)
-        if current_user.role_id == 3 and plan.is_gym_created and gym:
-            user_gym = self.user_gym_repo.get_user_gym(plan.user_email, gym.id)
-            if user_gym and user_gym.is_active and plan.user_gym_id == user_gym.id:
-                can_delete = True
+        # Verificar permisos con los claims del token
+        can_delete = can_manage_training_plan(plan, principal, self.user_gym_repo)
 
         if not can_delete:
             raise ValueError("No tienes permiso para eliminar este plan de entrenamiento")
             
         self.db.delete(plan)
+        catalog_changed(self.db)
         self.db.commit()
         return plan
 
 
-    def create_training_plan_as_user(self, training_plan: TrainingPlanCreate, current_user_email: str) -> training_plans:
+    def create_training_plan_as_user(self, training_plan: TrainingPlanCreate, principal: Principal) -> training_plans:
         """
         Crea un nuevo plan de entrenamiento para el usuario actual.
         
         Args:
             training_plan: Datos del plan a crear
-            current_user_email: Email del usuario que intenta crear el plan
+            principal: Usuario autenticado que intenta crear el plan
             
         Returns:
             El plan de entrenamiento creado
         """
-        # Obtener el usuario actual
-        current_user = self.db.query(User).filter(User.email == current_user_email).first()
-        if not current_user or current_user.role_id < 2:
+        if principal.role < 2:
             raise ValueError("Usuario no autorizado")
+        current_user_email = principal.email
 
         # Verificar que el usuario actual solo cree planes para sí mismo
         if training_plan.user_email != current_user_email:
@@ -248,26 +356,23 @@ class TrainingPlanRepository():
             )
             self.db.add(new_workout_day_exercise)
 
+        catalog_changed(self.db)
         self.db.commit()
         return new_training_plan
     
-    def create_plan_for_user_from_gym(self, training_plan: TrainingPlanCreateByGym, gym_email: str) -> training_plans:
-        # Verificar que el gimnasio exista
-        gym_user = self.db.query(User).filter(User.email == gym_email, User.role_id == 3).first()
-        if not gym_user:
+    def create_plan_for_user_from_gym(self, training_plan: TrainingPlanCreateByGym, principal: Principal) -> training_plans:
+        # El rol y el gimnasio vienen en los claims del token
+        if principal.role != 3:
             raise ValueError("El usuario actual no es un gimnasio válido")
+        if not principal.gym_id:
+            raise ValueError("No se encontró el gimnasio correspondiente al email")
         # Verificar que el usuario destino exista
-        target_user = self.db.query(User).filter(User.email == training_plan.user_email).first()
+        target_user = self.db.query(User.email).filter(User.email == training_plan.user_email).first()
         if not target_user:
             raise ValueError("Usuario objetivo no encontrado")
-        
-        # Obtener el gimnasio desde la tabla gyms
-        gym = self.gym_repo.get_gym_by_email(gym_email)
-        if not gym:
-            raise ValueError("No se encontró el gimnasio correspondiente al email")
 
         # Verificar relación activa entre gimnasio y usuario
-        user_gym = self.user_gym_repo.get_user_gym(user_email=training_plan.user_email, gym_id=gym.id)
+        user_gym = self.user_gym_repo.get_user_gym(user_email=training_plan.user_email, gym_id=principal.gym_id)
         if not user_gym or not user_gym.is_active:
             raise ValueError("El usuario no está asociado activamente al gimnasio")
 
@@ -294,18 +399,19 @@ class TrainingPlanRepository():
             )
             self.db.add(new_wde)
 
+        catalog_changed(self.db)
         self.db.commit()
         return new_plan
 
 
-    def update_training_plan(self, id: int, training_plan: TrainingPlanUpdate, current_user_email: str) -> dict:
+    def update_training_plan(self, id: int, training_plan: TrainingPlanUpdate, principal: Principal) -> dict:
         """
         Actualiza un plan de entrenamiento.
         
         Args:
             id: ID del plan a actualizar
             training_plan: Datos actualizados del plan
-            current_user_email: Email del usuario que intenta actualizar el plan
+            principal: Usuario autenticado que intenta actualizar el plan
             
         Returns:
             El plan de entrenamiento actualizado
@@ -315,26 +421,8 @@ class TrainingPlanRepository():
         if not plan:
             raise ValueError("Plan de entrenamiento no encontrado")
             
-        # Obtener el usuario actual
-        current_user = self.db.query(User).filter(User.email == current_user_email).first()
-        if not current_user:
-            raise ValueError("Usuario no encontrado")
-            
-        # Verificar permisos
-        can_update = False
-        
-        # Si el usuario actual es administrador (role 4)
-        if current_user.role_id == 4:
-            can_update = True
-        # Si el usuario actual es el dueño del plan y es premium (role 2)
-        elif current_user_email == plan.user_email and current_user.role_id >= 2:
-            can_update = True
-        # Si el usuario actual es un gimnasio (role 3), el plan fue creado por un gym y ese gimnasio es el creador
-        gym = self.gym_repo.get_gym_by_email(current_user_email)
-        if current_user.role_id == 3 and plan.is_gym_created and gym:
-            user_gym = self.user_gym_repo.get_user_gym(plan.user_email, gym.id)
-            if user_gym and user_gym.is_active and plan.user_gym_id == user_gym.id:
-                can_update = True
+        # Verificar permisos con los claims del token
+        can_update = can_manage_training_plan(plan, principal, self.user_gym_repo)
         
         if not can_update:
             raise ValueError("No tienes permiso para actualizar este plan de entrenamiento")
@@ -344,11 +432,12 @@ class TrainingPlanRepository():
             if key != 'id' and hasattr(plan, key):
                 setattr(plan, key, value)
                 
+        catalog_changed(self.db)
         self.db.commit()
         self.db.refresh(plan)
         return plan
 
-    def check_user_permissions_on_training_plan(self, training_plan_id: int, user_email: str) -> dict:
+    def check_user_permissions_on_training_plan(self, training_plan_id: int, principal: Principal) -> dict:
         """
         Retorna un dict con flags 'can_edit' y 'can_delete' para el usuario y el training_plan.
         """
@@ -357,29 +446,79 @@ class TrainingPlanRepository():
         if not plan:
             raise ValueError("Plan de entrenamiento no encontrado")
         
-        # Obtener el usuario actual
-        current_user = self.db.query(User).filter(User.email == user_email).first()
-        if not current_user:
-            raise ValueError("Usuario no encontrado")
-        
-        can_edit = False
-        can_delete = False
-        
-        # Administrador (role 4)
-        if current_user.role_id == 4:
-            can_edit = True
-            can_delete = True
-        # Dueño del plan y premium (role >= 2)
-        elif user_email == plan.user_email and current_user.role_id >= 2:
-            can_edit = True
-            can_delete = True
-        # Gimnasio (role 3), plan creado por gimnasio y es el creador
-        else:
-            gym = self.gym_repo.get_gym_by_email(user_email)
-            if gym and current_user.role_id == 3 and plan.is_gym_created:
-                user_gym = self.user_gym_repo.get_user_gym(plan.user_email, gym.id)
-                if user_gym and user_gym.is_active and plan.user_gym_id == user_gym.id:
-                    can_edit = True
-                    can_delete = True
+        can_edit = can_delete = can_manage_training_plan(plan, principal, self.user_gym_repo)
         
         return {"can_edit": can_edit, "can_delete": can_delete}
+
+
+class AsyncTrainingPlanRepository():
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def get_all_training_plans(
+        self, 
+        page: int = 1, 
+        size: int = 10,
+        search_name: Optional[str] = None,
+        role_id: Optional[int] = None,
+        tag_id: Optional[int] = None,
+        max_days: Optional[int] = None
+    ) -> Tuple[List[TrainingPlan], int]:
+        """
+        Versión asíncrona de TrainingPlanRepository.get_all_training_plans.
+        """
+        query = build_training_plans_query(search_name, role_id, tag_id, max_days, dialect=self.db.bind.dialect.name)
+
+        total = await self.db.scalar(select(func.count()).select_from(query.subquery()))
+
+        offset = (page - 1) * size
+        training_plans_list = (await self.db.scalars(query.offset(offset).limit(size))).all()
+
+        return training_plans_list, total
+
+    async def get_training_plans_after(
+        self,
+        size: int = 10,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        search_name: Optional[str] = None,
+        role_id: Optional[int] = None,
+        tag_id: Optional[int] = None,
+        max_days: Optional[int] = None
+    ) -> Tuple[List[TrainingPlan], Optional[str], Optional[int]]:
+        """
+        Página del catálogo por cursor: sin OFFSET, continúa después del último plan devuelto.
+        Las búsquedas se ordenan por relevancia, que no es indexable: su cursor guarda el desplazamiento.
+
+        Returns:
+            Tuple con los planes, el cursor de la página siguiente (None en la última) y el
+            total (solo con include_total; se reutiliza CATALOG_COUNT_TTL segundos por filtros)
+        """
+        filters = (search_name, role_id, tag_id, max_days)
+        dialect = self.db.bind.dialect.name
+        if search_name:
+            offset = decode_plan_cursor(cursor, size=1)[0] if cursor else 0
+            # El cursor llega del cliente: un desplazamiento negativo o fuera de BIGINT no es válido
+            if not 0 <= offset < 2 ** 63:
+                raise ValueError("Cursor inválido")
+            query = build_training_plans_query(*filters, dialect=dialect).offset(offset)
+        else:
+            after = decode_plan_cursor(cursor) if cursor else None
+            query = build_training_plans_query(*filters, after=after, dialect=dialect)
+        # Se pide un plan de más para saber si hay página siguiente
+        training_plans_list = (await self.db.scalars(query.limit(size + 1))).all()
+        next_cursor = None
+        if len(training_plans_list) > size:
+            last = training_plans_list[size - 1]
+            next_cursor = encode_plan_cursor(offset + size) if search_name else encode_plan_cursor(last.likes_count, last.id)
+
+        total = None
+        if include_total:
+            total = catalog_count_cache.get(filters)
+            if total is None:
+                total = await self.db.scalar(
+                    select(func.count()).select_from(build_training_plans_query(*filters, dialect=dialect).subquery())
+                )
+                catalog_count_cache.put(filters, total)
+
+        return training_plans_list[:size], next_cursor, total
@@ -1,24 +1,40 @@
-from typing import List, Optional
+import base64
+from types import SimpleNamespace
+from typing import Iterator, List, Optional
+from sqlalchemy import func, select
 from sqlalchemy.orm import load_only
 from src.schemas.user import User
-from src.models.user import User as users
+from src.models.gym import Gym
+from src.models.user import User as users, effective_role_id
 from datetime import date
 
+# Columnas del listado de administración: sin contraseña ni código de verificación
+SUMMARY_COLUMNS = (
+    users.email, users.id_number, users.user_name, users.name, users.phone, users.address, users.birth_date,
+    users.gender, users.status, users.start_date, users.final_date, users.role_id, users.is_verified,
+)
+
+def encode_cursor(email: str) -> str:
+    """Cursor opaco para continuar el listado después de email."""
+    return base64.urlsafe_b64encode(email.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> str:
+    """Email codificado en el cursor; ValueError si el cursor no es válido."""
+    try:
+        return base64.b64decode(cursor + "=" * (-len(cursor) % 4), altchars=b"-_", validate=True).decode()
+    except Exception as error:
+        raise ValueError("Cursor inválido") from error
+
 class UserRepository():
     def __init__(self, db) -> None:
         self.db = db
     
     def get_all_users(self) -> List[User]:
         """
-        Obtiene todos los usuarios y verifica sus fechas finales.
-        Actualiza los roles de los usuarios cuya fecha ha pasado o no está definida.
-        Solo se aplica a usuarios que no son administradores (rol 4).
+        Obtiene todos los usuarios con su rol vigente (sin escrituras: los vencidos
+        se ven con rol 1 y el trabajo de expiración actualiza las filas).
         """
         elements = self.db.query(users).all()
-        for element in elements:
-            if element.role_id != 4 and (element.final_date is None or element.final_date < date.today()):
-                element.role_id = 1  # Cambiar el rol a 1 (rol básico)
-        self.db.commit()
         return [User(
             email=element.email,
             id_number=element.id_number,
@@ -32,22 +48,74 @@ class UserRepository():
             status=element.status,
             start_date=element.start_date,
             final_date=element.final_date,
-            role_id=element.role_id,
+            role_id=element.effective_role,
             is_verified=element.is_verified,
             verification_code=element.verification_code
         ) for element in elements]
     
+    @staticmethod
+    def _listing_filters(role_id: int = None, status: bool = None, is_verified: bool = None,
+                         expiring_before: date = None) -> list:
+        filters = []
+        if role_id is not None:
+            filters.append(users.effective_role == role_id)
+        if status is not None:
+            filters.append(users.status == status)
+        if is_verified is not None:
+            filters.append(users.is_verified == is_verified)
+        if expiring_before is not None:
+            filters.append(users.final_date < expiring_before)
+        return filters
+
+    def iter_users(self, limit: int, after: str = None, **filters) -> Iterator[dict]:
+        """
+        Usuarios ordenados por email, a partir del siguiente a after (paginación por cursor).
+        Solo se leen las columnas de SUMMARY_COLUMNS y las filas se van entregando
+        a medida que llegan, sin construir la lista completa. role_id es el rol vigente.
+        Filtros: role_id, status, is_verified y expiring_before (final_date anterior).
+        """
+        query = select(*SUMMARY_COLUMNS).where(*self._listing_filters(**filters))
+        if after is not None:
+            query = query.where(users.email > after)
+        result = self.db.execute(query.order_by(users.email).limit(limit).execution_options(yield_per=100))
+        try:
+            for row in result:
+                yield {**row._asdict(), "role_id": effective_role_id(row.role_id, row.final_date)}
+        finally:
+            result.close()
+
+    def count_users(self, **filters) -> int:
+        """Total de usuarios con los mismos filtros que iter_users."""
+        return self.db.scalar(select(func.count()).select_from(users).where(*self._listing_filters(**filters)))
+
+    def get_login_data(self, email: str) -> Optional[SimpleNamespace]:
+        """
+        Columnas que necesitan el inicio de sesión y los tokens, en una sola consulta y sin escrituras.
+        Si la suscripción venció, role_id es el rol vigente (1) aunque la fila aún no
+        se haya actualizado.
+        gym_id es el gimnasio del usuario (para los claims de los gimnasios, rol 3).
+        """
+        gym_id = (
+            select(Gym.id).where(Gym.user_email == users.email).order_by(Gym.id).limit(1)
+            .correlate(users).scalar_subquery()
+        )
+        row = self.db.execute(
+            select(
+                users.email, users.password, users.name, users.id_number,
+                users.role_id, users.status, users.is_verified, users.final_date,
+                gym_id.label("gym_id")
+            ).where(users.email == email)
+        ).first()
+        if row is None:
+            return None
+        return SimpleNamespace(**{**row._asdict(), "role_id": effective_role_id(row.role_id, row.final_date)})
+
     def get_user_by_email(self, email: str) -> Optional[User]:
         """
-        Obtiene un usuario por su email y verifica su fecha final.
-        Si la fecha ha pasado o no está definida, actualiza su rol y estado.
+        Obtiene un usuario por su email con su rol vigente (sin escrituras).
         """
         element = self.db.query(users).filter(users.email == email).first()
         if element:
-            if element.role_id != 4 and (element.final_date is None or element.final_date < date.today()):
-                element.role_id = 1
-                self.db.commit()
-                self.db.refresh(element)
             return User(
                 email=element.email,
                 id_number=element.id_number,
@@ -61,7 +129,7 @@ class UserRepository():
                 status=element.status,
                 start_date=element.start_date,
                 final_date=element.final_date,
-                role_id=element.role_id,
+                role_id=element.effective_role,
                 is_verified=element.is_verified,
                 verification_code=element.verification_code
             )
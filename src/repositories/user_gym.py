@@ -27,9 +27,13 @@ class UserGymRepository():
             raise ValueError("El usuario no existe")
         
         # Verificar que el usuario no es un gimnasio
-        if user.role_id == 3:
+        if user.effective_role == 3:
             raise ValueError("No se puede asociar un usuario gimnasio a otro gimnasio")
         
+        # Verificar que el usuario no pertenece ya a este gimnasio
+        if self.get_user_gym(user_gym_data.user_email, user_gym_data.gym_id):
+            raise ValueError("El usuario ya pertenece a este gimnasio")
+        
         # Verificar que el gimnasio no ha alcanzado su límite de usuarios
         if gym.current_users >= gym.max_users:
             raise ValueError("El gimnasio ha alcanzado su límite de usuarios")
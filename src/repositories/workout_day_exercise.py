@@ -4,9 +4,11 @@ from src.models.workout_day_exercise import WorkoutDayExercise as WorkoutDayExer
 from src.models.training_plan import TrainingPlan as TrainingPlanModel
 from src.models.week_day import WeekDay as WeekDayModel
 from src.models.exercise_configuration import ExerciseConfiguration as ExerciseConfigurationModel
-from src.models.user import User as UserModel
 from src.repositories.user_gym import UserGymRepository
 from src.repositories.gym import GymRepository
+from src.repositories.training_plan import can_manage_training_plan
+from src.auth.principal import Principal
+from src.services.catalog_cache import catalog_changed
 
 
 class WorkoutDayExerciseRepository:
@@ -117,13 +119,13 @@ class WorkoutDayExerciseRepository:
             filter(WorkoutDayExerciseModel.week_day_id == week_day_id)
         return query.all()
 
-    def create_new_workout_day_exercise(self, workout_day_exercise: WorkoutDayExercise, user_email: str) -> dict:
+    def create_new_workout_day_exercise(self, workout_day_exercise: WorkoutDayExercise, principal: Principal) -> dict:
         """
         Crea un nuevo ejercicio por día de la semana.
 
         Parámetros:
         - workout_day_exercise: objeto WorkoutDayExercise que contiene los datos del ejercicio.
-        - user_email: email del usuario que está creando el workout day exercise
+        - principal: usuario autenticado que está creando el workout day exercise
 
         Precondición:
         - Ninguna.
@@ -131,39 +133,14 @@ class WorkoutDayExerciseRepository:
         Postcondición:
         - Crea un nuevo ejercicio por día de la semana en la base de datos y lo devuelve.
         """
-        # Obtener el usuario actual
-        current_user = self.db.query(UserModel).filter(UserModel.email == user_email).first()
-        if not current_user:    
-            raise ValueError("Usuario no encontrado")
-
         # Obtener el plan de entrenamiento
         training_plan = self.db.query(TrainingPlanModel).\
             filter(TrainingPlanModel.id == workout_day_exercise.training_plan_id).first()
         if not training_plan:
             raise ValueError(f"No existe un plan de entrenamiento con id {workout_day_exercise.training_plan_id}")
 
-        # Obtener el usuario objetivo
-        target_user = self.db.query(UserModel).filter(UserModel.email == training_plan.user_email).first()
-        if not target_user:
-            raise ValueError("Usuario objetivo no encontrado")
-
-        # Verificar permisos
-        can_create = False
-
-        # Si el usuario actual es administrador (role 4)
-        if current_user.role_id == 4:
-            can_create = True
-        # Si el usuario actual es el mismo que el objetivo y es premium (role 2)
-        elif user_email == training_plan.user_email and current_user.role_id >= 2:
-            can_create = True
-        #Verifica que el plan fue creado por un gimnasio, que el gimnasio está asociado con el usuario (user_gym.is_active) y 
-        #que ese mismo gimnasio fue el que creó el plan (training_plan.user_gym_id == user_gym.id).
-        gym = self.gym_repo.get_gym_by_email(user_email)
-        if gym and current_user.role_id == 3 and training_plan.is_gym_created:
-            user_gym = self.user_gym_repo.get_user_gym(training_plan.user_email, gym.id)
-            if user_gym and user_gym.is_active and training_plan.user_gym_id == user_gym.id:
-                can_create = True  
-
+        # Verificar permisos con los claims del token
+        can_create = can_manage_training_plan(training_plan, principal, self.user_gym_repo)
 
         if not can_create:
             raise ValueError("No tienes permiso para crear ejercicios para este plan de entrenamiento")
@@ -186,11 +163,12 @@ class WorkoutDayExerciseRepository:
         
         new_workout_day_exercise = WorkoutDayExerciseModel(**workout_day_exercise.model_dump())
         self.db.add(new_workout_day_exercise)
+        catalog_changed(self.db)
         self.db.commit()
         self.db.refresh(new_workout_day_exercise)
         return new_workout_day_exercise
 
-    def update_workout_day_exercise(self, id: int, workout_day_exercise: WorkoutDayExercise, user_email: str) -> dict:
+    def update_workout_day_exercise(self, id: int, workout_day_exercise: WorkoutDayExercise, principal: Principal) -> dict:
         """
         Actualiza un ejercicio por día de la semana.
 
@@ -204,11 +182,6 @@ class WorkoutDayExerciseRepository:
         Postcondición:
         - Actualiza el ejercicio por día de la semana en la base de datos y lo devuelve.
         """
-        # Obtener el usuario actual
-        current_user = self.db.query(UserModel).filter(UserModel.email == user_email).first()
-        if not current_user:
-            raise ValueError("Usuario no encontrado")
-
         # Obtener el workout day exercise existente
         element = self.db.query(WorkoutDayExerciseModel).\
             filter(WorkoutDayExerciseModel.id == id).first()
@@ -221,27 +194,8 @@ class WorkoutDayExerciseRepository:
         if not training_plan:
             raise ValueError("Plan de entrenamiento no encontrado")
 
-        # Obtener el usuario objetivo
-        target_user = self.db.query(UserModel).filter(UserModel.email == training_plan.user_email).first()
-        if not target_user:
-            raise ValueError("Usuario objetivo no encontrado")
-
-        # Verificar permisos
-        can_update = False
-
-        # Si el usuario actual es administrador (role 4)
-        if current_user.role_id == 4:
-            can_update = True
-        # Si el usuario actual es el mismo que el objetivo y es premium (role 2)
-        elif user_email == training_plan.user_email and current_user.role_id >= 2:
-            can_update = True
-        #Verifica que el plan fue creado por un gimnasio, que el gimnasio está asociado con el usuario (user_gym.is_active) y 
-        #que ese mismo gimnasio fue el que creó el plan (training_plan.user_gym_id == user_gym.id).
-        gym = self.gym_repo.get_gym_by_email(user_email)
-        if gym and current_user.role_id == 3 and training_plan.is_gym_created:
-            user_gym = self.user_gym_repo.get_user_gym(training_plan.user_email, gym.id)
-            if user_gym and user_gym.is_active and training_plan.user_gym_id == user_gym.id:
-                can_update = True
+        # Verificar permisos con los claims del token
+        can_update = can_manage_training_plan(training_plan, principal, self.user_gym_repo)
 
         if not can_update:
             raise ValueError("No tienes permiso para actualizar este ejercicio")
@@ -263,11 +217,12 @@ class WorkoutDayExerciseRepository:
         element.training_plan_id = workout_day_exercise.training_plan_id
         element.week_day_id = workout_day_exercise.week_day_id
         
+        catalog_changed(self.db)
         self.db.commit()
         self.db.refresh(element)
         return element
 
-    def delete_workout_day_exercise(self, id: int, user_email: str) -> dict:
+    def delete_workout_day_exercise(self, id: int, principal: Principal) -> dict:
         """
         Elimina un ejercicio por día de la semana.
 
@@ -280,11 +235,6 @@ class WorkoutDayExerciseRepository:
         Postcondición:
         - Elimina el ejercicio por día de la semana de la base de datos y lo devuelve.
         """
-        # Obtener el usuario actual
-        current_user = self.db.query(UserModel).filter(UserModel.email == user_email).first()
-        if not current_user:
-            raise ValueError("Usuario no encontrado")
-
         # Obtener el workout day exercise
         element = self.db.query(WorkoutDayExerciseModel).\
             filter(WorkoutDayExerciseModel.id == id).first()
@@ -297,31 +247,8 @@ class WorkoutDayExerciseRepository:
         if not training_plan:
             raise ValueError("Plan de entrenamiento no encontrado")
 
-        # Obtener el usuario objetivo
-        target_user = self.db.query(UserModel).filter(UserModel.email == training_plan.user_email).first()
-        if not target_user:
-            raise ValueError("Usuario objetivo no encontrado")
-
-        # Verificar permisos
-        can_delete = False
-
-        # Si el usuario actual es administrador (role 4)
-        if current_user.role_id == 4:
-            can_delete = True
-        # Si el usuario actual es el mismo que el objetivo y es premium (role 2)
-        elif user_email == training_plan.user_email and current_user.role_id >= 2:
-            can_delete = True
-        #Verifica que el plan fue creado por un gimnasio, que el gimnasio está asociado con el usuario (user_gym.is_active) y 
-        #que ese mismo gimnasio fue el que creó el plan (training_plan.user_gym_id == user_gym.id).
-        gym = self.gym_repo.get_gym_by_email(user_email)
-        if gym and current_user.role_id == 3 and training_plan.is_gym_created:
-            
-            user_gym = self.user_gym_repo.get_user_gym(training_plan.user_email, gym.id)
-            print(user_gym)
-            print(training_plan.user_email)
-            print(gym.id)
-            if user_gym and user_gym.is_active and training_plan.user_gym_id == user_gym.id:
-                can_delete = True
+        # Verificar permisos con los claims del token
+        can_delete = can_manage_training_plan(training_plan, principal, self.user_gym_repo)
 
         if not can_delete:
             raise ValueError("No tienes permiso para eliminar este ejercicio")
@@ -332,16 +259,14 @@ class WorkoutDayExerciseRepository:
 
         # Eliminar el workout day exercise
         self.db.delete(element)
+        catalog_changed(self.db)
         self.db.commit()
         return element
     
-    def check_user_permissions_on_workout_day_exercise(self, workout_day_exercise_id: int, user_email: str) -> dict:
+    def check_user_permissions_on_workout_day_exercise(self, workout_day_exercise_id: int, principal: Principal) -> dict:
         """
         Retorna un dict con flags 'can_edit' y 'can_delete' para el usuario y el workout_day_exercise.
         """
-        current_user = self.db.query(UserModel).filter(UserModel.email == user_email).first()
-        if not current_user:
-            raise ValueError("Usuario no encontrado")
         element = self.db.query(WorkoutDayExerciseModel).filter(WorkoutDayExerciseModel.id == workout_day_exercise_id).first()
         if not element:
             raise ValueError(f"No existe un ejercicio con id {workout_day_exercise_id}")
@@ -349,17 +274,5 @@ class WorkoutDayExerciseRepository:
         if not training_plan:
             raise ValueError("Plan de entrenamiento no encontrado")
 
-        can_edit = False
-        can_delete = False
-        # Aplica la lógica que ya tienes, pero retorna los flags en vez de lanzar error
-        if current_user.role_id == 4 or (user_email == training_plan.user_email and current_user.role_id >= 2):
-            can_edit = True
-            can_delete = True
-        else:
-            gym = self.gym_repo.get_gym_by_email(user_email)
-            if gym and current_user.role_id == 3 and training_plan.is_gym_created:
-                user_gym = self.user_gym_repo.get_user_gym(training_plan.user_email, gym.id)
-                if user_gym and user_gym.is_active and training_plan.user_gym_id == user_gym.id:
-                    can_edit = True
-                    can_delete = True
+        can_edit = can_delete = can_manage_training_plan(training_plan, principal, self.user_gym_repo)
         return {"can_edit": can_edit, "can_delete": can_delete}
\ No newline at end of file
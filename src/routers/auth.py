@@ -3,9 +3,9 @@ from fastapi.responses import JSONResponse
 from typing import Annotated, List 
 from fastapi.security import HTTPAuthorizationCredentials 
 from fastapi.encoders import jsonable_encoder 
-from src.repositories.user import UserRepository 
 from src.repositories.auth import AuthRepository 
-from src.config.database import SessionLocal 
+from src.config.database import get_db
+from sqlalchemy.orm import Session
 from src.schemas.user import (
     User as UserCreateSchema,
     UserLogin as UserLoginSchema,
@@ -15,15 +15,16 @@ from src.schemas.user import (
     EnableAccount
 )
 from src.auth.has_access import has_access, security    
-from src.auth import auth_handler
+from src.auth import auth_handler, rate_limiter
+from src.auth.principal import Principal, get_principal
 import traceback
 
 auth_router = APIRouter()
 
 @auth_router.post("/verify_email", tags=["Autorización"], response_model=dict, description="Verificar el email del usuario")
-def verify_email(email: str = Body(...), verification_code: str = Body(...)) -> dict:
+def verify_email(email: str = Body(...), verification_code: str = Body(...), db: Session = Depends(get_db)) -> dict:
     try:
-        auth_repo = AuthRepository()
+        auth_repo = AuthRepository(db)
         result = auth_repo.verify_email(email, verification_code)
         return result
     except Exception as e:
@@ -35,10 +36,10 @@ def verify_email(email: str = Body(...), verification_code: str = Body(...)) ->
             detail=str(e)
         )
 
-@auth_router.post("/register", tags=["Autorización"], response_model=dict, description="Registrar un nuevo usuario") 
-def register_user(user: UserRegister = Body()) -> dict: 
+@auth_router.post("/register", tags=["Autorización"], response_model=dict, dependencies=[Depends(rate_limiter.limit("register"))], description="Registrar un nuevo usuario") 
+def register_user(user: UserRegister = Body(), db: Session = Depends(get_db)) -> dict: 
     try: 
-        auth_repo = AuthRepository()
+        auth_repo = AuthRepository(db)
         new_user = auth_repo.register_user(user) 
         # Obtener el mensaje del objeto de usuario
         message = getattr(new_user, 'message', "Usuario registrado exitosamente. Por favor verifica tu email.")
@@ -64,19 +65,10 @@ def register_user(user: UserRegister = Body()) -> dict:
             detail=str(err)
         )
 
-@auth_router.post("/login", tags=["Autorización"], response_model=dict, description="Autenticar un usuario") 
-def login_user(user: UserLoginSchema) -> dict: 
+@auth_router.post("/login", tags=["Autorización"], response_model=dict, dependencies=[Depends(rate_limiter.limit("login"))], description="Autenticar un usuario") 
+def login_user(user: UserLoginSchema, db: Session = Depends(get_db)) -> dict: 
     try:
-        db = SessionLocal()
-        check_user = UserRepository(db).get_user_by_email(email=user.email)
-        
-        if check_user is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Credenciales inválidas"
-            )
-            
-        access_token, refresh_token = AuthRepository().login_user(user)
+        access_token, refresh_token = AuthRepository(db).login_user(user)
         return JSONResponse(
             content={
                 "access_token": access_token,
@@ -88,6 +80,7 @@ def login_user(user: UserLoginSchema) -> dict:
         return JSONResponse(
             content={"message": e.detail},
             status_code=e.status_code,
+            headers=e.headers,
         )
     except Exception as e:
         return JSONResponse(
@@ -96,41 +89,37 @@ def login_user(user: UserLoginSchema) -> dict:
         )
 
 @auth_router.get("/refresh_token", tags=["Autorización"], response_model=dict, description="Crear un nuevo token con tiempo de vida extendido") 
-def refresh_token(credentials: HTTPAuthorizationCredentials = Security(security)) -> dict: 
+def refresh_token(credentials: HTTPAuthorizationCredentials = Security(security), db: Session = Depends(get_db)) -> dict: 
     refresh_token = credentials.credentials 
-    new_token = auth_handler.refresh_token(refresh_token) 
-    return {"access_token": new_token}
+    new_token, new_refresh_token = auth_handler.refresh_token(refresh_token, db) 
+    return {"access_token": new_token, "refresh_token": new_refresh_token}
 
 
-@auth_router.get("/user_data", tags=["Autorización"], response_model=dict, description="Obtener datos del usuario a partir de su token")
-def get_user_data(credentials: HTTPAuthorizationCredentials = Security(security)) -> dict:
-    try:
-        # Obtener el token desde las credenciales
-        token = credentials.credentials
+@auth_router.post("/logout", tags=["Autorización"], response_model=dict, description="Cerrar la sesión del token actual")
+def logout(credentials: HTTPAuthorizationCredentials = Security(security)) -> dict:
+    auth_handler.revoke_token(credentials.credentials)
+    return JSONResponse(content={"message": "Sesión cerrada"}, status_code=status.HTTP_200_OK)
 
-        # Decodificar el token para obtener la información del usuario
-        user_data = auth_handler.decode_token(token)
 
-        print(user_data)
+@auth_router.post("/logout_all", tags=["Autorización"], response_model=dict, description="Cerrar todas las sesiones del usuario")
+def logout_all(principal: Annotated[Principal, Depends(get_principal)]) -> dict:
+    auth_handler.revoke_user(principal.email)
+    return JSONResponse(content={"message": "Sesiones cerradas"}, status_code=status.HTTP_200_OK)
 
-        if user_data:
-            return {"message": "User found", "data": jsonable_encoder(user_data)}
-        else:
-            return {"message": "User not found", "data": None}
-        
-    except Exception as err:
-        return {"message": str(err), "data": None}
+
+@auth_router.get("/user_data", tags=["Autorización"], response_model=dict, description="Obtener datos del usuario a partir de su token")
+def get_user_data(principal: Annotated[Principal, Depends(get_principal)]) -> dict:
+    return {"message": "User found", "data": jsonable_encoder(principal.claims)}
 
 @auth_router.post("/change_password", tags=["Autorización"], response_model=dict, description="Cambiar la contraseña del usuario autenticado")
 def change_password(
-    credentials: HTTPAuthorizationCredentials = Security(security),
-    password_data: ChangePassword = Body()
+    principal: Annotated[Principal, Depends(get_principal)],
+    password_data: ChangePassword = Body(),
+    db: Session = Depends(get_db)
 ) -> dict:
     try:
-        user_data = auth_handler.decode_token(credentials.credentials)
-        email = user_data.get("sub")
-        result = AuthRepository().change_password(
-            email=email,
+        result = AuthRepository(db).change_password(
+            email=principal.email,
             current_password=password_data.current_password,
             new_password=password_data.new_password
         )
@@ -144,10 +133,10 @@ def change_password(
             status_code=status.HTTP_400_BAD_REQUEST
         )
 
-@auth_router.post("/forgot_password", tags=["Autorización"], response_model=dict, description="Solicitar código para restablecer contraseña")
-def forgot_password(email: str = Body(...)) -> dict:
+@auth_router.post("/forgot_password", tags=["Autorización"], response_model=dict, dependencies=[Depends(rate_limiter.limit("forgot_password"))], description="Solicitar código para restablecer contraseña")
+def forgot_password(email: str = Body(...), db: Session = Depends(get_db)) -> dict:
     try:
-        auth_repo = AuthRepository()
+        auth_repo = AuthRepository(db)
         result = auth_repo.generate_reset_code(email)
         return JSONResponse(
             content=result,
@@ -165,9 +154,9 @@ def forgot_password(email: str = Body(...)) -> dict:
         )
 
 @auth_router.post("/reset_password", tags=["Autorización"], response_model=dict, description="Restablecer la contraseña usando el código")
-def reset_password(password_data: ResetPassword = Body()) -> dict:
+def reset_password(password_data: ResetPassword = Body(), db: Session = Depends(get_db)) -> dict:
     try:
-        auth_repo = AuthRepository()
+        auth_repo = AuthRepository(db)
         result = auth_repo.reset_password(
             email=password_data.email,
             new_password=password_data.new_password,
@@ -188,10 +177,10 @@ def reset_password(password_data: ResetPassword = Body()) -> dict:
             detail=str(err)
         )
 
-@auth_router.post("/resend-verification", tags=["Autorización"], response_model=dict, description="Reenviar el código de verificación al correo del usuario")
-def resend_verification_code(email: str = Body(...)) -> dict:
+@auth_router.post("/resend-verification", tags=["Autorización"], response_model=dict, dependencies=[Depends(rate_limiter.limit("resend_verification"))], description="Reenviar el código de verificación al correo del usuario")
+def resend_verification_code(email: str = Body(...), db: Session = Depends(get_db)) -> dict:
     try:
-        auth_repo = AuthRepository()
+        auth_repo = AuthRepository(db)
         result = auth_repo.resend_verification_code(email)
         return JSONResponse(
             content=result,
@@ -209,9 +198,9 @@ def resend_verification_code(email: str = Body(...)) -> dict:
         )
 
 @auth_router.post("/enable_account", tags=["Autorización"], response_model=dict, description="Habilita la cuenta de un usuario")
-def enable_account(account_data: EnableAccount = Body()) -> dict:
+def enable_account(account_data: EnableAccount = Body(), db: Session = Depends(get_db)) -> dict:
     try:
-        auth_repo = AuthRepository()
+        auth_repo = AuthRepository(db)
         result = auth_repo.enable_account(
             email=account_data.email,
             password=account_data.password
@@ -232,19 +221,15 @@ def enable_account(account_data: EnableAccount = Body()) -> dict:
         )
 
 @auth_router.post("/enable_account_by_email", tags=["Autorización"], response_model=dict, description="Habilitar la cuenta usando el email del token")
-def enable_account_by_email(credentials: HTTPAuthorizationCredentials = Security(security)) -> dict:
+def enable_account_by_email(principal: Annotated[Principal, Depends(get_principal)], db: Session = Depends(get_db)) -> dict:
     try:
-        token = credentials.credentials
-        user_data = auth_handler.decode_token(token)
-        email = user_data.get("sub")
-        
-        if not email:
+        if not principal.email:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="No se pudo obtener el email del token"
             )
         
-        result = AuthRepository().enable_account(email=email)
+        result = AuthRepository(db).enable_account(email=principal.email)
         return JSONResponse(
             content=result,
             status_code=status.HTTP_200_OK
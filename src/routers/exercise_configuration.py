@@ -2,11 +2,10 @@ from fastapi import APIRouter, Body, Depends, Query, Path, status
 from fastapi.responses import JSONResponse
 from typing import Annotated, List, Optional
 from fastapi import APIRouter
-from src.config.database import SessionLocal 
+from src.config.database import get_db
+from sqlalchemy.orm import Session
 from fastapi.encoders import jsonable_encoder
-from src.auth.has_access import security
-from src.auth import auth_handler
-from fastapi.security import HTTPAuthorizationCredentials
+from src.auth.principal import Principal, require_role
 
 from src.schemas.exercise_configuration import ExerciseConfiguration
 from src.repositories.exercise_configuration import ExerciseConfigurationRepository
@@ -19,37 +18,17 @@ exercise_configuration_router = APIRouter(tags=['Configuraciones de ejercicios']
 #CRUD exercise_configuration
 
 @exercise_configuration_router.get('',response_model=List[ExerciseConfiguration],description="Devuelve todas las configuraciones de ejercicios")
-def get_exercise_configurations(credentials: Annotated[HTTPAuthorizationCredentials,Depends(security)])-> List[ExerciseConfiguration]:
-    db= SessionLocal()
-    payload = auth_handler.decode_token(credentials.credentials)
-    if payload:
-        role_current_user = payload.get("user.role")
-        user_status = payload.get("user.status")
-        if role_current_user < 2:
-            return JSONResponse(content={"message": "You do not have the necessary permissions", "data": None}, status_code=status.HTTP_401_UNAUTHORIZED)
-        if user_status:
-            result = ExerciseConfigurationRepository(db).get_all_exercise_configurations()
-            return JSONResponse(content=jsonable_encoder(result), status_code=status.HTTP_200_OK)
-        return JSONResponse(content={"message": "Your account is inactive", "data": None}, status_code=status.HTTP_401_UNAUTHORIZED)
+def get_exercise_configurations(principal: Annotated[Principal, Depends(require_role(2))], db: Session = Depends(get_db))-> List[ExerciseConfiguration]:
+    result = ExerciseConfigurationRepository(db).get_all_exercise_configurations()
+    return JSONResponse(content=jsonable_encoder(result), status_code=status.HTTP_200_OK)
 
 @exercise_configuration_router.post('',response_model=dict,description="Crea una nueva configuración de ejercicio")
-def create_exercise_configuration(credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],exercise_configuration: ExerciseConfiguration = Body()) -> dict:
-    db = SessionLocal()
+def create_exercise_configuration(principal: Annotated[Principal, Depends(require_role(2))],exercise_configuration: ExerciseConfiguration = Body(), db: Session = Depends(get_db)) -> dict:
     try:
-        payload = auth_handler.decode_token(credentials.credentials)
-        if not payload:
-            return JSONResponse(content={"message": "Token inválido", "data": None}, status_code=status.HTTP_401_UNAUTHORIZED)
-        role_user = payload.get("user.role")
-        status_user = payload.get("user.status")
-        current_user = payload.get("sub")
-        if not status_user:
-            return JSONResponse(content={"message": "Usuario inactivo", "data": None}, status_code=status.HTTP_403_FORBIDDEN)
-        if role_user < 2:
-            return JSONResponse(content={"message": "Privilegios insuficientes", "data": None}, status_code=status.HTTP_403_FORBIDDEN)
         # Lógica delegada al repositorio
         new_exercise_configuration = ExerciseConfigurationRepository(db).create_new_exercise_configuration(
             exercise_configuration,
-            current_user
+            principal
         )
         return JSONResponse(
             content={
@@ -65,20 +44,9 @@ def create_exercise_configuration(credentials: Annotated[HTTPAuthorizationCreden
 
 
 @exercise_configuration_router.delete('/{id}',response_model=dict,description="Elimina una configuración de ejercicio específica")
-def remove_exercise_configuration(credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],id: int = Path(ge=1)) -> dict:
-    db = SessionLocal()
+def remove_exercise_configuration(principal: Annotated[Principal, Depends(require_role(2))],id: int = Path(ge=1), db: Session = Depends(get_db)) -> dict:
     try:
-        payload = auth_handler.decode_token(credentials.credentials)
-        if not payload:
-            return JSONResponse(content={"message": "Token inválido", "data": None}, status_code=status.HTTP_401_UNAUTHORIZED)
-        role_user = payload.get("user.role")
-        status_user = payload.get("user.status")
-        current_user = payload.get("sub")
-        if not status_user:
-            return JSONResponse(content={"message": "Usuario inactivo", "data": None}, status_code=status.HTTP_403_FORBIDDEN)
-        if role_user < 2:
-            return JSONResponse(content={"message": "Privilegios insuficientes", "data": None}, status_code=status.HTTP_403_FORBIDDEN)
-        deleted_data = ExerciseConfigurationRepository(db).delete_exercise_configuration(id, current_user)
+        deleted_data = ExerciseConfigurationRepository(db).delete_exercise_configuration(id, principal)
         return JSONResponse(
             content={
                 "message": "La configuración de ejercicio fue eliminada exitosamente",
@@ -93,50 +61,27 @@ def remove_exercise_configuration(credentials: Annotated[HTTPAuthorizationCreden
 
 @exercise_configuration_router.get('/{id}', response_model=ExerciseConfiguration, description="Devuelve una configuración de ejercicio específica")
 def get_exercise_configuration_by_id(
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-    id: int = Path(ge=1)
+    principal: Annotated[Principal, Depends(require_role(2))],
+    id: int = Path(ge=1),
+    db: Session = Depends(get_db)
 ) -> dict:
-    db = SessionLocal()
-    payload = auth_handler.decode_token(credentials.credentials)
-    if payload:
-        role_user = payload.get("user.role")
-        status_user = payload.get("user.status")
+    repo = ExerciseConfigurationRepository(db)
+    element = repo.get_exercise_configuration_by_id(id)
 
-        if not status_user:
-            return JSONResponse(content={"message": "Tu cuenta está inactiva"}, status_code=status.HTTP_401_UNAUTHORIZED)
-
-        if role_user < 2:
-            return JSONResponse(content={"message": "Privilegios insuficientes"}, status_code=status.HTTP_403_FORBIDDEN)
-
-        current_user = payload.get("sub")
-        repo = ExerciseConfigurationRepository(db)
-        element = repo.get_exercise_configuration_by_id(id)
-
-        if not element:
-            return JSONResponse(
-                content={"message": "La configuración de ejercicio solicitada no fue encontrada", "data": None},
-                status_code=status.HTTP_404_NOT_FOUND
-            )
-        permissions = repo.check_user_permissions_on_exercise_configuration(id, current_user)
-        response = jsonable_encoder(element)
-        response["permissions"] = permissions
-        return JSONResponse(content={"message": "Configuración obtenida exitosamente", "data": response}, status_code=status.HTTP_200_OK)
+    if not element:
+        return JSONResponse(
+            content={"message": "La configuración de ejercicio solicitada no fue encontrada", "data": None},
+            status_code=status.HTTP_404_NOT_FOUND
+        )
+    permissions = repo.check_user_permissions_on_exercise_configuration(id, principal)
+    response = jsonable_encoder(element)
+    response["permissions"] = permissions
+    return JSONResponse(content={"message": "Configuración obtenida exitosamente", "data": response}, status_code=status.HTTP_200_OK)
 
 @exercise_configuration_router.put('/{id}',response_model=dict,description="Actualiza una configuración de ejercicio específica")
-def update_exercise_configuration(credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],id: int = Path(ge=1),exercise_configuration: ExerciseConfiguration = Body()) -> dict:
-    db = SessionLocal()
+def update_exercise_configuration(principal: Annotated[Principal, Depends(require_role(2))],id: int = Path(ge=1),exercise_configuration: ExerciseConfiguration = Body(), db: Session = Depends(get_db)) -> dict:
     try:
-        payload = auth_handler.decode_token(credentials.credentials)
-        if not payload:
-            return JSONResponse(content={"message": "Token inválido", "data": None}, status_code=status.HTTP_401_UNAUTHORIZED)
-        role_user = payload.get("user.role")
-        status_user = payload.get("user.status")
-        current_user = payload.get("sub")
-        if not status_user:
-            return JSONResponse(content={"message": "Usuario inactivo", "data": None}, status_code=status.HTTP_403_FORBIDDEN)
-        if role_user < 2:
-            return JSONResponse(content={"message": "Privilegios insuficientes", "data": None}, status_code=status.HTTP_403_FORBIDDEN)
-        updated_data = ExerciseConfigurationRepository(db).update_exercise_configuration(id, exercise_configuration, current_user)
+        updated_data = ExerciseConfigurationRepository(db).update_exercise_configuration(id, exercise_configuration, principal)
         return JSONResponse(
             content={
                 "message": "La configuración de ejercicio fue actualizada exitosamente",
@@ -0,0 +1,9 @@
+from fastapi import APIRouter, status
+from fastapi.responses import Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+metrics_router = APIRouter(tags=['Métricas'])
+
+@metrics_router.get('',description="Devuelve las métricas del pool de conexiones y de las consultas en formato Prometheus")
+def get_metrics() -> Response:
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST, status_code=status.HTTP_200_OK)
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Body, Query, Path, status
+from fastapi import APIRouter, Body, Depends, Query, Path, status
 from fastapi.responses import JSONResponse
 from typing import List
 from fastapi import APIRouter
-from src.config.database import SessionLocal 
+from src.config.database import get_db
+from sqlalchemy.orm import Session
 from fastapi.encoders import jsonable_encoder
 from src.schemas.role import Role
 from src.models.role import Role as roles
@@ -13,14 +14,12 @@ role_router = APIRouter(tags=['Roles'])
 #CRUD role
 
 @role_router.get('',response_model=List[Role],description="Devuelve todos los roles")
-def get_roles()-> List[Role]:
-    db= SessionLocal()
+def get_roles(db: Session = Depends(get_db))-> List[Role]:
     result = RoleRepository(db).get_all_roles()
     return JSONResponse(content=jsonable_encoder(result), status_code=status.HTTP_200_OK)
 
 @role_router.get('/{id}',response_model=Role,description="Devuelve la información de un solo rol")
-def get_role(id: int = Path(ge=1)) -> Role:
-    db = SessionLocal()
+def get_role(id: int = Path(ge=1), db: Session = Depends(get_db)) -> Role:
     element=  RoleRepository(db).get_role_by_id(id)
     if not element:        
         return JSONResponse(
@@ -36,8 +35,7 @@ def get_role(id: int = Path(ge=1)) -> Role:
         ) 
 
 @role_router.post('',response_model=dict,description="Crea un nuevo rol")
-def create_role(role: Role = Body()) -> dict:
-    db= SessionLocal()
+def create_role(role: Role = Body(), db: Session = Depends(get_db)) -> dict:
     new_role = RoleRepository(db).create_new_role(role)
     return JSONResponse(
         content={        
@@ -48,8 +46,7 @@ def create_role(role: Role = Body()) -> dict:
     )
 
 @role_router.delete('/{id}',response_model=dict,description="Elimina un rol específico")
-def remove_role(id: int = Path(ge=1)) -> dict:
-    db = SessionLocal()
+def remove_role(id: int = Path(ge=1), db: Session = Depends(get_db)) -> dict:
     element = RoleRepository(db).delete_role(id)
     if not element:        
         return JSONResponse(
@@ -68,8 +65,7 @@ def remove_role(id: int = Path(ge=1)) -> dict:
         )
 
 @role_router.put('/{id}',response_model=dict,description="Actualiza un rol específico")
-def update_role(id: int = Path(ge=1), role: Role = Body()) -> dict:
-    db = SessionLocal()
+def update_role(id: int = Path(ge=1), role: Role = Body(), db: Session = Depends(get_db)) -> dict:
     element = RoleRepository(db).update_role(id, role)
     if not element:        
         return JSONResponse(
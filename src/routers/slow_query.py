@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import JSONResponse
+from typing import Annotated
+
+from src.auth.principal import Principal, require_role
+from src.config.database import slow_query_log
+
+slow_query_router = APIRouter(tags=['Consultas lentas'])
+
+@slow_query_router.get('',response_model=dict,description="Devuelve las últimas consultas SQL lentas con su plan de ejecución (solo administradores)")
+def get_slow_queries(principal: Annotated[Principal, Depends(require_role(4, active=False))], limit: int = Query(default=50, ge=1, le=200)) -> dict:
+    return JSONResponse(
+        content={
+            "threshold_ms": slow_query_log.threshold * 1000,
+            "data": slow_query_log.recent(limit)
+        },
+        status_code=status.HTTP_200_OK
+    )
@@ -2,219 +2,170 @@ from fastapi import APIRouter, Body, Depends, Query, Path, status
 from fastapi.responses import JSONResponse
 from typing import Annotated, List, Optional
 from fastapi import APIRouter
-from src.config.database import SessionLocal 
+from src.config.database import get_db
+from src.config.async_database import get_async_db
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.encoders import jsonable_encoder
 from src.schemas.training_plan import TrainingPlan, PaginatedTrainingPlanResponse, TrainingPlanCreate, TrainingPlanCreateByGym, TrainingPlanUpdate
 from src.models.training_plan import TrainingPlan as training_plans
-from src.repositories.training_plan import TrainingPlanRepository
-from fastapi.security import HTTPAuthorizationCredentials
-from src.auth.has_access import security
-from src.auth import auth_handler
+from src.repositories.training_plan import TrainingPlanRepository, AsyncTrainingPlanRepository, can_manage_training_plan
+from src.repositories.user_gym import UserGymRepository
+from src.services.training_plan_tree import training_plan_tree_cache
+from src.services.catalog_cache import catalog_cache, catalog_key
+from types import SimpleNamespace
+from src.auth.principal import Principal, require_role
 
 training_plan_router = APIRouter(tags=['Planes de entrenamiento'])
 
-@training_plan_router.get('', response_model=PaginatedTrainingPlanResponse, description="Retorna todos los planes de entrenamiento con paginación y filtros")
-def get_training_plans(
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-    page: int = Query(1, ge=1, description="Número de página"),
+@training_plan_router.get('', response_model=PaginatedTrainingPlanResponse, description="Retorna los planes de entrenamiento paginados por página o, con by_cursor o cursor, por cursor, con filtros")
+async def get_training_plans(
+    principal: Annotated[Principal, Depends(require_role(2))],
+    page: int = Query(1, ge=1, description="Número de página (sin cursor)"),
     size: int = Query(10, ge=1, le=100, description="Tamaño de la página"),
-    name: Optional[str] = Query(None, description="Texto para buscar en el nombre"),
+    by_cursor: bool = Query(False, description="Paginar por cursor: primera página sin total y con next_cursor"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página siguiente (next_cursor de la respuesta anterior)"),
+    include_total: bool = Query(False, description="Incluir el total de planes (con cursor se cachea unos segundos)"),
+    name: Optional[str] = Query(None, description="Texto para buscar en el nombre, la descripción y la etiqueta (ordena por relevancia)"),
     role_id: Optional[int] = Query(None, description="ID del rol del usuario para filtrar"),
     tag_id: Optional[int] = Query(None, description="ID de la etiqueta para filtrar"),
-    max_days: Optional[int] = Query(None, description="Cantidad máxima de días de la semana")
+    max_days: Optional[int] = Query(None, description="Cantidad máxima de días de la semana"),
+    db: AsyncSession = Depends(get_async_db)
 ) -> PaginatedTrainingPlanResponse:
-    db = SessionLocal()
-    payload = auth_handler.decode_token(credentials.credentials)
-    if payload:
-        role_current_user = payload.get("user.role")
-        status_user = payload.get("user.status")
-        if role_current_user < 2:
-            return JSONResponse(content={"message": "You do not have the necessary permissions", "data": None}, status_code=status.HTTP_401_UNAUTHORIZED)
-        if status_user == False:
-            return JSONResponse(content={"message": "Your account is disabled", "data": None}, status_code=status.HTTP_401_UNAUTHORIZED)
-        
-        # Obtener planes de entrenamiento con paginación y filtros
-        training_plans_list, total = TrainingPlanRepository(db).get_all_training_plans(
-            page=page,
-            size=size,
-            search_name=name,
-            role_id=role_id,
-            tag_id=tag_id,
-            max_days=max_days
-        )
-        
-        # Calcular el número total de páginas
-        total_pages = (total + size - 1) // size
-        
+    filters = {"search_name": name, "role_id": role_id, "tag_id": tag_id, "max_days": max_days}
+    # Sin cursor ni by_cursor se mantiene la paginación por página de siempre (con total)
+    keyset = by_cursor or cursor is not None
+
+    async def load_page(db: AsyncSession) -> dict:
+        repo = AsyncTrainingPlanRepository(db)
+        if not keyset:
+            # Paginación por página: OFFSET y total exacto
+            training_plans_list, total = await repo.get_all_training_plans(page=page, size=size, **filters)
+            next_cursor = None
+        else:
+            training_plans_list, next_cursor, total = await repo.get_training_plans_after(
+                size=size, cursor=cursor, include_total=include_total, **filters
+            )
+
+        # Calcular el número total de páginas si se conoce el total
+        total_pages = (total + size - 1) // size if total is not None else None
+
         # Convertir los objetos a diccionarios
         training_plans_dict = [jsonable_encoder(plan) for plan in training_plans_list]
-        
+
         # Crear la respuesta paginada
         paginated_response = PaginatedTrainingPlanResponse(
             items=training_plans_dict,
             total=total,
-            page=page,
+            page=None if keyset else page,
             size=size,
-            pages=total_pages
+            pages=total_pages,
+            next_cursor=next_cursor
         )
-        
-        return JSONResponse(content=jsonable_encoder(paginated_response), status_code=status.HTTP_200_OK)
+        return jsonable_encoder(paginated_response)
+
+    # La respuesta no depende del usuario: se cachea por los filtros normalizados
+    key = catalog_key(page=None if keyset else page, size=size, cursor=cursor,
+                      include_total=include_total if keyset else None, name=name,
+                      role_id=role_id, tag_id=tag_id, max_days=max_days)
+    try:
+        content, cache_status = await catalog_cache.get_or_load(key, load_page, db)
+    except ValueError as error:
+        return JSONResponse(content={"message": str(error), "data": None}, status_code=status.HTTP_400_BAD_REQUEST)
+
+    return JSONResponse(content=content, status_code=status.HTTP_200_OK, headers={"X-Cache": cache_status})
 
 @training_plan_router.get('/my', response_model=List[TrainingPlan], description="Retorna todos los planes de entrenamiento creados por el usuario actual")
 def get_my_training_plans(
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)]
+    principal: Annotated[Principal, Depends(require_role(2))],
+    db: Session = Depends(get_db)
 ) -> List[TrainingPlan]:
-    db = SessionLocal()
-    payload = auth_handler.decode_token(credentials.credentials)
-    if payload:
-        role_current_user = payload.get("user.role")
-        status_user = payload.get("user.status")
-        if role_current_user < 2:
-            return JSONResponse(content={"message": "You do not have the necessary permissions", "data": None}, status_code=status.HTTP_401_UNAUTHORIZED)
-        if status_user == False:
-            return JSONResponse(content={"message": "Your account is disabled", "data": None}, status_code=status.HTTP_401_UNAUTHORIZED)
-        
-        current_user = payload.get("sub")
-        result = TrainingPlanRepository(db).get_all_my_training_plans(current_user)
-        return JSONResponse(content=jsonable_encoder(result), status_code=status.HTTP_200_OK)
+    current_user = principal.email
+    result = TrainingPlanRepository(db).get_all_my_training_plans(current_user)
+    return JSONResponse(content=jsonable_encoder(result), status_code=status.HTTP_200_OK)
 
 @training_plan_router.get('/user/{email}', response_model=List[TrainingPlan], description="Retorna todos los planes de entrenamiento de un usuario específico")
 def get_user_training_plans(
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-    email: str = Path(min_length=5)
+    principal: Annotated[Principal, Depends(require_role(2))],
+    email: str = Path(min_length=5),
+    db: Session = Depends(get_db)
 ) -> List[TrainingPlan]:
-    db = SessionLocal()
-    payload = auth_handler.decode_token(credentials.credentials)
-    if payload:
-        role_current_user = payload.get("user.role")
-        status_user = payload.get("user.status")
-        if role_current_user < 2:
-            return JSONResponse(content={"message": "You do not have the necessary permissions", "data": None}, status_code=status.HTTP_401_UNAUTHORIZED)
-        if status_user == False:
-            return JSONResponse(content={"message": "Your account is disabled", "data": None}, status_code=status.HTTP_401_UNAUTHORIZED)
-        result = TrainingPlanRepository(db).get_all_training_plans_by_email(email)
-        return JSONResponse(content=jsonable_encoder(result), status_code=status.HTTP_200_OK)
+    result = TrainingPlanRepository(db).get_all_training_plans_by_email(email)
+    return JSONResponse(content=jsonable_encoder(result), status_code=status.HTTP_200_OK)
 
 @training_plan_router.get('/{id}', response_model=TrainingPlan, description="Retorna un solo plan de entrenamiento")
-def get_training_plan_by_id(credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)], id: int = Path(ge=1)) -> TrainingPlan:
-    db = SessionLocal()
-    payload = auth_handler.decode_token(credentials.credentials)
-    if payload:
-        role_current_user = payload.get("user.role")
-        status_user = payload.get("user.status")
-        current_user = payload.get("sub")
-
-        if not status_user:
-            return JSONResponse(content={"message": "Tu cuenta está inactiva", "data": None}, status_code=status.HTTP_401_UNAUTHORIZED)
-        
-        if role_current_user < 2:
-            return JSONResponse(content={"message": "Privilegios insuficientes", "data": None}, status_code=status.HTTP_403_FORBIDDEN)
-
-        repo = TrainingPlanRepository(db)
-        try:
-            existing_plan = repo.get_training_plan_by_id(id)
-            if not existing_plan:
-                return JSONResponse(content={"message": "El plan no fue encontrado", "data": None}, status_code=status.HTTP_404_NOT_FOUND)
-
-            # Si el plan es visible, lo puede ver cualquiera con rol >= 2 y cuenta activa
-            if existing_plan.is_visible:
-                response = jsonable_encoder(existing_plan)
-                permissions = repo.check_user_permissions_on_training_plan(id, current_user)
-                response['permissions'] = permissions
-                return JSONResponse(content={"message": "Plan obtenido exitosamente", "data": response}, status_code=status.HTTP_200_OK)
-
-            # Si no es visible, chequear permisos con la función que definiste
-            permissions = repo.check_user_permissions_on_training_plan(id, current_user)
-            if not (permissions["can_edit"] or role_current_user == 4):
-                return JSONResponse(content={"message": "No tienes permiso para ver este plan", "data": None}, status_code=status.HTTP_403_FORBIDDEN)
-            
+def get_training_plan_by_id(principal: Annotated[Principal, Depends(require_role(2))], id: int = Path(ge=1), db: Session = Depends(get_db)) -> TrainingPlan:
+    repo = TrainingPlanRepository(db)
+    try:
+        existing_plan = repo.get_training_plan_by_id(id)
+        if not existing_plan:
+            return JSONResponse(content={"message": "El plan no fue encontrado", "data": None}, status_code=status.HTTP_404_NOT_FOUND)
+
+        # Si el plan es visible, lo puede ver cualquiera con rol >= 2 y cuenta activa
+        if existing_plan.is_visible:
             response = jsonable_encoder(existing_plan)
+            permissions = repo.check_user_permissions_on_training_plan(id, principal)
             response['permissions'] = permissions
             return JSONResponse(content={"message": "Plan obtenido exitosamente", "data": response}, status_code=status.HTTP_200_OK)
 
-        except Exception as e:
-            return JSONResponse(content={"message": f"Error al obtener el plan: {str(e)}", "data": None}, status_code=status.HTTP_400_BAD_REQUEST)
+        # Si no es visible, chequear permisos con la función que definiste
+        permissions = repo.check_user_permissions_on_training_plan(id, principal)
+        if not (permissions["can_edit"] or principal.role == 4):
+            return JSONResponse(content={"message": "No tienes permiso para ver este plan", "data": None}, status_code=status.HTTP_403_FORBIDDEN)
+            
+        response = jsonable_encoder(existing_plan)
+        response['permissions'] = permissions
+        return JSONResponse(content={"message": "Plan obtenido exitosamente", "data": response}, status_code=status.HTTP_200_OK)
+
+    except Exception as e:
+        return JSONResponse(content={"message": f"Error al obtener el plan: {str(e)}", "data": None}, status_code=status.HTTP_400_BAD_REQUEST)
     
+@training_plan_router.get('/{id}/tree', response_model=dict, description="Retorna un plan de entrenamiento con su etiqueta, sus días, las configuraciones y los ejercicios")
+def get_training_plan_tree(principal: Annotated[Principal, Depends(require_role(2))], id: int = Path(ge=1), db: Session = Depends(get_db)) -> dict:
+    tree = training_plan_tree_cache.get_or_load(db, id)
+    if tree is None:
+        return JSONResponse(content={"message": "El plan no fue encontrado", "data": None}, status_code=status.HTTP_404_NOT_FOUND)
+
+    # Permisos con los claims del token y los datos del plan ya cargados (solo un gimnasio consulta la base)
+    can_manage = can_manage_training_plan(SimpleNamespace(**tree), principal, UserGymRepository(db))
+    if not tree["is_visible"] and not (can_manage or principal.role == 4):
+        return JSONResponse(content={"message": "No tienes permiso para ver este plan", "data": None}, status_code=status.HTTP_403_FORBIDDEN)
+
+    response = {**tree, "permissions": {"can_edit": can_manage, "can_delete": can_manage}}
+    return JSONResponse(content={"message": "Plan obtenido exitosamente", "data": response}, status_code=status.HTTP_200_OK)
+
 @training_plan_router.post('/me', response_model=dict, description="Un usuario premium crea su propio plan")
-def create_training_plan_as_user(credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)], training_plan: TrainingPlanCreate = Body()) -> dict:
-    db = SessionLocal()
-    payload = auth_handler.decode_token(credentials.credentials)
-    if payload:
-        user_email = payload.get("sub")
-        role = payload.get("user.role")
-        status_user = payload.get("user.status")
-
-        if role < 2:
-            return JSONResponse(content={"message": "Solo usuarios premium pueden crear planes propios"}, status_code=status.HTTP_403_FORBIDDEN)
-        if not status_user:
-            return JSONResponse(content={"message": "Tu cuenta está inactiva"}, status_code=status.HTTP_403_FORBIDDEN)
-
-        training_plan.user_email = user_email  # Seguridad: fuerza el email
-        try:
-            new_plan = TrainingPlanRepository(db).create_training_plan_as_user(training_plan, user_email)
-            return JSONResponse(content={"message": "Plan creado exitosamente", "data": jsonable_encoder(new_plan)}, status_code=status.HTTP_201_CREATED)
-        except ValueError as e:
-            return JSONResponse(content={"message": str(e), "data": None}, status_code=status.HTTP_400_BAD_REQUEST)
-        except Exception as e:
-            return JSONResponse(content={"message": "Error interno del servidor", "error": str(e)}, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+def create_training_plan_as_user(principal: Annotated[Principal, Depends(require_role(2))], training_plan: TrainingPlanCreate = Body(), db: Session = Depends(get_db)) -> dict:
+    training_plan.user_email = principal.email  # Seguridad: fuerza el email
+    try:
+        new_plan = TrainingPlanRepository(db).create_training_plan_as_user(training_plan, principal)
+        return JSONResponse(content={"message": "Plan creado exitosamente", "data": jsonable_encoder(new_plan)}, status_code=status.HTTP_201_CREATED)
+    except ValueError as e:
+        return JSONResponse(content={"message": str(e), "data": None}, status_code=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return JSONResponse(content={"message": "Error interno del servidor", "error": str(e)}, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 @training_plan_router.post('/gym', response_model=dict, description="Un gimnasio crea un plan para un usuario asociado")
-def create_training_plan_by_gym(credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)], training_plan: TrainingPlanCreateByGym = Body()) -> dict:
-    db = SessionLocal()
-    payload = auth_handler.decode_token(credentials.credentials)
-    if payload:
-        gym_email = payload.get("sub")
-        role = payload.get("user.role")
-        status_user = payload.get("user.status")
-
-        if role < 3:
-            return JSONResponse(content={"message": "Solo gimnasios o administradores pueden usar esta función"}, status_code=status.HTTP_403_FORBIDDEN)
-        if not status_user:
-            return JSONResponse(content={"message": "Tu cuenta está inactiva"}, status_code=status.HTTP_403_FORBIDDEN)
-        
-        try:
-            new_plan = TrainingPlanRepository(db).create_plan_for_user_from_gym(training_plan, gym_email)
-            return JSONResponse(content={"message": "Plan creado por gimnasio exitosamente", "data": jsonable_encoder(new_plan)}, status_code=status.HTTP_201_CREATED)
-        except ValueError as e:
-            return JSONResponse(content={"message": str(e), "data": None}, status_code=status.HTTP_400_BAD_REQUEST)
+def create_training_plan_by_gym(principal: Annotated[Principal, Depends(require_role(3))], training_plan: TrainingPlanCreateByGym = Body(), db: Session = Depends(get_db)) -> dict:
+    try:
+        new_plan = TrainingPlanRepository(db).create_plan_for_user_from_gym(training_plan, principal)
+        return JSONResponse(content={"message": "Plan creado por gimnasio exitosamente", "data": jsonable_encoder(new_plan)}, status_code=status.HTTP_201_CREATED)
+    except ValueError as e:
+        return JSONResponse(content={"message": str(e), "data": None}, status_code=status.HTTP_400_BAD_REQUEST)
 
 
 @training_plan_router.delete('/{id}', response_model=dict, description="Elimina un plan de entrenamiento")
-def delete_training_plan(credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)], id: int = Path(ge=1)) -> dict:
-    db = SessionLocal()
-    payload = auth_handler.decode_token(credentials.credentials)
-    if payload:
-        user_email = payload.get("sub")
-        role = payload.get("user.role")
-        status_user = payload.get("user.status")
-
-        if role < 2:
-            return JSONResponse(content={"message": "No tienes permisos suficientes"}, status_code=status.HTTP_403_FORBIDDEN)
-        if not status_user:
-            return JSONResponse(content={"message": "Cuenta inactiva"}, status_code=status.HTTP_403_FORBIDDEN)
-
+def delete_training_plan(principal: Annotated[Principal, Depends(require_role(2))], id: int = Path(ge=1), db: Session = Depends(get_db)) -> dict:
     try:
-        deleted = TrainingPlanRepository(db).delete_training_plan(id, user_email)
+        deleted = TrainingPlanRepository(db).delete_training_plan(id, principal)
         return JSONResponse(content={"message": "Plan eliminado exitosamente", "data": jsonable_encoder(deleted)}, status_code=status.HTTP_200_OK)
     except ValueError as e:
         return JSONResponse(content={"message": str(e), "data": None}, status_code=status.HTTP_400_BAD_REQUEST)
 
 @training_plan_router.put('/{id}', response_model=dict, description="Actualiza un plan de entrenamiento")
-def update_training_plan(credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)], id: int = Path(ge=1), training_plan: TrainingPlanUpdate = Body()) -> dict:
-    db = SessionLocal()
-    payload = auth_handler.decode_token(credentials.credentials)
-    if payload:
-        user_email = payload.get("sub")
-        role = payload.get("user.role")
-        status_user = payload.get("user.status")
-
-        if role < 2:
-            return JSONResponse(content={"message": "No tienes permisos suficientes"}, status_code=status.HTTP_403_FORBIDDEN)
-        if not status_user:
-            return JSONResponse(content={"message": "Tu cuenta está inactiva"}, status_code=status.HTTP_403_FORBIDDEN)
-
+def update_training_plan(principal: Annotated[Principal, Depends(require_role(2))], id: int = Path(ge=1), training_plan: TrainingPlanUpdate = Body(), db: Session = Depends(get_db)) -> dict:
     try:
-        updated = TrainingPlanRepository(db).update_training_plan(id, training_plan, user_email)
+        updated = TrainingPlanRepository(db).update_training_plan(id, training_plan, principal)
         return JSONResponse(content={"message": "Plan actualizado correctamente", "data": jsonable_encoder(updated)}, status_code=status.HTTP_200_OK)
     except ValueError as e:
         return JSONResponse(content={"message": str(e), "data": None}, status_code=status.HTTP_400_BAD_REQUEST)
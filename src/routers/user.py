@@ -1,215 +1,187 @@
 from fastapi import APIRouter, Body, Depends, Query, Path, status
-from fastapi.responses import JSONResponse
-from typing import Annotated, List
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import Annotated, Iterator, List, Optional
+import json
 from fastapi import APIRouter
-from src.config.database import SessionLocal 
+from src.config.database import get_db
+from sqlalchemy.orm import Session
 from fastapi.encoders import jsonable_encoder
-from src.schemas.user import User, UpdateUser, SubscriptionConfirmation
+from src.schemas.user import User, UpdateUser, SubscriptionConfirmation, UserPage
 from src.models.user import User as users
-from src.repositories.user import UserRepository
+from src.repositories.user import UserRepository, decode_cursor, encode_cursor
 from datetime import date
 
-from fastapi.security import HTTPAuthorizationCredentials
-from src.auth.has_access import security
-from src.auth import auth_handler
+from src.auth.principal import Principal, get_principal, require_role
 
 user_router = APIRouter(tags=['Usuarios'])
 
 #CRUD user
 
-@user_router.get('',response_model=List[User],description="Devuelve todos los usuarios")
-def get_users(credentials: Annotated[HTTPAuthorizationCredentials,Depends(security)])-> List[User]:
-    db= SessionLocal()
-    payload = auth_handler.decode_token(credentials.credentials)
-    if payload:
-        role_current_user = payload.get("user.role")
-        if role_current_user != 4:
-            return JSONResponse(content={"message": "You do not have the necessary permissions", "data": None}, status_code=status.HTTP_401_UNAUTHORIZED)
-        result = UserRepository(db).get_all_users()
-        return JSONResponse(content=jsonable_encoder(result), status_code=status.HTTP_200_OK)
+def stream_user_page(db: Session, rows: Iterator[dict], limit: int, total: Optional[int]) -> Iterator[str]:
+    """
+    Cuerpo JSON de la página escrito fila a fila. rows trae limit + 1 filas como máximo:
+    si llega la extra, hay página siguiente y su cursor es el email de la última entregada.
+    La sesión se cierra al terminar el cuerpo (la dependencia puede haberla cerrado antes de enviarlo).
+    """
+    next_cursor, last_email = None, None
+    try:
+        yield '{"items":['
+        for index, row in enumerate(rows):
+            if index == limit:
+                next_cursor = encode_cursor(last_email)
+                break
+            yield ("," if index else "") + json.dumps(jsonable_encoder(row))
+            last_email = row["email"]
+        yield f'],"next_cursor":{json.dumps(next_cursor)},"total":{json.dumps(total)}}}'
+    finally:
+        rows.close()
+        db.close()
+
+@user_router.get('',response_model=UserPage,description="Devuelve los usuarios paginados por cursor, sin datos sensibles y con filtros opcionales")
+def get_users(
+    principal: Annotated[Principal, Depends(require_role(4, active=False))],
+    limit: int = Query(50, ge=1, le=500, description="Usuarios por página"),
+    cursor: Optional[str] = Query(None, description="next_cursor de la página anterior"),
+    role_id: Optional[int] = Query(None, ge=1, le=4, description="Rol vigente"),
+    user_status: Optional[bool] = Query(None, alias="status", description="Cuenta activa o inactiva"),
+    is_verified: Optional[bool] = Query(None, description="Email verificado"),
+    expiring_before: Optional[date] = Query(None, description="Suscripción que termina antes de esta fecha"),
+    include_total: bool = Query(False, description="Incluir el total de usuarios con los filtros (una consulta más)"),
+    db: Session = Depends(get_db)
+) -> UserPage:
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        return JSONResponse(content={"message": str(e), "data": None}, status_code=status.HTTP_400_BAD_REQUEST)
+    repo = UserRepository(db)
+    filters = {"role_id": role_id, "status": user_status, "is_verified": is_verified, "expiring_before": expiring_before}
+    total = repo.count_users(**filters) if include_total else None
+    return StreamingResponse(
+        stream_user_page(db, repo.iter_users(limit + 1, after, **filters), limit, total),
+        media_type="application/json",
+    )
 
 @user_router.put('/{email}',response_model=dict,description="Updates specific user")
-def update_user(credentials: Annotated[HTTPAuthorizationCredentials,Depends(security)], email: str = Path(min_length=5), user: UpdateUser = Body()) -> dict:
-    payload = auth_handler.decode_token(credentials.credentials)
-    db = SessionLocal()
-    if payload:
-        element = UserRepository(db).update_user(email, user)
-        if not element:        
-            return JSONResponse(
-                content={            
-                    "message": "The requested user was not found",            
-                    "data": None        
-                    }, 
-                status_code=status.HTTP_404_NOT_FOUND
-            )
-        return JSONResponse(content=jsonable_encoder(element), status_code=status.HTTP_200_OK)
-    return JSONResponse(content={"message": "You do not have the necessary permissions", "data": None}, status_code=status.HTTP_401_UNAUTHORIZED)
+def update_user(principal: Annotated[Principal, Depends(get_principal)], email: str = Path(min_length=5), user: UpdateUser = Body(), db: Session = Depends(get_db)) -> dict:
+    element = UserRepository(db).update_user(email, user)
+    if not element:        
+        return JSONResponse(
+            content={            
+                "message": "The requested user was not found",            
+                "data": None        
+                }, 
+            status_code=status.HTTP_404_NOT_FOUND
+        )
+    return JSONResponse(content=jsonable_encoder(element), status_code=status.HTTP_200_OK)
 
 @user_router.get('/{email}',response_model=User,description="Devuelve la información de un solo usuario")
-def get_user(credentials: Annotated[HTTPAuthorizationCredentials,Depends(security)], email: str = Path(min_length=5)) -> User:
-    db = SessionLocal()
+def get_user(principal: Annotated[Principal, Depends(require_role(active=False))], email: str = Path(min_length=5), db: Session = Depends(get_db)) -> User:
     element=  UserRepository(db).get_user_by_email(email)
-    payload = auth_handler.decode_token(credentials.credentials)
-    if payload:
-        role_current_user = payload.get("user.role")
-        if role_current_user < 1:
-            return JSONResponse(content={"message": "You do not have the necessary permissions", "data": None}, status_code=status.HTTP_401_UNAUTHORIZED)
-        if not element:        
-            return JSONResponse(
-                content={            
-                    "message": "The requested user was not found",            
-                    "data": None        
-                    }, 
-                status_code=status.HTTP_404_NOT_FOUND
-                )    
+    if not element:        
         return JSONResponse(
-            content=jsonable_encoder(element),                        
-            status_code=status.HTTP_200_OK
-        )
+            content={            
+                "message": "The requested user was not found",            
+                "data": None        
+                }, 
+            status_code=status.HTTP_404_NOT_FOUND
+            )    
+    return JSONResponse(
+        content=jsonable_encoder(element),                        
+        status_code=status.HTTP_200_OK
+    )
 
 @user_router.put('/delete/{email}',response_model=dict,description="Desactiva el usuario del sistema")
-def remove_user(credentials: Annotated[HTTPAuthorizationCredentials,Depends(security)], email: str = Path(min_length=5)) -> dict:
-    db = SessionLocal()
-    payload = auth_handler.decode_token(credentials.credentials)
-    if payload:
-        element = UserRepository(db).delete_user(email)
-        if not element:        
-            return JSONResponse(
-                content={            
-                    "message": "The requested user was not found",            
-                    "data": None        
-                    }, 
-                status_code=status.HTTP_404_NOT_FOUND
-            )
-        return JSONResponse(content=jsonable_encoder(element), status_code=status.HTTP_200_OK)
-    return JSONResponse(content={"message": "You do not have the necessary permissions", "data": None}, status_code=status.HTTP_401_UNAUTHORIZED)
+def remove_user(principal: Annotated[Principal, Depends(get_principal)], email: str = Path(min_length=5), db: Session = Depends(get_db)) -> dict:
+    element = UserRepository(db).delete_user(email)
+    if not element:        
+        return JSONResponse(
+            content={            
+                "message": "The requested user was not found",            
+                "data": None        
+                }, 
+            status_code=status.HTTP_404_NOT_FOUND
+        )
+    return JSONResponse(content=jsonable_encoder(element), status_code=status.HTTP_200_OK)
 
 @user_router.put('/role/{email}',response_model=dict,description="Actualiza el rol del usuario en el sistema")
 def update_role(
-    credentials: Annotated[HTTPAuthorizationCredentials,Depends(security)], 
+    principal: Annotated[Principal, Depends(require_role(4))], 
     email: str = Path(min_length=5), 
     role_id: int = Query(...),
-    final_date: date = Query(..., description="Fecha de finalización del rol")
+    final_date: date = Query(..., description="Fecha de finalización del rol"),
+    db: Session = Depends(get_db)
 ) -> dict:
-    db = SessionLocal()
-    payload = auth_handler.decode_token(credentials.credentials)
-    if payload:
-        role_user = payload.get("user.role")
-        status_user = payload.get("user.status")
-        if role_user > 3:
-            if status_user:
-                element = UserRepository(db).update_role(email, role_id, final_date)
-            else:
-                return JSONResponse(content={"message": "Your account is inactive", "data": None}, status_code=status.HTTP_403_FORBIDDEN)
-        else:
-            return JSONResponse(content={"message": "You do not have the necessary permissions", "data": None}, status_code=status.HTTP_401_UNAUTHORIZED)
-        if not element:        
-            return JSONResponse(
-                content={            
-                    "message": "The requested user was not found",            
-                    "data": None        
-                    }, 
-                status_code=status.HTTP_404_NOT_FOUND
-            )
-        return JSONResponse(content=jsonable_encoder(element), status_code=status.HTTP_200_OK)
-    return JSONResponse(content={"message": "You do not have the necessary permissions", "data": None}, status_code=status.HTTP_401_UNAUTHORIZED)
+    element = UserRepository(db).update_role(email, role_id, final_date)
+    if not element:        
+        return JSONResponse(
+            content={            
+                "message": "The requested user was not found",            
+                "data": None        
+                }, 
+            status_code=status.HTTP_404_NOT_FOUND
+        )
+    return JSONResponse(content=jsonable_encoder(element), status_code=status.HTTP_200_OK)
 
 @user_router.put('/verification/{email}', response_model=dict, description="Actualiza el estado de verificación de un usuario")
 def update_verification_status(
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)], 
+    principal: Annotated[Principal, Depends(require_role(4))],  # Solo administradores (role_id = 4)
     email: str = Path(min_length=5), 
-    is_verified: bool = Query(..., description="Nuevo estado de verificación")
+    is_verified: bool = Query(..., description="Nuevo estado de verificación"),
+    db: Session = Depends(get_db)
 ) -> dict:
-    db = SessionLocal()
-    payload = auth_handler.decode_token(credentials.credentials)
-    if payload:
-        role_user = payload.get("user.role")
-        status_user = payload.get("user.status")
-        if role_user == 4:  # Solo administradores (role_id = 4)
-            if status_user:
-                element = UserRepository(db).update_verification_status(email, is_verified)
-                if not element:
-                    return JSONResponse(
-                        content={
-                            "message": "El usuario solicitado no fue encontrado",
-                            "data": None
-                        },
-                        status_code=status.HTTP_404_NOT_FOUND
-                    )
-                return JSONResponse(
-                    content={
-                        "message": "Estado de verificación actualizado correctamente",
-                        "data": jsonable_encoder(element)
-                    },
-                    status_code=status.HTTP_200_OK
-                )
-            else:
-                return JSONResponse(
-                    content={"message": "Tu cuenta está inactiva", "data": None},
-                    status_code=status.HTTP_403_FORBIDDEN
-                )
-        else:
-            return JSONResponse(
-                content={"message": "No tienes los permisos necesarios", "data": None},
-                status_code=status.HTTP_401_UNAUTHORIZED
-            )
+    element = UserRepository(db).update_verification_status(email, is_verified)
+    if not element:
+        return JSONResponse(
+            content={
+                "message": "El usuario solicitado no fue encontrado",
+                "data": None
+            },
+            status_code=status.HTTP_404_NOT_FOUND
+        )
     return JSONResponse(
-        content={"message": "No tienes los permisos necesarios", "data": None},
-        status_code=status.HTTP_401_UNAUTHORIZED
+        content={
+            "message": "Estado de verificación actualizado correctamente",
+            "data": jsonable_encoder(element)
+        },
+        status_code=status.HTTP_200_OK
     )
 
 @user_router.post('/subscription/confirm', response_model=dict, description="Confirma una suscripción y actualiza el rol del usuario")
 def confirm_subscription(
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-    subscription_data: SubscriptionConfirmation = Body(...)
+    principal: Annotated[Principal, Depends(require_role(4, active=False))],  # Solo administradores pueden confirmar suscripciones
+    subscription_data: SubscriptionConfirmation = Body(...),
+    db: Session = Depends(get_db)
 ) -> dict:
     """
     Endpoint para confirmar una suscripción.
     """
-    db = SessionLocal()
-    payload = auth_handler.decode_token(credentials.credentials)
-    
-    if payload:
-        role_user = payload.get("user.role")
-        if role_user != 4:  # Solo administradores pueden confirmar suscripciones
-            return JSONResponse(
-                content={"message": "No tienes los permisos necesarios", "data": None},
-                status_code=status.HTTP_401_UNAUTHORIZED
-            )
-            
-        try:
-            # Aquí podrías agregar lógica para verificar el payment_id con tu pasarela de pago
-            # Por ejemplo, hacer una llamada a la API de la pasarela para verificar el pago
-            
-            # Actualizar el rol y fechas del usuario
-            element = UserRepository(db).update_role(
-                email=subscription_data.email,
-                role_id=subscription_data.role_id,
-                final_date=subscription_data.final_date
-            )
-            
-            if not element:
-                return JSONResponse(
-                    content={"message": "Usuario no encontrado", "data": None},
-                    status_code=status.HTTP_404_NOT_FOUND
-                )
-                
-            return JSONResponse(
-                content={
-                    "message": "Suscripción confirmada exitosamente",
-                    "data": jsonable_encoder(element)
-                },
-                status_code=status.HTTP_200_OK
-            )
-            
-        except Exception as e:
+    try:
+        # Aquí podrías agregar lógica para verificar el payment_id con tu pasarela de pago
+        # Por ejemplo, hacer una llamada a la API de la pasarela para verificar el pago
+        
+        # Actualizar el rol y fechas del usuario
+        element = UserRepository(db).update_role(
+            email=subscription_data.email,
+            role_id=subscription_data.role_id,
+            final_date=subscription_data.final_date
+        )
+        
+        if not element:
             return JSONResponse(
-                content={"message": f"Error al confirmar la suscripción: {str(e)}", "data": None},
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+                content={"message": "Usuario no encontrado", "data": None},
+                status_code=status.HTTP_404_NOT_FOUND
             )
             
-    return JSONResponse(
-        content={"message": "No tienes los permisos necesarios", "data": None},
-        status_code=status.HTTP_401_UNAUTHORIZED
-    )
-
+        return JSONResponse(
+            content={
+                "message": "Suscripción confirmada exitosamente",
+                "data": jsonable_encoder(element)
+            },
+            status_code=status.HTTP_200_OK
+        )
+        
+    except Exception as e:
+        return JSONResponse(
+            content={"message": f"Error al confirmar la suscripción: {str(e)}", "data": None},
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
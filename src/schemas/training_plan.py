@@ -67,7 +67,8 @@ class TrainingPlanUpdate(BaseModel):
 
 class PaginatedTrainingPlanResponse(BaseModel):
     items: List[TrainingPlan]
-    total: int
-    page: int
+    total: Optional[int] = Field(default=None, title="Total de planes (con cursor, solo si se pide include_total)")
+    page: Optional[int] = Field(default=None, title="Número de página (solo paginación por page)")
     size: int
-    pages: int
\ No newline at end of file
+    pages: Optional[int] = Field(default=None, title="Total de páginas (si se conoce el total)")
+    next_cursor: Optional[str] = Field(default=None, title="Cursor de la página siguiente (None en la última)")
\ No newline at end of file
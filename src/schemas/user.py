@@ -32,6 +32,28 @@ class User(BaseModel):
     verification_code: Optional[str] = Field(default=None, title="Código de verificación", example=None)
     message: Optional[str] = Field(default=None, title="Mensaje personalizado", example=None)
 
+class UserSummary(BaseModel):
+    """Usuario en el listado de administración (sin contraseña ni código de verificación)."""
+    email: str = Field(title="Email del usuario")
+    id_number: Optional[str] = Field(default=None, title="Numero de identificacion del usuario")
+    user_name: Optional[str] = Field(default=None, title="Nombre de usuario")
+    name: Optional[str] = Field(default=None, title="Nombre del usuario")
+    phone: Optional[str] = Field(default=None, title="Telefono del usuario")
+    address: Optional[str] = Field(default=None, title="Direccion del usuario")
+    birth_date: Optional[date] = Field(default=None, title="Fecha de nacimiento del usuario")
+    gender: Optional[str] = Field(default=None, title="Genero del usuario")
+    status: Optional[bool] = Field(default=None, title="Estado del usuario")
+    start_date: Optional[date] = Field(default=None, title="Fecha de inicio del usuario")
+    final_date: Optional[date] = Field(default=None, title="Fecha de finalizacion del usuario")
+    role_id: Optional[int] = Field(default=None, title="Rol vigente del usuario")
+    is_verified: Optional[bool] = Field(default=None, title="Estado de verificación del usuario")
+
+class UserPage(BaseModel):
+    """Página del listado de usuarios; next_cursor es None en la última."""
+    items: List[UserSummary]
+    next_cursor: Optional[str] = Field(default=None, title="Cursor para pedir la página siguiente")
+    total: Optional[int] = Field(default=None, title="Total de usuarios con los filtros (si se pidió)")
+
 class UserLogin (BaseModel):
     email: EmailStr = Field(min_length=6, max_length=64, alias="email", title="Correo del usuario")
     password: str = Field(min_length=6, title="Contraseña del usuario")
@@ -0,0 +1,256 @@
+"""
+Caché de respuestas del catálogo público de planes (GET /training_plan).
+
+Las primeras páginas del catálogo se piden miles de veces por hora con los
+mismos filtros y la respuesta no depende del usuario. Se guardan por filtros
+normalizados (page, size, cursor, include_total, name, role_id, tag_id,
+max_days) con dos plazos:
+- CATALOG_CACHE_TTL segundos fresca: se sirve tal cual.
+- CATALOG_CACHE_STALE segundos más caducada: se sirve y se recalcula en
+  segundo plano con su propia sesión (stale-while-revalidate).
+Cada clave se calcula una sola vez a la vez: las peticiones que fallan mientras
+otra (o un refresco) la calcula esperan a esa carga en lugar de ir a la base.
+
+Invalidación: las escrituras de TrainingPlanRepository, LikeRepository y
+WorkoutDayExerciseRepository llaman a catalog_changed(db) y, tras el commit,
+se incrementa la generación del catálogo, que forma parte de la clave; las
+respuestas anteriores dejan de encontrarse y salen por LRU o por TTL. Otras
+escrituras que influyen en los filtros (roles de usuario, etiquetas) solo se
+ven al caducar la respuesta.
+
+Backends (CATALOG_CACHE_BACKEND):
+    memory  LRU del proceso con CATALOG_CACHE_SIZE respuestas (por defecto)
+    redis   almacén compartido (REDIS_URL, ver src/config/shared_store.py); sus
+            llamadas son de red y se hacen en el threadpool (blocking)
+    off     sin caché
+"""
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from fastapi.concurrency import run_in_threadpool
+from prometheus_client import Counter
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.config.shared_store import redis_client
+
+CATALOG_CACHE_BACKEND = os.getenv("CATALOG_CACHE_BACKEND", "memory").lower()
+CATALOG_CACHE_TTL = float(os.getenv("CATALOG_CACHE_TTL", "30"))
+CATALOG_CACHE_STALE = float(os.getenv("CATALOG_CACHE_STALE", "120"))
+CATALOG_CACHE_SIZE = int(os.getenv("CATALOG_CACHE_SIZE", "1000"))
+
+CATALOG_CACHE_REQUESTS = Counter(
+    "catalog_cache_requests_total",
+    "Consultas a la caché del catálogo de planes por resultado (hit/stale/miss)",
+    ["result"],
+)
+CATALOG_CACHE_INVALIDATIONS = Counter(
+    "catalog_cache_invalidations_total",
+    "Invalidaciones del catálogo de planes por escrituras",
+)
+
+# Clave de session.info que marca una transacción que cambia el catálogo
+PENDING_KEY = "catalog_changed"
+
+logger = logging.getLogger(__name__)
+
+
+def catalog_key(**filters) -> str:
+    """Clave de los filtros normalizados: sin valores vacíos y con el texto en minúsculas y espacios simples."""
+    name = filters.get("name")
+    if name is not None:
+        filters["name"] = " ".join(name.lower().split()) or None
+    return json.dumps({key: value for key, value in filters.items() if value is not None}, sort_keys=True)
+
+
+class MemoryCatalogCacheBackend:
+    """LRU del proceso: las entradas se descartan por antigüedad de uso al superar max_size."""
+
+    blocking = False
+
+    def __init__(self, max_size: int = CATALOG_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def generation(self) -> int:
+        return self._generation
+
+    def bump(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: dict, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+class SharedCatalogCacheBackend:
+    """Respuestas en el almacén compartido; la generación es un contador común a los workers."""
+
+    blocking = True
+
+    def __init__(self, client, prefix: str = "catalog") -> None:
+        self.client = client
+        self.prefix = prefix
+
+    def generation(self) -> int:
+        return int(self.client.get(f"{self.prefix}:generation") or 0)
+
+    def bump(self) -> None:
+        self.client.incr(f"{self.prefix}:generation")
+
+    def get(self, key: str):
+        value = self.client.get(f"{self.prefix}:entry:{key}")
+        return json.loads(value) if value is not None else None
+
+    def set(self, key: str, entry: dict, ttl: float) -> None:
+        self.client.set(f"{self.prefix}:entry:{key}", json.dumps(entry), ex=max(1, int(ttl)))
+
+
+class CatalogCache:
+    """Respuestas del catálogo con TTL y stale-while-revalidate sobre un backend."""
+
+    def __init__(self, backend, ttl: float = CATALOG_CACHE_TTL, stale: float = CATALOG_CACHE_STALE,
+                 session_factory=None) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.stale = stale
+        self.session_factory = session_factory
+        # Clave -> Future con la respuesta que se está calculando (None si la carga falla)
+        self._loading = {}
+        self._tasks = set()
+
+    async def _call(self, function, *args):
+        """Ejecutar una operación del backend sin bloquear el event loop si es de red."""
+        if self.backend.blocking:
+            return await run_in_threadpool(function, *args)
+        return function(*args)
+
+    def _lookup(self, key: str) -> tuple:
+        key = f"{self.backend.generation()}:{key}"
+        return key, self.backend.get(key)
+
+    def _store(self, key: str, payload: dict) -> None:
+        now = time.time()
+        entry = {"payload": payload, "fresh_until": now + self.ttl, "stale_until": now + self.ttl + self.stale}
+        self.backend.set(key, entry, self.ttl + self.stale)
+
+    async def get_or_load(self, key: str, loader, db):
+        """
+        Respuesta de key y su origen ("hit", "stale" o "miss").
+
+        loader(db) es una corrutina que calcula la respuesta; en un fallo se usa la
+        sesión de la petición y al refrescar una entrada caducada, una sesión nueva.
+        """
+        if self.backend is None:
+            return await loader(db), "miss"
+        key, entry = await self._call(self._lookup, key)
+        now = time.time()
+        if entry is not None and now < entry["stale_until"]:
+            if now < entry["fresh_until"]:
+                CATALOG_CACHE_REQUESTS.labels("hit").inc()
+                return entry["payload"], "hit"
+            CATALOG_CACHE_REQUESTS.labels("stale").inc()
+            self._schedule_refresh(key, loader)
+            return entry["payload"], "stale"
+        CATALOG_CACHE_REQUESTS.labels("miss").inc()
+        loading = self._loading.get(key)
+        if loading is not None:
+            # Otra petición o un refresco ya la está calculando: se usa esa carga
+            payload = await asyncio.shield(loading)
+            if payload is not None:
+                return payload, "miss"
+        future = self._start_loading(key)
+        payload = None
+        try:
+            payload = await loader(db)
+            await self._call(self._store, key, payload)
+            return payload, "miss"
+        finally:
+            self._finish_loading(key, future, payload)
+
+    def _start_loading(self, key: str) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self._loading.setdefault(key, future)
+        return future
+
+    def _finish_loading(self, key: str, future: asyncio.Future, payload) -> None:
+        if self._loading.get(key) is future:
+            del self._loading[key]
+        future.set_result(payload)
+
+    def _schedule_refresh(self, key: str, loader) -> None:
+        if key in self._loading:
+            return
+        future = self._start_loading(key)
+        task = asyncio.get_running_loop().create_task(self._refresh(key, loader, future))
+        # Referencia a la tarea hasta que termine para que no la recoja el recolector
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, key: str, loader, future: asyncio.Future) -> None:
+        payload = None
+        try:
+            session_factory = self.session_factory
+            if session_factory is None:
+                from src.config.async_database import AsyncSessionLocal as session_factory
+            async with session_factory() as db:
+                payload = await loader(db)
+            # Si el catálogo cambió mientras tanto, la respuesta ya no vale
+            if key.startswith(f"{await self._call(self.backend.generation)}:"):
+                await self._call(self._store, key, payload)
+        except Exception:
+            logger.exception("Falló el refresco en segundo plano del catálogo")
+        finally:
+            self._finish_loading(key, future, payload)
+
+    def invalidate(self) -> None:
+        if self.backend is not None:
+            self.backend.bump()
+            CATALOG_CACHE_INVALIDATIONS.inc()
+
+
+def build_catalog_cache(backend: str = CATALOG_CACHE_BACKEND, redis_url: str = None) -> CatalogCache:
+    """Caché configurada con CATALOG_CACHE_BACKEND ("memory", "redis" u "off")."""
+    if backend == "off":
+        return CatalogCache(None)
+    if backend == "redis":
+        return CatalogCache(SharedCatalogCacheBackend(redis_client(redis_url)))
+    return CatalogCache(MemoryCatalogCacheBackend())
+
+
+catalog_cache = build_catalog_cache(redis_url=os.getenv("REDIS_URL"))
+
+
+def catalog_changed(db) -> None:
+    """Marcar la transacción de db como escritura del catálogo; se invalida tras el commit."""
+    db.info[PENDING_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_catalog(session):
+    if session.info.pop(PENDING_KEY, False):
+        catalog_cache.invalidate()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_catalog_change(session, previous_transaction):
+    session.info.pop(PENDING_KEY, None)
@@ -0,0 +1,109 @@
+"""
+Conciliación de los contadores de likes de los planes de entrenamiento.
+
+training_plans.likes_count y dislikes_count los mantiene LikeRepository en la
+misma transacción que cada like. Si algo escribe en likes por otro camino
+(SQL manual, una restauración parcial...) los contadores se desvían; este
+trabajo los recalcula con una sola sentencia y solo toca los planes que no
+cuadran:
+
+    UPDATE training_plans SET likes_count = (...), dislikes_count = (...)
+    WHERE likes_count <> (...) OR dislikes_count <> (...)
+
+La aplicación lo ejecuta en un hilo cada LIKE_COUNTERS_RECONCILE_INTERVAL
+segundos (0 lo desactiva, p. ej. si se programa con cron):
+
+    python -m src.services.like_counters
+"""
+import logging
+import os
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import func, or_, select, update
+
+from src.models.like import Like
+from src.models.training_plan import TrainingPlan
+from src.services.catalog_cache import catalog_changed
+from src.services.periodic_job import PeriodicJob
+
+LIKE_COUNTERS_RECONCILE_INTERVAL = float(os.getenv("LIKE_COUNTERS_RECONCILE_INTERVAL", "86400"))
+
+LIKE_COUNTERS_RECONCILE_RUNS = Counter(
+    "like_counters_reconcile_runs_total",
+    "Ejecuciones de la conciliación de contadores de likes por resultado (ok/error)",
+    ["result"],
+)
+LIKE_COUNTERS_DRIFTED_PLANS = Counter(
+    "like_counters_drifted_plans_total",
+    "Planes cuyos contadores de likes no coincidían con la tabla likes",
+)
+LIKE_COUNTERS_RECONCILE_DURATION = Histogram(
+    "like_counters_reconcile_duration_seconds",
+    "Duración del UPDATE de conciliación de contadores de likes",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+LIKE_COUNTERS_LAST_SUCCESS = Gauge(
+    "like_counters_reconcile_last_success_timestamp_seconds",
+    "Momento (epoch) de la última conciliación correcta",
+)
+
+logger = logging.getLogger(__name__)
+
+
+def counted_likes(is_like: bool):
+    """Subconsulta correlacionada con los likes (o dislikes) reales del plan."""
+    return (
+        select(func.count(Like.id))
+        .where(Like.training_plan_id == TrainingPlan.id, Like.is_like == is_like)
+        .scalar_subquery()
+    )
+
+
+def reconcile_like_counters(db) -> int:
+    """Recalcular los contadores desviados; devuelve cuántos planes se corrigieron."""
+    likes, dislikes = counted_likes(True), counted_likes(False)
+    start = time.perf_counter()
+    try:
+        result = db.execute(
+            update(TrainingPlan)
+            .where(or_(TrainingPlan.likes_count != likes, TrainingPlan.dislikes_count != dislikes))
+            .values(likes_count=likes, dislikes_count=dislikes)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
+            catalog_changed(db)
+        db.commit()
+    except Exception:
+        db.rollback()
+        LIKE_COUNTERS_RECONCILE_RUNS.labels("error").inc()
+        raise
+    finally:
+        LIKE_COUNTERS_RECONCILE_DURATION.observe(time.perf_counter() - start)
+    LIKE_COUNTERS_RECONCILE_RUNS.labels("ok").inc()
+    LIKE_COUNTERS_DRIFTED_PLANS.inc(result.rowcount)
+    LIKE_COUNTERS_LAST_SUCCESS.set_to_current_time()
+    return result.rowcount
+
+
+class LikeCountersReconcileJob(PeriodicJob):
+    """Hilo que ejecuta reconcile_like_counters al arrancar y luego cada interval segundos."""
+
+    name = "like-counters-reconcile"
+
+    def __init__(self, session_factory, interval: float = LIKE_COUNTERS_RECONCILE_INTERVAL) -> None:
+        super().__init__(session_factory, interval)
+
+    def run_once(self) -> int:
+        with self.session_factory() as db:
+            drifted = reconcile_like_counters(db)
+        if drifted:
+            logger.warning("Contadores de likes corregidos en %d planes", drifted)
+        return drifted
+
+
+if __name__ == "__main__":
+    from src.config.database import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    LikeCountersReconcileJob(SessionLocal, interval=0).run_once()
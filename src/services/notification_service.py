@@ -1,4 +1,3 @@
-import httpx
 from src.schemas.notification import Notification
 from typing import List
 
@@ -16,6 +15,9 @@ class NotificationService:
             "channelId": "default"
         }
 
+        # httpx se importa al usarlo: cargarlo en el arranque retrasa a todas las instancias
+        import httpx
+
         try:
             async with httpx.AsyncClient() as client:
                 response = await client.post(
@@ -46,6 +48,8 @@ class NotificationService:
                 for token in tokens
             ]
 
+            import httpx
+
             try:
                 async with httpx.AsyncClient() as client:
                     response = await client.post(
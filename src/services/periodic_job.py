@@ -0,0 +1,45 @@
+"""
+Trabajos periódicos en un hilo de la aplicación (expiración de suscripciones,
+conciliación de contadores de likes...).
+"""
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicJob:
+    """Hilo que ejecuta run_once al arrancar y luego cada interval segundos (0 lo desactiva)."""
+
+    name = "periodic-job"
+
+    def __init__(self, session_factory, interval: float) -> None:
+        self.session_factory = session_factory
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+
+    def run_once(self):
+        raise NotImplementedError
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                # Se reintenta en el siguiente intervalo
+                logger.exception("Falló el trabajo periódico %s", self.name)
+            self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
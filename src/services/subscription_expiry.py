@@ -0,0 +1,102 @@
+"""
+Expiración de suscripciones en bloque.
+
+Los usuarios que no son administradores pasan a rol 1 cuando su suscripción
+vence (o no tiene fecha). En lugar de hacerlo al leer cada usuario, una sola
+sentencia actualiza todas las filas vencidas:
+
+    UPDATE users SET role_id = 1
+    WHERE role_id <> 4 AND role_id <> 1 AND (final_date IS NULL OR final_date < :hoy)
+
+Entre dos ejecuciones las lecturas ya ven el rol vigente (User.effective_role
+y effective_role_id), así que el intervalo solo decide cuándo se escribe.
+
+La aplicación lo ejecuta en un hilo cada SUBSCRIPTION_EXPIRY_INTERVAL segundos
+(0 lo desactiva, p. ej. si se programa con cron):
+
+    python -m src.services.subscription_expiry
+"""
+import logging
+import os
+import time
+from datetime import date
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import or_, update
+
+from src.models.user import User
+from src.services.periodic_job import PeriodicJob
+
+SUBSCRIPTION_EXPIRY_INTERVAL = float(os.getenv("SUBSCRIPTION_EXPIRY_INTERVAL", "3600"))
+
+SUBSCRIPTION_EXPIRY_RUNS = Counter(
+    "subscription_expiry_runs_total",
+    "Ejecuciones del trabajo de expiración de suscripciones por resultado (ok/error)",
+    ["result"],
+)
+SUBSCRIPTION_EXPIRY_USERS = Counter(
+    "subscription_expiry_users_total",
+    "Usuarios que han pasado a rol 1 por suscripción vencida",
+)
+SUBSCRIPTION_EXPIRY_DURATION = Histogram(
+    "subscription_expiry_duration_seconds",
+    "Duración del UPDATE de expiración de suscripciones",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+SUBSCRIPTION_EXPIRY_LAST_SUCCESS = Gauge(
+    "subscription_expiry_last_success_timestamp_seconds",
+    "Momento (epoch) de la última ejecución correcta",
+)
+
+logger = logging.getLogger(__name__)
+
+
+def expire_subscriptions(db, today: date = None) -> int:
+    """Pasar a rol 1 a los usuarios con la suscripción vencida; devuelve cuántos."""
+    today = today or date.today()
+    start = time.perf_counter()
+    try:
+        result = db.execute(
+            update(User)
+            .where(
+                User.role_id != 4,
+                User.role_id != 1,
+                or_(User.final_date.is_(None), User.final_date < today),
+            )
+            .values(role_id=1)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        SUBSCRIPTION_EXPIRY_RUNS.labels("error").inc()
+        raise
+    finally:
+        SUBSCRIPTION_EXPIRY_DURATION.observe(time.perf_counter() - start)
+    SUBSCRIPTION_EXPIRY_RUNS.labels("ok").inc()
+    SUBSCRIPTION_EXPIRY_USERS.inc(result.rowcount)
+    SUBSCRIPTION_EXPIRY_LAST_SUCCESS.set_to_current_time()
+    return result.rowcount
+
+
+class SubscriptionExpiryJob(PeriodicJob):
+    """Hilo que ejecuta expire_subscriptions al arrancar y luego cada interval segundos."""
+
+    name = "subscription-expiry"
+
+    def __init__(self, session_factory, interval: float = SUBSCRIPTION_EXPIRY_INTERVAL) -> None:
+        super().__init__(session_factory, interval)
+
+    def run_once(self) -> int:
+        with self.session_factory() as db:
+            expired = expire_subscriptions(db)
+        if expired:
+            logger.info("Suscripciones vencidas: %d usuarios pasan a rol 1", expired)
+        return expired
+
+
+if __name__ == "__main__":
+    from src.config.database import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    SubscriptionExpiryJob(SessionLocal, interval=0).run_once()
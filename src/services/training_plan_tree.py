@@ -0,0 +1,207 @@
+"""
+Árbol completo de un plan de entrenamiento y su caché.
+
+GET /training_plan/{id}/tree devuelve en una sola respuesta el plan, su
+etiqueta, sus días (WorkoutDayExercise), las configuraciones de cada día y los
+ejercicios que usan, en lugar de una petición por plan, por días y por cada
+configuración. El árbol se carga en un número fijo de consultas
+(TrainingPlanRepository.get_training_plan_tree) y se guarda serializado en el
+almacén compartido (src/config/shared_store.py) durante PLAN_TREE_CACHE_TTL
+segundos.
+
+Invalidación: al guardar un árbol se registra de qué filas depende (días,
+ejercicios y etiqueta) en conjuntos ptree:dep:{tipo}:{id}. Los eventos de la
+sesión anotan qué planes, días, configuraciones, ejercicios o etiquetas cambian
+en cada flush y, tras el commit, se borran los árboles afectados y se incrementa
+su generación (ptree:gen:{id}). Un árbol solo se guarda si la generación no
+cambió durante la carga, así una lectura que empezó antes de la escritura no
+vuelve a dejar el árbol anterior; la carga se hace en la primaria para no leer
+una réplica con retraso justo después del commit. Las escrituras
+en bloque que no pasan por la sesión (Query.delete, update()) solo se ven si
+también cambia el día o el plan en la misma transacción; si no, caducan por TTL.
+Con REDIS_URL vacía la caché es del proceso y los demás workers no ven la
+invalidación hasta el TTL.
+"""
+import json
+import os
+
+from fastapi.encoders import jsonable_encoder
+from prometheus_client import Counter
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from src.config.routing_session import use_primary
+from src.config.shared_store import redis_client
+from src.models.exercise import Exercise
+from src.models.exercise_configuration import ExerciseConfiguration
+from src.models.tag_of_training_plan import TagOfTrainingPlan
+from src.models.training_plan import TrainingPlan
+from src.models.workout_day_exercise import WorkoutDayExercise
+from src.repositories.training_plan import TrainingPlanRepository
+from src.schemas.training_plan import TrainingPlan as TrainingPlanSchema
+
+PLAN_TREE_CACHE_TTL = int(os.getenv("PLAN_TREE_CACHE_TTL", "300"))
+
+PLAN_TREE_CACHE_REQUESTS = Counter(
+    "training_plan_tree_cache_requests_total",
+    "Consultas a la caché de árboles de planes por resultado (hit/miss)",
+    ["result"],
+)
+PLAN_TREE_CACHE_INVALIDATIONS = Counter(
+    "training_plan_tree_cache_invalidations_total",
+    "Árboles de planes borrados de la caché por escrituras",
+)
+
+# Clave de session.info con las dependencias modificadas pendientes de commit
+PENDING_KEY = "training_plan_tree_invalidations"
+
+
+def build_training_plan_tree(plan: TrainingPlan) -> dict:
+    """Serializar un plan cargado con get_training_plan_tree."""
+    tag = plan.tags_of_training_plans
+    days = sorted(plan.workout_day_exercises, key=lambda day: (day.week_day_id or 0, day.id))
+    return jsonable_encoder({
+        **{field: getattr(plan, field) for field in TrainingPlanSchema.model_fields},
+        "tag": tag.to_dict() if tag else None,
+        "workout_days": [
+            {
+                **day.to_dict(),
+                "exercise_configurations": [
+                    {**configuration.to_dict(), "exercise": configuration.exercises.to_dict() if configuration.exercises else None}
+                    for configuration in sorted(day.exercise_configurations, key=lambda configuration: configuration.id)
+                ],
+            }
+            for day in days
+        ],
+    })
+
+
+def tree_dependencies(tree: dict) -> set:
+    """Filas de las que depende el árbol, como pares (tipo, id)."""
+    dependencies = {("plan", tree["id"])}
+    if tree["tag"]:
+        dependencies.add(("tag", tree["tag"]["id"]))
+    for day in tree["workout_days"]:
+        dependencies.add(("day", day["id"]))
+        for configuration in day["exercise_configurations"]:
+            if configuration["exercise"]:
+                dependencies.add(("exercise", configuration["exercise"]["id"]))
+    return dependencies
+
+
+class TrainingPlanTreeCache:
+    """Árboles de planes serializados en el almacén compartido, con índice inverso de dependencias."""
+
+    def __init__(self, client, ttl: int = PLAN_TREE_CACHE_TTL, prefix: str = "ptree") -> None:
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def _tree_key(self, plan_id: int) -> str:
+        return f"{self.prefix}:plan:{plan_id}"
+
+    def _dependency_key(self, kind: str, id: int) -> str:
+        return f"{self.prefix}:dep:{kind}:{id}"
+
+    def _generation_key(self, plan_id: int) -> str:
+        return f"{self.prefix}:gen:{plan_id}"
+
+    def generation(self, plan_id: int) -> int:
+        """Número de invalidaciones recientes del árbol del plan."""
+        return int(self.client.get(self._generation_key(plan_id)) or 0)
+
+    def get(self, plan_id: int):
+        value = self.client.get(self._tree_key(plan_id)) if self.ttl > 0 else None
+        PLAN_TREE_CACHE_REQUESTS.labels("hit" if value is not None else "miss").inc()
+        return json.loads(value) if value is not None else None
+
+    def put(self, tree: dict, generation: int = None) -> None:
+        """Guardar el árbol; con generation, solo si no se ha invalidado desde que empezó la carga."""
+        if self.ttl <= 0:
+            return
+        if generation is not None and self.generation(tree["id"]) != generation:
+            return
+        for kind, id in tree_dependencies(tree):
+            if kind == "plan":
+                continue
+            key = self._dependency_key(kind, id)
+            self.client.sadd(key, tree["id"])
+            self.client.expire(key, self.ttl)
+        self.client.set(self._tree_key(tree["id"]), json.dumps(tree), ex=self.ttl)
+
+    def get_or_load(self, db, plan_id: int):
+        """Árbol del plan desde la caché o desde la base de datos; None si el plan no existe."""
+        tree = self.get(plan_id)
+        if tree is None:
+            generation = self.generation(plan_id)
+            plan = TrainingPlanRepository(use_primary(db)).get_training_plan_tree(plan_id)
+            if plan is None:
+                return None
+            tree = build_training_plan_tree(plan)
+            self.put(tree, generation)
+        return tree
+
+    def invalidate(self, dependencies: set) -> None:
+        """Borrar los árboles que dependen de alguna de las filas (tipo, id)."""
+        plan_ids, keys = set(), []
+        for kind, id in dependencies:
+            if kind == "plan":
+                plan_ids.add(id)
+                continue
+            key = self._dependency_key(kind, id)
+            plan_ids.update(int(member) for member in self.client.smembers(key))
+            keys.append(key)
+        for plan_id in plan_ids:
+            # La generación dura lo que un árbol en caché: basta para descartar cargas en curso
+            self.client.incr(self._generation_key(plan_id))
+            self.client.expire(self._generation_key(plan_id), self.ttl)
+        keys += [self._tree_key(plan_id) for plan_id in plan_ids]
+        if keys:
+            self.client.delete(*keys)
+            PLAN_TREE_CACHE_INVALIDATIONS.inc(len(plan_ids))
+
+
+training_plan_tree_cache = TrainingPlanTreeCache(redis_client(os.getenv("REDIS_URL")))
+
+
+def _values(obj, attribute: str) -> set:
+    """Valor actual y anterior (si cambió en este flush) de un atributo."""
+    history = inspect(obj).attrs[attribute].history
+    return {value for value in (getattr(obj, attribute), *history.deleted) if value is not None}
+
+
+def changed_dependencies(obj) -> set:
+    """Pares (tipo, id) de los árboles a los que afecta escribir obj."""
+    if isinstance(obj, TrainingPlan):
+        return {("plan", obj.id)}
+    if isinstance(obj, WorkoutDayExercise):
+        return {("day", obj.id)} | {("plan", id) for id in _values(obj, "training_plan_id")}
+    if isinstance(obj, ExerciseConfiguration):
+        return {("day", id) for id in _values(obj, "workout_day_exercise_id")}
+    if isinstance(obj, Exercise):
+        return {("exercise", obj.id)}
+    if isinstance(obj, TagOfTrainingPlan):
+        return {("tag", obj.id)}
+    return set()
+
+
+@event.listens_for(Session, "after_flush")
+def collect_training_plan_tree_changes(session, flush_context):
+    """Anotar las dependencias escritas en el flush; se invalidan tras el commit."""
+    dependencies = set()
+    for obj in (*session.new, *session.deleted, *(obj for obj in session.dirty if session.is_modified(obj))):
+        dependencies |= changed_dependencies(obj)
+    if dependencies:
+        session.info.setdefault(PENDING_KEY, set()).update(dependencies)
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_training_plan_trees(session):
+    dependencies = session.info.pop(PENDING_KEY, None)
+    if dependencies:
+        training_plan_tree_cache.invalidate(dependencies)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_training_plan_tree_changes(session, previous_transaction):
+    session.info.pop(PENDING_KEY, None)
@@ -4,16 +4,23 @@ Pruebas unitarias para el repositorio de autenticación.
 import pytest
 from unittest.mock import MagicMock, patch
 from fastapi import HTTPException, status
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from src.repositories.auth import AuthRepository
 from src.schemas.user import User as UserCreateSchema, UserLogin as UserLoginSchema
 from src.models.user import User as UserModel
+from src.auth.jwt_handler import JWTHandler
+from src.auth.password_hasher import PasswordHasher
+from src.config.database import Base
+from src.config.query_stats import track_queries
 
 @pytest.fixture
 def auth_repo():
     """Fixture para crear una instancia del repositorio de autenticación."""
-    return AuthRepository()
+    return AuthRepository(MagicMock())
 
 @pytest.fixture
 def mock_user():
@@ -25,6 +32,8 @@ def mock_user():
     user.id_number = "123456789"
     user.role_id = 1
     user.is_verified = True
+    user.final_date = None
+    user.gym_id = None
     user.status = True
     return user
 
@@ -65,14 +74,13 @@ def mock_user_model(self):
 class TestAuthRepository:
     """Pruebas para el repositorio de autenticación."""
 
-    @patch('src.repositories.auth.SessionLocal')
-    def test_register_user_existing(self, mock_session_local, auth_repo):
+    def test_register_user_existing(self, auth_repo):
         """Probar el registro de un usuario que ya existe."""
         # Configurar los mocks
         mock_db = MagicMock()
         mock_user = MagicMock()
         mock_db.query.return_value.filter.return_value.first.return_value = mock_user
-        mock_session_local.return_value = mock_db
+        auth_repo.db = mock_db
 
         # Crear datos de usuario
         user_data = UserCreateSchema(
@@ -94,13 +102,12 @@ class TestAuthRepository:
         assert excinfo.value.status_code == status.HTTP_400_BAD_REQUEST
         assert excinfo.value.detail == "El usuario ya existe"
 
-    @patch('src.repositories.auth.SessionLocal')
-    def test_verify_email_user_not_found(self, mock_session_local, auth_repo):
+    def test_verify_email_user_not_found(self, auth_repo):
         """Probar la verificación del correo electrónico de un usuario que no existe."""
         # Configurar los mocks
         mock_db = MagicMock()
         mock_db.query.return_value.filter.return_value.first.return_value = None
-        mock_session_local.return_value = mock_db
+        auth_repo.db = mock_db
 
         # Verificar que se lanza una excepción
         with pytest.raises(HTTPException) as excinfo:
@@ -109,8 +116,7 @@ class TestAuthRepository:
         assert excinfo.value.status_code == status.HTTP_404_NOT_FOUND
         assert excinfo.value.detail == "Usuario no encontrado"
 
-    @patch('src.repositories.auth.SessionLocal')
-    def test_verify_email_invalid_code(self, mock_session_local, auth_repo):
+    def test_verify_email_invalid_code(self, auth_repo):
         """Probar la verificación del correo electrónico con un código inválido."""
         # Configurar los mocks
         mock_db = MagicMock()
@@ -118,7 +124,7 @@ class TestAuthRepository:
         mock_user.is_verified = False
         mock_user.verification_code = "123456"
         mock_db.query.return_value.filter.return_value.first.return_value = mock_user
-        mock_session_local.return_value = mock_db
+        auth_repo.db = mock_db
 
         # Verificar que se lanza una excepción
         with pytest.raises(HTTPException) as excinfo:
@@ -127,13 +133,12 @@ class TestAuthRepository:
         assert excinfo.value.status_code == status.HTTP_400_BAD_REQUEST
         assert excinfo.value.detail == "Código de verificación inválido"
 
-    @patch('src.repositories.auth.SessionLocal')
-    def test_change_password_user_not_found(self, mock_session_local, auth_repo):
+    def test_change_password_user_not_found(self, auth_repo):
         """Probar el cambio de contraseña de un usuario que no existe."""
         # Configurar los mocks
         mock_db = MagicMock()
         mock_db.query.return_value.filter.return_value.first.return_value = None
-        mock_session_local.return_value = mock_db
+        auth_repo.db = mock_db
 
         # Verificar que se lanza una excepción
         with pytest.raises(HTTPException) as excinfo:
@@ -146,16 +151,15 @@ class TestAuthRepository:
         assert excinfo.value.status_code == status.HTTP_404_NOT_FOUND
         assert excinfo.value.detail == "Usuario no encontrado"
 
-    @patch('src.repositories.auth.SessionLocal')
     @patch('src.repositories.auth.auth_handler')
-    def test_change_password_invalid_current(self, mock_auth_handler, mock_session_local, auth_repo):
+    def test_change_password_invalid_current(self, mock_auth_handler, auth_repo):
         """Probar el cambio de contraseña con la contraseña actual incorrecta."""
         # Configurar los mocks
         mock_db = MagicMock()
         mock_user = MagicMock()
         mock_user.password = "hashed_password"
         mock_db.query.return_value.filter.return_value.first.return_value = mock_user
-        mock_session_local.return_value = mock_db
+        auth_repo.db = mock_db
         mock_auth_handler.verify_password.return_value = False
 
         # Verificar que se lanza una excepción
@@ -169,15 +173,14 @@ class TestAuthRepository:
         assert excinfo.value.status_code == status.HTTP_401_UNAUTHORIZED
         assert excinfo.value.detail == "Contraseña actual incorrecta"
 
-    @patch('src.repositories.auth.SessionLocal')
-    def test_reset_password_invalid_code(self, mock_session_local, auth_repo):
+    def test_reset_password_invalid_code(self, auth_repo):
         """Probar el restablecimiento de contraseña con un código inválido."""
         # Configurar los mocks
         mock_db = MagicMock()
         mock_user = MagicMock()
         mock_user.verification_code = "123456"
         mock_db.query.return_value.filter.return_value.first.return_value = mock_user
-        mock_session_local.return_value = mock_db
+        auth_repo.db = mock_db
 
         # Verificar que se lanza una excepción
         with pytest.raises(HTTPException) as excinfo:
@@ -187,4 +190,28 @@ class TestAuthRepository:
                 reset_code="654321"
             )
 
-        assert excinfo.value.status_code == status.HTTP_400_BAD_REQUEST 
\ No newline at end of file
+        assert excinfo.value.status_code == status.HTTP_400_BAD_REQUEST 
+
+    def test_login_single_query_without_writes(self):
+        """Probar que el login hace una sola consulta y no degrada el rol en la base de datos."""
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=engine)
+        handler = JWTHandler("test_secret", "HS256", hasher=PasswordHasher(rounds=4, workers=1))
+        db = sessionmaker(bind=engine)()
+        db.add(UserModel(
+            email="test@example.com", name="Test User", id_number="123456789", role_id=2,
+            password=handler.hash_password("secret123"), status=True, is_verified=True,
+            final_date=date.today() - timedelta(days=1),
+        ))
+        db.commit()
+        db.expunge_all()
+
+        with patch('src.repositories.auth.auth_handler', handler), track_queries() as stats:
+            access_token, _ = AuthRepository(db).login_user(UserLoginSchema(email="test@example.com", password="secret123"))
+
+        assert stats.count == 1
+        assert stats.statements[0].lstrip().upper().startswith("SELECT")
+        assert handler.decode_token(access_token)["user.role"] == 1
+        assert not db.dirty
+        db.close()
+
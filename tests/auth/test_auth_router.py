@@ -3,7 +3,7 @@ Pruebas unitarias para los endpoints de autenticación.
 """
 import pytest
 from unittest.mock import MagicMock, patch
-from fastapi import status
+from fastapi import HTTPException, status
 from fastapi.testclient import TestClient
 
 from src.routers.auth import auth_router
@@ -28,6 +28,12 @@ def mock_auth_handler():
     with patch('src.routers.auth.auth_handler') as mock:
         yield mock
 
+@pytest.fixture
+def mock_principal_handler():
+    """Fixture para crear un mock del manejador JWT con el que se resuelve el usuario autenticado."""
+    with patch('src.auth.principal.auth_handler') as mock:
+        yield mock
+
 class TestAuthRouter:
     """Clase para probar los endpoints de autenticación."""
     
@@ -76,19 +82,19 @@ class TestAuthRouter:
     def test_refresh_token_success(self, client, mock_auth_handler):
         """Probar la actualización exitosa del token."""
         # Configurar el mock del manejador JWT
-        mock_auth_handler.refresh_token.return_value = "new_access_token"
+        mock_auth_handler.refresh_token.return_value = ("new_access_token", "new_refresh_token")
         
         # Realizar la solicitud
         response = client.get("/refresh_token", headers={"Authorization": "Bearer refresh_token"})
         
         # Verificar la respuesta
         assert response.status_code == status.HTTP_200_OK
-        assert response.json() == {"access_token": "new_access_token"}
+        assert response.json() == {"access_token": "new_access_token", "refresh_token": "new_refresh_token"}
     
-    def test_get_user_data_success(self, client, mock_auth_handler):
+    def test_get_user_data_success(self, client, mock_principal_handler):
         """Probar la obtención exitosa de datos del usuario."""
         # Configurar el mock del manejador JWT
-        mock_auth_handler.decode_token.return_value = {
+        mock_principal_handler.decode_token.return_value = {
             "sub": "test@example.com",
             "user.name": "Test User"
         }
@@ -101,15 +107,17 @@ class TestAuthRouter:
         assert response.json()["message"] == "User found"
         assert response.json()["data"]["sub"] == "test@example.com"
     
-    def test_get_user_data_error(self, client, mock_auth_handler):
-        """Probar la obtención de datos del usuario con error."""
+    def test_get_user_data_error(self, client, mock_principal_handler):
+        """Probar la obtención de datos del usuario con un token inválido."""
         # Configurar el mock del manejador JWT para simular un error
-        mock_auth_handler.decode_token.side_effect = Exception("Invalid token")
+        mock_principal_handler.decode_token.side_effect = HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token"
+        )
         
-        # Realizar la solicitud
-        response = client.get("/user_data", headers={"Authorization": "Bearer token"})
+        # El error de la dependencia llega sin convertir (el cliente envuelve solo el router)
+        with pytest.raises(HTTPException) as exc:
+            client.get("/user_data", headers={"Authorization": "Bearer token"})
         
-        # Verificar la respuesta
-        assert response.status_code == status.HTTP_200_OK
-        assert response.json()["message"] == "Invalid token"
-        assert response.json()["data"] is None 
\ No newline at end of file
+        # Verificar el error
+        assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
+        assert exc.value.detail == "Invalid token" 
\ No newline at end of file
@@ -30,6 +30,8 @@ def mock_user():
     user.role_id = 1
     user.status = True
     user.is_verified = True
+    user.final_date = None
+    user.gym_id = None
     return user
 
 class TestHasAccess:
@@ -1,6 +1,7 @@
 """
 Pruebas unitarias para el manejador JWT.
 """
+import calendar
 import pytest
 from unittest.mock import MagicMock, patch
 from datetime import datetime, timedelta
@@ -28,6 +29,8 @@ def mock_user():
     user.role_id = 1
     user.status = True
     user.is_verified = True
+    user.final_date = None
+    user.gym_id = None
     return user
 
 class TestJWTHandler:
@@ -68,6 +71,22 @@ class TestJWTHandler:
         assert payload["user.status"] == mock_user.status
         assert payload["user.is_verified"] == mock_user.is_verified
         assert payload["scope"] == "access_token"
+
+    def test_encode_token_caps_expiration_at_subscription_end(self, jwt_handler, mock_user):
+        """Probar que el token lleva la suscripción y el gimnasio y no dura más que la suscripción."""
+        mock_user.role_id = 3
+        mock_user.gym_id = 7
+        mock_user.final_date = datetime.utcnow().date() - timedelta(days=1)
+        token = jwt_handler.encode_token(mock_user)
+        payload = jwt.decode(token, TEST_SECRET, algorithms=[TEST_ALGORITHM], options={"verify_exp": False})
+
+        assert payload["user.final_date"] == mock_user.final_date.isoformat()
+        assert payload["user.gym_id"] == 7
+        end_of_subscription = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+        assert payload["exp"] == calendar.timegm(end_of_subscription.utctimetuple())
+        with pytest.raises(HTTPException) as excinfo:
+            jwt_handler.decode_token(token)
+        assert excinfo.value.detail == "Token expired"
     
     def test_encode_refresh_token(self, jwt_handler, mock_user):
         """Probar la codificación de token de actualización."""
@@ -126,13 +145,13 @@ class TestJWTHandler:
         with patch('src.auth.jwt_handler.UserRepository') as mock_user_repo:
             mock_user_repo_instance = MagicMock()
             mock_user_repo.return_value = mock_user_repo_instance
-            mock_user_repo_instance.get_user_by_email.return_value = mock_user
+            mock_user_repo_instance.get_login_data.return_value = mock_user
             
             # Configurar la sesión de base de datos
             jwt_handler.db = MagicMock()
             
             # Actualizar el token
-            new_token = jwt_handler.refresh_token(refresh_token)
+            new_token, _ = jwt_handler.refresh_token(refresh_token)
             
             # Verificar que se generó un nuevo token de acceso
             decoded = jwt.decode(new_token, TEST_SECRET, algorithms=[TEST_ALGORITHM])
@@ -0,0 +1,43 @@
+"""
+Pruebas del pool de bcrypt.
+"""
+import threading
+
+import pytest
+from fastapi import HTTPException, status
+
+from src.auth.jwt_handler import JWTHandler
+from src.auth.password_hasher import HasherBusyError, PasswordHasher
+
+@pytest.fixture
+def hasher():
+    """Fixture con un pool de un hilo, sin cola y coste mínimo."""
+    return PasswordHasher(rounds=4, workers=1, max_queue=0)
+
+class TestPasswordHasher:
+    """Clase para probar el hash de contraseñas fuera del hilo de la petición."""
+
+    def test_hash_uses_configured_rounds(self, hasher):
+        """Probar que el hash usa el coste configurado y se verifica correctamente."""
+        hashed = hasher.hash("password123")
+
+        assert hashed.startswith("$2b$04$")
+        assert hasher.verify("password123", hashed) is True
+        assert hasher.verify("otra", hashed) is False
+
+    def test_full_queue_is_rejected(self, hasher):
+        """Probar que con la cola llena se rechaza la operación y el manejador responde 503."""
+        release = threading.Event()
+        blocked = hasher._submit(release.wait)
+        try:
+            with pytest.raises(HasherBusyError):
+                hasher.hash("password123")
+            with pytest.raises(HTTPException) as error:
+                JWTHandler("secret", "HS256", hasher=hasher).verify_password("password123", "hash")
+            assert error.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        finally:
+            release.set()
+        blocked.result()
+
+        assert hasher.pending == 0
+        assert hasher.hash("password123")
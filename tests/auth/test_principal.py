@@ -0,0 +1,116 @@
+"""
+Pruebas del usuario autenticado y las guardas de rol.
+"""
+from typing import Annotated
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import Depends, FastAPI, status
+from fastapi.testclient import TestClient
+
+from src.auth.jwt_handler import JWTHandler
+from src.auth.principal import AuthorizationError, Principal, authorization_error_handler, require_role
+from src.config.database import get_db
+from src.routers.profile import profile_router
+from src.repositories.training_plan import can_manage_training_plan
+
+@pytest.fixture
+def jwt_handler():
+    """Fixture con un manejador JWT de prueba en lugar del global."""
+    handler = JWTHandler("test_secret", "HS256")
+    with patch("src.auth.principal.auth_handler", handler):
+        yield handler
+
+@pytest.fixture
+def client(jwt_handler):
+    """Fixture con una aplicación que protege una ruta con require_role(2)."""
+    app = FastAPI()
+    app.add_exception_handler(AuthorizationError, authorization_error_handler)
+
+    @app.get("/premium")
+    def premium(principal: Annotated[Principal, Depends(require_role(2))]):
+        return {"email": principal.email, "role": principal.role}
+
+    return TestClient(app)
+
+def make_token(jwt_handler, role_id=2, active=True):
+    """Token de acceso para un usuario con el rol y estado indicados."""
+    user = MagicMock()
+    user.email = "test@example.com"
+    user.name = "Test User"
+    user.id_number = "123456789"
+    user.role_id = role_id
+    user.status = active
+    user.is_verified = True
+    user.final_date = None
+    user.gym_id = None
+    return jwt_handler.encode_token(user)
+
+class TestRequireRole:
+    """Clase para probar las guardas declarativas de rol."""
+
+    def test_allows_enough_role(self, client, jwt_handler):
+        """Probar que un usuario activo con el rol necesario accede."""
+        response = client.get("/premium", headers={"Authorization": f"Bearer {make_token(jwt_handler)}"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"email": "test@example.com", "role": 2}
+
+    def test_rejects_low_role(self, client, jwt_handler):
+        """Probar que un rol insuficiente recibe 403 con el formato de la API."""
+        response = client.get("/premium", headers={"Authorization": f"Bearer {make_token(jwt_handler, role_id=1)}"})
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.json() == {"message": "You do not have the necessary permissions", "data": None}
+
+    def test_rejects_inactive_account(self, client, jwt_handler):
+        """Probar que una cuenta inactiva no accede aunque tenga el rol."""
+        response = client.get("/premium", headers={"Authorization": f"Bearer {make_token(jwt_handler, active=False)}"})
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.json() == {"message": "Your account is inactive", "data": None}
+
+    def test_inactive_account_reads_profile(self, jwt_handler):
+        """Probar que una cuenta inactiva puede seguir consultando los perfiles."""
+        app = FastAPI()
+        app.add_exception_handler(AuthorizationError, authorization_error_handler)
+        app.include_router(profile_router, prefix="/profile")
+        app.dependency_overrides[get_db] = lambda: MagicMock()
+        token = make_token(jwt_handler, role_id=1, active=False)
+
+        with patch("src.routers.profile.ProfileRepository") as repository:
+            repository.return_value.get_all_profile.return_value = []
+            response = TestClient(app).get("/profile", headers={"Authorization": f"Bearer {token}"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+
+    def test_rejects_missing_token(self, client):
+        """Probar que sin token se responde 401 y no 403."""
+        response = client.get("/premium")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.json() == {"message": "Not authenticated", "data": None}
+
+class TestClaimPermissions:
+    """Clase para probar los permisos de escritura decididos con los claims del token."""
+
+    def test_owner_and_admin_without_queries(self):
+        """Probar que dueño y administrador no consultan la relación usuario-gimnasio."""
+        plan = MagicMock(user_email="owner@example.com", is_gym_created=False)
+        user_gym_repo = MagicMock()
+
+        assert can_manage_training_plan(plan, Principal("owner@example.com", 2, True, True), user_gym_repo)
+        assert can_manage_training_plan(plan, Principal("admin@example.com", 4, True, True), user_gym_repo)
+        assert not can_manage_training_plan(plan, Principal("other@example.com", 2, True, True), user_gym_repo)
+        user_gym_repo.get_user_gym.assert_not_called()
+
+    def test_gym_uses_gym_id_claim(self):
+        """Probar que el gimnasio se identifica con el claim gym_id sin buscarlo por email."""
+        plan = MagicMock(user_email="member@example.com", is_gym_created=True, user_gym_id=5)
+        user_gym_repo = MagicMock()
+        user_gym_repo.get_user_gym.return_value = MagicMock(id=5, is_active=True)
+        principal = Principal.from_payload({"sub": "gym@example.com", "user.role": 3, "user.status": True, "user.gym_id": 9})
+
+        assert can_manage_training_plan(plan, principal, user_gym_repo)
+        user_gym_repo.get_user_gym.assert_called_once_with("member@example.com", 9)
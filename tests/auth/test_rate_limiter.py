@@ -0,0 +1,87 @@
+"""
+Pruebas del límite de peticiones de las rutas de autenticación.
+"""
+import pytest
+from fastapi import Body, Depends, FastAPI, status
+from fastapi.testclient import TestClient
+
+from src.auth.rate_limiter import (
+    MemoryRateLimitBackend, RateLimitExceeded, RateLimitPolicy, RedisRateLimitBackend, build_rate_limiter,
+    rate_limit_error_handler
+)
+from src.config.shared_store import LocalRedis
+
+POLICIES = {"login": {"ip": "5/60", "email": "2/60"}, "forgot_password": {"email": "1/60"}}
+
+@pytest.fixture(params=["memory", "redis"])
+def client(request):
+    """Fixture con una aplicación limitada por cada backend (Redis sobre LocalRedis)."""
+    limiter = build_rate_limiter("memory", POLICIES)
+    if request.param == "redis":
+        limiter.backend = RedisRateLimitBackend(LocalRedis())
+    app = FastAPI()
+    app.add_exception_handler(RateLimitExceeded, rate_limit_error_handler)
+
+    @app.post("/login", dependencies=[Depends(limiter.limit("login"))])
+    def login(data: dict = Body(...)):
+        return {"email": data["email"]}
+
+    @app.post("/forgot_password", dependencies=[Depends(limiter.limit("forgot_password"))])
+    def forgot_password(email: str = Body(...)):
+        return {"email": email}
+
+    return TestClient(app)
+
+class TestRateLimiter:
+    """Clase para probar las políticas por IP y por email."""
+
+    def test_email_limit_with_retry_after(self, client):
+        """Probar que al superar el límite por email se responde 429 con Retry-After."""
+        for _ in range(2):
+            assert client.post("/login", json={"email": "Test@example.com"}).status_code == status.HTTP_200_OK
+
+        response = client.post("/login", json={"email": "test@example.com"})
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response.json() == {"message": "Too many requests, try again later", "data": None}
+        assert 1 <= int(response.headers["Retry-After"]) <= 60
+
+        # Otro email sigue entrando hasta agotar el límite por IP
+        for i in range(2):
+            assert client.post("/login", json={"email": f"other{i}@example.com"}).status_code == status.HTTP_200_OK
+        assert client.post("/login", json={"email": "another@example.com"}).status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_plain_email_body(self, client):
+        """Probar que se reconoce el email enviado como cadena en el cuerpo."""
+        assert client.post("/forgot_password", json="test@example.com").status_code == status.HTTP_200_OK
+        assert client.post("/forgot_password", json="test@example.com").status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert client.post("/forgot_password", json="other@example.com").status_code == status.HTTP_200_OK
+
+class TestMemoryBackend:
+    """Clase para probar el token bucket en memoria."""
+
+    def test_refills_over_time(self, monkeypatch):
+        """Probar que el cubo se rellena al ritmo limit/window."""
+        now = [1000.0]
+        monkeypatch.setattr("time.monotonic", lambda: now[0])
+        backend = MemoryRateLimitBackend()
+        policy = RateLimitPolicy.parse("2/10")
+
+        assert [backend.hit("k", policy) for _ in range(3)] == [0, 0, 5]
+        now[0] += 5
+        assert backend.hit("k", policy) == 0
+        assert backend.hit("k", policy) == 5
+
+    def test_flood_of_keys_keeps_active_limits(self, monkeypatch):
+        """Probar que una avalancha de claves nuevas no reinicia el límite de una clave activa."""
+        now = [1000.0]
+        monkeypatch.setattr("time.monotonic", lambda: now[0])
+        backend = MemoryRateLimitBackend(max_keys=10)
+        slow, fast = RateLimitPolicy.parse("1/3600"), RateLimitPolicy.parse("5/1")
+
+        assert backend.hit("slow", slow) == 0
+        for i in range(30):
+            now[0] += 2
+            # La ventana corta de las claves nuevas no debe olvidar el cubo de la ventana larga
+            backend.hit(f"flood{i}", fast)
+            assert backend.hit("slow", slow) > 0
+        assert len(backend._buckets) <= 10
@@ -0,0 +1,71 @@
+"""
+Pruebas de la caché de tokens verificados.
+"""
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException, status
+
+from src.auth.jwt_handler import JWTHandler
+from src.auth.token_cache import TokenCache
+
+@pytest.fixture
+def jwt_handler():
+    """Fixture con un manejador JWT y una caché pequeña."""
+    return JWTHandler("test_secret", "HS256", token_cache=TokenCache(max_size=2))
+
+@pytest.fixture
+def token(jwt_handler):
+    """Fixture con un token de acceso válido."""
+    user = MagicMock()
+    user.email = "test@example.com"
+    user.name = "Test User"
+    user.id_number = "123456789"
+    user.role_id = 1
+    user.status = True
+    user.is_verified = True
+    user.final_date = None
+    user.gym_id = None
+    return jwt_handler.encode_token(user)
+
+class TestTokenCache:
+    """Clase para probar la caché de payloads de tokens verificados."""
+
+    def test_second_decode_skips_verification(self, jwt_handler, token):
+        """Probar que el mismo token solo se verifica una vez."""
+        first = jwt_handler.decode_token(token)
+        with patch("src.auth.jwt_handler.jwt.decode") as decode:
+            second = jwt_handler.decode_token(token)
+
+        decode.assert_not_called()
+        assert second == first
+
+    def test_expired_entry_is_not_served(self, jwt_handler, token):
+        """Probar que una entrada no se usa pasado el exp del token."""
+        payload = jwt_handler.decode_token(token)
+        key = jwt_handler.token_cache.key(token)
+
+        with patch("src.auth.token_cache.time.time", return_value=payload["exp"]):
+            assert jwt_handler.token_cache.get(key) is None
+
+    def test_revoked_token_is_rejected(self, jwt_handler, token):
+        """Probar que un token revocado se rechaza aunque estuviera en caché."""
+        jwt_handler.decode_token(token)
+        jwt_handler.revoke_token(token)
+
+        with pytest.raises(HTTPException) as error:
+            jwt_handler.decode_token(token)
+
+        assert error.value.status_code == status.HTTP_401_UNAUTHORIZED
+        assert error.value.detail == "Token revoked"
+
+    def test_revoked_list_stays_bounded(self):
+        """Probar que la lista de revocados no pasa de su tamaño y descarta primero lo que antes caduca."""
+        cache = TokenCache(max_size=3)
+        now = time.time()
+        for i, ttl in enumerate((500, 100, 300, 400, 200)):
+            cache.revoke(bytes([i]), now + ttl)
+
+        assert len(cache._revoked) == 3
+        assert [cache.is_revoked(bytes([i])) for i in range(5)] == [True, False, False, True, True]
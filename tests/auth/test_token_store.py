@@ -0,0 +1,137 @@
+"""
+Pruebas de la rotación de tokens de actualización y la revocación en memoria.
+"""
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException, status
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.auth.jwt_handler import JWTHandler
+from src.auth.revocation import BloomFilter, RevocationList
+from src.auth.token_store import RedisTokenStore, SQLTokenStore
+from src.config.shared_store import LocalRedis
+from src.config.database import Base
+from src.config.migrations import load_models
+
+@pytest.fixture(params=["sql", "redis"])
+def token_store(request, tmp_path):
+    """Fixture con cada backend: un archivo SQLite y Redis sobre LocalRedis."""
+    if request.param == "redis":
+        yield RedisTokenStore(LocalRedis())
+        return
+    load_models()
+    # Una conexión por sesión: el refresco en segundo plano no comparte la de la petición
+    engine = create_engine(f"sqlite:///{tmp_path / 'tokens.sqlite'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    yield SQLTokenStore(sessionmaker(bind=engine))
+    engine.dispose()
+
+@pytest.fixture
+def db(token_store):
+    """Fixture con la sesión de la petición (la del almacén SQL, un mock con Redis)."""
+    if isinstance(token_store, SQLTokenStore):
+        with token_store.session_factory() as db:
+            yield db
+    else:
+        yield MagicMock()
+
+@pytest.fixture
+def jwt_handler(token_store):
+    """Fixture con un manejador JWT respaldado por el almacén."""
+    return JWTHandler("test_secret", "HS256", token_store=token_store)
+
+def make_user(email="test@example.com"):
+    """Datos de un usuario para los tokens."""
+    user = MagicMock()
+    user.email = email
+    user.name = "Test User"
+    user.id_number = "123456789"
+    user.role_id = 2
+    user.status = True
+    user.is_verified = True
+    user.final_date = None
+    user.gym_id = None
+    return user
+
+@pytest.fixture
+def user():
+    """Fixture con los datos de un usuario para los tokens."""
+    return make_user()
+
+def refresh(jwt_handler, user, refresh_token, db):
+    with patch("src.auth.jwt_handler.UserRepository") as user_repo:
+        user_repo.return_value.get_login_data.return_value = user
+        return jwt_handler.refresh_token(refresh_token, db)
+
+class TestTokenStore:
+    """Clase para probar la rotación y revocación de familias de tokens."""
+
+    def test_rotation_and_reuse_detection(self, jwt_handler, user, db):
+        """Probar que reutilizar un token ya rotado revoca toda la familia."""
+        access_token, refresh_token = jwt_handler.issue_tokens(user, db)
+        new_access_token, new_refresh_token = refresh(jwt_handler, user, refresh_token, db)
+        assert jwt_handler.decode_token(new_access_token)["sub"] == user.email
+
+        with pytest.raises(HTTPException) as excinfo:
+            refresh(jwt_handler, user, refresh_token, db)
+        assert excinfo.value.detail == "Refresh token reused"
+
+        for token in (access_token, new_access_token):
+            with pytest.raises(HTTPException) as excinfo:
+                jwt_handler.decode_token(token)
+            assert excinfo.value.status_code == status.HTTP_401_UNAUTHORIZED
+        with pytest.raises(HTTPException):
+            refresh(jwt_handler, user, new_refresh_token, db)
+
+    def test_logout_all_without_store_lookups(self, jwt_handler, token_store, user):
+        """Probar que cerrar todas las sesiones rechaza sus tokens sin consultar el almacén."""
+        sessions = [jwt_handler.issue_tokens(user) for _ in range(2)]
+        other_access_token, _ = jwt_handler.issue_tokens(make_user("other@example.com"))
+
+        jwt_handler.revocations.refresh()
+        jwt_handler.revoke_user(user.email)
+
+        with patch.object(token_store, "is_revoked") as is_revoked, patch.object(token_store, "revoked_ids") as revoked_ids:
+            for access_token, _ in sessions:
+                with pytest.raises(HTTPException):
+                    jwt_handler.decode_token(access_token)
+            assert jwt_handler.decode_token(other_access_token)["sub"] == "other@example.com"
+        is_revoked.assert_not_called()
+        revoked_ids.assert_not_called()
+
+    def test_other_instances_see_revocations_after_refresh(self, jwt_handler, token_store, user):
+        """Probar que otra instancia conoce las revocaciones al recargar la lista."""
+        access_token, _ = jwt_handler.issue_tokens(user)
+        other_instance = JWTHandler("test_secret", "HS256", token_store=token_store,
+                                    revocations=RevocationList(token_store, refresh_interval=60))
+        other_instance.revocations.refresh()
+        assert other_instance.decode_token(access_token)["sub"] == user.email
+
+        jwt_handler.revoke_token(access_token)
+        other_instance.token_cache = jwt_handler.token_cache.__class__()
+        other_instance.revocations._refreshed_at = time.monotonic() - 61
+
+        # La comprobación no consulta el almacén: lanza el refresco en segundo plano
+        with patch.object(token_store, "is_revoked") as is_revoked:
+            assert other_instance.revocations.is_revoked("other-family") is False
+            refresh_thread = other_instance.revocations._thread
+            if refresh_thread is not None:
+                refresh_thread.join()
+            with pytest.raises(HTTPException):
+                other_instance.decode_token(access_token)
+        is_revoked.assert_not_called()
+
+class TestBloomFilter:
+    """Clase para probar el filtro de Bloom de familias revocadas."""
+
+    def test_no_false_negatives(self):
+        """Probar que todo lo añadido se encuentra y casi nada más."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"family-{i}")
+
+        assert all(f"family-{i}" in bloom for i in range(1000))
+        assert sum(f"other-{i}" in bloom for i in range(10000)) < 300
@@ -0,0 +1,3 @@
+"""
+Paquete de pruebas unitarias para la configuración.
+""" 
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""
+Pruebas de la siembra de datos iniciales.
+"""
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from src.config.database_init import ROLES, SEED_NAME, SEEDS, WEEK_DAYS, init_data, init_roles, insert_ignore, seed_fingerprint
+from src.config.migrations import run_migrations
+from src.config.query_stats import track_queries
+from src.models.role import Role
+from src.models.seed_fingerprint import SeedFingerprint
+from src.models.week_day import WeekDay
+
+@pytest.fixture
+def db(tmp_path):
+    """Fixture con una sesión sobre un archivo SQLite migrado."""
+    url = f"sqlite:///{tmp_path / 'seed.sqlite'}"
+    run_migrations(url)
+    engine = create_engine(url)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+class TestDatabaseInit:
+    """Clase para probar la siembra idempotente de los catálogos."""
+
+    def test_seeders_are_idempotent(self, db):
+        """Probar que repetir un catálogo no duplica ni pisa filas existentes."""
+        db.add(Role(id=1, name="Renombrado", description="Rol cambiado a mano"))
+        db.commit()
+
+        init_roles(db)
+        init_roles(db)
+
+        assert db.scalar(select(func.count()).select_from(Role)) == len(ROLES)
+        assert db.get(Role, 1).name == "Renombrado"
+
+    def test_empty_catalog_is_skipped(self, db):
+        """Probar que un catálogo sin filas no ejecuta ninguna sentencia."""
+        with track_queries() as stats:
+            insert_ignore(db, Role, [])
+
+        assert stats.count == 0
+
+    def test_unchanged_fingerprint_skips_seeding(self, db):
+        """Probar que con la huella sin cambios la siembra cuesta una sola consulta."""
+        init_data(db)
+        with track_queries() as stats:
+            init_data(db)
+
+        assert stats.count == 1
+        assert db.scalar(select(func.count()).select_from(Role)) == len(ROLES)
+
+    def test_changed_seeds_are_applied(self, db):
+        """Probar que un cambio en los datos a sembrar vuelve a ejecutar la siembra."""
+        init_data(db)
+        init_data(db, SEEDS + [(WeekDay, WEEK_DAYS)])
+
+        assert db.scalar(select(func.count()).select_from(WeekDay)) == len(WEEK_DAYS)
+        stored = db.scalar(select(SeedFingerprint.fingerprint).where(SeedFingerprint.name == SEED_NAME))
+        assert stored == seed_fingerprint(SEEDS + [(WeekDay, WEEK_DAYS)])
@@ -0,0 +1,79 @@
+"""
+Pruebas unitarias para las métricas del pool y de las consultas.
+"""
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from src.config.metrics import InstrumentedQueuePool, instrument_engine
+from src.config.pool_monitor import PoolMonitor
+
+@pytest.fixture
+def engine(request):
+    """Fixture para crear un motor SQLite instrumentado con un nombre propio por prueba."""
+    engine = create_engine("sqlite://", poolclass=InstrumentedQueuePool, pool_size=2, max_overflow=1, pool_pre_ping=True, pool_recycle=1800)
+    monitor = PoolMonitor(leak_threshold=60)
+    factory = sessionmaker(bind=engine)
+    monitor.attach(engine, factory)
+    label = request.node.name
+    instrument_engine(engine, label, monitor)
+    yield engine, factory, label
+    engine.dispose()
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+class TestMetrics:
+    """Clase para probar la instrumentación del pool y del motor."""
+
+    def test_pool_checkout_and_gauges(self, engine):
+        """Probar que se miden el checkout, el pre-ping y el estado del pool."""
+        engine, _, label = engine
+
+        with engine.connect():
+            with engine.connect():
+                assert sample("db_pool_checked_out", engine=label) == 2
+        with engine.connect():
+            pass
+
+        assert sample("db_pool_checkout_wait_seconds_count", engine=label) == 3
+        assert sample("db_pool_pre_ping_seconds_count", engine=label) == 1
+        assert sample("db_pool_connections_opened_total", engine=label) == 2
+        assert sample("db_pool_size", engine=label) == 2
+        assert sample("db_pool_checked_out", engine=label) == 0
+        assert sample("db_pool_peak_checked_out", engine=label) == 2
+
+    def test_queries_by_route(self, engine):
+        """Probar que las consultas se cuentan por la ruta de la sesión."""
+        engine, factory, label = engine
+
+        with factory() as db:
+            db.info["route"] = "GET /exercise"
+            db.execute(text("SELECT 1"))
+            db.execute(text("SELECT 2"))
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 3"))
+
+        assert sample("db_query_duration_seconds_count", engine=label, route="GET /exercise") == 2
+        assert sample("db_query_duration_seconds_count", engine=label, route="desconocido") == 1
+
+    def test_recycled_connections(self, engine):
+        """Probar que se cuentan las conexiones recicladas por antigüedad."""
+        engine, _, label = engine
+
+        with engine.connect() as connection:
+            connection._dbapi_connection._connection_record.starttime -= 3600
+
+        with engine.connect():
+            pass
+
+        assert sample("db_pool_connections_recycled_total", engine=label) == 1
+        assert sample("db_pool_connections_opened_total", engine=label) == 2
+
+    def test_metrics_endpoint(self, client):
+        """Probar que /metrics expone el formato de texto de Prometheus."""
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "db_pool_checkout_wait_seconds" in response.text
@@ -0,0 +1,63 @@
+"""
+Pruebas de las migraciones de Alembic.
+"""
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect, text
+
+from src.config.database import Base
+from src.config.migrations import alembic_config, include_name, load_models, run_migrations
+
+@pytest.fixture
+def database_url(tmp_path):
+    """Fixture con la URL de un archivo SQLite vacío."""
+    return f"sqlite:///{tmp_path / 'migrations.sqlite'}"
+
+class TestMigrations:
+    """Clase para probar el esquema generado por las migraciones."""
+
+    def test_head_matches_models(self, database_url):
+        """Probar que la última revisión coincide con la metadata de los modelos."""
+        run_migrations(database_url)
+        load_models()
+
+        engine = create_engine(database_url)
+        with engine.connect() as connection:
+            diff = compare_metadata(MigrationContext.configure(connection, opts={"include_name": include_name}), Base.metadata)
+            indexes = {index["name"] for index in inspect(connection).get_indexes("history_pr_exercises")}
+        engine.dispose()
+
+        assert diff == []
+        assert "ix_history_pr_exercises_user_email_exercise_id_date" in indexes
+
+    def test_lookup_indexes_remove_duplicates(self, database_url):
+        """Probar que la revisión de índices elimina los likes repetidos antes de la restricción única."""
+        run_migrations(database_url, "0001")
+        engine = create_engine(database_url)
+        with engine.begin() as connection:
+            connection.execute(text("INSERT INTO likes (user_email, training_plan_id, is_like) VALUES ('a@a.com', 1, 1), ('a@a.com', 1, 0), ('b@b.com', 1, 1)"))
+
+        run_migrations(database_url)
+
+        with engine.connect() as connection:
+            rows = connection.execute(text("SELECT user_email, is_like FROM likes ORDER BY id")).all()
+        engine.dispose()
+        assert rows == [("a@a.com", 1), ("b@b.com", 1)]
+
+    def test_legacy_database_is_stamped(self, database_url):
+        """Probar que una base creada con create_all se marca con la revisión inicial y se actualiza."""
+        load_models()
+        engine = create_engine(database_url)
+        command.upgrade(alembic_config(database_url), "0001")
+        with engine.begin() as connection:
+            connection.execute(text("DROP TABLE alembic_version"))
+
+        run_migrations(database_url)
+
+        with engine.connect() as connection:
+            version = connection.execute(text("SELECT version_num FROM alembic_version")).scalar()
+        engine.dispose()
+        assert version == ScriptDirectory.from_config(alembic_config()).get_current_head()
@@ -0,0 +1,61 @@
+"""
+Pruebas unitarias para el monitor del pool de conexiones.
+"""
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from src.config.pool_monitor import PoolMonitor
+
+@pytest.fixture
+def engine():
+    """Fixture para crear un motor SQLite con un pool acotado."""
+    engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=2, max_overflow=0)
+    yield engine
+    engine.dispose()
+
+class TestPoolMonitor:
+    """Clase para probar el monitor del pool."""
+
+    def test_usage_counts_checkouts(self, engine):
+        """Probar que se cuentan las conexiones en uso y la capacidad."""
+        monitor = PoolMonitor(leak_threshold=60)
+        monitor.attach(engine)
+
+        with engine.connect():
+            assert monitor.usage()["checked_out"] == 1
+
+        usage = monitor.usage()
+        assert usage["checked_out"] == 0
+        assert usage["capacity"] == 2
+        assert usage["checkouts_total"] == 1
+        assert usage["leaks_total"] == 0
+
+    def test_leak_reports_route(self, engine):
+        """Probar que una sesión retenida se reporta con su ruta."""
+        monitor = PoolMonitor(leak_threshold=0)
+        factory = sessionmaker(bind=engine)
+        monitor.attach(engine, factory)
+
+        db = factory()
+        db.info["route"] = "GET /exercise"
+        db.execute(text("SELECT 1"))
+
+        leaked = monitor.check_leaks()
+        assert [route for route, _ in leaked] == ["GET /exercise"]
+        assert monitor.usage()["leaks_total"] == 1
+
+        db.close()
+        assert monitor.usage()["checked_out"] == 0
+        assert monitor.usage()["leaks_total"] == 1
+
+    def test_saturation_is_counted(self, engine):
+        """Probar que se cuenta cuando el pool supera el umbral de alerta."""
+        monitor = PoolMonitor(leak_threshold=60, alert_ratio=0.5)
+        monitor.attach(engine)
+
+        with engine.connect():
+            pass
+
+        assert monitor.usage()["saturation_total"] == 1
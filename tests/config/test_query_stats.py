@@ -0,0 +1,67 @@
+"""
+Pruebas del conteo de consultas SQL por petición.
+"""
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from src.config.query_stats import track_queries
+from src.middlewares.query_counter import QueryCounter
+
+class TestQueryStats:
+    """Clase para probar el conteo de sentencias y las cabeceras de respuesta."""
+
+    def test_track_queries_counts_statements(self, db_session):
+        """Probar que se cuentan solo las sentencias ejecutadas dentro del bloque."""
+        db_session.execute(text("SELECT 1"))
+        with track_queries() as stats:
+            db_session.execute(text("SELECT 1"))
+            db_session.execute(text("SELECT 2"))
+
+        assert stats.count == 2
+        assert stats.statements == ["SELECT 1", "SELECT 2"]
+        assert stats.duration > 0
+
+        with track_queries(max_statements=1) as stats:
+            db_session.execute(text("SELECT 1"))
+            db_session.execute(text("SELECT 2"))
+        assert stats.count == 2 and stats.statements == ["SELECT 1"]
+
+    def test_response_headers(self, client):
+        """Probar que la respuesta informa las consultas y el tiempo de base de datos."""
+        response = client.get("/role")
+
+        assert response.status_code == 200
+        assert response.headers["X-Query-Count"] == "1"
+        assert response.headers["Server-Timing"].startswith("db;dur=")
+
+    def test_budget_fails_when_exceeded(self, client, query_budget):
+        """Probar que el fixture de presupuesto falla si el endpoint se excede."""
+        response = client.get("/role")
+
+        assert query_budget(response, 1) == 1
+        with pytest.raises(AssertionError, match="presupuesto: 0"):
+            query_budget(response, 0)
+
+    def test_streaming_response_checked_after_body(self, db_session, caplog):
+        """Probar que en streaming no se envían cabeceras parciales y el presupuesto cuenta todo el cuerpo."""
+        app = FastAPI()
+        app.add_middleware(QueryCounter, budget=2, headers=True)
+
+        @app.get("/stream")
+        def stream():
+            def rows():
+                for i in range(3):
+                    yield f"{db_session.execute(text(f'SELECT {i}')).scalar()}\n"
+            return StreamingResponse(rows(), media_type="text/plain")
+
+        with caplog.at_level(logging.WARNING, logger="src.middlewares.query_counter"):
+            response = TestClient(app).get("/stream")
+
+        assert response.text == "0\n1\n2\n"
+        assert "X-Query-Count" not in response.headers
+        assert "ejecutó 3 consultas SQL (presupuesto 2)" in caplog.text
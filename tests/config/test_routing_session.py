@@ -0,0 +1,83 @@
+"""
+Pruebas unitarias para el enrutamiento de lecturas a réplicas.
+"""
+import pytest
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, AsyncSession
+
+from src.config.async_database import to_async_url
+from src.config.database import Base
+from src.config.routing_session import RoutingSession, use_primary
+from src.models.role import Role
+
+@pytest.fixture
+def databases(tmp_path):
+    """Fixture con dos archivos SQLite: primaria y réplica con datos distintos."""
+    urls = {name: f"sqlite:///{tmp_path / name}.sqlite" for name in ("primary", "replica")}
+    engines = {name: create_engine(url) for name, url in urls.items()}
+    for name, engine in engines.items():
+        Base.metadata.create_all(bind=engine, tables=[Role.__table__])
+        with sessionmaker(bind=engine)() as db:
+            db.add(Role(id=1, name=name))
+            db.commit()
+    yield urls, engines
+    for engine in engines.values():
+        engine.dispose()
+
+@pytest.fixture
+def session_factory(databases):
+    """Fixture para crear sesiones que enrutan entre primaria y réplica."""
+    _, engines = databases
+    return sessionmaker(class_=RoutingSession, bind=engines["primary"], replicas=[engines["replica"]])
+
+def role_name(db) -> str:
+    return db.scalar(select(Role.name).where(Role.id == 1))
+
+class TestRoutingSession:
+    """Clase para probar la separación de lecturas y escrituras."""
+
+    def test_reads_go_to_replica(self, session_factory):
+        """Probar que una lectura se resuelve contra la réplica."""
+        with session_factory() as db:
+            assert role_name(db) == "replica"
+
+    def test_sticky_to_primary_after_write(self, session_factory):
+        """Probar que tras escribir la sesión lee de la primaria."""
+        with session_factory() as db:
+            db.add(Role(id=2, name="nuevo"))
+            db.commit()
+            assert role_name(db) == "primary"
+            assert db.get(Role, 2).name == "nuevo"
+
+    def test_dml_statement_sticks_to_primary(self, session_factory):
+        """Probar que un UPDATE explícito también fija la sesión a la primaria."""
+        with session_factory() as db:
+            db.execute(update(Role).where(Role.id == 1).values(description="x"))
+            assert role_name(db) == "primary"
+
+    def test_use_primary(self, session_factory):
+        """Probar que se puede forzar la primaria antes de leer."""
+        with session_factory() as db:
+            assert role_name(use_primary(db)) == "primary"
+
+    def test_without_replicas_uses_primary(self, databases):
+        """Probar que sin réplicas se comporta como una sesión normal."""
+        _, engines = databases
+        with sessionmaker(class_=RoutingSession, bind=engines["primary"])() as db:
+            assert role_name(db) == "primary"
+
+    @pytest.mark.asyncio
+    async def test_async_reads_go_to_replica(self, databases):
+        """Probar el mismo enrutamiento sobre AsyncSession."""
+        urls, _ = databases
+        primary = create_async_engine(to_async_url(urls["primary"]))
+        replica = create_async_engine(to_async_url(urls["replica"]))
+        factory = async_sessionmaker(bind=primary, class_=AsyncSession, sync_session_class=RoutingSession, replicas=[replica.sync_engine])
+        async with factory() as db:
+            assert await db.scalar(select(Role.name).where(Role.id == 1)) == "replica"
+            db.add(Role(id=3, name="async"))
+            await db.commit()
+            assert await db.scalar(select(Role.name).where(Role.id == 1)) == "primary"
+        await primary.dispose()
+        await replica.dispose()
@@ -0,0 +1,65 @@
+"""
+Pruebas del registro de consultas lentas.
+"""
+import json
+import pytest
+from unittest.mock import patch
+from sqlalchemy import create_engine, text
+
+from src.config.slow_query_log import SlowQueryLog
+
+@pytest.fixture
+def engine(tmp_path):
+    """Fixture para crear un motor SQLite con una tabla de prueba."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'slow.sqlite'}")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+    yield engine
+    engine.dispose()
+
+class TestSlowQueryLog:
+    """Clase para probar la captura de consultas lentas."""
+
+    def test_slow_query_logged_with_plan(self, engine, tmp_path):
+        """Probar que una consulta lenta se guarda con parámetros, ruta y plan."""
+        log_file = tmp_path / "logs" / "slow.log"
+        slow_log = SlowQueryLog(threshold_ms=0, explain_sample=1, log_file=str(log_file))
+        slow_log.attach(engine)
+
+        with engine.connect() as connection:
+            connection.info["route"] = "GET /items"
+            connection.execute(text("SELECT * FROM items WHERE name = :name"), {"name": "press"})
+        slow_log._executor.shutdown(wait=True)
+
+        entry = slow_log.recent(1)[0]
+        assert entry["route"] == "GET /items"
+        assert "press" in entry["parameters"]
+        assert "SCAN items" in entry["plan"]
+        lines = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert lines[-1] == {"id": entry["id"], "plan": entry["plan"]}
+
+    def test_fast_queries_and_sampling(self, engine):
+        """Probar que no se registran las consultas rápidas ni se explican las no muestreadas."""
+        slow_log = SlowQueryLog(threshold_ms=60000, explain_sample=0, log_file="")
+        slow_log.attach(engine)
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        assert slow_log.recent() == []
+
+        slow_log.threshold = 0
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        assert slow_log.recent(1)[0]["plan"] is None
+        assert slow_log._executor is None
+
+    def test_endpoint_admin_only(self, client):
+        """Probar que solo los administradores ven las consultas lentas."""
+        headers = {"Authorization": "Bearer token"}
+        with patch("src.auth.principal.auth_handler") as mock_auth_handler:
+            mock_auth_handler.decode_token.return_value = {"user.role": 1}
+            assert client.get("/slow_query", headers=headers).status_code == 403
+
+            mock_auth_handler.decode_token.return_value = {"user.role": 4}
+            response = client.get("/slow_query", headers=headers)
+        assert response.status_code == 200
+        assert "data" in response.json()
@@ -0,0 +1,60 @@
+"""
+Pruebas del backend SQLite ajustado.
+"""
+import asyncio
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from src.config.migrations import run_migrations
+from src.config.sqlite_database_connector import SQLITE_BUSY_TIMEOUT_MS, create_async_sqlite_engine, create_sqlite_engine
+from src.models.like import Like
+from src.schemas.role import Role
+from src.repositories.role import RoleRepository
+
+@pytest.fixture
+def database_url(tmp_path):
+    """Fixture con un archivo SQLite migrado hasta la última revisión."""
+    url = f"sqlite:///{tmp_path / 'gym.sqlite'}"
+    run_migrations(url)
+    return url
+
+class TestSqliteDatabaseConnector:
+    """Clase para probar los PRAGMA por conexión y el uso de los repositorios."""
+
+    def test_pragmas_applied(self, database_url):
+        """Probar que cada conexión sale con WAL, synchronous=NORMAL, busy_timeout y claves foráneas."""
+        engine = create_sqlite_engine(database_url)
+        with engine.connect() as connection:
+            assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            assert connection.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+            assert connection.exec_driver_sql("PRAGMA busy_timeout").scalar() == SQLITE_BUSY_TIMEOUT_MS
+            assert connection.exec_driver_sql("PRAGMA foreign_keys").scalar() == 1
+        engine.dispose()
+
+    def test_async_pragmas_applied(self, database_url):
+        """Probar que el motor aiosqlite recibe los mismos PRAGMA."""
+        async def pragmas():
+            engine = create_async_sqlite_engine(database_url.replace("sqlite://", "sqlite+aiosqlite://"))
+            async with engine.connect() as connection:
+                result = (
+                    (await connection.exec_driver_sql("PRAGMA journal_mode")).scalar(),
+                    (await connection.exec_driver_sql("PRAGMA foreign_keys")).scalar(),
+                )
+            await engine.dispose()
+            return result
+
+        assert asyncio.run(pragmas()) == ("wal", 1)
+
+    def test_repositories_and_foreign_keys(self, database_url):
+        """Probar que los repositorios funcionan y que las claves foráneas se aplican."""
+        engine = create_sqlite_engine(database_url)
+        with sessionmaker(bind=engine)() as db:
+            RoleRepository(db).create_new_role(Role(id=1, name="Usuario", description="Rol básico"))
+            assert [role.name for role in RoleRepository(db).get_all_roles()] == ["Usuario"]
+
+            db.add(Like(user_email="nadie@gym.com", training_plan_id=99, is_like=True))
+            with pytest.raises(IntegrityError):
+                db.commit()
+        engine.dispose()
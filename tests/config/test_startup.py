@@ -0,0 +1,31 @@
+"""
+Pruebas de la sonda de disponibilidad de la base de datos y del tiempo de arranque.
+"""
+import statistics
+
+import pytest
+
+from benchmarks.bench_import_time import IMPORT_TIME_BUDGET_MS, measure
+from src.config.startup import wait_for_database
+
+class TestStartup:
+    """Clase para probar la espera a la base de datos al arrancar."""
+
+    def test_wait_for_database_ready(self, tmp_path):
+        """Probar que una base disponible responde al primer intento."""
+        waited = wait_for_database(f"sqlite:///{tmp_path / 'ready.sqlite'}", timeout=1)
+
+        assert waited < 1
+
+    def test_wait_for_database_timeout(self, tmp_path):
+        """Probar que se lanza TimeoutError si la base no responde a tiempo."""
+        with pytest.raises(TimeoutError):
+            wait_for_database(f"sqlite:///{tmp_path / 'no_existe' / 'db.sqlite'}", timeout=0.3, interval=0.1)
+
+    def test_import_time_within_budget(self):
+        """Probar que importar main no supera el presupuesto de arranque (IMPORT_TIME_BUDGET_MS)."""
+        if not IMPORT_TIME_BUDGET_MS:
+            pytest.skip("IMPORT_TIME_BUDGET_MS=0 desactiva el presupuesto")
+        totals, _ = measure("main", runs=3)
+
+        assert statistics.median(totals) <= IMPORT_TIME_BUDGET_MS
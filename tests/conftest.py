@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
 # Importar la aplicación FastAPI y modelos
@@ -39,15 +40,45 @@ def override_get_db():
     finally:
         db.close()
 
+# Crear un motor asíncrono en memoria (aiosqlite) para los endpoints async
+TEST_ASYNC_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+async_engine = create_async_engine(TEST_ASYNC_DATABASE_URL, poolclass=StaticPool)
+TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+# Sobreescribir la dependencia asíncrona de base de datos
+async def override_get_async_db():
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
 # Aplicar la sobreescritura de dependencias
 from src.config.database import get_db
+from src.config.async_database import get_async_db
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_async_db] = override_get_async_db
 
 # Crear un cliente de prueba
 @pytest.fixture
 def client():
     return TestClient(app)
 
+# Presupuesto de consultas SQL por endpoint
+@pytest.fixture
+def query_budget():
+    """
+    Devuelve una función que falla la prueba si la respuesta ejecutó más
+    consultas SQL que las declaradas, según la cabecera X-Query-Count.
+    """
+    def check(response, max_queries: int) -> int:
+        count = int(response.headers["X-Query-Count"])
+        assert count <= max_queries, (
+            f"{response.request.method} {response.request.url.path} ejecutó {count} consultas SQL "
+            f"(presupuesto: {max_queries})"
+        )
+        return count
+    return check
+
 # Crear una sesión de base de datos para pruebas
 @pytest.fixture
 def db_session():
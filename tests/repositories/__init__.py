@@ -0,0 +1,3 @@
+"""
+Paquete de pruebas unitarias para los repositorios.
+""" 
\ No newline at end of file
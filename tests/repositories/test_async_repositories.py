@@ -0,0 +1,123 @@
+"""
+Pruebas unitarias para los repositorios asíncronos.
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.config.database import Base
+from src.models.exercise import Exercise
+from src.models.like import Like
+from src.models.tag_of_training_plan import TagOfTrainingPlan
+from src.models.training_plan import TrainingPlan
+from src.models.user import User
+from src.repositories.exercise import ExerciseRepository, AsyncExerciseRepository
+from src.repositories.training_plan import TrainingPlanRepository, AsyncTrainingPlanRepository, encode_plan_cursor
+
+@pytest.fixture
+def database_file(tmp_path):
+    """Fixture para crear una base de datos SQLite compartida por ambos motores."""
+    path = tmp_path / "test.sqlite"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all([
+        User(email="admin@example.com", role_id=4),
+        User(email="premium@example.com", role_id=2),
+    ])
+    db.add_all([Exercise(name=f"Curl {i}", dificulty_id=i % 2 + 1) for i in range(15)])
+    db.add_all([
+        TagOfTrainingPlan(id=1, name="Volumen"),
+        TrainingPlan(id=1, name="Fuerza", description="Fuerza máxima con sentadillas", user_email="admin@example.com",
+                     is_visible=True, dislikes_count=1),
+        TrainingPlan(id=2, name="Hipertrofia", description="Series largas y algo de fuerza", tag_of_training_plan_id=1,
+                     user_email="premium@example.com", is_visible=True, likes_count=2),
+        TrainingPlan(id=3, name="Oculto", user_email="premium@example.com", is_visible=False),
+    ])
+    db.add_all([
+        Like(user_email="admin@example.com", training_plan_id=2, is_like=True),
+        Like(user_email="premium@example.com", training_plan_id=2, is_like=True),
+        Like(user_email="premium@example.com", training_plan_id=1, is_like=False),
+    ])
+    db.commit()
+    db.close()
+    yield path, engine
+    engine.dispose()
+
+class TestAsyncRepositories:
+    """Clase para comprobar que las versiones async devuelven lo mismo que las síncronas."""
+
+    @pytest.mark.asyncio
+    async def test_exercises_match_sync(self, database_file):
+        """Probar que la paginación y los filtros de ejercicios coinciden."""
+        path, engine = database_file
+        sync_items, sync_total = ExerciseRepository(sessionmaker(bind=engine)()).get_all_excercises(page=2, size=4, difficulty_id=1)
+
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        async with async_sessionmaker(bind=async_engine)() as db:
+            items, total = await AsyncExerciseRepository(db).get_all_excercises(page=2, size=4, difficulty_id=1)
+        await async_engine.dispose()
+
+        assert total == sync_total == 8
+        assert [e.id for e in items] == [e.id for e in sync_items]
+
+    @pytest.mark.asyncio
+    async def test_training_plans_match_sync(self, database_file):
+        """Probar que el catálogo se ordena por likes y oculta los planes no visibles."""
+        path, engine = database_file
+        sync_items, sync_total = TrainingPlanRepository(sessionmaker(bind=engine)()).get_all_training_plans()
+
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        async with async_sessionmaker(bind=async_engine)() as db:
+            items, total = await AsyncTrainingPlanRepository(db).get_all_training_plans()
+        await async_engine.dispose()
+
+        assert total == sync_total == 2
+        assert [p.id for p in items] == [p.id for p in sync_items] == [2, 1]
+
+    @pytest.mark.asyncio
+    async def test_training_plans_cursor_pages(self, database_file):
+        """Probar que las páginas por cursor recorren el catálogo en el mismo orden que por página."""
+        path, engine = database_file
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        async with async_sessionmaker(bind=async_engine)() as db:
+            repo = AsyncTrainingPlanRepository(db)
+            offset_items, _ = await repo.get_all_training_plans(size=10)
+            ids, cursor, total = [], None, None
+            for _ in range(3):
+                items, cursor, total = await repo.get_training_plans_after(size=1, cursor=cursor, include_total=True)
+                ids += [p.id for p in items]
+                if cursor is None:
+                    break
+            with pytest.raises(ValueError):
+                await repo.get_training_plans_after(cursor="%%%")
+        await async_engine.dispose()
+
+        assert ids == [p.id for p in offset_items] == [2, 1]
+        assert total == 2
+
+    @pytest.mark.asyncio
+    async def test_training_plans_text_search(self, database_file):
+        """Probar que la búsqueda cubre descripción y etiqueta, ordena por relevancia y combina filtros."""
+        path, engine = database_file
+        sync_repo = TrainingPlanRepository(sessionmaker(bind=engine)())
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        async with async_sessionmaker(bind=async_engine)() as db:
+            repo = AsyncTrainingPlanRepository(db)
+            by_tag, _, _ = await repo.get_training_plans_after(search_name="volumen")
+            by_prefix, _ = await repo.get_all_training_plans(search_name="sentadilla")
+            ranked, cursor, total = await repo.get_training_plans_after(size=1, search_name="fuerza", include_total=True)
+            next_page, _, _ = await repo.get_training_plans_after(size=1, cursor=cursor, search_name="fuerza")
+            filtered, _, _ = await repo.get_training_plans_after(search_name="fuerza", tag_id=1)
+            # Cursores de búsqueda manipulados: desplazamiento negativo o mayor que BIGINT
+            for forged in (encode_plan_cursor(-1), encode_plan_cursor(2 ** 63)):
+                with pytest.raises(ValueError):
+                    await repo.get_training_plans_after(cursor=forged, search_name="fuerza")
+        await async_engine.dispose()
+
+        assert [p.id for p in by_tag] == [2]
+        assert [p.id for p in by_prefix] == [p.id for p in sync_repo.get_all_training_plans(search_name="sentadilla")[0]] == [1]
+        assert [p.id for p in ranked + next_page] == [1, 2] and total == 2
+        assert [p.id for p in filtered] == [2]
+        assert sync_repo.get_all_training_plans(search_name="\"*")[1] == 2
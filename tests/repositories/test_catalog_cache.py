@@ -0,0 +1,105 @@
+"""
+Pruebas de la caché de respuestas del catálogo de planes.
+"""
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.config.database import Base
+from src.config.migrations import load_models
+from src.config.shared_store import LocalRedis
+from src.models.training_plan import TrainingPlan
+from src.models.user import User
+from src.repositories.like import LikeRepository
+from src.schemas.like import Like as LikeSchema
+from src.services import catalog_cache as catalog_cache_module
+from src.services.catalog_cache import (
+    CatalogCache, MemoryCatalogCacheBackend, SharedCatalogCacheBackend, catalog_key,
+)
+
+class FakeSession:
+    """Sesión asíncrona vacía para los refrescos en segundo plano."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+@pytest.fixture(params=["memory", "shared"])
+def cache(request):
+    """Fixture con cada backend y refrescos sobre una sesión vacía."""
+    backend = MemoryCatalogCacheBackend(max_size=10) if request.param == "memory" else SharedCatalogCacheBackend(LocalRedis())
+    return CatalogCache(backend, ttl=60, stale=60, session_factory=FakeSession)
+
+class TestCatalogCache:
+    """Clase para probar TTL, stale-while-revalidate e invalidación de la caché del catálogo."""
+
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate(self, cache, monkeypatch):
+        """Probar que una respuesta caducada se sirve mientras se recalcula una sola vez."""
+        calls = []
+
+        async def loader(db):
+            calls.append(db)
+            return {"items": [], "version": len(calls)}
+
+        key = catalog_key(page=None, size=10, name="  Fuerza  MÁXIMA ")
+        assert key == catalog_key(size=10, name="fuerza máxima")
+        assert await cache.get_or_load(key, loader, "request") == ({"items": [], "version": 1}, "miss")
+        assert (await cache.get_or_load(key, loader, "request"))[1] == "hit"
+
+        start = time.time()
+        monkeypatch.setattr(time, "time", lambda: start + 90)
+        first, second = await cache.get_or_load(key, loader, "request"), await cache.get_or_load(key, loader, "request")
+        assert first == second == ({"items": [], "version": 1}, "stale")
+        await asyncio.gather(*cache._tasks)
+        assert len(calls) == 2 and isinstance(calls[1], FakeSession)
+        assert await cache.get_or_load(key, loader, "request") == ({"items": [], "version": 2}, "hit")
+
+        monkeypatch.setattr(time, "time", lambda: start + 500)
+        assert (await cache.get_or_load(key, loader, "request"))[1] == "miss"
+        cache.invalidate()
+        assert (await cache.get_or_load(key, loader, "request"))[1] == "miss"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once(self, cache):
+        """Probar que las peticiones simultáneas de una clave sin caché calculan la respuesta una sola vez."""
+        calls = []
+        release = asyncio.Event()
+
+        async def loader(db):
+            calls.append(db)
+            await release.wait()
+            return {"items": []}
+
+        key = catalog_key(size=10)
+        requests = [asyncio.create_task(cache.get_or_load(key, loader, "request")) for _ in range(5)]
+        # Con el backend compartido las búsquedas pasan por el threadpool
+        await asyncio.sleep(0.2)
+        release.set()
+
+        assert await asyncio.gather(*requests) == [({"items": []}, "miss")] * 5
+        assert len(calls) == 1
+        assert cache._loading == {}
+
+    def test_like_commit_invalidates(self, monkeypatch):
+        """Probar que dar like invalida el catálogo solo después del commit."""
+        cache = CatalogCache(MemoryCatalogCacheBackend())
+        monkeypatch.setattr(catalog_cache_module, "catalog_cache", cache)
+        load_models()
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=engine)
+        with sessionmaker(bind=engine)() as db:
+            db.add(User(email="user@example.com", role_id=2))
+            db.add(TrainingPlan(id=1, name="Fuerza", user_email="user@example.com", is_visible=True))
+            db.commit()
+            assert cache.backend.generation() == 0
+
+            LikeRepository(db).create_like(LikeSchema(user_email="user@example.com", training_plan_id=1))
+            assert cache.backend.generation() == 1
+        engine.dispose()
@@ -0,0 +1,72 @@
+"""
+Pruebas de los contadores de likes de los planes y su conciliación.
+"""
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.config.database import Base
+from src.config.migrations import load_models
+from src.models.like import Like
+from src.models.training_plan import TrainingPlan
+from src.models.user import User
+from src.repositories.like import LikeRepository
+from src.repositories.training_plan import TrainingPlanRepository
+from src.schemas.like import Like as LikeSchema
+from src.services.like_counters import reconcile_like_counters
+
+@pytest.fixture
+def db():
+    """Fixture con tres usuarios y dos planes visibles en SQLite en memoria."""
+    load_models()
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([User(email=f"user{i}@example.com", role_id=4) for i in range(3)])
+    session.add_all([
+        TrainingPlan(id=1, name="Fuerza", user_email="user0@example.com", is_visible=True),
+        TrainingPlan(id=2, name="Hipertrofia", user_email="user0@example.com", is_visible=True),
+    ])
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+def counters(db, plan_id):
+    db.expire_all()
+    return tuple(db.execute(
+        select(TrainingPlan.likes_count, TrainingPlan.dislikes_count).where(TrainingPlan.id == plan_id)
+    ).one())
+
+class TestLikeCounters:
+    """Clase para probar que LikeRepository mantiene los contadores del plan."""
+
+    def test_like_change_and_remove(self, db):
+        """Probar que dar like, cambiarlo a dislike y quitarlo mueve los contadores."""
+        repo = LikeRepository(db)
+        like_id = repo.create_like(LikeSchema(user_email="user1@example.com", training_plan_id=2, is_like=True)).id
+        repo.create_like(LikeSchema(user_email="user2@example.com", training_plan_id=2, is_like=True))
+        repo.create_like(LikeSchema(user_email="user1@example.com", training_plan_id=2, is_like=True))
+        assert counters(db, 2) == (2, 0)
+        assert [plan.id for plan in TrainingPlanRepository(db).get_all_training_plans()[0]] == [2, 1]
+
+        repo.create_like(LikeSchema(user_email="user1@example.com", training_plan_id=2, is_like=False))
+        assert counters(db, 2) == (1, 1)
+        assert repo.get_training_plan_dislikes_count(2) == 1
+
+        assert repo.remove_like(like_id)
+        assert not repo.remove_like(like_id)
+        assert counters(db, 2) == (1, 0)
+
+    def test_reconcile_repairs_drift(self, db):
+        """Probar que la conciliación corrige solo los planes desviados."""
+        db.execute(insert(Like), [
+            {"user_email": "user1@example.com", "training_plan_id": 1, "is_like": True},
+            {"user_email": "user2@example.com", "training_plan_id": 1, "is_like": False},
+        ])
+        db.commit()
+
+        assert reconcile_like_counters(db) == 1
+        assert counters(db, 1) == (1, 1)
+        assert reconcile_like_counters(db) == 0
@@ -0,0 +1,102 @@
+"""
+Pruebas del árbol completo de un plan y su caché.
+"""
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.config.database import Base
+from src.config.migrations import load_models
+from src.config.shared_store import LocalRedis
+from src.models.exercise import Exercise
+from src.models.exercise_configuration import ExerciseConfiguration
+from src.models.tag_of_training_plan import TagOfTrainingPlan
+from src.models.training_plan import TrainingPlan
+from src.models.workout_day_exercise import WorkoutDayExercise
+from src.repositories.training_plan import TrainingPlanRepository
+from src.services import training_plan_tree
+from src.services.training_plan_tree import TrainingPlanTreeCache, build_training_plan_tree
+
+@pytest.fixture
+def session_factory():
+    """Fixture con un plan de siete días y dos configuraciones por día en SQLite en memoria."""
+    load_models()
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as db:
+        db.add(TagOfTrainingPlan(id=1, name="Fuerza"))
+        db.add_all([Exercise(id=i, name=f"Ejercicio {i}") for i in range(1, 4)])
+        db.add(TrainingPlan(id=1, name="Plan completo", tag_of_training_plan_id=1, is_visible=True))
+        db.add_all([WorkoutDayExercise(id=day, week_day_id=day, training_plan_id=1) for day in range(1, 8)])
+        db.add_all([
+            ExerciseConfiguration(workout_day_exercise_id=day, exercise_id=exercise, sets=3, repsHigh=12)
+            for day in range(1, 8) for exercise in (1, 2)
+        ])
+        db.commit()
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+    factory.statements = statements
+    yield factory
+    engine.dispose()
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Fixture con una caché vacía en memoria instalada como la de la aplicación."""
+    cache = TrainingPlanTreeCache(LocalRedis(), ttl=60)
+    monkeypatch.setattr(training_plan_tree, "training_plan_tree_cache", cache)
+    return cache
+
+class TestTrainingPlanTree:
+    """Clase para probar la carga del árbol de un plan y su invalidación."""
+
+    def test_tree_loads_in_fixed_queries(self, session_factory):
+        """Probar que el árbol se carga en cuatro consultas con todos sus niveles."""
+        with session_factory() as db:
+            tree = build_training_plan_tree(TrainingPlanRepository(db).get_training_plan_tree(1))
+
+        assert len(session_factory.statements) == 4
+        assert tree["tag"]["name"] == "Fuerza"
+        assert [day["week_day_id"] for day in tree["workout_days"]] == list(range(1, 8))
+        assert [c["exercise"]["name"] for c in tree["workout_days"][0]["exercise_configurations"]] == ["Ejercicio 1", "Ejercicio 2"]
+
+    def test_writes_invalidate_cached_tree(self, session_factory, cache):
+        """Probar que la caché evita las consultas y que escribir un nivel del árbol la invalida."""
+        with session_factory() as db:
+            cache.get_or_load(db, 1)
+        with session_factory() as db:
+            cache.get_or_load(db, 1)
+        assert len(session_factory.statements) == 4
+
+        with session_factory() as db:
+            db.add(ExerciseConfiguration(workout_day_exercise_id=3, exercise_id=3, sets=4, repsHigh=8))
+            db.commit()
+        with session_factory() as db:
+            day = cache.get_or_load(db, 1)["workout_days"][2]
+        assert [c["exercise_id"] for c in day["exercise_configurations"]] == [1, 2, 3]
+
+        with session_factory() as db:
+            db.get(Exercise, 3).name = "Ejercicio renombrado"
+            db.commit()
+        assert cache.get(1) is None
+        with session_factory() as db:
+            cache.get_or_load(db, 1)
+            db.add(TrainingPlan(id=2, name="Otro plan"))
+            db.commit()
+        assert cache.get(1) is not None
+
+    def test_load_started_before_invalidation_is_not_cached(self, session_factory, cache):
+        """Probar que un árbol cargado antes de una escritura no se guarda tras su invalidación."""
+        with session_factory() as db:
+            generation = cache.generation(1)
+            stale_tree = build_training_plan_tree(TrainingPlanRepository(db).get_training_plan_tree(1))
+        with session_factory() as db:
+            db.get(TrainingPlan, 1).name = "Plan renombrado"
+            db.commit()
+
+        cache.put(stale_tree, generation)
+        assert cache.get(1) is None
+        with session_factory() as db:
+            assert cache.get_or_load(db, 1)["name"] == "Plan renombrado"
+        assert cache.get(1)["name"] == "Plan renombrado"
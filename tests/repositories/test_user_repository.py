@@ -0,0 +1,152 @@
+"""
+Pruebas de las lecturas de usuarios y la expiración de suscripciones en bloque.
+"""
+from datetime import date, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.auth.jwt_handler import JWTHandler
+from src.config.database import Base, get_db
+from src.config.migrations import load_models
+from src.models.user import User
+from src.repositories.user import UserRepository
+from src.routers.user import user_router
+from src.services.subscription_expiry import expire_subscriptions
+
+@pytest.fixture
+def session_factory():
+    """Fixture con usuarios vencidos, vigentes y administradores en SQLite en memoria."""
+    load_models()
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    yesterday, next_year = date.today() - timedelta(days=1), date.today() + timedelta(days=365)
+    users = [("expired@example.com", 2, yesterday), ("nodate@example.com", 3, None),
+             ("active@example.com", 2, next_year), ("admin@example.com", 4, None)]
+    with factory() as db:
+        db.add_all([
+            User(email=email, role_id=role_id, final_date=final_date, id_number="12345678", password="hashed",
+                 name="Test User", phone="600000000", birth_date=date(1990, 1, 1), gender="M")
+            for email, role_id, final_date in users
+        ])
+        db.commit()
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+    factory.statements = statements
+    yield factory
+    engine.dispose()
+
+class TestUserReads:
+    """Clase para probar que las lecturas de usuarios no escriben."""
+
+    def test_reads_show_effective_role_without_writes(self, session_factory):
+        """Probar que un usuario vencido se ve con rol 1 sin UPDATE ni commit."""
+        with session_factory() as db:
+            repo = UserRepository(db)
+            roles = {user.email: user.role_id for user in repo.get_all_users()}
+            assert repo.get_user_by_email("expired@example.com").role_id == 1
+            assert not db.dirty
+
+        assert roles == {"expired@example.com": 1, "nodate@example.com": 1, "active@example.com": 2, "admin@example.com": 4}
+        assert not [s for s in session_factory.statements if not s.lstrip().upper().startswith("SELECT")]
+
+    def test_update_role_of_expired_user_is_written(self, session_factory):
+        """Probar que bajar a rol 1 a un premium vencido escribe el rol aunque ya se viera como 1."""
+        next_month = date.today() + timedelta(days=30)
+        with session_factory() as db:
+            UserRepository(db).update_role("expired@example.com", 1, next_month)
+        with session_factory() as db:
+            row = db.execute(select(User.role_id, User.final_date).where(User.email == "expired@example.com")).one()
+
+        assert tuple(row) == (1, next_month)
+
+class TestSubscriptionExpiry:
+    """Clase para probar el UPDATE en bloque de suscripciones vencidas."""
+
+    def test_expire_subscriptions(self, session_factory):
+        """Probar que una sola sentencia pasa a rol 1 solo a los vencidos que no son administradores."""
+        with session_factory() as db:
+            assert expire_subscriptions(db) == 2
+            assert expire_subscriptions(db) == 0
+            rows = dict(db.execute(select(User.email, User.role_id)).all())
+
+        assert rows == {"expired@example.com": 1, "nodate@example.com": 1, "active@example.com": 2, "admin@example.com": 4}
+        assert sum(s.lstrip().upper().startswith("UPDATE") for s in session_factory.statements) == 2
+
+@pytest.fixture
+def admin_client(session_factory):
+    """Fixture con el router de usuarios sobre la base de prueba y el token de un administrador."""
+    handler = JWTHandler("test_secret", "HS256")
+    app = FastAPI()
+    app.include_router(user_router, prefix="/user")
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    admin = SimpleNamespace(email="admin@example.com", name="Admin", id_number="12345678", role_id=4,
+                            status=True, is_verified=True, final_date=None, gym_id=None)
+    with patch("src.auth.principal.auth_handler", handler):
+        client = TestClient(app)
+        client.headers["Authorization"] = f"Bearer {handler.encode_token(admin)}"
+        yield client
+
+class TestUserListing:
+    """Clase para probar el listado de usuarios paginado por cursor."""
+
+    def test_pages_cover_all_users_without_secrets(self, admin_client):
+        """Probar que las páginas recorren todos los usuarios en orden y sin datos sensibles."""
+        emails, cursor = [], None
+        while True:
+            params = {"limit": 3, "include_total": True, **({"cursor": cursor} if cursor else {})}
+            response = admin_client.get("/user", params=params)
+            assert response.status_code == status.HTTP_200_OK
+            page = response.json()
+            assert page["total"] == 4
+            assert all("password" not in item and "verification_code" not in item for item in page["items"])
+            emails += [item["email"] for item in page["items"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert emails == sorted(["expired@example.com", "nodate@example.com", "active@example.com", "admin@example.com"])
+
+    def test_filters_use_effective_role(self, admin_client):
+        """Probar que el filtro de rol usa el rol vigente y se combina con la fecha de fin."""
+        response = admin_client.get("/user", params={"role_id": 1})
+        assert [item["email"] for item in response.json()["items"]] == ["expired@example.com", "nodate@example.com"]
+        assert {item["role_id"] for item in response.json()["items"]} == {1}
+
+        response = admin_client.get("/user", params={"expiring_before": date.today().isoformat()})
+        assert [item["email"] for item in response.json()["items"]] == ["expired@example.com"]
+
+        assert admin_client.get("/user", params={"cursor": "%%%"}).status_code == status.HTTP_400_BAD_REQUEST
+
+class TestEffectiveRole:
+    """Clase para probar User.effective_role en Python y en SQL."""
+
+    def test_sql_matches_python(self, session_factory):
+        """Probar que el filtro en SQL devuelve los mismos usuarios que el valor en memoria."""
+        with session_factory() as db:
+            loaded = {user.email: user.effective_role for user in db.scalars(select(User))}
+            for role_id in (1, 2, 3, 4):
+                matched = set(db.scalars(select(User.email).where(User.effective_role == role_id)))
+                assert matched == {email for email, role in loaded.items() if role == role_id}
+                assert set(db.scalars(select(User.email).where(User.effective_role != role_id))) == set(loaded) - matched
+            assert dict(db.execute(select(User.email, User.effective_role)).all()) == loaded
+
+    def test_role_filter_is_sargable(self):
+        """Probar que la igualdad con un rol no envuelve role_id en un CASE."""
+        sql = str(select(User.email).where(User.effective_role == 2))
+        assert "CASE" not in sql and "users.role_id =" in sql